@@ -12,4 +12,8 @@ db.createUser({
         }
     ]
 });
+// 프롬프트 입력 지문으로 기존 생성 결과 재사용 조회
+db.interview_questions.createIndex({ unique_key: 1, input_fingerprint: 1, created_at: -1 });
+db.learning_paths.createIndex({ unique_key: 1, input_fingerprint: 1, created_at: -1 });
+
 print('Database initialized successfully');
@@ -30,6 +30,10 @@ def get_interview_collection():
     """Interview 컬렉션 반환"""
     return db_manager.get_collection(Collections.INTERVIEW_QUESTIONS)
 
+def get_learning_collection():
+    """Learning 컬렉션 반환 (커리어 번들 결과 저장)"""
+    return db_manager.get_collection(Collections.LEARNING_PATHS)
+
 def get_resumes_collection():
     """Resume 컬렉션 반환 (다른 서비스 데이터 접근)"""
     return db_manager.get_collection(Collections.RESUMES)
\ No newline at end of file
@@ -5,7 +5,9 @@ Interview 서비스 CRUD 함수들
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from datetime import datetime
 from typing import List, Optional, Dict, Any
-from database import get_interview_collection, get_resumes_collection
+from shared.database.generations import find_reusable_generation
+from shared.generation.near_duplicate import find_near_duplicate_generation
+from database import get_interview_collection, get_learning_collection, get_resumes_collection
 
 async def get_resume_by_unique_key(unique_key: str) -> Optional[Dict[str, Any]]:
     """Resume 컬렉션에서 직접 이력서 조회"""
@@ -17,20 +19,52 @@ async def get_resume_by_unique_key(unique_key: str) -> Optional[Dict[str, Any]]:
     return resume
 
 async def get_interview_by_unique_key(unique_key: str) -> Optional[Dict[str, Any]]:
-    """unique_key로 면접 질문 조회"""
+    """unique_key로 최신 면접 질문 조회"""
     interview_collection = get_interview_collection()
-    interview = await interview_collection.find_one({"unique_key": unique_key})
+    interview = await interview_collection.find_one({"unique_key": unique_key}, sort=[("created_at", -1)])
     if interview:
         interview["id"] = str(interview["_id"])
         del interview["_id"]
     return interview
 
+async def get_interview_by_fingerprint(unique_key: str, fingerprint: str,
+                                      prompt_version: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """프롬프트 입력 지문과 프롬프트 버전이 같은 최신 면접 질문 조회 (재사용 가능한 생성 결과)"""
+    interview = await find_reusable_generation(get_interview_collection(), unique_key, fingerprint, prompt_version)
+    if interview:
+        interview["id"] = str(interview["_id"])
+        del interview["_id"]
+    return interview
+
+async def get_interview_by_near_duplicate(resume_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """유사 이력서(MinHash/LSH)의 최신 면접 질문 조회 (document, unique_key, similarity)"""
+    match = await find_near_duplicate_generation(get_interview_collection(), resume_data)
+    if match:
+        match["document"]["id"] = str(match["document"]["_id"])
+        del match["document"]["_id"]
+    return match
+
+async def get_learning_by_fingerprint(unique_key: str, fingerprint: str,
+                                     prompt_version: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """프롬프트 입력 지문과 프롬프트 버전이 같은 최신 학습 경로 조회 (커리어 번들)"""
+    learning = await find_reusable_generation(get_learning_collection(), unique_key, fingerprint, prompt_version)
+    if learning:
+        learning["id"] = str(learning["_id"])
+        del learning["_id"]
+    return learning
+
 async def create_interview_questions(interview_data: Dict[str, Any]) -> str:
     """면접 질문 저장"""
     interview_collection = get_interview_collection()
     result = await interview_collection.insert_one(interview_data)
     return str(result.inserted_id)
 
+async def create_learning_path(learning_data: Dict[str, Any]) -> str:
+    """학습 경로 저장 (커리어 번들)"""
+    learning_collection = get_learning_collection()
+    result = await learning_collection.insert_one(learning_data)
+    return str(result.inserted_id)
+
 async def get_interview_questions_by_unique_key(unique_key: str) -> List[Dict[str, Any]]:
     """unique_key로 모든 면접 질문 조회"""
     interview_collection = get_interview_collection()
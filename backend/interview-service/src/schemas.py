@@ -3,7 +3,7 @@ Interview 서비스 스키마
 """
 
 from pydantic import BaseModel, Field
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 
 class InterviewQuestion(BaseModel):
@@ -13,6 +13,10 @@ class InterviewQuestion(BaseModel):
     question: str = Field(..., description="실제 질문 본문")
     what_good_answers_cover: List[str] = Field(..., description="좋은 답변이 포함해야 할 핵심 요소")
 
+class InterviewQuestionsOutput(BaseModel):
+    """면접 질문 생성 결과 (LLM 구조화 출력 스키마)"""
+    questions: List[InterviewQuestion] = Field(..., description="면접 질문 목록")
+
 class InterviewQuestionsResponse(BaseModel):
     """면접 질문 생성 응답 스키마"""
     interview_id: str = Field(..., description="면접 질문 세션 ID")
@@ -39,3 +43,17 @@ class ResumeData(BaseModel):
     unique_key: str
     created_at: datetime
     updated_at: datetime
+
+class BulkResumeQuery(BaseModel):
+    """대량 작업 대상 이력서 조회 조건"""
+    name: Optional[str] = Field(None, description="이력서 작성자 이름")
+    min_experience_months: Optional[int] = Field(None, description="최소 경력 (개월)", ge=0)
+    max_experience_months: Optional[int] = Field(None, description="최대 경력 (개월)", ge=0)
+    limit: int = Field(default=100, description="조회할 최대 이력서 수", ge=1, le=500)
+
+class BulkJobRequest(BaseModel):
+    """대량 면접 질문 생성 작업 요청 스키마"""
+    unique_keys: List[str] = Field(default=[], description="대상 이력서 고유 키 목록")
+    resume_query: Optional[BulkResumeQuery] = Field(None, description="대상 이력서 조회 조건 (unique_keys와 병합)")
+    job_type: str = Field(default="interview", description="작업 유형 (interview, learning)")
+    concurrency: Optional[int] = Field(None, description="최대 동시 실행 수 (설정 상한 적용)", ge=1)
@@ -3,26 +3,52 @@
 """
 import json
 from shared.utils.logger import setup_logger
-from typing import Dict, List, Any
+from shared.utils.metrics import observe_cache_lookup
+from typing import Dict, List, Any, Optional
 from datetime import datetime
-from langchain_core.messages import SystemMessage, HumanMessage
-from shared.llm.registry import registry
-from shared.prompts.loader import get_prompt_loader
-from shared.utils.resume_formatter import format_resume_for_interview
-from shared.utils.json_parser import parse_llm_json_response
-from .crud import get_resume_by_unique_key, create_interview_questions
+from shared.llm.router import llm_router
+from shared.llm.base import cached_prompt_tokens
+from shared.llm.summarizer import condense_resume
+from shared.utils.token_estimator import estimate_message_tokens
+from shared.prompts.loader import get_prompt_loader, prompt_version_of
+from shared.prompts.experiments import select_prompt, selected_prompt_version
+from shared.utils.resume_formatter import format_resume_for_interview, prompt_input_fingerprint, compute_prompt_fingerprints
+from shared.llm.structured import parse_structured_response, uses_structured_output
+from shared.generation.career_bundle import generate_career_bundle, bundle_prompt_versions
+from shared.generation.item_regeneration import resolve_item_index, regenerate_item, build_revision
+from shared.generation.diversity import resolve_candidate_count, with_candidate_instruction, select_diverse_questions
+from shared.generation.question_bank import get_question_bank, assemble_question_set, SOURCE_QUESTION_BANK
+from shared.generation.repair import repair_response
+from shared.generation.near_duplicate import (
+    NEAR_DUPLICATE_REUSE,
+    NEAR_DUPLICATE_DRAFT,
+    resolve_near_duplicate_mode,
+    draft_instruction,
+    merge_draft_response,
+)
+from shared.utils.error_handler import InterviewErrors
+from .schemas import InterviewQuestion, InterviewQuestionsOutput
+from .crud import (
+    get_resume_by_unique_key,
+    get_interview_by_unique_key,
+    get_interview_by_fingerprint,
+    get_interview_by_near_duplicate,
+    get_learning_by_fingerprint,
+    create_interview_questions,
+    create_learning_path
+)
 from config import settings
 
 logger = setup_logger("interview-service", settings.log_level)
 
-def _create_interview_prompt(formatted_data: Dict[str, Any]) -> List:
+def _create_interview_prompt(formatted_data: Dict[str, Any], unique_key: Optional[str] = None) -> List:
     """면접 질문 생성 프롬프트 생성 (YAML 파일 기반)"""
     try:
         # 프롬프트 로더 가져오기
         loader = get_prompt_loader('interview')
         
-        # 프롬프트 설정 로드
-        config = loader.load_prompt_config('interview_questions.yaml')
+        # 컴파일된 프롬프트 (파일이 바뀌었으면 재로드된 버전, 변형 실험 중이면 이력서별 배정 변형)
+        prompt, experiment = select_prompt(loader, 'interview_questions.yaml', unique_key)
         
         # 경력 레벨 결정
         years_exp = formatted_data.get('years_experience', 0)
@@ -30,26 +56,18 @@ def _create_interview_prompt(formatted_data: Dict[str, Any]) -> List:
         
         logger.info(f"경력 {years_exp}년 → {experience_level} 레벨로 분류")
         
-        # 시스템 프롬프트 렌더링
-        system_prompt = loader.render_system_prompt(config, {
-            'experience_level': experience_level
-        })
-        
-        # 휴먼 프롬프트 렌더링
-        human_prompt = loader.render_human_prompt(config, formatted_data)
-        
-        return [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=human_prompt)
-        ]
+        # 시스템 프롬프트(고정 접두부, 제공자 프롬프트 캐시 대상, 버전 표시) + 휴먼 프롬프트 렌더링
+        return prompt.build_messages(formatted_data, experiment)
         
     except Exception as e:
-        logger.error(f"프롬프트 생성 실패: {e}")
+        logger.warning("프롬프트 생성 실패, 폴백 프롬프트 사용: %s", e)
         # 폴백: 간단한 기본 프롬프트
         return _create_fallback_prompt(formatted_data)
 
 def _create_fallback_prompt(formatted_data: Dict[str, Any]) -> List:
     """YAML 로드 실패 시 사용할 폴백 프롬프트"""
+    from langchain_core.messages import SystemMessage, HumanMessage
+    
     system_prompt = """
 당신은 백엔드 개발자 채용 전문 기술 면접관입니다.
 주어진 이력서 정보를 바탕으로 개인 맞춤형 면접 질문 5개를 생성해주세요.
@@ -89,98 +107,229 @@ def _create_fallback_prompt(formatted_data: Dict[str, Any]) -> List:
         HumanMessage(content=human_prompt)
     ]
 
-async def generate_interview_questions_service(unique_key: str, provider: str = "gemini") -> Dict[str, Any]:
-    """면접 질문 생성 서비스 함수"""
+def _reused_interview_response(interview: Dict[str, Any]) -> Dict[str, Any]:
+    """저장된 면접 질문을 생성 응답 형태로 변환"""
+    return {
+        "interview_id": interview["id"],
+        "resume_id": interview.get("resume_id"),
+        "unique_key": interview["unique_key"],
+        "provider": interview.get("provider") or interview.get("model_used", "unknown"),
+        "model": interview.get("model", "unknown"),
+        "questions": interview["questions"],
+        "generated_at": interview.get("created_at"),
+        "reused": True
+    }
+
+def _near_duplicate_source(match: Dict[str, Any]) -> Dict[str, Any]:
+    """유사 이력서 생성 결과의 출처 정보 (저장/응답 공용)"""
+    return {
+        "unique_key": match["unique_key"],
+        "interview_id": match["document"]["id"],
+        "similarity": match["similarity"],
+    }
+
+async def _near_duplicate_reuse_response(resume_data: Dict[str, Any], unique_key: str, fingerprint: str,
+                                         match: Dict[str, Any]) -> Dict[str, Any]:
+    """유사 이력서의 면접 질문을 이 이력서의 결과로 복사 저장 (다음 요청부터는 지문 재사용)"""
+    document = match["document"]
+    source = _near_duplicate_source(match)
+    created_at = datetime.utcnow()
+    interview_id = await create_interview_questions({
+        "unique_key": unique_key,
+        "provider": document.get("provider"),
+        "model": document.get("model"),
+        "prompt_tokens": 0,  # LLM 호출 없음
+        "input_fingerprint": fingerprint,
+        "questions": document["questions"],
+        "reused_from": source,
+        "created_at": created_at,
+        "resume_id": resume_data["id"],
+        "session_id": f"{unique_key}_near_duplicate_{int(created_at.timestamp())}"
+    })
+    return {
+        "interview_id": interview_id,
+        "resume_id": resume_data["id"],
+        "unique_key": unique_key,
+        "provider": document.get("provider", "unknown"),
+        "model": document.get("model", "unknown"),
+        "questions": document["questions"],
+        "generated_at": created_at,
+        "reused": True,
+        "near_duplicate": source
+    }
+
+async def _question_bank_response(resume_data: Dict[str, Any], unique_key: str,
+                                  degraded: bool) -> Optional[Dict[str, Any]]:
+    """질문 은행에서 이력서 기술 스택에 맞춘 질문 세트 구성 후 저장 (구성할 수 없으면 None)"""
+    index = get_question_bank()
+    if index is None:
+        return None
+    # 장애 시에는 기술 태그가 겹치지 않더라도 빈도 높은 질문으로 채워 응답
+    questions = assemble_question_set(index, resume_data, 5, require_match=not degraded)
+    if not questions:
+        return None
+
+    created_at = datetime.utcnow()
+    interview_id = await create_interview_questions({
+        "unique_key": unique_key,
+        "provider": SOURCE_QUESTION_BANK,
+        "model": None,
+        "source": SOURCE_QUESTION_BANK,  # 은행 수집 대상에서 제외
+        "degraded": degraded,
+        "questions": questions,
+        "created_at": created_at,
+        "resume_id": resume_data["id"],
+        "session_id": f"{unique_key}_{SOURCE_QUESTION_BANK}_{int(created_at.timestamp())}"
+    })
+    return {
+        "interview_id": interview_id,
+        "resume_id": resume_data["id"],
+        "unique_key": unique_key,
+        "provider": SOURCE_QUESTION_BANK,
+        "model": None,
+        "questions": questions,
+        "generated_at": created_at,
+        "reused": False,
+        "source": SOURCE_QUESTION_BANK,
+        "degraded": degraded
+    }
+
+async def generate_interview_questions_service(unique_key: str, provider: Optional[str] = None,
+                                               force: bool = False, candidates: Optional[int] = None,
+                                               fast: bool = False,
+                                               near_duplicate: Optional[str] = None) -> Dict[str, Any]:
+    """
+    면접 질문 생성 서비스 함수
+
+    프롬프트 입력 지문이 같은 기존 결과가 있으면 LLM을 호출하지 않고 반환 (force=True면 항상 재생성)
+    candidates가 5보다 크면 후보를 한 번에 과생성한 뒤 MMR로 다양한 5개를 선택
+    fast=True이거나 모든 LLM 제공자가 장애 상태면 질문 은행에서 구성 (구성할 수 없으면 LLM 호출)
+    near_duplicate='reuse'면 유사 이력서의 결과를 그대로, 'draft'면 초안으로 넘겨 바뀐 질문만 생성
+    """
+    try:
+        mode = resolve_near_duplicate_mode(near_duplicate)
+    except ValueError as e:
+        raise InterviewErrors.validation_error("near_duplicate", str(e))
+
     try:
-        logger.error(f"Starting interview questions generation for {unique_key}")
+        logger.debug("Starting interview questions generation for %s", unique_key)
         
         # 이력서 조회
-        try:
-            resume_data = await get_resume_by_unique_key(unique_key)
-            logger.error(f"Resume data retrieved successfully")
-            logger.error(f"Resume data type: {type(resume_data)}")
-            
-            if not resume_data:
-                raise Exception("Resume not found")
-                
-        except Exception as e:
-            logger.error(f"Error in get_resume_by_unique_key: {e}")
-            raise e
+        resume_data = await get_resume_by_unique_key(unique_key)
+        if not resume_data:
+            raise Exception("Resume not found")
         
-        # 이력서 데이터 포맷팅 (면접 질문용)
-        try:
-            formatted_data = format_resume_for_interview(resume_data)
-            logger.error(f"Resume data formatted successfully: {formatted_data}")
-        except Exception as e:
-            logger.error(f"Error in format_resume_for_interview: {e}")
-            logger.error(f"Resume data causing error: {resume_data}")
-            raise e
+        # 프롬프트 입력과 프롬프트(내용 해시, 변형)가 바뀌지 않았으면 기존 결과 재사용
+        fingerprint = prompt_input_fingerprint("interview", resume_data)
+        if not force:
+            prompt_version = selected_prompt_version(get_prompt_loader('interview'), 'interview_questions.yaml',
+                                                     unique_key)
+            existing = await get_interview_by_fingerprint(unique_key, fingerprint, prompt_version)
+            observe_cache_lookup("generation", existing is not None)
+            if existing:
+                logger.info("Reusing interview questions for %s (fingerprint %s)", unique_key, fingerprint)
+                return _reused_interview_response(existing)
         
-        # 지정된 LLM 클라이언트 가져오기
-        llm_client = registry.get_client(provider)
-        logger.error(f"Requested provider: {provider}")
-        logger.error(f"LLM client: {llm_client}")
-        logger.error(f"Available clients: {registry.get_available_clients()}")
+        # 유사 이력서(같은 템플릿, 한 줄만 고친 재제출 등)의 기존 결과 활용
+        draft_match = None
+        if mode in (NEAR_DUPLICATE_REUSE, NEAR_DUPLICATE_DRAFT) and not force:
+            match = await get_interview_by_near_duplicate(resume_data)
+            if match and mode == NEAR_DUPLICATE_REUSE:
+                logger.info("Reusing interview questions of near-duplicate %s for %s (similarity %s)",
+                            match['unique_key'], unique_key, match['similarity'])
+                return await _near_duplicate_reuse_response(resume_data, unique_key, fingerprint, match)
+            draft_match = match
         
-        if not llm_client:
-            # 폴백 시도
-            llm_client = registry.get_client_with_fallback()
-            if llm_client:
-                logger.warning(f"Provider '{provider}' not available, using fallback: {llm_client.name}")
-            else:
-                raise Exception(f"LLM provider '{provider}' not available and no fallback available")
+        # 질문 은행 (fast 모드 또는 모든 제공자 장애 시 degraded 모드)
+        degraded = not fast and settings.question_bank_degraded_enabled and await llm_router.aall_circuits_open()
+        if fast or degraded:
+            banked = await _question_bank_response(resume_data, unique_key, degraded)
+            observe_cache_lookup("question_bank", banked is not None)
+            if banked:
+                logger.info("Served interview questions for %s from question bank (degraded=%s)", unique_key, degraded)
+                return banked
+            logger.info("Question bank could not serve %s, falling back to LLM", unique_key)
+        
+        # 이력서 데이터 포맷팅 (면접 질문용, 대형 이력서는 섹션별 요약 후 포맷팅)
+        resume_data = await condense_resume(resume_data)
+        formatted_data = format_resume_for_interview(resume_data)
         
         # 프롬프트 생성
-        try:
-            logger.error(f"About to create interview prompt with formatted_data: {formatted_data}")
-            messages = _create_interview_prompt(formatted_data)
-            logger.error(f"Interview prompt created successfully")
-        except Exception as e:
-            logger.error(f"Error in _create_interview_prompt: {e}")
-            logger.error(f"Formatted data causing error: {formatted_data}")
-            raise e
+        messages = _create_interview_prompt(formatted_data, unique_key)
+        # 초안 모드에서는 후보 과생성 없이 바뀐 질문만 생성
+        candidate_count = 0 if draft_match else resolve_candidate_count(candidates, 5)
+        messages = with_candidate_instruction(messages, candidate_count)
+        if draft_match:
+            messages[-1].content += draft_instruction(draft_match["document"]["questions"])
         
         # LLM 호출
-        try:
-            logger.error(f"About to call LLM with messages count: {len(messages)}")
-            response_text = await llm_client.ainvoke(messages)
-            logger.error(f"LLM response received: {type(response_text)}, length: {len(response_text) if response_text else 0}")
-            logger.error(f"LLM response content (first 200 chars): {response_text[:200] if response_text else 'None'}")
-        except Exception as e:
-            logger.error(f"Error in LLM call: {e}")
-            raise e
+        # 요청마다 지연 시간/오류율 기반으로 제공자 선택 (provider 지정 시 우선 사용)
+        # 지원 제공자는 구조화 출력으로 호출 (초안 응답은 keep/questions 형식이라 제외)
+        response_model = None if draft_match else InterviewQuestionsOutput
+        response_text, llm_client = await llm_router.ainvoke(messages, preferred=provider,
+                                                             response_model=response_model)
+        structured = uses_structured_output(llm_client, response_model)
+        provider = llm_client.name
+        prompt_tokens = estimate_message_tokens(messages, provider)
+        logger.info("Interview LLM response for %s (%s, prompt tokens %d, cache hit %d, response chars %d)",
+                    unique_key, provider, prompt_tokens, cached_prompt_tokens(response_text), len(response_text))
         
         # JSON 파싱 - 공통 유틸리티 사용
+        # 잘렸거나 일부 질문이 스키마에 맞지 않으면 전체 재생성 대신 부족한 질문만 이어받기/재요청
         try:
-            parsed_response = parse_llm_json_response(
-                response_text,
+            parse_options = dict(
+                response_model=response_model,
                 expected_keys=["questions"],
                 fallback_keys={"questions": ["interview_questions", "result"]}
             )
+            if draft_match:
+                parsed_response, repair = parse_structured_response(response_text, llm_client, **parse_options), None
+            else:
+                parsed_response, repair = await repair_response(
+                    "interview", response_text, llm_client, messages, InterviewQuestion, 5, **parse_options
+                )
             
             # 질문 추출 (다양한 응답 형태 처리)
-            if isinstance(parsed_response, list):
+            if draft_match and isinstance(parsed_response, dict) and "keep" in parsed_response:
+                # 초안 응답: 유지할 초안 번호 + 새로 생성한 질문만
+                questions = merge_draft_response(draft_match["document"]["questions"], parsed_response)
+            elif isinstance(parsed_response, list):
                 # LLM이 직접 질문 배열로 응답한 경우: [{...}, {...}, ...]
                 questions = parsed_response
-                logger.error(f"Questions found as direct array: count: {len(questions)}")
             elif isinstance(parsed_response, dict):
                 # LLM이 올바른 스키마로 응답한 경우: {"questions": [...]}
                 # 공통 파싱에서 이미 키 매핑 처리됨
                 questions = parsed_response.get("questions", [])
-                logger.error(f"Questions extracted from dict: count: {len(questions)}")
             else:
-                logger.error(f"Unexpected response type: {type(parsed_response)}")
+                logger.warning("Unexpected interview response type: %s", type(parsed_response).__name__)
                 questions = []
             
             if not isinstance(questions, list) or len(questions) == 0:
                 raise ValueError("No valid questions in response")
             
+            llm_router.record_parse(llm_client, True, structured=structured)
+            
+            # 과생성한 후보에서 기술 스택 관련도/다양성 기준으로 5개 선택
+            selection = None
+            if candidate_count:
+                selection = select_diverse_questions(questions, resume_data, 5, settings.interview_mmr_lambda)
+                questions = selection["questions"]
+                logger.info("Selected %d/%d candidates in %sms", len(questions), candidate_count, selection['selection_ms'])
+            
             # 데이터베이스에 저장 (Provider 및 Model 정보 포함)
             interview_data = {
                 "unique_key": unique_key,
                 "provider": provider,
                 "model": llm_client._model,  # 실제 사용된 모델명 저장
+                "prompt_tokens": prompt_tokens,  # 입력 토큰 수 (로컬 추정)
+                "cached_prompt_tokens": cached_prompt_tokens(response_text),  # 제공자 프롬프트 캐시 적중 토큰
+                "prompt_version": prompt_version_of(messages),  # 프롬프트 이름/버전/내용 해시 (폴백 프롬프트: None)
+                "input_fingerprint": fingerprint,  # 프롬프트 입력 지문 (재사용 판단)
                 "questions": questions[:5],  # 최대 5개
+                "candidate_count": candidate_count or None,  # 과생성 후보 수 (사용 안 함: None)
+                "selected_indices": selection["indices"] if selection else None,
+                "draft_from": _near_duplicate_source(draft_match) if draft_match else None,
+                "repair": repair,  # 잘림 이어받기/항목 재요청 내역 (복구 안 함: None)
                 "created_at": datetime.utcnow(),
                 "resume_id": resume_data["id"],
                 "session_id": f"{unique_key}_{provider}_{int(datetime.utcnow().timestamp())}"
@@ -195,13 +344,135 @@ async def generate_interview_questions_service(unique_key: str, provider: str =
                 "provider": provider,
                 "model": llm_client._model,
                 "questions": questions[:5],
-                "generated_at": datetime.utcnow()
+                "generated_at": datetime.utcnow(),
+                "reused": False,
+                "source": "llm",
+                "near_duplicate": _near_duplicate_source(draft_match) if draft_match else None
             }
             
         except (json.JSONDecodeError, ValueError, KeyError) as e:
-            logger.error(f"Failed to parse LLM response: {e}")
+            logger.warning("Failed to parse interview LLM response for %s: %s", unique_key, e)
+            llm_router.record_parse(llm_client, False, structured=structured)
             raise Exception("Failed to generate interview questions")
         
     except Exception as e:
-        logger.error(f"Error generating interview questions: {e}")
-        raise e
\ No newline at end of file
+        logger.error("Error generating interview questions for %s: %s", unique_key, e)
+        raise e
+
+async def generate_career_bundle_service(unique_key: str, mode: Optional[str] = None,
+                                         provider: Optional[str] = None, force: bool = False) -> Dict[str, Any]:
+    """
+    커리어 번들 생성 서비스 함수
+    이력서를 한 번만 조회/포맷팅하고 면접 질문과 학습 경로를 함께 생성해 두 컬렉션에 저장
+    (두 결과 모두 프롬프트 입력 지문이 같은 기존 결과가 있으면 재사용, force=True면 항상 재생성)
+    """
+    resume_data = await get_resume_by_unique_key(unique_key)
+    if not resume_data:
+        raise Exception("Resume not found")
+
+    fingerprints = compute_prompt_fingerprints(resume_data)
+    if not force:
+        versions = bundle_prompt_versions()
+        existing_interview = await get_interview_by_fingerprint(unique_key, fingerprints["interview"],
+                                                                versions["interview"])
+        existing_learning = await get_learning_by_fingerprint(unique_key, fingerprints["learning"],
+                                                              versions["learning"])
+        if existing_interview and existing_learning:
+            logger.info(f"Reusing career bundle for {unique_key}")
+            return {
+                "resume_id": resume_data["id"],
+                "unique_key": unique_key,
+                "mode": existing_interview.get("bundle_mode"),
+                "interview": {"interview_id": existing_interview.pop("id"), **existing_interview},
+                "learning": {"learning_id": existing_learning.pop("id"), **existing_learning},
+                "elapsed_ms": 0,
+                "generated_at": existing_interview.get("created_at"),
+                "reused": True
+            }
+
+    bundle = await generate_career_bundle(resume_data, mode or settings.career_bundle_default_mode, provider)
+    interview, learning = bundle["interview"], bundle["learning"]
+    created_at = datetime.utcnow()
+
+    interview_id = await create_interview_questions({
+        "unique_key": unique_key,
+        "provider": interview["provider"],
+        "model": interview["model"],
+        "prompt_tokens": interview["prompt_tokens"],
+        "cached_prompt_tokens": interview.get("cached_prompt_tokens", 0),
+        "prompt_version": interview.get("prompt_version"),
+        "input_fingerprint": fingerprints["interview"],
+        "questions": interview["questions"],
+        "created_at": created_at,
+        "resume_id": resume_data["id"],
+        "session_id": f"{unique_key}_{interview['provider']}_{int(created_at.timestamp())}",
+        "bundle_mode": bundle["mode"]
+    })
+    learning_id = await create_learning_path({
+        "unique_key": unique_key,
+        "provider": learning["provider"],
+        "model": learning["model"],
+        "prompt_tokens": learning["prompt_tokens"],
+        "cached_prompt_tokens": learning.get("cached_prompt_tokens", 0),
+        "prompt_version": learning.get("prompt_version"),
+        "analysis": learning["analysis"],
+        "summary": learning["summary"],
+        "input_fingerprint": fingerprints["learning"],
+        "learning_paths": learning["learning_paths"],
+        "created_at": created_at,
+        "resume_id": resume_data["id"],
+        "session_id": f"{unique_key}_{learning['provider']}_{int(created_at.timestamp())}",
+        "bundle_mode": bundle["mode"]
+    })
+
+    return {
+        "resume_id": resume_data["id"],
+        "unique_key": unique_key,
+        "mode": bundle["mode"],
+        "interview": {"interview_id": interview_id, **interview},
+        "learning": {"learning_id": learning_id, **learning},
+        "elapsed_ms": bundle["elapsed_ms"],
+        "generated_at": bundle["generated_at"],
+        "reused": False
+    }
+
+async def regenerate_interview_question_service(unique_key: str, index: Optional[int] = None,
+                                                topic: Optional[str] = None,
+                                                provider: Optional[str] = None) -> Dict[str, Any]:
+    """
+    면접 질문 하나만 재생성 (index 또는 topic으로 지정)
+
+    최신 면접 질문의 나머지 질문을 컨텍스트로 넘겨 중복을 피하고,
+    교체되지 않은 질문을 공유하는 새 리비전으로 저장
+    """
+    resume_data = await get_resume_by_unique_key(unique_key)
+    if not resume_data:
+        raise Exception("Resume not found")
+
+    interview = await get_interview_by_unique_key(unique_key)
+    if not interview:
+        raise InterviewErrors.not_found(unique_key)
+
+    try:
+        position = resolve_item_index("interview", interview["questions"], index, topic)
+    except ValueError as e:
+        raise InterviewErrors.validation_error("index" if topic is None else "topic", str(e))
+
+    regenerated = await regenerate_item("interview", resume_data, interview["questions"], position, provider)
+    revision = build_revision("interview", interview, position, regenerated)
+    interview_id = await create_interview_questions(revision)
+    logger.info(f"Regenerated question {position} for {unique_key} (revision {revision['revision']})")
+
+    return {
+        "interview_id": interview_id,
+        "parent_id": revision["parent_id"],
+        "revision": revision["revision"],
+        "resume_id": resume_data["id"],
+        "unique_key": unique_key,
+        "regenerated_index": position,
+        "provider": regenerated["provider"],
+        "model": regenerated["model"],
+        "prompt_tokens": regenerated["prompt_tokens"],
+        "questions": revision["questions"],
+        "generated_at": revision["created_at"]
+    }
@@ -3,65 +3,49 @@ Interview Service Celery Tasks
 진행률 추적과 함께 면접 질문 생성 작업 처리
 """
 
-import json
-import redis
 from typing import Dict, Any
 from datetime import datetime
 from celery import current_task, current_app
-from shared.config.base import BaseAppSettings
+from celery.exceptions import SoftTimeLimitExceeded
 from shared.database.connection import get_database
-from shared.utils.resume_formatter import format_resume_for_interview
-from shared.utils.json_parser import parse_llm_json_response
-from shared.llm.registry import registry
+from shared.utils.resume_formatter import format_resume_for_interview, prompt_input_fingerprint, compute_prompt_fingerprints
+from shared.llm.structured import uses_structured_output
+from shared.llm.prompt_cache import mark_cache_prefix
+from shared.llm.base import cached_prompt_tokens
+from shared.generation.repair import repair_response
+from shared.llm.router import llm_router
+from shared.llm.summarizer import condense_resume
+from shared.generation.career_bundle import generate_career_bundle, bundle_prompt_versions
+from shared.generation.diversity import resolve_candidate_count, with_candidate_instruction, select_diverse_questions
+from shared.generation.question_bank import (
+    get_question_bank,
+    assemble_question_set,
+    update_question_bank as update_question_bank_index,
+    SOURCE_QUESTION_BANK
+)
+from shared.utils.token_estimator import estimate_message_tokens
 from shared.prompts.loader import get_prompt_loader
+from shared.prompts.experiments import select_prompt
+from shared.jobs import bulk as bulk_jobs
+from shared.utils.metrics import observe_cache_lookup
+from shared.jobs.progress import set_task_progress, get_task_progress_from_redis
+from shared.jobs.warmup import finish_generation
+from shared.database.generations import find_reusable_generation, serialize_generation
+from shared.jobs.cancellation import TaskCancelledError, raise_if_cancelled, run_cancellable
 from shared.utils.logger import setup_logger
 from config import settings
+from src.schemas import InterviewQuestion, InterviewQuestionsOutput
 
 logger = setup_logger("interview-service", settings.log_level)
-settings = BaseAppSettings()
-
-# Redis 직접 연결 (progress tracking용)
-redis_client = redis.from_url("redis://redis:6379/0")
-
-def set_task_progress(task_id: str, progress_data: Dict[str, Any]):
-    """Redis에 직접 task progress 저장"""
-    try:
-        key = f"task_progress:{task_id}"
-        redis_client.setex(key, 3600, json.dumps(progress_data))  # 1시간 TTL
-        logger.info(f"Progress saved for task {task_id}: {progress_data.get('progress', 0)}%")
-    except Exception as e:
-        logger.error(f"Failed to save progress for task {task_id}: {e}")
-
-def get_task_progress_from_redis(task_id: str) -> Dict[str, Any]:
-    """Redis에서 직접 task progress 조회"""
-    try:
-        key = f"task_progress:{task_id}"
-        data = redis_client.get(key)
-        if data:
-            return json.loads(data)
-        return {
-            'task_id': task_id,
-            'state': 'PENDING',
-            'progress': 0,
-            'message': '작업 대기 중...',
-            'stage': 'pending'
-        }
-    except Exception as e:
-        logger.error(f"Failed to get progress for task {task_id}: {e}")
-        return {
-            'task_id': task_id,
-            'state': 'ERROR',
-            'progress': 0,
-            'message': f'진행률 조회 오류: {str(e)}',
-            'stage': 'error'
-        }
 
 @current_app.task(bind=True, name='tasks.generate_interview_questions_async')
-def generate_interview_questions_async(self, resume_id: str) -> Dict[str, Any]:
+def generate_interview_questions_async(self, resume_id: str, force: bool = False, candidates: int = None) -> Dict[str, Any]:
     """
     비동기로 면접 질문 생성
-    진행률 업데이트와 함께 처리
+    진행률 업데이트와 함께 처리 (프롬프트 입력 지문이 같은 기존 결과가 있으면 재사용, force=True면 재생성)
+    candidates가 5보다 크면 후보를 과생성한 뒤 MMR로 다양한 5개를 선택
     """
+    generated_fingerprint = None
     try:
         # 1. 이력서 데이터 로드 (10%)
         set_task_progress(self.request.id, {
@@ -80,7 +64,65 @@ def generate_interview_questions_async(self, resume_id: str) -> Dict[str, Any]:
         if not resume_data:
             raise ValueError(f"Resume not found: {resume_id}")
         
-        logger.info(f"Resume data retrieved for {resume_id}")
+        logger.debug("Resume data retrieved for %s", resume_id)
+        
+        # 컴파일된 프롬프트 로드 (파일이 바뀌었으면 재로드된 버전)
+        # 프롬프트 변형 실험 중이면 이력서별로 배정된 변형
+        prompt, experiment = select_prompt(get_prompt_loader('interview'), 'interview_questions.yaml', resume_id)
+        prompt_version = {**prompt.version_info, **(experiment or {})}
+        
+        # 프롬프트 입력과 프롬프트(내용 해시, 변형)가 바뀌지 않았으면 LLM 호출 없이 기존 결과 재사용
+        fingerprint = prompt_input_fingerprint("interview", resume_data)
+        existing = None if force else find_reusable_generation(db.interview_questions, resume_id, fingerprint,
+                                                               prompt_version)
+        if not force:
+            observe_cache_lookup("generation", existing is not None)
+        if existing:
+            result = {**serialize_generation(existing), "reused": True, "task_id": self.request.id}
+            generated_fingerprint = fingerprint
+            set_task_progress(self.request.id, {
+                'state': 'SUCCESS',
+                'progress': 100,
+                'message': '이력서 변경 사항이 없어 기존 면접 질문을 재사용했습니다',
+                'stage': 'completed',
+                'timestamp': datetime.now().isoformat(),
+                'result': result
+            })
+            logger.info(f"Reused interview generation for {resume_id} (fingerprint {fingerprint})")
+            return result
+        
+        # 모든 LLM 제공자가 장애 상태면 질문 은행에서 구성 (degraded 모드)
+        if settings.question_bank_degraded_enabled and llm_router.all_circuits_open():
+            index = get_question_bank()
+            questions = assemble_question_set(index, resume_data, 5, require_match=False) if index else []
+            observe_cache_lookup("question_bank", bool(questions))
+            if questions:
+                result = {
+                    "resume_id": resume_id,
+                    "unique_key": resume_id,
+                    "questions": questions,
+                    "generated_at": datetime.now().isoformat(),
+                    "created_at": datetime.utcnow(),
+                    "model_used": SOURCE_QUESTION_BANK,
+                    "source": SOURCE_QUESTION_BANK,
+                    "degraded": True,
+                    "reused": False,
+                    "task_id": self.request.id
+                }
+                result["_id"] = db.interview_questions.insert_one(result).inserted_id
+                result = serialize_generation(result)
+                set_task_progress(self.request.id, {
+                    'state': 'SUCCESS',
+                    'progress': 100,
+                    'message': 'AI 제공자 장애로 질문 은행에서 면접 질문을 구성했습니다',
+                    'stage': 'completed',
+                    'timestamp': datetime.now().isoformat(),
+                    'result': result
+                })
+                logger.warning(f"All LLM providers unavailable, served {resume_id} from question bank")
+                return result
+        
+        raise_if_cancelled(self.request.id)
         
         # 2. 프롬프트 생성 (30%)
         set_task_progress(self.request.id, {
@@ -91,23 +133,22 @@ def generate_interview_questions_async(self, resume_id: str) -> Dict[str, Any]:
             'timestamp': datetime.now().isoformat()
         })
         
-        # 이력서 데이터 포맷팅
+        # 이력서 데이터 포맷팅 (대형 이력서는 섹션별 요약 후 포맷팅)
+        resume_data = run_cancellable(condense_resume(resume_data), self.request.id)
         formatted_data = format_resume_for_interview(resume_data)
         
-        # 프롬프트 로드 및 렌더링
-        loader = get_prompt_loader('interview')
-        config = loader.load_prompt_config('interview_questions.yaml')
-        
         # 시스템 및 휴먼 프롬프트 렌더링
-        system_prompt = loader.render_system_prompt(config)
-        human_prompt = loader.render_human_prompt(config, formatted_data)
+        system_prompt = prompt.system_prompt
+        human_prompt = prompt.render_human(formatted_data)
         
         prompt_messages = [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": human_prompt}
         ]
         
-        logger.info(f"Prompt generated for {resume_id}")
+        logger.debug("Prompt generated for %s", resume_id)
+        
+        raise_if_cancelled(self.request.id)
         
         # 3. LLM API 호출 (70%)
         set_task_progress(self.request.id, {
@@ -118,21 +159,29 @@ def generate_interview_questions_async(self, resume_id: str) -> Dict[str, Any]:
             'timestamp': datetime.now().isoformat()
         })
         
-        # LLM 클라이언트 가져오기 (폴백 전략 적용)
-        llm_client = registry.get_client_with_fallback()
-        
         # LangChain 메시지 변환
         from langchain_core.messages import SystemMessage, HumanMessage
         langchain_messages = []
         for msg in prompt_messages:
             if msg["role"] == "system":
-                langchain_messages.append(SystemMessage(content=msg["content"]))
+                # 요청마다 동일한 시스템 프롬프트는 제공자 프롬프트 캐시용 고정 접두부
+                langchain_messages.append(mark_cache_prefix(SystemMessage(content=msg["content"])))
             elif msg["role"] == "user":
                 langchain_messages.append(HumanMessage(content=msg["content"]))
+        candidate_count = resolve_candidate_count(candidates, 5)
+        langchain_messages = with_candidate_instruction(langchain_messages, candidate_count)
+        
+        # LLM 호출 (취소 신호 수신 시 진행 중인 호출 중단)
+        # 제공자는 지연 시간/오류율 기반 라우터가 선택 (실패 시 다음 제공자로 폴백)
+        # 지원 제공자는 구조화 출력으로 호출 (스키마 검증 한 번으로 파싱)
+        response_content, llm_client = run_cancellable(
+            llm_router.ainvoke(langchain_messages, response_model=InterviewQuestionsOutput), self.request.id
+        )
+        structured = uses_structured_output(llm_client, InterviewQuestionsOutput)
+        prompt_tokens = estimate_message_tokens(langchain_messages, llm_client.name)
+        logger.info("LLM response received for %s (prompt tokens: %d)", resume_id, prompt_tokens)
         
-        # 동기 LLM 호출 (책임 분리)
-        response_content = llm_client.invoke(langchain_messages)
-        logger.info(f"LLM response received for {resume_id}")
+        raise_if_cancelled(self.request.id)
         
         # 4. 응답 파싱 (90%)
         set_task_progress(self.request.id, {
@@ -143,28 +192,57 @@ def generate_interview_questions_async(self, resume_id: str) -> Dict[str, Any]:
             'timestamp': datetime.now().isoformat()
         })
         
-        # JSON 파싱 (문자열 응답 처리)
-        parsed_response = parse_llm_json_response(
-            response_content,
-            expected_keys=["questions"],
-            fallback_keys={"interview_questions": ["questions"]}
-        )
+        # JSON 파싱 (문자열 응답 처리) - 파싱 성공률은 라우터 통계에 반영
+        # 잘렸거나 일부 항목이 스키마에 맞지 않으면 부족한 항목만 이어받기/재요청
+        try:
+            parsed_response, repair = run_cancellable(repair_response(
+                "interview", response_content, llm_client, langchain_messages, InterviewQuestion, 5,
+                response_model=InterviewQuestionsOutput,
+                expected_keys=["questions"],
+                fallback_keys={"interview_questions": ["questions"]}
+            ), self.request.id)
+        except ValueError:
+            llm_router.record_parse(llm_client, False, structured=structured)
+            raise
+        llm_router.record_parse(llm_client, bool(parsed_response.get("questions")), structured=structured)
+        
+        # 과생성한 후보에서 기술 스택 관련도/다양성 기준으로 5개 선택
+        questions = parsed_response.get("questions", [])
+        selection = None
+        if candidate_count and questions:
+            selection = select_diverse_questions(questions, resume_data, 5, settings.interview_mmr_lambda)
+            questions = selection["questions"]
+            logger.info("Selected %d/%d candidates in %sms", len(questions), candidate_count, selection['selection_ms'])
         
         # 결과 구성
         result = {
             "resume_id": resume_id,
-            "questions": parsed_response.get("questions", []),
+            "unique_key": resume_id,
+            "questions": questions,
+            "candidate_count": candidate_count or None,
+            "selected_indices": selection["indices"] if selection else None,
             "generated_at": datetime.now().isoformat(),
-            "model_used": llm_client.name,
+            "created_at": datetime.utcnow(),  # 조회 API 최신순 정렬 기준
+            "provider": llm_client.name,
+            "model": llm_client._model,  # 실제 사용된 모델명 저장
+            "model_used": llm_client._model,
+            "prompt_tokens": prompt_tokens,
+            "cached_prompt_tokens": cached_prompt_tokens(response_content),  # 제공자 프롬프트 캐시 적중 토큰
+            "prompt_version": prompt_version,  # 프롬프트 이름/버전/내용 해시, 실험 변형
+            "input_fingerprint": fingerprint,  # 프롬프트 입력 지문 (재사용 판단)
+            "repair": repair,  # 잘림 이어받기/항목 재요청 내역 (복구 안 함: None)
+            "reused": False,
             "task_id": self.request.id
         }
         
         # 5. DB 저장 및 완료 (100%)
         interview_collection = db.interview_questions
         insert_result = interview_collection.insert_one(result)
+        generated_fingerprint = fingerprint
         
-        # ObjectId를 문자열로 변환하여 serialization 문제 해결
+        # ObjectId/datetime을 문자열로 변환하여 serialization 문제 해결
         result["_id"] = str(insert_result.inserted_id)
+        result["created_at"] = result["created_at"].isoformat()
         
         set_task_progress(self.request.id, {
             'state': 'SUCCESS',
@@ -178,6 +256,30 @@ def generate_interview_questions_async(self, resume_id: str) -> Dict[str, Any]:
         logger.info(f"Interview questions generated successfully for {resume_id}")
         return result
         
+    except TaskCancelledError as exc:
+        logger.info(f"Generation cancelled for {resume_id}: {exc}")
+        set_task_progress(self.request.id, {
+            'state': 'CANCELLED',
+            'progress': 0,
+            'message': '작업이 취소되었습니다',
+            'stage': 'cancelled',
+            'timestamp': datetime.now().isoformat()
+        })
+        raise
+
+    except SoftTimeLimitExceeded:
+        logger.error(f"Generation timed out for {resume_id} after {settings.celery_task_soft_time_limit}s")
+        set_task_progress(self.request.id, {
+            'state': 'FAILURE',
+            'progress': 0,
+            'message': '면접 질문 생성 시간이 초과되었습니다',
+            'stage': 'failed',
+            'error': 'timeout',
+            'timestamp': datetime.now().isoformat()
+        })
+        # 그대로 다시 발생 (대량 작업 레인이 시간 제한 초과를 구분해 남은 항목을 건너뜀)
+        raise
+
     except Exception as exc:
         error_message = f"면접 질문 생성 중 오류가 발생했습니다: {str(exc)}"
         logger.error(f"Error generating interview questions for {resume_id}: {exc}")
@@ -193,9 +295,205 @@ def generate_interview_questions_async(self, resume_id: str) -> Dict[str, Any]:
         # Use simple exception to avoid serialization issues
         raise RuntimeError(str(exc))
 
+    finally:
+        # 워밍업 중복 방지 키 해제, 성공 시 프롬프트 입력 지문 기록
+        finish_generation("interview", resume_id, self.request.id, generated_fingerprint)
+
+@current_app.task(bind=True, name='tasks.generate_career_bundle_async')
+def generate_career_bundle_async(self, resume_id: str, mode: str = None, force: bool = False) -> Dict[str, Any]:
+    """
+    비동기로 커리어 번들(면접 질문 + 학습 경로) 생성
+    이력서를 한 번만 불러와 두 생성을 동시에(또는 단일 호출로) 처리하고 두 컬렉션에 저장
+    두 결과 모두 프롬프트 입력 지문이 같은 기존 생성이 있으면 재사용 (force=True면 항상 재생성)
+    """
+    mode = mode or settings.career_bundle_default_mode
+    try:
+        set_task_progress(self.request.id, {
+            'state': 'PROGRESS',
+            'progress': 10,
+            'message': '이력서 데이터를 불러오고 있습니다...',
+            'stage': 'loading_resume',
+            'timestamp': datetime.now().isoformat()
+        })
+        
+        db = get_database()
+        resume_data = db.resumes.find_one({"unique_key": resume_id})
+        if not resume_data:
+            raise ValueError(f"Resume not found: {resume_id}")
+        
+        fingerprints = compute_prompt_fingerprints(resume_data)
+        if not force:
+            versions = bundle_prompt_versions()
+            interview_doc = find_reusable_generation(db.interview_questions, resume_id, fingerprints["interview"],
+                                                     versions["interview"])
+            learning_doc = find_reusable_generation(db.learning_paths, resume_id, fingerprints["learning"],
+                                                    versions["learning"])
+            if interview_doc and learning_doc:
+                logger.info(f"Reusing career bundle for {resume_id}")
+                result = {
+                    "resume_id": resume_id,
+                    "mode": interview_doc.get("bundle_mode"),
+                    "interview": serialize_generation(interview_doc),
+                    "learning": serialize_generation(learning_doc),
+                    "elapsed_ms": 0,
+                    "generated_at": serialize_generation(interview_doc).get("generated_at"),
+                    "reused": True,
+                    "task_id": self.request.id
+                }
+                set_task_progress(self.request.id, {
+                    'state': 'SUCCESS',
+                    'progress': 100,
+                    'message': '이력서 내용이 바뀌지 않아 기존 결과를 사용합니다',
+                    'stage': 'completed',
+                    'timestamp': datetime.now().isoformat(),
+                    'result': result
+                })
+                return result
+        
+        raise_if_cancelled(self.request.id)
+        
+        set_task_progress(self.request.id, {
+            'state': 'PROGRESS',
+            'progress': 40,
+            'message': 'AI가 면접 질문과 학습 경로를 함께 생성하고 있습니다... (최대 60초 소요)',
+            'stage': 'calling_llm',
+            'timestamp': datetime.now().isoformat()
+        })
+        
+        bundle = run_cancellable(generate_career_bundle(resume_data, mode), self.request.id)
+        
+        raise_if_cancelled(self.request.id)
+        
+        set_task_progress(self.request.id, {
+            'state': 'PROGRESS',
+            'progress': 90,
+            'message': '결과를 저장하고 있습니다...',
+            'stage': 'processing_response',
+            'timestamp': datetime.now().isoformat()
+        })
+        
+        generated_at = datetime.now().isoformat()
+        interview, learning = bundle["interview"], bundle["learning"]
+        interview_result = {
+            "resume_id": resume_id,
+            "questions": interview["questions"],
+            "generated_at": generated_at,
+            "provider": interview["provider"],
+            "model": interview["model"],
+            "model_used": interview["model"],
+            "prompt_tokens": interview["prompt_tokens"],
+            "cached_prompt_tokens": interview.get("cached_prompt_tokens", 0),
+            "input_fingerprint": fingerprints["interview"],
+            "unique_key": resume_id,
+            "created_at": datetime.utcnow(),
+            "bundle_mode": bundle["mode"],
+            "task_id": self.request.id
+        }
+        learning_result = {
+            "resume_id": resume_id,
+            "analysis": learning["analysis"],
+            "summary": learning["summary"],
+            "learning_paths": learning["learning_paths"],
+            "generated_at": generated_at,
+            "provider": learning["provider"],
+            "model": learning["model"],
+            "model_used": learning["model"],
+            "prompt_tokens": learning["prompt_tokens"],
+            "cached_prompt_tokens": learning.get("cached_prompt_tokens", 0),
+            "input_fingerprint": fingerprints["learning"],
+            "unique_key": resume_id,
+            "created_at": datetime.utcnow(),
+            "bundle_mode": bundle["mode"],
+            "task_id": self.request.id
+        }
+        interview_result["_id"] = str(db.interview_questions.insert_one(interview_result).inserted_id)
+        learning_result["_id"] = str(db.learning_paths.insert_one(learning_result).inserted_id)
+        interview_result = serialize_generation(interview_result)
+        learning_result = serialize_generation(learning_result)
+        
+        result = {
+            "resume_id": resume_id,
+            "mode": bundle["mode"],
+            "interview": interview_result,
+            "learning": learning_result,
+            "elapsed_ms": bundle["elapsed_ms"],
+            "generated_at": generated_at,
+            "reused": False,
+            "task_id": self.request.id
+        }
+        
+        set_task_progress(self.request.id, {
+            'state': 'SUCCESS',
+            'progress': 100,
+            'message': '면접 질문과 학습 경로 생성이 완료되었습니다!',
+            'stage': 'completed',
+            'timestamp': datetime.now().isoformat(),
+            'result': result
+        })
+        
+        logger.info(f"Career bundle generated for {resume_id} (mode={bundle['mode']}, {bundle['elapsed_ms']}ms)")
+        return result
+        
+    except TaskCancelledError as exc:
+        logger.info(f"Career bundle cancelled for {resume_id}: {exc}")
+        set_task_progress(self.request.id, {
+            'state': 'CANCELLED',
+            'progress': 0,
+            'message': '작업이 취소되었습니다',
+            'stage': 'cancelled',
+            'timestamp': datetime.now().isoformat()
+        })
+        raise
+
+    except SoftTimeLimitExceeded:
+        logger.error(f"Career bundle timed out for {resume_id} after {settings.celery_task_soft_time_limit}s")
+        set_task_progress(self.request.id, {
+            'state': 'FAILURE',
+            'progress': 0,
+            'message': '면접 질문/학습 경로 생성 시간이 초과되었습니다',
+            'stage': 'failed',
+            'error': 'timeout',
+            'timestamp': datetime.now().isoformat()
+        })
+        # 그대로 다시 발생 (대량 작업 레인이 시간 제한 초과를 구분해 남은 항목을 건너뜀)
+        raise
+
+    except Exception as exc:
+        logger.error(f"Error generating career bundle for {resume_id}: {exc}")
+        set_task_progress(self.request.id, {
+            'state': 'FAILURE',
+            'progress': 0,
+            'message': f"면접 질문/학습 경로 생성 중 오류가 발생했습니다: {str(exc)}",
+            'stage': 'failed',
+            'error': str(exc),
+            'timestamp': datetime.now().isoformat()
+        })
+        raise RuntimeError(str(exc))
+
+@current_app.task(name='tasks.update_question_bank')
+def update_question_bank() -> Dict[str, Any]:
+    """
+    저장된 면접 질문을 질문 은행 색인에 증분 수집 (체크포인트 이후 생성분만)
+    """
+    return update_question_bank_index(get_database())
+
 @current_app.task(name='tasks.get_task_progress')
 def get_task_progress(task_id: str) -> Dict[str, Any]:
     """
     작업 진행 상황 조회 (Redis 직접 사용)
     """
     return get_task_progress_from_redis(task_id)
+
+@current_app.task(name='tasks.run_bulk_lane')
+def run_bulk_lane(job_id: str, unique_keys: list) -> Dict[str, Any]:
+    """
+    대량 작업 레인 실행 (레인 내 이력서들을 순차 처리)
+    """
+    return bulk_jobs.run_bulk_lane(job_id, unique_keys, generate_interview_questions_async)
+
+@current_app.task(name='tasks.finalize_bulk_job')
+def finalize_bulk_job(lane_results: list, job_id: str) -> Dict[str, Any]:
+    """
+    대량 작업 종료 처리 (chord 콜백) - 요약 레코드 저장
+    """
+    return bulk_jobs.finalize_bulk_job(job_id, lane_results, get_database())
@@ -9,7 +9,10 @@ from contextlib import asynccontextmanager
 
 from config import settings
 from database import connect_to_mongo, close_mongo_connection
+from shared.utils.startup import warm_up_service, shut_down_service
 from src.routes import router
+from shared.utils.metrics import install_metrics
+from shared.utils.tracing import install_tracing
 from shared.utils.error_handler import (
     APIError,
     handle_api_error,
@@ -23,9 +26,11 @@ async def lifespan(app: FastAPI):
     """애플리케이션 생명주기 관리"""
     # 시작 시
     await connect_to_mongo()
+    await warm_up_service("learning", ["learning_path.yaml"])
     yield
     # 종료 시
     await close_mongo_connection()
+    await shut_down_service()
 
 # FastAPI 애플리케이션 생성
 app = FastAPI(
@@ -57,6 +62,12 @@ app.add_exception_handler(HTTPException, handle_http_exception)
 app.add_exception_handler(RequestValidationError, handle_validation_error)
 app.add_exception_handler(Exception, handle_general_exception)
 
+# 메트릭 (라우트별 지연 시간/동시 요청 수, /metrics 엔드포인트)
+install_metrics(app, settings.service_name)
+
+# 분산 트레이싱 (요청 스팬, traceparent를 Celery 작업 헤더로 전파)
+install_tracing(app, settings.service_name)
+
 # 라우터 등록
 app.include_router(router, prefix=settings.api_prefix, tags=["learning"])
 
@@ -11,27 +11,39 @@ from sse_starlette.sse import EventSourceResponse
 from datetime import datetime
 import json
 
-from .service import generate_learning_path_service
-from .schemas import LearningPathCreateResponse
-from database import get_learning_collection
-from tasks import get_task_progress_from_redis
+from typing import Optional
+from .service import generate_learning_path_service, regenerate_learning_path_item_service
+from .schemas import LearningPathCreateResponse, LearningPathRegenerateResponse, BulkJobRequest
+from database import get_learning_collection, get_resumes_collection
 from shared.celery_app import celery_app
 from config import settings
-from shared.utils.error_handler import LearningErrors, ResumeErrors
+from shared.utils.error_handler import LearningErrors, ResumeErrors, CeleryErrors
+from shared.jobs.progress import get_task_progress_from_redis, mark_task_queued, TASK_TERMINAL_STATES
+from shared.jobs.cancellation import cancel_task
+from shared.jobs.bulk import (
+    BULK_JOB_TYPES,
+    BULK_JOB_TERMINAL_STATES,
+    build_resume_filter,
+    create_bulk_job,
+    get_bulk_job_progress,
+    cancel_bulk_job
+)
 
 logger = setup_logger("learning-service", settings.log_level)
 
 router = APIRouter()
 
 @router.post("/{unique_key}/learning-path", response_model=LearningPathCreateResponse)
-async def generate_learning_path(unique_key: str):
+async def generate_learning_path(unique_key: str, force: bool = False, near_duplicate: Optional[str] = None):
     """특정 unique_key의 이력서를 기반으로 학습 경로 생성 (여러 번 생성 가능)
     
     Args:
         unique_key: 이력서 고유 키
+        force: True면 프롬프트 입력이 같은 기존 결과가 있어도 재생성
+        near_duplicate: 유사 이력서 결과 활용 방식 off|reuse|draft (학습 경로는 draft를 off로 처리)
     
     Note:
-        기본 LLM: Gemini (폴백: Gemini -> OpenAI -> Claude)
+        LLM 제공자: 지연 시간/오류율 기반 라우터가 선택 (실패 시 다음 제공자로 폴백)
     """
     try:
         # URL 디코딩 및 입력 검증
@@ -55,21 +67,20 @@ async def generate_learning_path(unique_key: str):
         if re.search(r'[\x00-\x1f\x7f-\x9f]', cleaned_key):
             raise LearningErrors.validation_error("unique_key", "Unique key contains invalid characters")
         
-        # Gemini 고정 사용
-        provider = "gemini"
-        
-        # 학습 경로 생성
-        result = await generate_learning_path_service(cleaned_key, provider)
+        # 학습 경로 생성 (제공자는 LLM 라우터가 요청마다 선택)
+        result = await generate_learning_path_service(cleaned_key, force=force, near_duplicate=near_duplicate)
         
         return {
             "message": "Learning path generated successfully",
             "unique_key": cleaned_key,
-            "provider": provider,
+            "provider": result["provider"],
             "model": result.get("model", "unknown"),  # 사용된 모델 정보 포함
             "analysis": result.get("analysis", {"strengths": [], "weaknesses": []}),
             "summary": result["summary"],
             "learning_paths": result["learning_paths"],
-            "generated_at": datetime.utcnow()
+            "generated_at": result.get("generated_at") or datetime.utcnow(),
+            "reused": result.get("reused", False),
+            "near_duplicate": result.get("near_duplicate")
         }
         
     except Exception as e:
@@ -79,6 +90,33 @@ async def generate_learning_path(unique_key: str):
             raise ResumeErrors.not_found(unique_key)
         raise LearningErrors.generation_failed(unique_key, str(e))
 
+@router.post("/{unique_key}/learning-path/regenerate", response_model=LearningPathRegenerateResponse)
+async def regenerate_learning_path_item(unique_key: str, index: Optional[int] = None, topic: Optional[str] = None):
+    """최신 학습 경로 중 항목 하나만 재생성해 새 리비전으로 저장
+    
+    Args:
+        unique_key: 이력서 고유 키
+        index: 교체할 항목 위치 (0부터 시작)
+        topic: 교체할 항목의 제목/카테고리 키워드 (index 대신 사용, 처음 일치하는 항목)
+    """
+    try:
+        cleaned_key = unquote(unique_key).strip()
+        if not cleaned_key:
+            raise LearningErrors.validation_error("unique_key", "Unique key cannot be empty")
+        if len(cleaned_key) > 200:
+            raise LearningErrors.validation_error("unique_key", "Unique key is too long (max 200 characters)")
+        if re.search(r'[\x00-\x1f\x7f-\x9f]', cleaned_key):
+            raise LearningErrors.validation_error("unique_key", "Unique key contains invalid characters")
+        
+        return await regenerate_learning_path_item_service(cleaned_key, index=index, topic=topic)
+        
+    except Exception as e:
+        if hasattr(e, 'error_code'):  # APIError인 경우
+            raise
+        if "Resume not found" in str(e):
+            raise ResumeErrors.not_found(unique_key)
+        raise LearningErrors.generation_failed(unique_key, str(e))
+
 @router.get("/{unique_key}/learning-path", response_model=dict)
 async def get_learning_path(unique_key: str):
     """unique_key로 학습 경로 조회"""
@@ -143,8 +181,9 @@ async def health_check():
 
 @router.get("/debug/llm")
 async def debug_llm():
-    """LLM Registry 디버깅 (Learning Service용)"""
+    """LLM Registry / 라우터 디버깅 (Learning Service용)"""
     from shared.llm.registry import registry
+    from shared.llm.router import llm_router
     
     try:
         available_clients = registry.get_available_clients()
@@ -169,7 +208,8 @@ async def debug_llm():
         return {
             "service": "learning-service",
             "available_clients": available_clients,
-            "client_status": client_status
+            "client_status": client_status,
+            "router": llm_router.describe()
         }
         
     except Exception as e:
@@ -181,14 +221,21 @@ async def debug_llm():
 # =================================
 
 @router.post("/async/{unique_key}/learning-path", response_model=dict)
-async def generate_learning_path_async_api(unique_key: str):
+async def generate_learning_path_async_api(unique_key: str, force: bool = False):
     """
     비동기로 학습 경로 생성 시작
-    즉시 task_id를 반환하고 백그라운드에서 처리
+    즉시 task_id를 반환하고 백그라운드에서 처리 (force=True면 기존 결과가 있어도 재생성)
     """
     try:
         # Celery 작업 시작 (full task name 사용)
-        task = celery_app.send_task('learning_service.tasks.generate_learning_path_async', args=[unique_key], queue='learning_queue')
+        task = celery_app.send_task(
+            'learning_service.tasks.generate_learning_path_async',
+            args=[unique_key],
+            kwargs={'force': force},
+            queue='learning_queue.v2',
+            expires=settings.celery_task_expires  # 큐에서 오래 대기한 작업은 실행하지 않고 폐기
+        )
+        await asyncio.to_thread(mark_task_queued, task.id)  # 취소 요청 시 알 수 없는 작업 ID와 구분
         logger.info(f"Async learning path generation started for {unique_key}, task_id: {task.id}")
         return {
             "task_id": task.id,
@@ -229,6 +276,30 @@ async def get_task_progress_api(task_id: str):
             detail=f"Failed to get task progress: {str(e)}"
         )
 
+@router.post("/tasks/{task_id}/cancel", response_model=dict)
+async def cancel_task_api(task_id: str):
+    """
+    작업 취소
+    큐에서 대기 중인 작업은 폐기하고, 실행 중인 작업은 다음 단계 전환 시점 또는
+    진행 중인 LLM 호출 도중에 중단
+    
+    Args:
+        task_id: 작업 고유 ID
+        
+    Returns:
+        cancelled: 취소 요청 여부 (이미 종료됐거나 알 수 없는 작업이면 False)
+        state: 현재 상태 (CANCELLED, CANCELLING, 종료 상태 또는 NOT_FOUND)
+    """
+    try:
+        # 동기 Redis/브로커 호출(취소 표시, revoke)은 이벤트 루프 밖에서
+        return await asyncio.to_thread(cancel_task, celery_app, task_id)
+    except Exception as e:
+        logger.error(f"Failed to cancel task {task_id}: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to cancel task: {str(e)}"
+        )
+
 @router.get("/tasks/{task_id}/stream")
 async def stream_task_progress(task_id: str):
     """
@@ -251,8 +322,8 @@ async def stream_task_progress(task_id: str):
                 # Redis에서 진행 상황 조회
                 progress_data = get_task_progress_from_redis(task_id)
                 
-                # 완료되었거나 실패했으면 종료
-                if progress_data.get('state') in ['SUCCESS', 'FAILURE']:
+                # 완료, 실패 또는 취소되었으면 종료
+                if progress_data.get('state') in TASK_TERMINAL_STATES:
                     break
                 
                 # 진행률이 변경된 경우만 이벤트 전송
@@ -283,6 +354,18 @@ async def stream_task_progress(task_id: str):
                     "event": "completed",
                     "data": json.dumps(final_data)
                 }
+            elif progress_data.get('state') == 'CANCELLED':
+                yield {
+                    "event": "cancelled",
+                    "data": json.dumps({
+                        'task_id': task_id,
+                        'state': 'CANCELLED',
+                        'progress': progress_data.get('progress', 0),
+                        'message': progress_data.get('message', '작업이 취소되었습니다'),
+                        'stage': 'cancelled',
+                        'timestamp': datetime.now().isoformat()
+                    })
+                }
             else:  # FAILURE
                 error_data = {
                     'task_id': task_id,
@@ -320,3 +403,135 @@ async def stream_task_progress(task_id: str):
             }
 
     return EventSourceResponse(event_stream())
+
+# =================================
+# 대량(Bulk) 생성 작업 API 엔드포인트들
+# =================================
+
+@router.post("/bulk/jobs", response_model=dict)
+async def create_bulk_job_api(request: BulkJobRequest):
+    """
+    여러 이력서에 대한 학습 경로 생성 작업을 한 번에 시작
+    레인 단위로 동시 실행 수를 제한하며, 작업 전체 진행률을 하나의 job_id로 추적
+    
+    Args:
+        request: 대상 이력서 키 목록 또는 조회 조건, 작업 유형
+        
+    Returns:
+        job_id: 대량 작업 추적을 위한 고유 ID
+        total: 대상 이력서 수
+        concurrency: 동시 실행 레인 수
+    """
+    if request.job_type not in BULK_JOB_TYPES:
+        raise LearningErrors.validation_error("job_type", f"Unsupported job type: {request.job_type}")
+    
+    unique_keys = [key.strip() for key in request.unique_keys if key and key.strip()]
+    
+    try:
+        # 조회 조건이 있으면 대상 이력서 키 추가
+        if request.resume_query:
+            resume_filter = build_resume_filter(request.resume_query.model_dump())
+            cursor = get_resumes_collection().find(resume_filter, {"unique_key": 1}).limit(request.resume_query.limit)
+            unique_keys.extend([resume["unique_key"] async for resume in cursor])
+    except Exception as e:
+        logger.error(f"Failed to resolve bulk job targets: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to resolve bulk job targets: {str(e)}")
+    
+    if not unique_keys:
+        raise LearningErrors.validation_error("unique_keys", "No target resumes for bulk job")
+    
+    if len(set(unique_keys)) > settings.bulk_job_max_items:
+        raise LearningErrors.validation_error(
+            "unique_keys", f"Too many target resumes (max {settings.bulk_job_max_items})"
+        )
+    
+    try:
+        # 동기 Redis/브로커 호출은 이벤트 루프 밖에서
+        job = await asyncio.to_thread(create_bulk_job, celery_app, request.job_type, unique_keys, request.concurrency)
+    except Exception as e:
+        logger.error(f"Failed to start bulk job: {e}")
+        raise CeleryErrors.queue_error(BULK_JOB_TYPES[request.job_type]["queue"], str(e))
+    
+    return {
+        **job,
+        "status": "pending",
+        "message": "대량 생성 작업이 시작되었습니다"
+    }
+
+@router.get("/bulk/jobs/{job_id}/progress", response_model=dict)
+async def get_bulk_job_progress_api(job_id: str):
+    """
+    대량 작업 진행률 조회 (완료/실패/진행 중 건수 및 ETA)
+    """
+    progress = await asyncio.to_thread(get_bulk_job_progress, job_id)
+    if progress["state"] == "NOT_FOUND":
+        raise CeleryErrors.bulk_job_not_found(job_id)
+    return progress
+
+@router.post("/bulk/jobs/{job_id}/cancel", response_model=dict)
+async def cancel_bulk_job_api(job_id: str):
+    """
+    대량 작업 취소 (대기 중인 항목은 건너뜀)
+    """
+    if not await asyncio.to_thread(cancel_bulk_job, job_id):
+        progress = await asyncio.to_thread(get_bulk_job_progress, job_id)
+        if progress["state"] == "NOT_FOUND":
+            raise CeleryErrors.bulk_job_not_found(job_id)
+        return {"job_id": job_id, "cancelled": False, "state": progress["state"]}
+    
+    return {"job_id": job_id, "cancelled": True, "state": "CANCELLING"}
+
+@router.get("/bulk/jobs/{job_id}/stream")
+async def stream_bulk_job_progress(job_id: str):
+    """
+    SSE로 대량 작업 진행률 실시간 스트리밍
+    """
+    
+    async def event_stream():
+        """SSE 이벤트 스트림 생성기"""
+        try:
+            last_snapshot = None
+            
+            while True:
+                progress_data = await asyncio.to_thread(get_bulk_job_progress, job_id)
+                
+                if progress_data["state"] in BULK_JOB_TERMINAL_STATES + ("NOT_FOUND",):
+                    break
+                
+                # 집계 값이 변경된 경우만 이벤트 전송
+                snapshot = (progress_data["done"], progress_data["failed"], progress_data["skipped"],
+                            progress_data["running"], progress_data["state"])
+                if snapshot != last_snapshot:
+                    yield {
+                        "event": "progress",
+                        "data": json.dumps(progress_data)
+                    }
+                    last_snapshot = snapshot
+                
+                await asyncio.sleep(1)
+            
+            yield {
+                "event": "completed" if progress_data["state"] != "NOT_FOUND" else "error",
+                "data": json.dumps(progress_data)
+            }
+            
+            yield {
+                "event": "close",
+                "data": json.dumps({
+                    "message": "Stream completed",
+                    "timestamp": datetime.now().isoformat()
+                })
+            }
+            
+        except Exception as e:
+            yield {
+                "event": "error",
+                "data": json.dumps({
+                    'job_id': job_id,
+                    'error': str(e),
+                    'timestamp': datetime.now().isoformat()
+                })
+            }
+    
+    return EventSourceResponse(event_stream())
+
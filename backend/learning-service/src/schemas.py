@@ -3,7 +3,7 @@ Learning Service 스키마 정의
 """
 
 from pydantic import BaseModel, Field
-from typing import List
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 class LearningPathAnalysis(BaseModel):
@@ -20,6 +20,12 @@ class LearningPathItem(BaseModel):
     resources: List[str] = Field(default=[], description="추천 학습 리소스/방법")
     link: str = Field(..., description="관련 학습 링크")
 
+class LearningPathOutput(BaseModel):
+    """이력서 분석과 학습 경로 생성 결과 (LLM 구조화 출력 스키마)"""
+    analysis: LearningPathAnalysis = Field(..., description="이력서 장점/단점 분석 결과")
+    summary: str = Field(..., description="전체 학습 전략 요약")
+    learning_paths: List[LearningPathItem] = Field(..., description="학습 경로 목록")
+
 class LearningPathResponse(BaseModel):
     """학습 경로 추천 응답 스키마"""
     resume_id: str = Field(..., description="이력서 ID")
@@ -44,3 +50,32 @@ class LearningPathCreateResponse(BaseModel):
     summary: str = Field(..., description="학습 경로 전체 요약")
     learning_paths: List[LearningPathItem] = Field(..., description="생성된 학습 경로 목록")
     generated_at: datetime = Field(..., description="생성 시간")
+    reused: bool = Field(default=False, description="프롬프트 입력이 같은 기존 결과 재사용 여부")
+    near_duplicate: Optional[Dict[str, Any]] = Field(default=None, description="결과를 재사용한 유사 이력서 (unique_key, learning_id, similarity)")
+
+class LearningPathRegenerateResponse(BaseModel):
+    """학습 경로 항목 부분 재생성 응답 스키마"""
+    learning_id: str = Field(..., description="새 리비전 ID")
+    parent_id: str = Field(..., description="교체 전 리비전 ID")
+    revision: int = Field(..., description="리비전 번호")
+    unique_key: str = Field(..., description="이력서 고유 키")
+    regenerated_index: int = Field(..., description="재생성된 항목 위치")
+    provider: str = Field(..., description="사용된 LLM 제공자")
+    model: Optional[str] = Field(None, description="사용된 LLM 모델")
+    prompt_tokens: int = Field(..., description="입력 토큰 수 (로컬 추정)")
+    learning_paths: List[LearningPathItem] = Field(..., description="교체 후 학습 경로 목록")
+    generated_at: datetime = Field(..., description="생성 시간")
+
+class BulkResumeQuery(BaseModel):
+    """대량 작업 대상 이력서 조회 조건"""
+    name: Optional[str] = Field(None, description="이력서 작성자 이름")
+    min_experience_months: Optional[int] = Field(None, description="최소 경력 (개월)", ge=0)
+    max_experience_months: Optional[int] = Field(None, description="최대 경력 (개월)", ge=0)
+    limit: int = Field(default=100, description="조회할 최대 이력서 수", ge=1, le=500)
+
+class BulkJobRequest(BaseModel):
+    """대량 학습 경로 생성 작업 요청 스키마"""
+    unique_keys: List[str] = Field(default=[], description="대상 이력서 고유 키 목록")
+    resume_query: Optional[BulkResumeQuery] = Field(None, description="대상 이력서 조회 조건 (unique_keys와 병합)")
+    job_type: str = Field(default="learning", description="작업 유형 (interview, learning)")
+    concurrency: Optional[int] = Field(None, description="최대 동시 실행 수 (설정 상한 적용)", ge=1)
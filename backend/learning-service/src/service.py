@@ -3,42 +3,47 @@ Learning Service 함수들
 """
 import json
 from shared.utils.logger import setup_logger
-from typing import Dict, List, Any
+from shared.utils.metrics import observe_cache_lookup
+from typing import Dict, List, Any, Optional
 from datetime import datetime
-from langchain_core.messages import SystemMessage, HumanMessage
-from shared.llm.registry import registry
-from shared.prompts.loader import get_prompt_loader
-from shared.utils.resume_formatter import format_resume_for_learning
-from shared.utils.json_parser import parse_llm_json_response
+from shared.llm.router import llm_router
+from shared.llm.base import cached_prompt_tokens
+from shared.llm.summarizer import condense_resume
+from shared.utils.token_estimator import estimate_message_tokens
+from shared.prompts.loader import get_prompt_loader, prompt_version_of
+from shared.prompts.experiments import select_prompt, selected_prompt_version
+from shared.utils.resume_formatter import format_resume_for_learning, prompt_input_fingerprint
+from shared.database.generations import find_reusable_generation
+from shared.generation.item_regeneration import resolve_item_index, regenerate_item, build_revision
+from shared.generation.near_duplicate import NEAR_DUPLICATE_REUSE, resolve_near_duplicate_mode, find_near_duplicate_generation
+from shared.utils.error_handler import LearningErrors
+from shared.llm.structured import uses_structured_output
+from shared.generation.repair import repair_response
 from database import get_resumes_collection, get_learning_collection
+from .schemas import LearningPathItem, LearningPathOutput
 from config import settings
     
 logger = setup_logger("learning-service", settings.log_level)
 
-def _create_learning_path_prompt(formatted_data: Dict[str, Any]) -> List:
+def _create_learning_path_prompt(formatted_data: Dict[str, Any], unique_key: Optional[str] = None) -> List:
     """학습 경로 추천 프롬프트 생성 (YAML 파일 기반)"""
     try:
         loader = get_prompt_loader('learning')
-        config = loader.load_prompt_config('learning_path.yaml')
+        # 변형 실험 중이면 이력서별 배정 변형
+        prompt, experiment = select_prompt(loader, 'learning_path.yaml', unique_key)
         
-        # 시스템 프롬프트 렌더링
-        system_prompt = loader.render_system_prompt(config)
-        
-        # 휴먼 프롬프트 렌더링  
-        human_prompt = loader.render_human_prompt(config, formatted_data)
-        
-        return [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=human_prompt)
-        ]
+        # 시스템 프롬프트(고정 접두부, 제공자 프롬프트 캐시 대상, 버전 표시) + 휴먼 프롬프트 렌더링
+        return prompt.build_messages(formatted_data, experiment)
         
     except Exception as e:
-        logger.error(f"프롬프트 생성 실패: {e}")
+        logger.warning("프롬프트 생성 실패, 폴백 프롬프트 사용: %s", e)
         # 폴백: 간단한 기본 프롬프트
         return _create_fallback_prompt(formatted_data)
 
 def _create_fallback_prompt(formatted_data: Dict[str, Any]) -> List:
     """YAML 로드 실패 시 사용할 폴백 프롬프트"""
+    from langchain_core.messages import SystemMessage, HumanMessage
+    
     system_prompt = """
 당신은 경험이 풍부한 커리어 코치이자 기술 멘토입니다.
 주어진 프로젝트 경험을 바탕으로 구직자의 역량을 강화하고 합격률을 높일 수 있는 개인 맞춤형 학습 경로를 제안해주세요.
@@ -81,10 +86,64 @@ def _create_fallback_prompt(formatted_data: Dict[str, Any]) -> List:
         HumanMessage(content=human_prompt)
     ]
 
-async def generate_learning_path_service(unique_key: str, provider: str = "gemini") -> Dict[str, Any]:
-    """학습 경로 생성 서비스 함수"""
+async def _near_duplicate_reuse_response(resume: Dict[str, Any], unique_key: str, fingerprint: str,
+                                         match: Dict[str, Any]) -> Dict[str, Any]:
+    """유사 이력서의 학습 경로를 이 이력서의 결과로 복사 저장 (다음 요청부터는 지문 재사용)"""
+    document = match["document"]
+    source = {
+        "unique_key": match["unique_key"],
+        "learning_id": str(document["_id"]),
+        "similarity": match["similarity"],
+    }
+    logger.info(f"Reusing learning path of near-duplicate {source['unique_key']} "
+                f"for {unique_key} (similarity {source['similarity']})")
+
+    created_at = datetime.utcnow()
+    learning_data = {
+        "unique_key": unique_key,
+        "provider": document.get("provider"),
+        "model": document.get("model"),
+        "prompt_tokens": 0,  # LLM 호출 없음
+        "input_fingerprint": fingerprint,
+        "analysis": document.get("analysis", {"strengths": [], "weaknesses": []}),
+        "summary": document.get("summary", ""),
+        "learning_paths": document["learning_paths"],
+        "reused_from": source,
+        "created_at": created_at,
+        "resume_id": str(resume["_id"]),
+        "session_id": f"{unique_key}_near_duplicate_{int(created_at.timestamp())}"
+    }
+    result = await get_learning_collection().insert_one(learning_data)
+
+    return {
+        "learning_id": str(result.inserted_id),
+        "resume_id": str(resume["_id"]),
+        "unique_key": unique_key,
+        "provider": learning_data["provider"] or "unknown",
+        "model": learning_data["model"] or "unknown",
+        "analysis": learning_data["analysis"],
+        "summary": learning_data["summary"],
+        "learning_paths": learning_data["learning_paths"],
+        "generated_at": created_at,
+        "reused": True,
+        "near_duplicate": source
+    }
+
+async def generate_learning_path_service(unique_key: str, provider: Optional[str] = None,
+                                         force: bool = False, near_duplicate: Optional[str] = None) -> Dict[str, Any]:
+    """
+    학습 경로 생성 서비스 함수
+
+    프롬프트 입력 지문이 같은 기존 결과가 있으면 LLM을 호출하지 않고 반환 (force=True면 항상 재생성)
+    near_duplicate='reuse'면 유사 이력서의 최신 학습 경로를 복사해 반환 (학습 경로는 초안 모드 미지원)
+    """
+    try:
+        mode = resolve_near_duplicate_mode(near_duplicate)
+    except ValueError as e:
+        raise LearningErrors.validation_error("near_duplicate", str(e))
+
     try:
-        logger.info(f"Starting learning path generation for {unique_key}")
+        logger.debug("Starting learning path generation for %s", unique_key)
         
         # 이력서 조회
         resumes_collection = get_resumes_collection()
@@ -93,33 +152,57 @@ async def generate_learning_path_service(unique_key: str, provider: str = "gemin
         if not resume:
             raise Exception("Resume not found")
         
-        # 지정된 LLM 클라이언트 가져오기
-        llm_client = registry.get_client(provider)
-        logger.info(f"Requested provider: {provider}")
-        logger.info(f"LLM client: {llm_client}")
-        logger.info(f"Available clients: {registry.get_available_clients()}")
-        
-        if not llm_client:
-            # 폴백 시도
-            llm_client = registry.get_client_with_fallback()
-            if llm_client:
-                logger.warning(f"Provider '{provider}' not available, using fallback: {llm_client.name}")
-            else:
-                raise Exception(f"LLM provider '{provider}' not available and no fallback available")
+        # 프롬프트 입력과 프롬프트(내용 해시, 변형)가 바뀌지 않았으면 기존 결과 재사용
+        fingerprint = prompt_input_fingerprint("learning", resume)
+        if not force:
+            prompt_version = selected_prompt_version(get_prompt_loader('learning'), 'learning_path.yaml', unique_key)
+            existing = await find_reusable_generation(get_learning_collection(), unique_key, fingerprint,
+                                                      prompt_version)
+            observe_cache_lookup("generation", existing is not None)
+            if existing:
+                logger.info("Reusing learning path for %s (fingerprint %s)", unique_key, fingerprint)
+                return {
+                    "learning_id": str(existing["_id"]),
+                    "resume_id": str(resume["_id"]),
+                    "unique_key": unique_key,
+                    "provider": existing.get("provider", "unknown"),
+                    "model": existing.get("model", "unknown"),
+                    "analysis": existing.get("analysis", {"strengths": [], "weaknesses": []}),
+                    "summary": existing.get("summary", ""),
+                    "learning_paths": existing["learning_paths"],
+                    "generated_at": existing.get("created_at"),
+                    "reused": True
+                }
+            
+            # 유사 이력서(같은 템플릿, 한 줄만 고친 재제출 등)의 기존 결과 재사용
+            if mode == NEAR_DUPLICATE_REUSE:
+                match = await find_near_duplicate_generation(get_learning_collection(), resume)
+                if match:
+                    return await _near_duplicate_reuse_response(resume, unique_key, fingerprint, match)
         
-        # 이력서 데이터 포맷팅 (학습 경로용)
+        # 이력서 데이터 포맷팅 (학습 경로용, 대형 이력서는 섹션별 요약 후 포맷팅)
+        resume = await condense_resume(resume)
         formatted_data = format_resume_for_learning(resume)
         
         # 프롬프트 생성
-        messages = _create_learning_path_prompt(formatted_data)
+        messages = _create_learning_path_prompt(formatted_data, unique_key)
         
-        # LLM 호출
-        response_text = await llm_client.ainvoke(messages)
+        # LLM 호출 (요청마다 지연 시간/오류율 기반으로 제공자 선택, provider 지정 시 우선 사용)
+        # 지원 제공자는 구조화 출력으로 호출 (스키마 검증 한 번으로 파싱)
+        response_text, llm_client = await llm_router.ainvoke(messages, preferred=provider,
+                                                             response_model=LearningPathOutput)
+        structured = uses_structured_output(llm_client, LearningPathOutput)
+        provider = llm_client.name
+        prompt_tokens = estimate_message_tokens(messages, provider)
+        logger.info("Learning LLM response for %s (%s, prompt tokens %d, cache hit %d, response chars %d)",
+                    unique_key, provider, prompt_tokens, cached_prompt_tokens(response_text), len(response_text))
         
         # JSON 파싱 - 공통 유틸리티 사용
+        # 잘렸거나 일부 경로가 스키마에 맞지 않으면 전체 재생성 대신 부족한 경로만 이어받기/재요청
         try:
-            parsed_response = parse_llm_json_response(
-                response_text,
+            parsed_response, repair = await repair_response(
+                "learning", response_text, llm_client, messages, LearningPathItem, 5,
+                response_model=LearningPathOutput,
                 expected_keys=["analysis", "summary", "learning_paths"],
                 fallback_keys={"learning_paths": ["paths", "recommendations"]}
             )
@@ -131,14 +214,21 @@ async def generate_learning_path_service(unique_key: str, provider: str = "gemin
             if not isinstance(learning_paths, list) or len(learning_paths) == 0:
                 raise ValueError("No valid learning paths in response")
             
+            llm_router.record_parse(llm_client, True, structured=structured)
+            
             # 데이터베이스에 저장 (Provider 및 Model 정보 포함)
             learning_data = {
                 "unique_key": unique_key,
                 "provider": provider,
                 "model": llm_client._model,  # 실제 사용된 모델명 저장
+                "prompt_tokens": prompt_tokens,  # 입력 토큰 수 (로컬 추정)
+                "cached_prompt_tokens": cached_prompt_tokens(response_text),  # 제공자 프롬프트 캐시 적중 토큰
+                "prompt_version": prompt_version_of(messages),  # 프롬프트 이름/버전/내용 해시 (폴백 프롬프트: None)
+                "input_fingerprint": fingerprint,  # 프롬프트 입력 지문 (재사용 판단)
                 "analysis": analysis,
                 "summary": summary,
                 "learning_paths": learning_paths[:8],  # 최대 8개
+                "repair": repair,  # 잘림 이어받기/항목 재요청 내역 (복구 안 함: None)
                 "created_at": datetime.utcnow(),
                 "resume_id": str(resume["_id"]),
                 "session_id": f"{unique_key}_{provider}_{int(datetime.utcnow().timestamp())}"
@@ -156,13 +246,56 @@ async def generate_learning_path_service(unique_key: str, provider: str = "gemin
                 "analysis": analysis,
                 "summary": summary,
                 "learning_paths": learning_paths[:8],  # 최대 8개
-                "generated_at": datetime.utcnow()
+                "generated_at": datetime.utcnow(),
+                "reused": False
             }
             
         except (json.JSONDecodeError, ValueError, KeyError) as e:
-            logger.error(f"Failed to parse LLM response: {e}")
+            logger.warning("Failed to parse learning LLM response for %s: %s", unique_key, e)
+            llm_router.record_parse(llm_client, False, structured=structured)
             raise Exception("Failed to generate learning path")
         
     except Exception as e:
-        logger.error(f"Error generating learning path for {unique_key}: {e}")
+        logger.error("Error generating learning path for %s: %s", unique_key, e)
         raise e
+
+async def regenerate_learning_path_item_service(unique_key: str, index: Optional[int] = None,
+                                                topic: Optional[str] = None,
+                                                provider: Optional[str] = None) -> Dict[str, Any]:
+    """
+    학습 경로 항목 하나만 재생성 (index 또는 topic으로 지정)
+
+    최신 학습 경로의 나머지 항목을 컨텍스트로 넘겨 중복을 피하고,
+    교체되지 않은 항목과 분석/요약을 공유하는 새 리비전으로 저장
+    """
+    resume = await get_resumes_collection().find_one({"unique_key": unique_key})
+    if not resume:
+        raise Exception("Resume not found")
+
+    learning_collection = get_learning_collection()
+    latest = await learning_collection.find_one({"unique_key": unique_key}, sort=[("created_at", -1)])
+    if not latest:
+        raise LearningErrors.not_found(unique_key)
+
+    try:
+        position = resolve_item_index("learning", latest["learning_paths"], index, topic)
+    except ValueError as e:
+        raise LearningErrors.validation_error("index" if topic is None else "topic", str(e))
+
+    regenerated = await regenerate_item("learning", resume, latest["learning_paths"], position, provider)
+    revision = build_revision("learning", latest, position, regenerated)
+    result = await learning_collection.insert_one(revision)
+    logger.info(f"Regenerated learning path item {position} for {unique_key} (revision {revision['revision']})")
+
+    return {
+        "learning_id": str(result.inserted_id),
+        "parent_id": revision["parent_id"],
+        "revision": revision["revision"],
+        "unique_key": unique_key,
+        "regenerated_index": position,
+        "provider": regenerated["provider"],
+        "model": regenerated["model"],
+        "prompt_tokens": regenerated["prompt_tokens"],
+        "learning_paths": revision["learning_paths"],
+        "generated_at": revision["created_at"]
+    }
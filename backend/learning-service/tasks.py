@@ -4,64 +4,39 @@ Learning Service Celery Tasks
 """
 
 from shared.utils.logger import setup_logger
-import json
-import redis
 from typing import Dict, Any
 from datetime import datetime
 from celery import current_task, current_app
-from shared.config.base import BaseAppSettings
+from celery.exceptions import SoftTimeLimitExceeded
 from shared.database.connection import get_database
-from shared.utils.resume_formatter import format_resume_for_learning
-from shared.utils.json_parser import parse_llm_json_response
-from shared.llm.registry import registry
+from shared.utils.resume_formatter import format_resume_for_learning, prompt_input_fingerprint
+from shared.llm.structured import uses_structured_output
+from shared.llm.prompt_cache import mark_cache_prefix
+from shared.llm.base import cached_prompt_tokens
+from shared.generation.repair import repair_response
+from shared.llm.router import llm_router
+from shared.llm.summarizer import condense_resume
+from shared.utils.token_estimator import estimate_message_tokens
 from shared.prompts.loader import get_prompt_loader
+from shared.prompts.experiments import select_prompt
+from shared.jobs import bulk as bulk_jobs
+from shared.utils.metrics import observe_cache_lookup
+from shared.jobs.progress import set_task_progress, get_task_progress_from_redis
+from shared.jobs.warmup import finish_generation
+from shared.database.generations import find_reusable_generation, serialize_generation
+from shared.jobs.cancellation import TaskCancelledError, raise_if_cancelled, run_cancellable
 from config import settings
+from src.schemas import LearningPathItem, LearningPathOutput
 
 logger = setup_logger("learning-service", settings.log_level)
-settings = BaseAppSettings()
-
-# Redis 직접 연결 (progress tracking용)
-redis_client = redis.from_url("redis://redis:6379/0")
-
-def set_task_progress(task_id: str, progress_data: Dict[str, Any]):
-    """Redis에 직접 task progress 저장"""
-    try:
-        key = f"task_progress:{task_id}"
-        redis_client.setex(key, 3600, json.dumps(progress_data))  # 1시간 TTL
-        logger.info(f"Progress saved for task {task_id}: {progress_data.get('progress', 0)}%")
-    except Exception as e:
-        logger.error(f"Failed to save progress for task {task_id}: {e}")
-
-def get_task_progress_from_redis(task_id: str) -> Dict[str, Any]:
-    """Redis에서 직접 task progress 조회"""
-    try:
-        key = f"task_progress:{task_id}"
-        data = redis_client.get(key)
-        if data:
-            return json.loads(data)
-        return {
-            'task_id': task_id,
-            'state': 'PENDING',
-            'progress': 0,
-            'message': '작업 대기 중...',
-            'stage': 'pending'
-        }
-    except Exception as e:
-        logger.error(f"Failed to get progress for task {task_id}: {e}")
-        return {
-            'task_id': task_id,
-            'state': 'ERROR',
-            'progress': 0,
-            'message': f'진행률 조회 오류: {str(e)}',
-            'stage': 'error'
-        }
 
 @current_app.task(bind=True, name='learning_service.tasks.generate_learning_path_async')
-def generate_learning_path_async(self, resume_id: str) -> Dict[str, Any]:
+def generate_learning_path_async(self, resume_id: str, force: bool = False) -> Dict[str, Any]:
     """
     비동기로 학습 경로 생성
-    진행률 업데이트와 함께 처리
+    진행률 업데이트와 함께 처리 (프롬프트 입력 지문이 같은 기존 결과가 있으면 재사용, force=True면 재생성)
     """
+    generated_fingerprint = None
     try:
         # 1. 이력서 데이터 로드 (10%)
         set_task_progress(self.request.id, {
@@ -80,7 +55,34 @@ def generate_learning_path_async(self, resume_id: str) -> Dict[str, Any]:
         if not resume_data:
             raise ValueError(f"Resume not found: {resume_id}")
 
-        logger.info(f"Resume data retrieved for {resume_id}")
+        logger.debug("Resume data retrieved for %s", resume_id)
+        
+        # 컴파일된 프롬프트 로드 (파일이 바뀌었으면 재로드된 버전)
+        # 프롬프트 변형 실험 중이면 이력서별로 배정된 변형
+        prompt, experiment = select_prompt(get_prompt_loader('learning'), 'learning_path.yaml', resume_id)
+        prompt_version = {**prompt.version_info, **(experiment or {})}
+
+        # 프롬프트 입력과 프롬프트(내용 해시, 변형)가 바뀌지 않았으면 LLM 호출 없이 기존 결과 재사용
+        fingerprint = prompt_input_fingerprint("learning", resume_data)
+        existing = None if force else find_reusable_generation(db.learning_paths, resume_id, fingerprint,
+                                                               prompt_version)
+        if not force:
+            observe_cache_lookup("generation", existing is not None)
+        if existing:
+            result = {**serialize_generation(existing), "reused": True, "task_id": self.request.id}
+            generated_fingerprint = fingerprint
+            set_task_progress(self.request.id, {
+                'state': 'SUCCESS',
+                'progress': 100,
+                'message': '이력서 변경 사항이 없어 기존 학습 경로를 재사용했습니다',
+                'stage': 'completed',
+                'timestamp': datetime.now().isoformat(),
+                'result': result
+            })
+            logger.info(f"Reused learning generation for {resume_id} (fingerprint {fingerprint})")
+            return result
+
+        raise_if_cancelled(self.request.id)
 
         # 2. 프롬프트 생성 (30%)
         set_task_progress(self.request.id, {
@@ -91,14 +93,13 @@ def generate_learning_path_async(self, resume_id: str) -> Dict[str, Any]:
             'timestamp': datetime.now().isoformat()
         })
 
-        # 이력서 데이터 포맷팅
+        # 이력서 데이터 포맷팅 (대형 이력서는 섹션별 요약 후 포맷팅)
+        resume_data = run_cancellable(condense_resume(resume_data), self.request.id)
         formatted_data = format_resume_for_learning(resume_data)
 
-        # 프롬프트 로드 및 렌더링
-        loader = get_prompt_loader('learning')
-        config = loader.load_prompt_config('learning_path.yaml')
-        system_prompt = loader.render_system_prompt(config)
-        human_prompt = loader.render_human_prompt(config, formatted_data)
+        # 프롬프트 렌더링
+        system_prompt = prompt.system_prompt
+        human_prompt = prompt.render_human(formatted_data)
 
         # LangChain 메시지 형식으로 변환
         prompt_messages = [
@@ -106,7 +107,9 @@ def generate_learning_path_async(self, resume_id: str) -> Dict[str, Any]:
             {"role": "user", "content": human_prompt}
         ]
 
-        logger.info(f"Prompt generated for {resume_id}")
+        logger.debug("Prompt generated for %s", resume_id)
+
+        raise_if_cancelled(self.request.id)
 
         # 3. LLM API 호출 (70%)
         set_task_progress(self.request.id, {
@@ -117,21 +120,27 @@ def generate_learning_path_async(self, resume_id: str) -> Dict[str, Any]:
             'timestamp': datetime.now().isoformat()
         })
 
-        # LLM 클라이언트 가져오기 (폴백 전략 적용)
-        llm_client = registry.get_client_with_fallback()
-
         # LangChain 메시지 변환
         from langchain_core.messages import SystemMessage, HumanMessage
         langchain_messages = []
         for msg in prompt_messages:
             if msg["role"] == "system":
-                langchain_messages.append(SystemMessage(content=msg["content"]))
+                # 요청마다 동일한 시스템 프롬프트는 제공자 프롬프트 캐시용 고정 접두부
+                langchain_messages.append(mark_cache_prefix(SystemMessage(content=msg["content"])))
             elif msg["role"] == "user":
                 langchain_messages.append(HumanMessage(content=msg["content"]))
 
-        # 동기 LLM 호출 (책임 분리)
-        response_content = llm_client.invoke(langchain_messages)
-        logger.info(f"LLM response received for {resume_id}")
+        # LLM 호출 (취소 신호 수신 시 진행 중인 호출 중단)
+        # 제공자는 지연 시간/오류율 기반 라우터가 선택 (실패 시 다음 제공자로 폴백)
+        # 지원 제공자는 구조화 출력으로 호출 (스키마 검증 한 번으로 파싱)
+        response_content, llm_client = run_cancellable(
+            llm_router.ainvoke(langchain_messages, response_model=LearningPathOutput), self.request.id
+        )
+        structured = uses_structured_output(llm_client, LearningPathOutput)
+        prompt_tokens = estimate_message_tokens(langchain_messages, llm_client.name)
+        logger.info("LLM response received for %s (prompt tokens: %d)", resume_id, prompt_tokens)
+
+        raise_if_cancelled(self.request.id)
 
         # 4. 응답 파싱 (90%)
         set_task_progress(self.request.id, {
@@ -142,12 +151,19 @@ def generate_learning_path_async(self, resume_id: str) -> Dict[str, Any]:
             'timestamp': datetime.now().isoformat()
         })
 
-        # JSON 파싱 (문자열 응답 처리) - analysis, summary 포함
-        parsed_response = parse_llm_json_response(
-            response_content,
-            expected_keys=["analysis", "summary", "learning_paths"],
-            fallback_keys={"paths": ["learning_paths"], "recommendations": ["learning_paths"]}
-        )
+        # JSON 파싱 (문자열 응답 처리) - analysis, summary 포함, 파싱 성공률은 라우터 통계에 반영
+        # 잘렸거나 일부 항목이 스키마에 맞지 않으면 부족한 항목만 이어받기/재요청
+        try:
+            parsed_response, repair = run_cancellable(repair_response(
+                "learning", response_content, llm_client, langchain_messages, LearningPathItem, 5,
+                response_model=LearningPathOutput,
+                expected_keys=["analysis", "summary", "learning_paths"],
+                fallback_keys={"paths": ["learning_paths"], "recommendations": ["learning_paths"]}
+            ), self.request.id)
+        except ValueError:
+            llm_router.record_parse(llm_client, False, structured=structured)
+            raise
+        llm_router.record_parse(llm_client, bool(parsed_response.get("learning_paths")), structured=structured)
 
         # 결과 구성 (service.py와 동일한 구조)
         analysis = parsed_response.get("analysis", {"strengths": [], "weaknesses": []})
@@ -157,21 +173,30 @@ def generate_learning_path_async(self, resume_id: str) -> Dict[str, Any]:
         result = {
             "resume_id": resume_id,
             "unique_key": resume_id,  # HTML에서 unique_key를 참조
-            "provider": "gemini",  # LLM 제공자 정보
-            "model": llm_client.name,  # HTML에서 model을 참조
+            "provider": llm_client.name,  # LLM 제공자 정보
+            "model": llm_client._model,  # 실제 사용된 모델명 저장 (HTML에서 model을 참조)
+            "prompt_tokens": prompt_tokens,
+            "cached_prompt_tokens": cached_prompt_tokens(response_content),  # 제공자 프롬프트 캐시 적중 토큰
+            "prompt_version": prompt_version,  # 프롬프트 이름/버전/내용 해시, 실험 변형
+            "input_fingerprint": fingerprint,  # 프롬프트 입력 지문 (재사용 판단)
             "analysis": analysis,      # HTML에서 필요한 analysis
             "summary": summary,        # HTML에서 필요한 summary
             "learning_paths": learning_paths,
+            "repair": repair,  # 잘림 이어받기/항목 재요청 내역 (복구 안 함: None)
             "generated_at": datetime.now().isoformat(),
+            "created_at": datetime.utcnow(),  # 조회 API 최신순 정렬 기준
+            "reused": False,
             "task_id": self.request.id
         }
 
         # 5. DB 저장 및 완료 (100%)
         learning_collection = db.learning_paths
         insert_result = learning_collection.insert_one(result)
+        generated_fingerprint = fingerprint
         
-        # ObjectId를 문자열로 변환하여 serialization 문제 해결
+        # ObjectId/datetime을 문자열로 변환하여 serialization 문제 해결
         result["_id"] = str(insert_result.inserted_id)
+        result["created_at"] = result["created_at"].isoformat()
 
         set_task_progress(self.request.id, {
             'state': 'SUCCESS',
@@ -185,6 +210,30 @@ def generate_learning_path_async(self, resume_id: str) -> Dict[str, Any]:
         logger.info(f"Learning path generated successfully for {resume_id}")
         return result
 
+    except TaskCancelledError as exc:
+        logger.info(f"Generation cancelled for {resume_id}: {exc}")
+        set_task_progress(self.request.id, {
+            'state': 'CANCELLED',
+            'progress': 0,
+            'message': '작업이 취소되었습니다',
+            'stage': 'cancelled',
+            'timestamp': datetime.now().isoformat()
+        })
+        raise
+
+    except SoftTimeLimitExceeded:
+        logger.error(f"Generation timed out for {resume_id} after {settings.celery_task_soft_time_limit}s")
+        set_task_progress(self.request.id, {
+            'state': 'FAILURE',
+            'progress': 0,
+            'message': '학습 경로 생성 시간이 초과되었습니다',
+            'stage': 'failed',
+            'error': 'timeout',
+            'timestamp': datetime.now().isoformat()
+        })
+        # 그대로 다시 발생 (대량 작업 레인이 시간 제한 초과를 구분해 남은 항목을 건너뜀)
+        raise
+
     except Exception as exc:
         error_message = f"학습 경로 생성 중 오류가 발생했습니다: {str(exc)}"
         logger.error(f"Error generating learning path for {resume_id}: {exc}")
@@ -200,9 +249,27 @@ def generate_learning_path_async(self, resume_id: str) -> Dict[str, Any]:
         # Use simple exception to avoid serialization issues
         raise RuntimeError(str(exc))
 
+    finally:
+        # 워밍업 중복 방지 키 해제, 성공 시 프롬프트 입력 지문 기록
+        finish_generation("learning", resume_id, self.request.id, generated_fingerprint)
+
 @current_app.task(name='learning_service.tasks.get_task_progress')
 def get_task_progress(task_id: str) -> Dict[str, Any]:
     """
     작업 진행 상황 조회 (Redis 직접 사용)
     """
     return get_task_progress_from_redis(task_id)
+
+@current_app.task(name='learning_service.tasks.run_bulk_lane')
+def run_bulk_lane(job_id: str, unique_keys: list) -> Dict[str, Any]:
+    """
+    대량 작업 레인 실행 (레인 내 이력서들을 순차 처리)
+    """
+    return bulk_jobs.run_bulk_lane(job_id, unique_keys, generate_learning_path_async)
+
+@current_app.task(name='learning_service.tasks.finalize_bulk_job')
+def finalize_bulk_job(lane_results: list, job_id: str) -> Dict[str, Any]:
+    """
+    대량 작업 종료 처리 (chord 콜백) - 요약 레코드 저장
+    """
+    return bulk_jobs.finalize_bulk_job(job_id, lane_results, get_database())
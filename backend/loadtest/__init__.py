@@ -0,0 +1,12 @@
+"""
+전체 스택 부하 테스트/벤치마크
+
+가짜 LLM 제공자로 API 서비스 3개와 Celery 워커를 실행하고, 시나리오별 작업 비율로 부하를 걸어
+작업별 p50/p95/p99 지연, 처리량, 오류율, 프로세스 자원 사용량을 측정해 커밋별 결과로 저장한다.
+
+사용법 (backend 디렉토리에서):
+    python -m loadtest list
+    python -m loadtest run mixed [--users 50] [--duration 60] [--set FAKE_LLM_LATENCY_MS=3000]
+    python -m loadtest run sse_storm --attach [--resume-url ... --interview-url ... --learning-url ...]
+    python -m loadtest compare <기준 커밋|파일> <비교 커밋|파일> [--scenario mixed] [--threshold 0.1]
+"""
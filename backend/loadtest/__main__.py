@@ -0,0 +1,133 @@
+"""
+부하 테스트 CLI (python -m loadtest)
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+from .resources import ResourceSampler
+from .results import (
+    RESULTS_DIR,
+    build_result,
+    compare_results,
+    format_comparison,
+    format_summary,
+    load_result,
+    resolve_result,
+    save_result,
+)
+from .runner import run_load
+from .scenarios import SCENARIOS, get_scenario
+from .stack import LocalStack, default_base_urls
+
+
+def _parse_overrides(pairs: List[str]) -> Dict[str, str]:
+    overrides = {}
+    for pair in pairs:
+        key, separator, value = pair.partition("=")
+        if not separator or not key:
+            raise SystemExit(f"--set expects KEY=VALUE, got '{pair}'")
+        overrides[key] = value
+    return overrides
+
+
+async def _drive(scenario: Dict, base_urls: Dict[str, str], seed: int, pids: Optional[Dict[str, int]]) -> Dict:
+    # SSE 구독자가 많은 시나리오도 연결 풀에서 막히지 않도록 연결 수 상한을 사용자 × 구독자 수로
+    limits = httpx.Limits(max_connections=scenario["users"] * (scenario["watchers"] + 1),
+                          max_keepalive_connections=scenario["users"])
+    clients = {name: httpx.AsyncClient(base_url=url, timeout=scenario["timeout"], limits=limits)
+               for name, url in base_urls.items()}
+    try:
+        sampler = ResourceSampler(pids) if pids and ResourceSampler.available() else None
+        return await run_load(scenario, clients, seed=seed, sampler=sampler)
+    finally:
+        for client in clients.values():
+            await client.aclose()
+
+
+def run(args) -> int:
+    scenario = get_scenario(args.scenario, users=args.users, duration=args.duration, watchers=args.watchers,
+                            timeout=args.timeout)
+    scenario["env"] = {**scenario["env"], **_parse_overrides(args.set)}
+    started_at = datetime.now(timezone.utc)
+
+    if args.attach:
+        if scenario["env"]:
+            print(f"warning: --attach ignores stack env overrides {scenario['env']} "
+                  "(apply them to the running stack yourself)", file=sys.stderr)
+        base_urls = {**default_base_urls(), **{name: url for name, url in
+                                               (("resume", args.resume_url), ("interview", args.interview_url),
+                                                ("learning", args.learning_url)) if url}}
+        summary = asyncio.run(_drive(scenario, base_urls, args.seed, None))
+    else:
+        with LocalStack(scenario["env"], api_workers=args.api_workers, worker_concurrency=args.worker_concurrency,
+                        log_dir=Path(args.output_dir) / "logs") as stack:
+            summary = asyncio.run(_drive(scenario, stack.base_urls, args.seed, stack.pids()))
+
+    result = build_result(scenario, summary, started_at, "attach" if args.attach else "local-stack")
+    print(format_summary(result))
+    if not args.no_save:
+        print(f"saved {save_result(result, Path(args.output_dir))}")
+    return 0
+
+
+def compare(args) -> int:
+    base = load_result(resolve_result(args.base, args.scenario, Path(args.output_dir)))
+    new = load_result(resolve_result(args.new, args.scenario, Path(args.output_dir)))
+    if base["scenario"]["name"] != new["scenario"]["name"]:
+        print(f"warning: comparing different scenarios ({base['scenario']['name']} vs {new['scenario']['name']})",
+              file=sys.stderr)
+    rows = compare_results(base, new, args.threshold)
+    print(f"{base['meta']['commit'][:10]} → {new['meta']['commit'][:10]} ({new['scenario']['name']})")
+    print(format_comparison(rows, regressions_only=args.regressions_only))
+    # 회귀가 있으면 실패 코드 (CI에서 기준 결과와 비교)
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m loadtest", description="전체 스택 부하 테스트/벤치마크")
+    parser.add_argument("--output-dir", default=str(RESULTS_DIR), help="결과 저장 디렉토리")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="시나리오 목록")
+
+    run_parser = commands.add_parser("run", help="시나리오 실행 후 결과 저장")
+    run_parser.add_argument("scenario", choices=sorted(SCENARIOS))
+    run_parser.add_argument("--users", type=int, help="가상 사용자 수 (기본값: 시나리오 설정)")
+    run_parser.add_argument("--duration", type=float, help="측정 시간(초)")
+    run_parser.add_argument("--watchers", type=int, help="비동기 작업당 SSE 구독자 수")
+    run_parser.add_argument("--timeout", type=float, help="요청/스트림 제한 시간(초)")
+    run_parser.add_argument("--seed", type=int, default=0, help="작업 선택/이력서 내용 난수 시드")
+    run_parser.add_argument("--set", action="append", default=[], metavar="KEY=VALUE",
+                            help="스택 환경 변수 오버라이드 (예: FAKE_LLM_LATENCY_MS=3000)")
+    run_parser.add_argument("--attach", action="store_true", help="스택을 실행하지 않고 실행 중인 서비스에 연결")
+    run_parser.add_argument("--resume-url")
+    run_parser.add_argument("--interview-url")
+    run_parser.add_argument("--learning-url")
+    run_parser.add_argument("--api-workers", type=int, default=1, help="서비스별 uvicorn 워커 수")
+    run_parser.add_argument("--worker-concurrency", type=int, default=2, help="Celery 워커별 동시 실행 수")
+    run_parser.add_argument("--no-save", action="store_true")
+
+    compare_parser = commands.add_parser("compare", help="두 결과 비교 (회귀가 있으면 종료 코드 1)")
+    compare_parser.add_argument("base", help="기준 결과 파일 또는 커밋 해시")
+    compare_parser.add_argument("new", help="비교할 결과 파일 또는 커밋 해시")
+    compare_parser.add_argument("--scenario", help="커밋 해시로 찾을 때 시나리오")
+    compare_parser.add_argument("--threshold", type=float, default=0.1, help="회귀 판정 상대 변화 (기본 10%%)")
+    compare_parser.add_argument("--regressions-only", action="store_true")
+
+    args = parser.parse_args(argv)
+    if args.command == "list":
+        for name, scenario in SCENARIOS.items():
+            print(f"{name:<15} users={scenario['users']:<4} duration={scenario['duration']}s  {scenario['description']}")
+        return 0
+    return run(args) if args.command == "run" else compare(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+부하 테스트 중 스택 프로세스 자원 사용량 (CPU %, RSS) 샘플링
+
+Linux /proc 기준이며, 프로세스마다 하위 프로세스(uvicorn 워커, Celery prefork 자식)까지 합산한다.
+/proc이 없는 환경에서는 빈 결과를 반환한다.
+"""
+
+import asyncio
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+PROC = Path("/proc")
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def _read_stat(pid: int) -> Optional[Tuple[int, float, int]]:
+    """(부모 pid, 누적 CPU 초, RSS 바이트) - 프로세스가 없으면 None"""
+    try:
+        raw = (PROC / str(pid) / "stat").read_text()
+    except OSError:
+        return None
+    # 두 번째 필드(comm)에 공백/괄호가 있을 수 있으므로 마지막 ')' 이후를 분리
+    fields = raw[raw.rfind(")") + 2:].split()
+    ppid, utime, stime, rss_pages = int(fields[1]), int(fields[11]), int(fields[12]), int(fields[21])
+    return ppid, (utime + stime) / _CLOCK_TICKS, rss_pages * _PAGE_SIZE
+
+
+def _children_by_parent() -> Dict[int, List[int]]:
+    children: Dict[int, List[int]] = {}
+    for entry in PROC.iterdir():
+        if entry.name.isdigit():
+            stat = _read_stat(int(entry.name))
+            if stat is not None:
+                children.setdefault(stat[0], []).append(int(entry.name))
+    return children
+
+
+def process_tree(root: int, children: Optional[Dict[int, List[int]]] = None) -> List[int]:
+    """root와 모든 하위 프로세스 pid"""
+    children = _children_by_parent() if children is None else children
+    tree, pending = [], [root]
+    while pending:
+        pid = pending.pop()
+        tree.append(pid)
+        pending.extend(children.get(pid, []))
+    return tree
+
+
+class ResourceSampler:
+    """이름별 프로세스 트리의 CPU/RSS를 주기적으로 기록"""
+
+    def __init__(self, pids: Dict[str, int], interval: float = 1.0):
+        self.pids = pids
+        self.interval = interval
+        self.samples: Dict[str, List[Dict[str, float]]] = {name: [] for name in pids}
+        self._last: Dict[str, Tuple[float, float]] = {}
+
+    @staticmethod
+    def available() -> bool:
+        return (PROC / "self" / "stat").exists()
+
+    def sample(self, now: float) -> None:
+        children = _children_by_parent()
+        for name, root in self.pids.items():
+            stats = [stat for stat in map(_read_stat, process_tree(root, children)) if stat is not None]
+            if not stats:
+                continue
+            cpu_seconds = sum(stat[1] for stat in stats)
+            rss = sum(stat[2] for stat in stats)
+            previous = self._last.get(name)
+            self._last[name] = (now, cpu_seconds)
+            if previous is None or now <= previous[0]:
+                continue
+            self.samples[name].append({
+                # 하위 프로세스가 종료되면 누적 시간이 줄어들 수 있으므로 0 미만은 버림
+                "cpu_percent": max(cpu_seconds - previous[1], 0.0) / (now - previous[0]) * 100,
+                "rss_mb": rss / 1024 / 1024,
+                "processes": len(stats),
+            })
+
+    async def run(self) -> None:
+        """취소될 때까지 샘플링 (asyncio 작업으로 실행)"""
+        if not self.available():
+            return
+        loop = asyncio.get_running_loop()
+        while True:
+            self.sample(loop.time())
+            await asyncio.sleep(self.interval)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """이름별 CPU 평균/최대(%, 코어 하나 = 100), 최대 RSS(MB), 최대 프로세스 수"""
+        result = {}
+        for name, samples in self.samples.items():
+            if not samples:
+                continue
+            cpu = [sample["cpu_percent"] for sample in samples]
+            result[name] = {
+                "cpu_percent_avg": round(sum(cpu) / len(cpu), 1),
+                "cpu_percent_max": round(max(cpu), 1),
+                "rss_mb_max": round(max(sample["rss_mb"] for sample in samples), 1),
+                "processes": max(sample["processes"] for sample in samples),
+            }
+        return result
@@ -0,0 +1,161 @@
+"""
+부하 테스트 결과 저장/비교
+
+- 결과는 <결과 디렉토리>/<시나리오>/<시각>-<커밋>.json으로 저장 (커밋 해시, 작업 트리 변경 여부 포함)
+- 비교 대상은 파일 경로 또는 커밋 해시(접두부) - 커밋이면 같은 시나리오의 그 커밋 최신 결과 사용
+- 회귀 판정: 지연 백분위수/평균이 임계 비율 이상 증가, 처리량이 임계 비율 이상 감소, 오류율이 1%p 이상 증가
+"""
+
+import json
+import platform
+import subprocess
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .stack import BACKEND_DIR
+
+RESULTS_DIR = BACKEND_DIR / "loadtest" / "results"
+
+LATENCY_KEYS = ("p50", "p95", "p99")
+ERROR_RATE_TOLERANCE = 0.01
+
+
+def git_revision() -> Dict[str, Any]:
+    """현재 커밋 해시와 작업 트리 변경 여부 (git을 쓸 수 없으면 unknown)"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=BACKEND_DIR, capture_output=True, text=True,
+                                check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=BACKEND_DIR,
+                                    capture_output=True, text=True, check=True).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": "unknown", "dirty": None}
+    return {"commit": commit, "dirty": dirty}
+
+
+def build_result(scenario: Dict[str, Any], summary: Dict[str, Any], started_at: datetime,
+                 mode: str) -> Dict[str, Any]:
+    """
+    저장할 결과 문서
+
+    Args:
+        mode: 'local-stack'(스택 직접 실행) | 'attach'(실행 중인 스택에 연결)
+    """
+    return {
+        "scenario": scenario,
+        "meta": {
+            **git_revision(),
+            "started_at": started_at.isoformat(timespec="seconds"),
+            "mode": mode,
+            "host": platform.node(),
+            "python": platform.python_version(),
+        },
+        **summary,
+    }
+
+
+def save_result(result: Dict[str, Any], results_dir: Path = RESULTS_DIR) -> Path:
+    started_at = datetime.fromisoformat(result["meta"]["started_at"])
+    directory = Path(results_dir) / result["scenario"]["name"]
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{started_at:%Y%m%dT%H%M%S}-{result['meta']['commit'][:10]}.json"
+    path.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+    return path
+
+
+def resolve_result(ref: str, scenario: Optional[str] = None, results_dir: Path = RESULTS_DIR) -> Path:
+    """
+    파일 경로 또는 커밋 해시(접두부) → 결과 파일
+
+    Raises:
+        FileNotFoundError: 일치하는 결과가 없음
+    """
+    path = Path(ref)
+    if path.is_file():
+        return path
+    pattern = f"{scenario}/*.json" if scenario else "*/*.json"
+    matches = sorted(candidate for candidate in Path(results_dir).glob(pattern)
+                     if json.loads(candidate.read_text(encoding="utf-8"))["meta"]["commit"].startswith(ref))
+    if not matches:
+        raise FileNotFoundError(f"No load test result for '{ref}'" + (f" (scenario {scenario})" if scenario else ""))
+    return matches[-1]
+
+
+def load_result(path: Path) -> Dict[str, Any]:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def _change(base: Optional[float], new: Optional[float]) -> Optional[float]:
+    if base is None or new is None:
+        return None
+    if base == 0:
+        return 0.0 if new == 0 else None
+    return (new - base) / base
+
+
+def compare_results(base: Dict[str, Any], new: Dict[str, Any], threshold: float = 0.1) -> List[Dict[str, Any]]:
+    """
+    작업별 지표 비교
+
+    Args:
+        threshold: 회귀로 볼 상대 변화 (0.1 = 지연 10% 증가 / 처리량 10% 감소)
+
+    Returns:
+        List[Dict]: operation, metric, base, new, change(상대 변화, 오류율은 절대 차이), regression
+    """
+    rows = []
+    for operation in sorted(set(base["operations"]) & set(new["operations"])):
+        before, after = base["operations"][operation], new["operations"][operation]
+        for key in LATENCY_KEYS + ("mean",):
+            change = _change(before["latency_ms"].get(key), after["latency_ms"].get(key))
+            rows.append({"operation": operation, "metric": f"latency_{key}_ms",
+                         "base": before["latency_ms"].get(key), "new": after["latency_ms"].get(key),
+                         "change": change, "regression": change is not None and change > threshold})
+        change = _change(before["throughput_rps"], after["throughput_rps"])
+        rows.append({"operation": operation, "metric": "throughput_rps", "base": before["throughput_rps"],
+                     "new": after["throughput_rps"], "change": change,
+                     "regression": change is not None and change < -threshold})
+        difference = after["error_rate"] - before["error_rate"]
+        rows.append({"operation": operation, "metric": "error_rate", "base": before["error_rate"],
+                     "new": after["error_rate"], "change": round(difference, 4),
+                     "regression": difference > ERROR_RATE_TOLERANCE})
+    return rows
+
+
+def format_summary(result: Dict[str, Any]) -> str:
+    """결과를 사람이 읽는 표 형식으로"""
+    meta, totals = result["meta"], result["totals"]
+    lines = [
+        f"scenario {result['scenario']['name']} @ {meta['commit'][:10]}{' (dirty)' if meta['dirty'] else ''} "
+        f"users={result['scenario']['users']} elapsed={result['elapsed_s']}s",
+        f"total: {totals['count']} requests, {totals['throughput_rps']} rps, error_rate={totals['error_rate']}",
+        f"{'operation':<28}{'count':>7}{'rps':>9}{'err%':>7}{'p50':>10}{'p95':>10}{'p99':>10}",
+    ]
+    for operation, summary in result["operations"].items():
+        latency = summary["latency_ms"]
+        cells = [f"{latency[key]:>10.1f}" if latency[key] is not None else f"{'-':>10}" for key in LATENCY_KEYS]
+        lines.append(f"{operation:<28}{summary['count']:>7}{summary['throughput_rps']:>9.2f}"
+                     f"{summary['error_rate'] * 100:>7.1f}{''.join(cells)}")
+        if summary["error_kinds"]:
+            lines.append(f"{'':<28}errors: {', '.join(f'{k}={v}' for k, v in summary['error_kinds'].items())}")
+    for name, usage in result.get("resources", {}).items():
+        lines.append(f"resource {name}: cpu avg {usage['cpu_percent_avg']}% max {usage['cpu_percent_max']}%, "
+                     f"rss max {usage['rss_mb_max']}MB ({usage['processes']} processes)")
+    return "\n".join(lines)
+
+
+def format_comparison(rows: List[Dict[str, Any]], regressions_only: bool = False) -> str:
+    lines = []
+    for row in rows:
+        if regressions_only and not row["regression"]:
+            continue
+        if row["change"] is None:
+            change = "-"
+        elif row["metric"] == "error_rate":
+            change = f"{row['change'] * 100:+.1f}%p"
+        else:
+            change = f"{row['change'] * 100:+.1f}%"
+        marker = " REGRESSION" if row["regression"] else ""
+        lines.append(f"{row['operation']:<28}{row['metric']:<18}{row['base']!s:>10} → {row['new']!s:<10}"
+                     f"{change:>9}{marker}")
+    return "\n".join(lines) if lines else "no differences"
@@ -0,0 +1,301 @@
+"""
+부하 생성기 (닫힌 루프 가상 사용자)
+
+- 가상 사용자마다 시나리오 비율로 작업을 고르고, 응답을 받은 뒤 대기 시간(think time) 후 다음 작업 실행
+- 작업별 지연(성공 요청 기준)과 오류 종류(HTTP 상태 코드/예외 이름)를 기록
+- 비동기 생성은 작업 등록 → SSE 구독자 N명이 종료 이벤트까지 대기:
+  <작업>.submit(등록 응답), <작업>.first_event(구독 시작 → 첫 이벤트), <작업>.stream(구독자별 종료 이벤트까지),
+  <작업>(등록 → 작업 완료, 작업당 1건)으로 나눠 기록
+"""
+
+import asyncio
+import math
+import random
+import time
+import uuid
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from .scenarios import API_PREFIXES, choose_operation, make_resume
+
+PERCENTILES = (50, 95, 99)
+_TERMINAL_EVENTS = {"completed": None, "error": "sse_error", "cancelled": "sse_cancelled"}
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """선형 보간 백분위수 (값이 없으면 None)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    low, high = math.floor(position), math.ceil(position)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+class Recorder:
+    """작업별 지연/오류 기록"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, Counter] = defaultdict(Counter)
+
+    def record(self, operation: str, latency_ms: float, error: Optional[str] = None) -> None:
+        if error:
+            self.errors[operation][error] += 1
+        else:
+            self.latencies[operation].append(latency_ms)
+
+    def summary(self, elapsed: float) -> Dict[str, Any]:
+        """
+        작업별 요청 수, 오류율, 처리량(rps), 지연 백분위수(ms)와 전체 합계
+
+        Args:
+            elapsed: 측정 구간 길이 (초)
+        """
+        operations = {}
+        for operation in sorted(set(self.latencies) | set(self.errors)):
+            latencies = self.latencies.get(operation, [])
+            errors = sum(self.errors.get(operation, Counter()).values())
+            count = len(latencies) + errors
+            latency = {f"p{q}": _round(percentile(latencies, q)) for q in PERCENTILES}
+            latency.update(mean=_round(sum(latencies) / len(latencies)) if latencies else None,
+                           max=_round(max(latencies)) if latencies else None)
+            operations[operation] = {
+                "count": count,
+                "errors": errors,
+                "error_rate": round(errors / count, 4) if count else 0.0,
+                "throughput_rps": round(count / elapsed, 3) if elapsed else 0.0,
+                "latency_ms": latency,
+                "error_kinds": dict(self.errors.get(operation, {})),
+            }
+        # 합계는 사용자 요청 단위 작업만 (하위 측정 <작업>.submit 등은 제외)
+        top_level = [summary for name, summary in operations.items() if "." not in name]
+        count = sum(summary["count"] for summary in top_level)
+        errors = sum(summary["errors"] for summary in top_level)
+        return {
+            "operations": operations,
+            "totals": {
+                "count": count,
+                "errors": errors,
+                "error_rate": round(errors / count, 4) if count else 0.0,
+                "throughput_rps": round(count / elapsed, 3) if elapsed else 0.0,
+            },
+        }
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return None if value is None else round(value, 1)
+
+
+def _error_kind(error: BaseException) -> str:
+    if isinstance(error, httpx.HTTPStatusError):
+        return f"http_{error.response.status_code}"
+    return type(error).__name__
+
+
+class LoadContext:
+    """실행 중 공유 상태 (서비스별 HTTP 클라이언트, 이력서 키 목록)"""
+
+    def __init__(self, clients: Dict[str, httpx.AsyncClient], scenario: Dict[str, Any], recorder: Recorder):
+        self.clients = clients
+        self.scenario = scenario
+        self.recorder = recorder
+        self.run_id = uuid.uuid4().hex[:8]
+        self.resume_keys: List[str] = []
+        self.generated_keys: List[str] = []
+        self._names = 0
+
+    def next_name(self) -> str:
+        self._names += 1
+        return f"lt{self.run_id}u{self._names}"
+
+    def pick_key(self, rng: random.Random, generated: bool = False) -> Optional[str]:
+        keys = (self.generated_keys if generated else None) or self.resume_keys
+        return rng.choice(keys) if keys else None
+
+    def params(self) -> Dict[str, str]:
+        return {"force": "true"} if self.scenario.get("force") else {}
+
+    async def call(self, operation: str, service: str, method: str, path: str, **kwargs) -> Optional[httpx.Response]:
+        """요청 한 번 측정 (오류면 기록 후 None)"""
+        started = time.perf_counter()
+        try:
+            response = await self.clients[service].request(method, API_PREFIXES[service] + path, **kwargs)
+            response.raise_for_status()
+        except Exception as e:
+            self.recorder.record(operation, (time.perf_counter() - started) * 1000, _error_kind(e))
+            return None
+        self.recorder.record(operation, (time.perf_counter() - started) * 1000)
+        return response
+
+
+# ---------- 작업 ----------
+
+async def create_resume(context: LoadContext, rng: random.Random, warmup: Optional[bool] = None) -> Optional[str]:
+    params = {} if warmup is None else {"warmup": str(warmup).lower()}
+    response = await context.call("create_resume", "resume", "POST", "/",
+                                  json=make_resume(context.next_name(), rng), params=params)
+    if response is None:
+        return None
+    key = response.json()["unique_key"]
+    context.resume_keys.append(key)
+    return key
+
+
+async def get_resume(context: LoadContext, rng: random.Random) -> None:
+    key = context.pick_key(rng)
+    if key:
+        await context.call("get_resume", "resume", "GET", f"/{key}")
+
+
+async def sync_questions(context: LoadContext, rng: random.Random) -> None:
+    key = context.pick_key(rng)
+    if key and await context.call("sync_questions", "interview", "POST", f"/{key}/questions",
+                                  params=context.params()):
+        context.generated_keys.append(key)
+
+
+async def sync_learning(context: LoadContext, rng: random.Random) -> None:
+    key = context.pick_key(rng)
+    if key:
+        await context.call("sync_learning", "learning", "POST", f"/{key}/learning-path", params=context.params())
+
+
+async def get_questions(context: LoadContext, rng: random.Random) -> None:
+    key = context.pick_key(rng, generated=True)
+    if key:
+        await context.call("get_questions", "interview", "GET", f"/{key}/questions")
+
+
+async def watch_task(client: httpx.AsyncClient, path: str, timeout: float) -> Tuple[Optional[float], float, Optional[str]]:
+    """
+    SSE 스트림을 종료 이벤트까지 구독
+
+    Returns:
+        (첫 이벤트까지 ms, 종료 이벤트까지 ms, 오류 종류 - 작업 완료면 None)
+    """
+    started = time.perf_counter()
+    first_event_ms = None
+    event = None
+    async with client.stream("GET", path, timeout=timeout) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if not line.startswith("event:"):
+                continue
+            event = line[len("event:"):].strip()
+            if first_event_ms is None:
+                first_event_ms = (time.perf_counter() - started) * 1000
+            if event in _TERMINAL_EVENTS:
+                return first_event_ms, (time.perf_counter() - started) * 1000, _TERMINAL_EVENTS[event]
+    return first_event_ms, (time.perf_counter() - started) * 1000, "sse_closed"
+
+
+async def _async_generation(context: LoadContext, rng: random.Random, operation: str, service: str,
+                            path: str) -> None:
+    key = context.pick_key(rng)
+    if not key:
+        return
+    started = time.perf_counter()
+    response = await context.call(f"{operation}.submit", service, "POST", path.format(key=key),
+                                  params=context.params())
+    if response is None:
+        context.recorder.record(operation, (time.perf_counter() - started) * 1000, "submit_failed")
+        return
+    stream_path = f"{API_PREFIXES[service]}/tasks/{response.json()['task_id']}/stream"
+
+    async def watcher() -> Optional[str]:
+        try:
+            first_event_ms, stream_ms, error = await watch_task(context.clients[service], stream_path,
+                                                                context.scenario["timeout"])
+        except Exception as e:
+            context.recorder.record(f"{operation}.stream", 0.0, _error_kind(e))
+            return _error_kind(e)
+        if first_event_ms is not None:
+            context.recorder.record(f"{operation}.first_event", first_event_ms)
+        context.recorder.record(f"{operation}.stream", stream_ms, error)
+        return error
+
+    outcomes = await asyncio.gather(*(watcher() for _ in range(int(context.scenario["watchers"]))))
+    # 작업 결과는 구독자 중 하나라도 완료를 받았으면 성공 (구독 연결 오류는 <작업>.stream에서 따로 집계)
+    error = None if None in outcomes else outcomes[0]
+    context.recorder.record(operation, (time.perf_counter() - started) * 1000, error)
+    if error is None and service == "interview":
+        context.generated_keys.append(key)
+
+
+async def async_questions(context: LoadContext, rng: random.Random) -> None:
+    await _async_generation(context, rng, "async_questions", "interview", "/async/{key}/questions")
+
+
+async def async_learning(context: LoadContext, rng: random.Random) -> None:
+    await _async_generation(context, rng, "async_learning", "learning", "/async/{key}/learning-path")
+
+
+OPERATION_HANDLERS = {
+    "create_resume": create_resume,
+    "get_resume": get_resume,
+    "sync_questions": sync_questions,
+    "sync_learning": sync_learning,
+    "get_questions": get_questions,
+    "async_questions": async_questions,
+    "async_learning": async_learning,
+}
+
+
+# ---------- 실행 ----------
+
+async def seed_resumes(context: LoadContext, count: int, seed: int) -> None:
+    """측정 전 조회/생성 대상 이력서 준비 (측정에서 제외, 사전 생성 없이)"""
+    rng = random.Random(seed)
+    for _ in range(count):
+        await create_resume(context, rng, warmup=False)
+    context.recorder.latencies.pop("create_resume", None)
+    errors = context.recorder.errors.pop("create_resume", None)
+    if count and not context.resume_keys:
+        raise RuntimeError(f"Failed to seed resumes ({dict(errors or {})}) - check the resume service and MongoDB")
+
+
+async def _virtual_user(context: LoadContext, index: int, deadline: float, seed: int) -> None:
+    scenario = context.scenario
+    rng = random.Random(f"{seed}-{index}")
+    # 시작 시점을 분산 (첫 1초에 모든 요청이 몰리지 않도록)
+    await asyncio.sleep(min(scenario["ramp_up"], scenario["duration"]) * index / max(scenario["users"], 1))
+    while time.monotonic() < deadline:
+        await OPERATION_HANDLERS[choose_operation(scenario["mix"], rng)](context, rng)
+        await asyncio.sleep(scenario["think_ms"] / 1000 * rng.uniform(0.5, 1.5))
+
+
+async def run_load(scenario: Dict[str, Any], clients: Dict[str, httpx.AsyncClient], seed: int = 0,
+                   sampler=None) -> Dict[str, Any]:
+    """
+    시나리오 실행 후 요약 반환
+
+    Args:
+        scenario: get_scenario 결과 (users, duration, mix, watchers, force, think_ms, ramp_up, timeout)
+        clients: 서비스 이름(resume/interview/learning) → base_url이 설정된 클라이언트
+        sampler: 자원 사용량 샘플러 (ResourceSampler, 측정 구간 동안만 실행)
+
+    Returns:
+        Dict: Recorder.summary 결과 + elapsed_s (+ resources)
+    """
+    recorder = Recorder()
+    context = LoadContext(clients, scenario, recorder)
+    await seed_resumes(context, int(scenario.get("seed_resumes", 0)), seed)
+
+    sampling = asyncio.ensure_future(sampler.run()) if sampler is not None else None
+    started = time.monotonic()
+    try:
+        await asyncio.gather(*(_virtual_user(context, index, started + scenario["duration"], seed)
+                               for index in range(int(scenario["users"]))))
+    finally:
+        elapsed = time.monotonic() - started
+        if sampling is not None:
+            sampling.cancel()
+            await asyncio.gather(sampling, return_exceptions=True)
+
+    result = {"elapsed_s": round(elapsed, 2), **recorder.summary(elapsed)}
+    if sampler is not None:
+        result["resources"] = sampler.summary()
+    return result
@@ -0,0 +1,142 @@
+"""
+부하 테스트 시나리오
+
+- 작업(operation): 이력서 생성/조회, 동기 면접 질문/학습 경로 생성, 생성 결과 조회, 비동기 생성 + SSE 구독
+- 시나리오: 작업 비율(mix), 가상 사용자 수, 실행 시간, 스택 환경 변수 오버라이드(가짜 제공자 지연 등)
+- 운영 장애 재현: 다수 SSE 구독(sse_storm), 느린 LLM 제공자(slow_provider)
+"""
+
+import random
+from typing import Any, Dict
+
+# 서비스별 API 접두부 (각 서비스 config.api_prefix)
+API_PREFIXES = {
+    "resume": "/api/v1/resumes",
+    "interview": "/api/v1/interview",
+    "learning": "/api/v1/learning",
+}
+
+OPERATIONS = (
+    "create_resume",
+    "get_resume",
+    "sync_questions",
+    "sync_learning",
+    "get_questions",
+    "async_questions",
+    "async_learning",
+)
+
+SCENARIOS: Dict[str, Dict[str, Any]] = {
+    "smoke": {
+        "description": "모든 작업을 한 번씩 거치는 짧은 점검 (배포 전/CI)",
+        "users": 4,
+        "duration": 20,
+        "seed_resumes": 4,
+        "mix": {operation: 1 for operation in OPERATIONS},
+    },
+    "mixed": {
+        "description": "운영 트래픽 비율 - 조회 위주, 생성은 동기/비동기 혼합",
+        "users": 30,
+        "duration": 120,
+        "seed_resumes": 30,
+        "mix": {
+            "get_resume": 30,
+            "get_questions": 25,
+            "create_resume": 10,
+            "sync_questions": 8,
+            "sync_learning": 4,
+            "async_questions": 15,
+            "async_learning": 8,
+        },
+    },
+    "generation": {
+        "description": "생성만 반복 (force=true로 재사용 없이 LLM 경로 처리량 측정)",
+        "users": 20,
+        "duration": 120,
+        "seed_resumes": 20,
+        "force": True,
+        "mix": {"sync_questions": 2, "sync_learning": 1, "async_questions": 2, "async_learning": 1},
+    },
+    "sse_storm": {
+        "description": "작업마다 SSE 구독자 여러 명 (진행률 스트림 폴링이 Redis/이벤트 루프에 주는 부하 재현)",
+        "users": 100,
+        "duration": 120,
+        "seed_resumes": 20,
+        "force": True,
+        "watchers": 5,
+        "mix": {"async_questions": 3, "async_learning": 1, "get_resume": 1},
+    },
+    "slow_provider": {
+        "description": "LLM 제공자 지연 급증 (동기 생성 요청이 쌓일 때 조회 지연/오류율 재현)",
+        "users": 40,
+        "duration": 120,
+        "seed_resumes": 20,
+        "force": True,
+        "env": {"FAKE_LLM_LATENCY_MS": "8000"},
+        "mix": {"get_resume": 30, "get_questions": 20, "sync_questions": 15, "async_questions": 10},
+    },
+}
+
+
+def get_scenario(name: str, **overrides) -> Dict[str, Any]:
+    """
+    시나리오 설정 (None이 아닌 오버라이드 값으로 덮어씀)
+
+    Raises:
+        KeyError: 알 수 없는 시나리오
+    """
+    if name not in SCENARIOS:
+        raise KeyError(f"Unknown scenario '{name}' (available: {', '.join(SCENARIOS)})")
+    scenario = {"name": name, "watchers": 1, "force": False, "think_ms": 100, "ramp_up": 5, "timeout": 120,
+                "env": {}, **SCENARIOS[name]}
+    scenario.update({key: value for key, value in overrides.items() if value is not None})
+    unknown = set(scenario["mix"]) - set(OPERATIONS)
+    if unknown:
+        raise KeyError(f"Unknown operations in mix: {', '.join(sorted(unknown))}")
+    return scenario
+
+
+def choose_operation(mix: Dict[str, float], rng: random.Random) -> str:
+    """비율에 비례해 다음 작업 선택"""
+    operations = list(mix)
+    return rng.choices(operations, weights=[mix[operation] for operation in operations])[0]
+
+
+_SKILL_POOL = ["Python", "Java", "Kotlin", "Go", "TypeScript", "FastAPI", "Spring Boot", "Django", "Kafka",
+               "Redis", "MongoDB", "PostgreSQL", "Docker", "Kubernetes", "AWS", "GCP", "Terraform", "Celery"]
+
+
+def make_resume(name: str, rng: random.Random) -> Dict[str, Any]:
+    """
+    이력서 생성 요청 본문 (기술 스택/경력을 섞어 생성 결과 재사용 비율이 운영과 비슷하도록)
+
+    Args:
+        name: 이력서 이름 (unique_key는 서비스가 '<name>_<순번>'으로 발급)
+    """
+    skills = rng.sample(_SKILL_POOL, 6)
+    return {
+        "name": name,
+        "contact": {"email": f"{name}@example.com", "github": f"https://github.com/{name}"},
+        "summary": f"{skills[0]}와 {skills[1]} 기반 백엔드 서비스를 설계하고 운영한 개발자입니다.",
+        "work_experiences": [{
+            "company": f"company-{rng.randint(1, 50)}",
+            "position": "Backend Engineer",
+            "duration": "2022.03 ~ 2024.12",
+            "project_name": "주문 처리 플랫폼",
+            "project_description": f"{skills[2]} 기반 이벤트 처리 파이프라인 구축",
+            "tech_stack": skills[:4],
+            "achievements": [f"{skills[3]} 도입으로 응답 시간 {rng.randint(20, 70)}% 단축"],
+        }],
+        "total_experience_months": rng.randint(6, 120),
+        "personal_projects": [{
+            "name": "사이드 프로젝트",
+            "description": f"{skills[4]}로 만든 실시간 알림 서비스",
+            "tech_stack": skills[4:],
+        }],
+        "technical_skills": {
+            "programming_languages": skills[:2],
+            "frameworks": skills[2:4],
+            "databases": skills[4:5],
+            "others": skills[5:],
+        },
+    }
@@ -0,0 +1,131 @@
+"""
+부하 테스트용 로컬 스택 (API 서비스 3개 + Celery 워커 2개를 하위 프로세스로 실행)
+
+- 가짜 LLM 제공자(LLM_FAKE_PROVIDER=true)로 실행하고, 시나리오의 환경 변수 오버라이드(FAKE_LLM_LATENCY_MS 등)를 적용
+- MongoDB/Redis/RabbitMQ는 현재 환경(MONGODB_URL, REDIS_URL, CELERY_BROKER_URL 등)이 가리키는 로컬 인스턴스 사용
+  (예: docker compose up -d mongodb redis rabbitmq 후 localhost 주소로 지정)
+"""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# 서비스 이름 → (서비스 디렉토리, 포트)
+SERVICES = {
+    "resume": ("resume-service", 8001),
+    "interview": ("interview-service", 8002),
+    "learning": ("learning-service", 8003),
+}
+# 워커 이름 → 큐
+WORKERS = {
+    "interview": "interview_queue.v2",
+    "learning": "learning_queue.v2",
+}
+
+# 스택 공통 환경 (시나리오 오버라이드가 우선)
+STACK_ENV = {
+    "LLM_FAKE_PROVIDER": "true",
+    "LOG_LEVEL": "WARNING",
+    "METRICS_WORKER_PORT": "0",  # 워커 두 개가 같은 포트를 쓰지 않도록 (자원 사용량은 /proc에서 측정)
+}
+
+
+def default_base_urls(host: str = "127.0.0.1") -> Dict[str, str]:
+    return {name: f"http://{host}:{port}" for name, (_, port) in SERVICES.items()}
+
+
+class LocalStack:
+    """API 서비스/워커 프로세스 묶음 (with 블록 종료 시 모두 종료)"""
+
+    def __init__(self, env: Optional[Dict[str, str]] = None, api_workers: int = 1, worker_concurrency: int = 2,
+                 log_dir: Optional[Path] = None):
+        """
+        Args:
+            env: 스택 프로세스에 추가할 환경 변수 (시나리오 오버라이드)
+            api_workers: 서비스별 uvicorn 워커 프로세스 수
+            worker_concurrency: Celery 워커별 동시 실행 수
+            log_dir: 프로세스별 출력 파일 디렉토리 (없으면 출력 버림)
+        """
+        self.env = {**os.environ, **STACK_ENV, **(env or {})}
+        self.env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(BACKEND_DIR), os.environ.get("PYTHONPATH")]))
+        self.api_workers = api_workers
+        self.worker_concurrency = worker_concurrency
+        self.log_dir = log_dir
+        self.processes: Dict[str, subprocess.Popen] = {}
+        self._logs: List = []
+        self.base_urls = default_base_urls()
+
+    def _spawn(self, name: str, command: List[str], cwd: Path) -> None:
+        output = subprocess.DEVNULL
+        if self.log_dir is not None:
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            output = open(self.log_dir / f"{name}.log", "ab")
+            self._logs.append(output)
+        self.processes[name] = subprocess.Popen(command, cwd=cwd, env=self.env, stdout=output,
+                                                stderr=subprocess.STDOUT)
+
+    def start(self, ready_timeout: float = 60.0) -> "LocalStack":
+        for name, (directory, port) in SERVICES.items():
+            self._spawn(name, [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1",
+                               "--port", str(port), "--workers", str(self.api_workers), "--no-access-log"],
+                        BACKEND_DIR / directory)
+        for name, queue in WORKERS.items():
+            self._spawn(f"worker-{name}", [sys.executable, "-m", "celery", "-A", f"shared.workers.{name}", "worker",
+                                           "-Q", queue, "--concurrency", str(self.worker_concurrency),
+                                           "--loglevel", "warning"],
+                        BACKEND_DIR)
+        try:
+            self.wait_ready(ready_timeout)
+        except Exception:
+            self.stop()
+            raise
+        return self
+
+    def wait_ready(self, timeout: float) -> None:
+        """모든 서비스의 /health가 응답할 때까지 대기"""
+        deadline = time.monotonic() + timeout
+        pending = dict(self.base_urls)
+        while pending:
+            for name, process in self.processes.items():
+                if process.poll() is not None:
+                    raise RuntimeError(f"Stack process '{name}' exited with code {process.returncode}")
+            for name, base_url in list(pending.items()):
+                try:
+                    if httpx.get(f"{base_url}/health", timeout=1.0).status_code == 200:
+                        del pending[name]
+                except httpx.HTTPError:
+                    pass
+            if pending and time.monotonic() > deadline:
+                raise TimeoutError(f"Services not ready after {timeout}s: {', '.join(pending)}")
+            time.sleep(0.5)
+
+    def pids(self) -> Dict[str, int]:
+        return {name: process.pid for name, process in self.processes.items() if process.poll() is None}
+
+    def stop(self, timeout: float = 15.0) -> None:
+        for process in self.processes.values():
+            if process.poll() is None:
+                process.terminate()
+        deadline = time.monotonic() + timeout
+        for process in self.processes.values():
+            try:
+                process.wait(max(deadline - time.monotonic(), 0.1))
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+        for output in self._logs:
+            output.close()
+        self.processes, self._logs = {}, []
+
+    def __enter__(self) -> "LocalStack":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
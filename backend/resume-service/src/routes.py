@@ -2,16 +2,23 @@
 Resume Service API 라우트 - Resume 관련 기능만 담당
 """
 
+import asyncio
 from fastapi import APIRouter, HTTPException
 from datetime import datetime
+from typing import Optional
 from urllib.parse import unquote
 import re
 from .schemas import ResumeCreate, ResumeResponse
 from .crud import (
     create_resume as create_resume_db,
     get_resumes_by_name,
-    get_resume_by_unique_key
+    get_resume_by_unique_key,
+    update_resume as update_resume_db
 )
+from shared.celery_app import celery_app
+from shared.jobs.warmup import schedule_resume_warmup
+from shared.utils.resume_formatter import compute_prompt_fingerprints
+from shared.generation.near_duplicate import index_resume
 from shared.utils.error_handler import ResumeErrors
 
 router = APIRouter()
@@ -26,8 +33,12 @@ async def health_check():
     }
 
 @router.post("/", response_model=dict)
-async def create_resume(resume_data: ResumeCreate):
-    """이력서 생성"""
+async def create_resume(resume_data: ResumeCreate, warmup: Optional[bool] = None):
+    """이력서 생성
+    
+    Args:
+        warmup: 면접 질문/학습 경로 사전 생성 여부 (None이면 RESUME_WARMUP_ENABLED 설정 사용)
+    """
     try:
         # 사용자별 이력서 개수 확인
         existing_count = await get_resumes_by_name(resume_data.name)
@@ -41,19 +52,59 @@ async def create_resume(resume_data: ResumeCreate):
         resume_dict["unique_key"] = unique_key
         resume_dict["created_at"] = datetime.utcnow()
         resume_dict["updated_at"] = datetime.utcnow()
+        resume_dict["prompt_fingerprints"] = compute_prompt_fingerprints(resume_dict)  # 생성 결과 재사용 판단용
         
         # 데이터베이스에 저장
         resume_id = await create_resume_db(resume_dict)
         
+        # 유사 이력서 탐지 색인 갱신 (최선 노력, 실패해도 저장은 유지, 동기 Redis 호출은 이벤트 루프 밖에서)
+        await asyncio.to_thread(index_resume, resume_dict)
+        
+        # 첫 조회 전에 낮은 우선순위로 사전 생성 (최선 노력, 동기 Redis/브로커 호출은 이벤트 루프 밖에서)
+        warmup_result = await asyncio.to_thread(schedule_resume_warmup, celery_app, resume_dict, warmup)
+        
         return {
             "message": "Resume created successfully",
             "resume_id": resume_id,
-            "unique_key": unique_key
+            "unique_key": unique_key,
+            "warmup": warmup_result
         }
         
     except Exception as e:
         raise ResumeErrors.creation_failed(str(e))
 
+@router.put("/{unique_key}", response_model=dict)
+async def update_resume(unique_key: str, resume_data: ResumeCreate, warmup: Optional[bool] = None):
+    """이력서 수정
+    
+    Args:
+        warmup: 수정된 이력서로 사전 생성 여부 (프롬프트 입력이 바뀌지 않았으면 재생성하지 않음)
+    """
+    try:
+        existing = await get_resume_by_unique_key(unique_key)
+        if not existing:
+            raise ResumeErrors.not_found(unique_key)
+        
+        update_data = resume_data.model_dump()
+        update_data["prompt_fingerprints"] = compute_prompt_fingerprints(update_data)
+        await update_resume_db(unique_key, update_data)
+        await asyncio.to_thread(index_resume, {**update_data, "unique_key": unique_key})
+        
+        warmup_result = await asyncio.to_thread(schedule_resume_warmup, celery_app,
+                                                {**update_data, "unique_key": unique_key}, warmup)
+        
+        return {
+            "message": "Resume updated successfully",
+            "resume_id": existing["id"],
+            "unique_key": unique_key,
+            "warmup": warmup_result
+        }
+        
+    except Exception as e:
+        if hasattr(e, 'error_code'):  # APIError인 경우
+            raise
+        raise ResumeErrors.update_failed(unique_key, str(e))
+
 @router.get("/{unique_key}", response_model=ResumeResponse)
 async def get_resume(unique_key: str):
     """unique_key로 이력서 조회"""
@@ -1,127 +1,148 @@
 """
 Celery 앱 설정
+
+- API 프로세스: producer 전용 앱 (send_task만 사용, 워커 코드/LLM SDK를 import하지 않음)
+- 워커 프로세스: 서비스별 앱 팩토리 (tasks 모듈은 워커 기동 시점에 지연 로드)
 """
 
 import os
-import importlib
+import sys
+from typing import Optional
 from celery import Celery
-from shared.config.base import BaseAppSettings
+from celery.signals import before_task_publish
+from shared.config.base import get_settings
+from shared.utils.metrics import install_worker_metrics, stamp_published_at
+from shared.utils.tracing import inject_task_headers, install_worker_tracing
 
 # 설정 로드
-settings = BaseAppSettings()
-
-# 현재 working directory 확인
-current_dir = os.getcwd()
-print(f"🔍 Current working directory: {current_dir}")
-
-# Celery 앱 생성 (include 없이)
-celery_app = Celery(
-    "interview_coach",
-    broker=settings.celery_broker_url,
-    backend=settings.celery_result_backend
-)
-
-# Working directory에 따라 tasks 강제 import
-if 'interview-service' in current_dir:
-    print("📍 Interview Service environment detected")
-    if os.path.exists('tasks.py'):
-        try:
-            print("✅ Interview tasks.py found - importing directly")
-            # Celery 앱 설정 완료 후 tasks 모듈 강제 import
-            import sys
-            sys.path.insert(0, os.getcwd())  # 현재 디렉토리를 path에 추가
-            import tasks  # interview-service/tasks.py import
-            print(f"🎯 Successfully imported interview tasks module")
-            
-            # 등록된 tasks 확인
-            task_names = [name for name in celery_app.tasks.keys() if 'tasks.' in name]
-            print(f"📋 Registered interview tasks: {task_names}")
-        except Exception as e:
-            print(f"❌ Failed to import interview tasks: {e}")
-            import traceback
-            traceback.print_exc()
-    else:
-        print("❌ tasks.py not found in interview-service")
-        
-elif 'learning-service' in current_dir:
-    print("📍 Learning Service environment detected")
-    if os.path.exists('tasks.py'):
-        try:
-            print("✅ Learning tasks.py found - importing directly")
-            # Celery 앱 설정 완료 후 tasks 모듈 강제 import
-            import sys
-            sys.path.insert(0, os.getcwd())  # 현재 디렉토리를 path에 추가
-            import tasks  # learning-service/tasks.py import
-            print(f"🎯 Successfully imported learning tasks module")
-            
-            # 등록된 tasks 확인
-            task_names = [name for name in celery_app.tasks.keys() if 'learning_service.tasks.' in name or 'tasks.' in name]
-            print(f"📋 Registered learning tasks: {task_names}")
-        except Exception as e:
-            print(f"❌ Failed to import learning tasks: {e}")
-            import traceback
-            traceback.print_exc()
-    else:
-        print("❌ tasks.py not found in learning-service")
-        
-else:
-    print("🔄 General environment - tasks loaded individually by workers")
-    print("📋 Each worker handles its own task loading")
-
-# Celery 설정
-celery_app.conf.update(
-    task_serializer=settings.celery_task_serializer,
-    accept_content=[settings.celery_accept_content],
-    result_serializer=settings.celery_result_serializer,
-    timezone=settings.celery_timezone,
-    enable_utc=True,
-    
-    # 작업 라우팅
-    task_routes={
-        'tasks.*': {'queue': 'interview_queue'},
-        'learning_service.tasks.*': {'queue': 'learning_queue'},
-    },
-    
-    # 성능 최적화
-    worker_prefetch_multiplier=1,
-    task_acks_late=True,
-    worker_disable_rate_limits=False,
-    
-    # 재시도 설정
-    task_default_retry_delay=60,
-    task_max_retries=3,
-    
-    # 결과 만료 시간 (1시간)
-    result_expires=3600,
-    
-    # 작업 추적 활성화
-    task_track_started=True,
-    task_send_sent_event=True,
-    
-    # 결과 확장 정보 포함 (serialization 문제 해결)
-    result_extended=True,
-    
-    # 보다 안전한 serialization 설정
-    task_ignore_result=False,
-    task_store_errors_even_if_ignored=True,
-)
-
-# 큐 설정
-celery_app.conf.task_default_queue = 'default'
-celery_app.conf.task_queues = {
-    'default': {
-        'exchange': 'default',
-        'routing_key': 'default',
-    },
-    'interview_queue': {
-        'exchange': 'interview',
-        'routing_key': 'interview',
-    },
-    'learning_queue': {
-        'exchange': 'learning', 
-        'routing_key': 'learning',
-    }
+settings = get_settings()
+
+# 등록 시각 헤더 (워커에서 큐 대기 시간 측정), 현재 요청의 trace context 헤더
+before_task_publish.connect(stamp_published_at, weak=False)
+before_task_publish.connect(inject_task_headers, weak=False)
+
+# backend/ 디렉토리 (작업 디렉토리와 무관하게 서비스 경로를 결정)
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 서비스별 tasks 모듈 위치
+WORKER_SERVICE_DIRS = {
+    "interview": os.path.join(BACKEND_DIR, "interview-service"),
+    "learning": os.path.join(BACKEND_DIR, "learning-service"),
 }
 
+
+def _configure(app: Celery) -> None:
+    """공통 Celery 설정 적용"""
+    app.conf.update(
+        task_serializer=settings.celery_task_serializer,
+        accept_content=[settings.celery_accept_content],
+        result_serializer=settings.celery_result_serializer,
+        timezone=settings.celery_timezone,
+        enable_utc=True,
+
+        # 작업 라우팅
+        task_routes={
+            'tasks.*': {'queue': 'interview_queue.v2'},
+            'learning_service.tasks.*': {'queue': 'learning_queue.v2'},
+        },
+
+        # 성능 최적화
+        worker_prefetch_multiplier=1,
+        task_acks_late=True,
+        worker_disable_rate_limits=False,
+
+        # 우선순위 (워밍업 등 백그라운드 작업은 낮은 우선순위로 등록)
+        task_default_priority=settings.celery_task_default_priority,
+
+        # 브로커 커넥션 풀 (앱 인스턴스 하나를 프로세스 전체가 공유)
+        broker_pool_limit=settings.celery_broker_pool_limit,
+
+        # 시간 제한 (soft: 태스크가 정리 후 실패 기록, hard: 워커 프로세스 강제 종료)
+        task_soft_time_limit=settings.celery_task_soft_time_limit,
+        task_time_limit=settings.celery_task_time_limit,
+
+        # 재시도 설정
+        task_default_retry_delay=60,
+        task_max_retries=3,
+
+        # 결과 만료 시간 (1시간)
+        result_expires=3600,
+
+        # 작업 추적 활성화
+        task_track_started=True,
+        task_send_sent_event=True,
+
+        # 결과 확장 정보 포함 (serialization 문제 해결)
+        result_extended=True,
+
+        # 보다 안전한 serialization 설정
+        task_ignore_result=False,
+        task_store_errors_even_if_ignored=True,
+    )
+
+    # 큐 설정
+    # 우선순위 큐(x-max-priority)는 기존 interview_queue/learning_queue와 인자가 달라 같은 이름으로 재선언하면
+    # 브로커가 PRECONDITION_FAILED로 거부하므로 새 이름/라우팅 키(.v2)로 선언한다.
+    # 이전 큐는 남은 메시지를 처리한 뒤 삭제 (rabbitmqctl delete_queue interview_queue / learning_queue)
+    app.conf.task_default_queue = 'default'
+    app.conf.task_queues = {
+        'default': {
+            'exchange': 'default',
+            'routing_key': 'default',
+        },
+        'interview_queue.v2': {
+            'exchange': 'interview',
+            'routing_key': 'interview.v2',
+            'queue_arguments': {'x-max-priority': settings.celery_queue_max_priority},
+        },
+        'learning_queue.v2': {
+            'exchange': 'learning',
+            'routing_key': 'learning.v2',
+            'queue_arguments': {'x-max-priority': settings.celery_queue_max_priority},
+        }
+    }
+
+
+def create_celery_app(service: Optional[str] = None) -> Celery:
+    """
+    Celery 앱 생성
+
+    Args:
+        service: 워커 서비스 이름 ("interview" | "learning"). None이면 producer 전용 앱
+
+    Returns:
+        Celery: 설정이 적용된 앱 (워커 앱은 기동 시 해당 서비스의 tasks 모듈을 로드)
+    """
+    app = Celery(
+        "interview_coach",
+        broker=settings.celery_broker_url,
+        backend=settings.celery_result_backend
+    )
+    _configure(app)
+
+    if service is None:
+        return app
+
+    if service not in WORKER_SERVICE_DIRS:
+        raise ValueError(f"Unknown worker service: {service}")
+
+    # tasks.py가 서비스 로컬 모듈(config, database)을 사용하므로 서비스 디렉토리를 경로에 등록
+    service_dir = WORKER_SERVICE_DIRS[service]
+    if service_dir not in sys.path:
+        sys.path.insert(0, service_dir)
+
+    # 워커 초기화 시점에 import (앱 생성 시에는 로드하지 않음)
+    app.conf.imports = ("tasks",)
+
+    # 작업 대기/실행 시간 기록, 워커 메트릭 노출 (METRICS_WORKER_PORT)
+    install_worker_metrics()
+    # 메시지 헤더의 traceparent로 작업 스팬 시작
+    install_worker_tracing(service)
+    return app
+
+
+# API 프로세스용 producer 전용 앱
+celery_app = create_celery_app()
+
 if __name__ == '__main__':
     celery_app.start()
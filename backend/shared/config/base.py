@@ -2,6 +2,7 @@
 모든 서비스의 기본 설정
 """
 
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 import os
 from dotenv import load_dotenv
@@ -17,6 +18,9 @@ class BaseAppSettings(BaseSettings):
     
     # 공통 설정
     log_level: str = "INFO"
+    log_format: str = os.environ.get("LOG_FORMAT", "json")  # json | text
+    log_sample_rates: str = os.environ.get("LOG_SAMPLE_RATES", "")  # 로거별 INFO 이하 샘플링 비율 ("interview-service=0.1,shared-llm=0.5")
+    log_redact_pii: bool = os.environ.get("LOG_REDACT_PII", True)  # 로그의 이력서 PII(이메일/전화번호/이름·연락처 필드) 마스킹
     debug: bool = False
     
     # LLM 설정 (공통)
@@ -40,6 +44,77 @@ class BaseAppSettings(BaseSettings):
     gemini_max_tokens: int = os.environ.get("GEMINI_MAX_TOKENS")
     gemini_timeout: int = os.environ.get("GEMINI_TIMEOUT")
     
+    # LLM 클라이언트 풀 / HTTP 커넥션 풀 (프로세스 단위)
+    llm_client_pool_size: int = os.environ.get("LLM_CLIENT_POOL_SIZE", 32)
+    llm_http_max_connections: int = os.environ.get("LLM_HTTP_MAX_CONNECTIONS", 20)
+    llm_http_keepalive_expiry: float = os.environ.get("LLM_HTTP_KEEPALIVE_EXPIRY", 30.0)
+    
+    # 적응형 LLM 라우팅 (objective: lowest_p95 | cheapest_under_slo | weighted_round_robin)
+    llm_router_objective: str = os.environ.get("LLM_ROUTER_OBJECTIVE", "lowest_p95")
+    llm_router_slo_p95_ms: float = os.environ.get("LLM_ROUTER_SLO_P95_MS", 20000)
+    llm_router_max_error_rate: float = os.environ.get("LLM_ROUTER_MAX_ERROR_RATE", 0.5)
+    llm_router_ewma_alpha: float = os.environ.get("LLM_ROUTER_EWMA_ALPHA", 0.2)
+    llm_router_probe_rate: float = os.environ.get("LLM_ROUTER_PROBE_RATE", 0.05)
+    llm_router_stats_refresh_seconds: float = os.environ.get("LLM_ROUTER_STATS_REFRESH_SECONDS", 5)
+    llm_provider_costs: str = os.environ.get("LLM_PROVIDER_COSTS", "gemini:1,openai:3,claude:4")  # 상대 비용
+    
+    # 제공자 네이티브 구조화 출력 (OpenAI json_schema, Claude 도구 호출, 미지원 제공자는 관대한 JSON 파서)
+    llm_structured_output: bool = os.environ.get("LLM_STRUCTURED_OUTPUT", True)
+    
+    # 잘린 응답 이어받기 / 검증 실패 항목만 재요청 (전체 재생성 대신)
+    llm_repair_max_attempts: int = os.environ.get("LLM_REPAIR_MAX_ATTEMPTS", 2)  # 응답 하나당 복구 호출 상한 (0: 사용 안 함)
+    llm_repair_max_tokens: int = os.environ.get("LLM_REPAIR_MAX_TOKENS", 1200)  # 복구 호출 하나의 출력 상한
+    
+    # 제공자 프롬프트 캐시 (고정 시스템 프롬프트 접두부: Claude cache_control, OpenAI 자동 캐시, Gemini cachedContents)
+    llm_prompt_cache: bool = os.environ.get("LLM_PROMPT_CACHE", True)
+    llm_prompt_cache_ttl_seconds: int = os.environ.get("LLM_PROMPT_CACHE_TTL_SECONDS", 3600)  # Gemini 캐시 핸들 TTL
+    llm_prompt_cache_refresh_seconds: int = os.environ.get("LLM_PROMPT_CACHE_REFRESH_SECONDS", 300)  # 만료 전 갱신 시작
+    gemini_cache_min_tokens: int = os.environ.get("GEMINI_CACHE_MIN_TOKENS", 1024)  # 모델별 캐시 최소 토큰
+    
+    # 가짜 LLM 제공자 (네트워크 없이 로컬 개발/테스트/부하 테스트, 프롬프트 캐시 동작 재현)
+    llm_fake_provider: bool = os.environ.get("LLM_FAKE_PROVIDER", False)
+    fake_llm_latency_ms: float = os.environ.get("FAKE_LLM_LATENCY_MS", 200)  # 고정 지연
+    fake_llm_ms_per_1k_input_tokens: float = os.environ.get("FAKE_LLM_MS_PER_1K_INPUT_TOKENS", 100)  # 캐시 미적중 입력 처리 지연
+    
+    # 프롬프트 이력서 영역 입력 토큰 예산
+    prompt_resume_token_budget_interview: int = os.environ.get("PROMPT_RESUME_TOKEN_BUDGET_INTERVIEW", 400)
+    prompt_resume_token_budget_learning: int = os.environ.get("PROMPT_RESUME_TOKEN_BUDGET_LEARNING", 500)
+    
+    # 프롬프트 템플릿 핫 리로드 (YAML 파일 mtime 확인 주기, 음수: 최초 로드 후 확인 안 함)
+    prompt_reload_check_seconds: float = os.environ.get("PROMPT_RELOAD_CHECK_SECONDS", 2)
+    # 프롬프트 변형 실험 트래픽 배정 (JSON: {"기준 프롬프트 파일": {"변형 프롬프트 파일": 가중치}}, 빈 값: 실험 없음)
+    prompt_experiments: str = os.environ.get("PROMPT_EXPERIMENTS", "")
+    
+    # 대형 이력서 섹션 요약 (map-reduce)
+    resume_summary_threshold_tokens: int = os.environ.get("RESUME_SUMMARY_THRESHOLD_TOKENS", 1500)  # 전체 이력서 추정 토큰
+    resume_summary_section_min_tokens: int = os.environ.get("RESUME_SUMMARY_SECTION_MIN_TOKENS", 120)
+    resume_summary_max_tokens: int = os.environ.get("RESUME_SUMMARY_MAX_TOKENS", 300)  # 섹션 요약 호출 출력 상한
+    resume_summary_concurrency: int = os.environ.get("RESUME_SUMMARY_CONCURRENCY", 8)
+    resume_summary_cache_ttl: int = os.environ.get("RESUME_SUMMARY_CACHE_TTL", 7 * 24 * 3600)
+    
+    # 커리어 번들 (면접 질문 + 학습 경로 동시 생성)
+    career_bundle_default_mode: str = os.environ.get("CAREER_BUNDLE_DEFAULT_MODE", "concurrent")  # concurrent | merged
+    career_bundle_merged_max_tokens: int = os.environ.get("CAREER_BUNDLE_MERGED_MAX_TOKENS", 8000)  # 단일 호출 출력 상한
+    
+    # 부분 재생성 (면접 질문/학습 경로 항목 하나)
+    item_regeneration_max_tokens: int = os.environ.get("ITEM_REGENERATION_MAX_TOKENS", 1500)  # 항목 하나 출력 상한
+    
+    # 면접 질문 후보 과생성 + MMR 선택 (0이면 사용 안 함, 요청별 candidates 파라미터로 지정 가능)
+    interview_candidate_count: int = os.environ.get("INTERVIEW_CANDIDATE_COUNT", 0)
+    interview_candidate_max: int = os.environ.get("INTERVIEW_CANDIDATE_MAX", 15)
+    interview_mmr_lambda: float = os.environ.get("INTERVIEW_MMR_LAMBDA", 0.7)  # 1에 가까울수록 관련도 우선
+    
+    # 면접 질문 은행 (저장된 생성 결과로 LLM 없이 질문 세트 구성)
+    question_bank_index_path: str = os.environ.get("QUESTION_BANK_INDEX_PATH", "")  # 비어 있으면 backend/data/question_bank.idx
+    question_bank_dedup_distance: int = os.environ.get("QUESTION_BANK_DEDUP_DISTANCE", 10)  # SimHash 해밍 거리 (64비트)
+    question_bank_degraded_enabled: bool = os.environ.get("QUESTION_BANK_DEGRADED_ENABLED", True)  # 모든 제공자 장애 시 자동 전환
+    
+    # 유사 이력서 탐지 (MinHash + LSH, 기존 생성 결과 재활용)
+    resume_lsh_num_perm: int = os.environ.get("RESUME_LSH_NUM_PERM", 128)
+    resume_lsh_bands: int = os.environ.get("RESUME_LSH_BANDS", 16)  # 밴드당 행 수 = num_perm / bands
+    resume_near_duplicate_threshold: float = os.environ.get("RESUME_NEAR_DUPLICATE_THRESHOLD", 0.85)  # 추정 자카드 유사도
+    resume_near_duplicate_mode: str = os.environ.get("RESUME_NEAR_DUPLICATE_MODE", "off")  # off | reuse | draft
+    
     # Celery 설정
     celery_broker_url: str = os.environ.get("CELERY_BROKER_URL")
     celery_result_backend: str = os.environ.get("CELERY_RESULT_BACKEND")
@@ -48,6 +123,55 @@ class BaseAppSettings(BaseSettings):
     celery_result_serializer: str = os.environ.get("CELERY_RESULT_SERIALIZER", "json")
     celery_timezone: str = os.environ.get("CELERY_TIMEZONE", "Asia/Seoul")
     
+    # Celery 작업 시간 제한 (초)
+    celery_task_soft_time_limit: int = os.environ.get("CELERY_TASK_SOFT_TIME_LIMIT", 90)
+    celery_task_time_limit: int = os.environ.get("CELERY_TASK_TIME_LIMIT", 120)
+    celery_task_expires: int = os.environ.get("CELERY_TASK_EXPIRES", 300)  # 큐 대기 허용 시간
+    task_cancel_poll_interval: float = os.environ.get("TASK_CANCEL_POLL_INTERVAL", 0.5)
+    
+    # Celery 브로커 커넥션 풀 (프로세스 내 모든 producer가 공유)
+    celery_broker_pool_limit: int = os.environ.get("CELERY_BROKER_POOL_LIMIT", 10)
+    
+    # Celery 작업 우선순위 (RabbitMQ x-max-priority, 숫자가 클수록 먼저 처리)
+    celery_queue_max_priority: int = os.environ.get("CELERY_QUEUE_MAX_PRIORITY", 10)
+    celery_task_default_priority: int = os.environ.get("CELERY_TASK_DEFAULT_PRIORITY", 5)
+    
+    # 서비스 시작 시간 예산 (main 모듈 import 시간, ms)
+    startup_import_budget_ms: int = os.environ.get("STARTUP_IMPORT_BUDGET_MS", 3000)
+    
+    # Redis 설정 (진행률 추적)
+    redis_url: str = os.environ.get("REDIS_URL", "redis://redis:6379/0")
+    
+    # 대량(Bulk) 생성 작업 설정
+    bulk_job_max_concurrency: int = os.environ.get("BULK_JOB_MAX_CONCURRENCY", 4)
+    bulk_job_max_items: int = os.environ.get("BULK_JOB_MAX_ITEMS", 500)
+    bulk_job_ttl_seconds: int = os.environ.get("BULK_JOB_TTL_SECONDS", 86400)
+    
+    # 쓰기 시점 생성 워밍업 (이력서 생성/수정 시 사전 생성, 요청 단위 opt-in 가능)
+    resume_warmup_enabled: bool = os.environ.get("RESUME_WARMUP_ENABLED", False)
+    resume_warmup_priority: int = os.environ.get("RESUME_WARMUP_PRIORITY", 1)
+    resume_warmup_expires: int = os.environ.get("RESUME_WARMUP_EXPIRES", 3600)  # 낮은 우선순위라 대기 허용 시간이 김
+    resume_warmup_rate_limit: int = os.environ.get("RESUME_WARMUP_RATE_LIMIT", 5)  # 이력서(unique_key)별 윈도우당 워밍업 횟수
+    resume_warmup_rate_window_seconds: int = os.environ.get("RESUME_WARMUP_RATE_WINDOW_SECONDS", 3600)
+    resume_warmup_fingerprint_ttl: int = os.environ.get("RESUME_WARMUP_FINGERPRINT_TTL", 30 * 24 * 3600)
+    
+    # Prometheus 메트릭 (API는 /metrics, 워커는 별도 포트로 노출)
+    metrics_worker_port: int = os.environ.get("METRICS_WORKER_PORT", 9100)  # 0이면 워커 노출 안 함
+    metrics_queue_depth_cache_seconds: float = os.environ.get("METRICS_QUEUE_DEPTH_CACHE_SECONDS", 5)  # 큐 길이 조회 캐시
+    
+    # 분산 트레이싱 (HTTP → Celery → LLM/Mongo/Redis 스팬)
+    tracing_exporter: str = os.environ.get("TRACING_EXPORTER", "none")  # none | file | otlp
+    tracing_sample_rate: float = os.environ.get("TRACING_SAMPLE_RATE", 1.0)  # 새 trace 샘플링 비율 (이어받은 trace는 부모 결정 따름)
+    tracing_file_path: str = os.environ.get("TRACING_FILE_PATH", "/tmp/traces.jsonl")
+    tracing_otlp_endpoint: str = os.environ.get("TRACING_OTLP_ENDPOINT", "http://otel-collector:4318/v1/traces")
+    tracing_export_interval_seconds: float = os.environ.get("TRACING_EXPORT_INTERVAL_SECONDS", 2)  # 스팬 배치 내보내기 주기
+    
     class Config:
         env_file = ".env"   
         case_sensitive = False
+
+
+@lru_cache()
+def get_settings() -> BaseAppSettings:
+    """프로세스 단위로 공유되는 공통 설정 인스턴스 반환"""
+    return BaseAppSettings()
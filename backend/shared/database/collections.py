@@ -7,6 +7,7 @@ class Collections:
     RESUMES = "resumes"
     INTERVIEW_QUESTIONS = "interview_questions"
     LEARNING_PATHS = "learning_paths"
+    BULK_JOBS = "bulk_jobs"
 
 
 class CollectionSchemas:
@@ -141,4 +142,23 @@ class CollectionSchemas:
             ],
             "generated_at": "datetime"  # 생성 시간
         }
-
+    
+    @staticmethod
+    def get_bulk_jobs_schema():
+        """대량 생성 작업 요약 컬렉션 스키마"""
+        return {
+            "_id": "ObjectId",          # MongoDB 자동 생성 ID
+            "job_id": "str",            # 대량 작업 ID
+            "job_type": "str",          # 작업 유형 (interview|learning)
+            "state": "str",             # 최종 상태 (SUCCESS|FAILURE|CANCELLED)
+            "total": "int",             # 전체 대상 건수
+            "succeeded": [              # 성공 항목
+                {"unique_key": "str", "task_id": "str"}
+            ],
+            "failed": [                 # 실패 항목
+                {"unique_key": "str", "task_id": "str", "error": "str"}
+            ],
+            "skipped": ["str"],         # 취소로 건너뛴 이력서 키
+            "created_at": "str",        # 작업 생성 시간 (ISO)
+            "finished_at": "str"        # 작업 종료 시간 (ISO)
+        }
@@ -6,7 +6,7 @@ from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 import pymongo
 from typing import Optional
 from shared.utils.logger import setup_logger
-from shared.config.base import BaseAppSettings
+from shared.config.base import get_settings
 from config import settings
 
 logger = setup_logger("shared-database", settings.log_level)
@@ -16,7 +16,7 @@ def get_database():
     """
     Celery tasks용 동기 MongoDB 연결
     """
-    settings = BaseAppSettings()
+    settings = get_settings()
     try:
         client = pymongo.MongoClient(settings.mongodb_url)
         database = client[settings.database_name]
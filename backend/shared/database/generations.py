@@ -0,0 +1,50 @@
+"""
+생성 결과(면접 질문/학습 경로) 문서 공통 조회
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+def reusable_generation_query(unique_key: str, fingerprint: str,
+                              prompt_version: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    같은 프롬프트 입력 지문과 같은 프롬프트로 생성된 결과 조회 조건
+
+    프롬프트 파일이 핫 리로드로 바뀌었거나(내용 해시) 실험 변형 배정이 바뀌었으면 이전 결과는 제외
+    (변형 없는 결과에는 variant 필드가 없어 None 조건과 일치). prompt_version이 None이면 폴백 프롬프트 결과만.
+    """
+    query = {"unique_key": unique_key, "input_fingerprint": fingerprint}
+    if prompt_version is None:
+        query["prompt_version"] = None
+    else:
+        query["prompt_version.hash"] = prompt_version.get("hash")
+        query["prompt_version.variant"] = prompt_version.get("variant")
+    return query
+
+
+def find_reusable_generation(collection, unique_key: str, fingerprint: str,
+                             prompt_version: Optional[Dict[str, Any]]):
+    """
+    프롬프트 입력 지문과 프롬프트 버전(내용 해시, 실험 변형)이 같은 최신 생성 결과 조회
+
+    Motor/pymongo 컬렉션 모두 지원 (Motor 컬렉션이면 await 가능한 객체 반환)
+
+    Args:
+        prompt_version: 지금 생성하면 기록될 프롬프트 버전 표시 (selected_prompt_version)
+    """
+    return collection.find_one(reusable_generation_query(unique_key, fingerprint, prompt_version),
+                               sort=[("created_at", -1)])
+
+
+def serialize_generation(document: Dict[str, Any]) -> Dict[str, Any]:
+    """ObjectId/datetime 필드를 문자열로 변환 (Celery 결과/진행률 저장용)"""
+    serialized = {}
+    for key, value in document.items():
+        if isinstance(value, datetime):
+            serialized[key] = value.isoformat()
+        elif key == "_id":
+            serialized[key] = str(value)
+        else:
+            serialized[key] = value
+    return serialized
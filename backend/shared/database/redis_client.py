@@ -0,0 +1,42 @@
+"""
+Redis 연결 관리
+"""
+
+import redis
+from redis.client import Pipeline
+from typing import Optional
+from shared.config.base import get_settings
+from shared.utils.tracing import start_span
+
+_redis_client: Optional[redis.Redis] = None
+
+
+class TracedPipeline(Pipeline):
+    """파이프라인 실행 한 번을 스팬 하나로 기록"""
+
+    def execute(self, raise_on_error: bool = True):
+        with start_span("redis pipeline", kind="client",
+                        attributes={"db.system": "redis", "db.redis.commands": len(self.command_stack)}):
+            return super().execute(raise_on_error)
+
+
+class TracedRedis(redis.Redis):
+    """명령마다 Redis 스팬을 기록하는 클라이언트 (진행 중인 스팬이 있을 때만)"""
+
+    def execute_command(self, *args, **options):
+        with start_span(f"redis {args[0]}", kind="client", attributes={"db.system": "redis"}):
+            return super().execute_command(*args, **options)
+
+    def pipeline(self, transaction: bool = True, shard_hint=None) -> TracedPipeline:
+        return TracedPipeline(self.connection_pool, self.response_callbacks, transaction, shard_hint)
+
+
+def get_redis_client() -> redis.Redis:
+    """
+    프로세스 단위로 공유되는 동기 Redis 클라이언트 반환
+    (진행률 추적, 작업 제어 신호 등에 사용)
+    """
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = TracedRedis.from_url(get_settings().redis_url)
+    return _redis_client
@@ -0,0 +1,3 @@
+"""
+공통 생성(Generation) 모듈
+"""
@@ -0,0 +1,223 @@
+"""
+커리어 번들 생성 (면접 질문 + 학습 경로)
+
+이력서를 한 번만 축약/포맷팅한 뒤 두 결과를 함께 생성한다.
+- concurrent: 면접/학습 프롬프트를 asyncio.gather로 동시에 호출 (지연 시간 = 둘 중 느린 호출)
+- merged: 두 출력 스키마를 합친 프롬프트로 LLM을 한 번만 호출
+
+저장은 호출 측(API 서비스는 Motor, Celery 태스크는 pymongo)이 담당한다.
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from shared.config.base import get_settings
+from shared.llm.base import cached_prompt_tokens
+from shared.llm.prompt_cache import mark_cache_prefix
+from shared.llm.router import llm_router
+from shared.llm.summarizer import condense_resume
+from shared.prompts.experiments import selected_prompt_version
+from shared.prompts.loader import PROMPT_VERSION_KEY, get_prompt_loader, prompt_version_of
+from shared.utils.json_parser import parse_llm_json_response
+from shared.utils.logger import setup_logger
+from shared.utils.resume_formatter import format_resume_for_ai
+from shared.utils.token_estimator import estimate_message_tokens
+
+settings = get_settings()
+logger = setup_logger("career-bundle", settings.log_level)
+
+BUNDLE_MODE_CONCURRENT = "concurrent"
+BUNDLE_MODE_MERGED = "merged"
+BUNDLE_MODES = (BUNDLE_MODE_CONCURRENT, BUNDLE_MODE_MERGED)
+
+MAX_INTERVIEW_QUESTIONS = 5
+MAX_LEARNING_PATHS = 8
+
+_MERGED_SYSTEM_HEADER = """
+아래 두 작업을 한 번에 수행하세요. 각 작업의 지침은 그대로 따르되, 출력은 두 결과를 합친 하나의 JSON 객체로만 제공하세요.
+"""
+
+_MERGED_OUTPUT_INSTRUCTION = """
+최종 출력 형식 (이 형식이 위 작업별 출력 형식보다 우선합니다):
+{
+  "interview": {"questions": [ ... 작업 1의 questions 항목 ... ]},
+  "learning": {"analysis": { ... }, "summary": "...", "learning_paths": [ ... 작업 2의 learning_paths 항목 ... ]}
+}
+"""
+
+
+def _load_prompt(service_name: str, prompt_file: str, formatted_data: Dict[str, Any]) -> Dict[str, Any]:
+    prompt = get_prompt_loader(service_name).get_prompt(prompt_file)
+    return {
+        "system": prompt.system_prompt,
+        "human": prompt.render_human(formatted_data),
+        "version": prompt.version_info,
+    }
+
+
+def bundle_prompt_versions() -> Dict[str, Optional[Dict[str, str]]]:
+    """번들 결과에 기록될 면접/학습 프롬프트 버전 (기준 프롬프트, 실험 변형 없음 - 생성 결과 재사용 조회용)"""
+    return {
+        "interview": selected_prompt_version(get_prompt_loader("interview"), "interview_questions.yaml"),
+        "learning": selected_prompt_version(get_prompt_loader("learning"), "learning_path.yaml"),
+    }
+
+
+def _to_messages(system_prompt: str, human_prompt: str, prompt_version: Any = None) -> List:
+    """시스템 프롬프트는 요청마다 동일하므로 제공자 프롬프트 캐시용 고정 접두부로 표시"""
+    from langchain_core.messages import SystemMessage, HumanMessage
+    system_message = mark_cache_prefix(SystemMessage(content=system_prompt))
+    if prompt_version is not None:
+        system_message.additional_kwargs[PROMPT_VERSION_KEY] = prompt_version
+    return [system_message, HumanMessage(content=human_prompt)]
+
+
+def build_interview_messages(formatted_data: Dict[str, Any]) -> List:
+    """면접 질문 생성 메시지 (interview_questions.yaml)"""
+    prompt = _load_prompt("interview", "interview_questions.yaml", formatted_data)
+    return _to_messages(prompt["system"], prompt["human"], prompt["version"])
+
+
+def build_learning_messages(formatted_data: Dict[str, Any]) -> List:
+    """학습 경로 생성 메시지 (learning_path.yaml)"""
+    prompt = _load_prompt("learning", "learning_path.yaml", formatted_data)
+    return _to_messages(prompt["system"], prompt["human"], prompt["version"])
+
+
+def build_merged_messages(formatted_data: Dict[str, Any]) -> List:
+    """면접/학습 프롬프트를 합친 단일 호출용 메시지"""
+    interview = _load_prompt("interview", "interview_questions.yaml", formatted_data)
+    learning = _load_prompt("learning", "learning_path.yaml", formatted_data)
+    system_prompt = "\n".join([
+        _MERGED_SYSTEM_HEADER,
+        "[작업 1: 면접 질문 생성]", interview["system"],
+        "[작업 2: 학습 경로 추천]", learning["system"],
+        _MERGED_OUTPUT_INSTRUCTION,
+    ])
+    human_prompt = "\n".join([
+        "[작업 1: 면접 질문 생성]", interview["human"],
+        "[작업 2: 학습 경로 추천]", learning["human"],
+    ])
+    # 두 프롬프트의 버전을 [면접, 학습] 순서로 표시
+    return _to_messages(system_prompt, human_prompt, [interview["version"], learning["version"]])
+
+
+def parse_interview_payload(payload: Any) -> List[Dict[str, Any]]:
+    """면접 질문 응답(문자열 또는 파싱된 객체)에서 질문 목록 추출"""
+    if isinstance(payload, str):
+        payload = parse_llm_json_response(
+            payload,
+            expected_keys=["questions"],
+            fallback_keys={"questions": ["interview_questions", "result"]}
+        )
+    questions = payload if isinstance(payload, list) else (payload or {}).get("questions", [])
+    if not isinstance(questions, list) or not questions:
+        raise ValueError("No valid questions in response")
+    return questions[:MAX_INTERVIEW_QUESTIONS]
+
+
+def parse_learning_payload(payload: Any) -> Dict[str, Any]:
+    """학습 경로 응답(문자열 또는 파싱된 객체)에서 analysis/summary/learning_paths 추출"""
+    if isinstance(payload, str):
+        payload = parse_llm_json_response(
+            payload,
+            expected_keys=["analysis", "summary", "learning_paths"],
+            fallback_keys={"learning_paths": ["paths", "recommendations"]}
+        )
+    payload = payload or {}
+    learning_paths = payload.get("learning_paths", [])
+    if not isinstance(learning_paths, list) or not learning_paths:
+        raise ValueError("No valid learning paths in response")
+    return {
+        "analysis": payload.get("analysis", {"strengths": [], "weaknesses": []}),
+        "summary": payload.get("summary", ""),
+        "learning_paths": learning_paths[:MAX_LEARNING_PATHS],
+    }
+
+
+async def _generate(messages: List, parse, provider: Optional[str], record_latency: bool = True,
+                    **client_options) -> Dict[str, Any]:
+    """
+    LLM 호출 + 파싱 (파싱 성공 여부는 라우터 통계에 반영)
+
+    record_latency=False면 지연 시간을 라우팅 통계에 반영하지 않음 (merged 모드의 두 배 분량 출력)
+    """
+    response_text, llm_client = await llm_router.ainvoke(
+        messages, preferred=provider, client_options=client_options or None, record_latency=record_latency
+    )
+    try:
+        parsed = parse(response_text)
+    except ValueError:
+        llm_router.record_parse(llm_client, False)
+        raise
+    llm_router.record_parse(llm_client, True)
+    return {
+        "parsed": parsed,
+        "provider": llm_client.name,
+        "model": getattr(llm_client, "_model", None),
+        "prompt_tokens": estimate_message_tokens(messages, llm_client.name),
+        "cached_prompt_tokens": cached_prompt_tokens(response_text),
+        "prompt_version": prompt_version_of(messages),
+    }
+
+
+def _merged_parse(response_text: str) -> Dict[str, Any]:
+    payload = parse_llm_json_response(response_text, expected_keys=["interview", "learning"])
+    return {
+        "interview": parse_interview_payload(payload.get("interview") or payload),
+        "learning": parse_learning_payload(payload.get("learning") or payload),
+    }
+
+
+async def generate_career_bundle(resume_data: Dict[str, Any], mode: str = BUNDLE_MODE_CONCURRENT,
+                                 provider: Optional[str] = None) -> Dict[str, Any]:
+    """
+    이력서 한 건으로 면접 질문과 학습 경로를 함께 생성
+
+    Args:
+        resume_data: 원본 이력서 데이터 (이미 조회된 문서)
+        mode: 'concurrent'(두 호출 동시 실행) 또는 'merged'(단일 호출)
+        provider: 우선 사용할 LLM 제공자 (None이면 라우터가 선택)
+
+    Returns:
+        Dict[str, Any]: interview/learning 결과와 각 결과의 provider, model, prompt_tokens, cached_prompt_tokens,
+            prompt_version
+    """
+    if mode not in BUNDLE_MODES:
+        raise ValueError(f"Unknown bundle mode: {mode}")
+
+    started = time.perf_counter()
+
+    # 이력서 축약/포맷팅은 한 번만 (두 프롬프트 중 큰 예산 기준)
+    condensed = await condense_resume(resume_data)
+    formatted_data = format_resume_for_ai(
+        condensed,
+        token_budget=max(settings.prompt_resume_token_budget_interview, settings.prompt_resume_token_budget_learning)
+    )
+
+    if mode == BUNDLE_MODE_MERGED:
+        messages = build_merged_messages(formatted_data)
+        merged = await _generate(messages, _merged_parse, provider, record_latency=False,
+                                 max_tokens=settings.career_bundle_merged_max_tokens)
+        meta = {key: merged[key] for key in ("provider", "model", "prompt_tokens", "cached_prompt_tokens")}
+        interview_version, learning_version = merged["prompt_version"]
+        interview = {"questions": merged["parsed"]["interview"], **meta, "prompt_version": interview_version}
+        learning = {**merged["parsed"]["learning"], **meta, "prompt_version": learning_version}
+    else:
+        interview_result, learning_result = await asyncio.gather(
+            _generate(build_interview_messages(formatted_data), parse_interview_payload, provider),
+            _generate(build_learning_messages(formatted_data), parse_learning_payload, provider),
+        )
+        interview = {"questions": interview_result.pop("parsed"), **interview_result}
+        learning = {**learning_result.pop("parsed"), **learning_result}
+
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+    logger.info(f"Career bundle generated (mode={mode}) in {elapsed_ms}ms")
+    return {
+        "mode": mode,
+        "interview": interview,
+        "learning": learning,
+        "elapsed_ms": elapsed_ms,
+        "generated_at": datetime.utcnow(),
+    }
@@ -0,0 +1,166 @@
+"""
+후보 과생성 + 로컬 다양성 선택 (면접 질문)
+
+한 번의 호출로 N(>5)개 후보 질문을 받은 뒤 서버에서 5개를 고른다.
+- 문자 n-gram TF-IDF 벡터 (한국어/영문 혼용 텍스트에 형태소 분석 없이 동작)
+- 관련도: 이력서 기술 스택(프로젝트 등장 빈도 가중)과의 코사인 유사도
+- MMR(maximal marginal relevance): 관련도는 높고 이미 고른 질문과는 덜 겹치는 후보를 차례로 선택
+
+후보 15개 기준 선택 시간은 1ms 안팎으로 재시도 호출보다 훨씬 저렴하다.
+"""
+
+import re
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from shared.config.base import get_settings
+
+settings = get_settings()
+
+NGRAM_RANGE = (2, 3)
+DEFAULT_MMR_LAMBDA = 0.7
+
+_WHITESPACE = re.compile(r"\s+")
+
+_CANDIDATE_INSTRUCTION = """
+
+[후보 생성]
+위 지침의 질문 개수 대신 서로 다른 주제/유형의 후보 질문 {count}개를 생성하세요.
+출력 형식은 동일하게 {{"questions": [ ... ]}} 입니다. 최종 질문은 서버에서 선택합니다.
+"""
+
+
+def resolve_candidate_count(requested: Optional[int], k: int) -> int:
+    """
+    요청할 후보 수 결정 (요청값 없으면 INTERVIEW_CANDIDATE_COUNT, 상한 INTERVIEW_CANDIDATE_MAX)
+
+    Returns:
+        int: 후보 수, k 이하이면 0 (과생성하지 않음)
+    """
+    count = int(settings.interview_candidate_count if requested is None else requested)
+    if count <= k:
+        return 0
+    return min(count, int(settings.interview_candidate_max))
+
+
+def with_candidate_instruction(messages: List, count: int) -> List:
+    """마지막 휴먼 메시지에 후보 과생성 지시문을 덧붙인 새 메시지 목록"""
+    from langchain_core.messages import HumanMessage
+
+    if not count:
+        return messages
+    *head, last = messages
+    return [*head, HumanMessage(content=last.content + _CANDIDATE_INSTRUCTION.format(count=count))]
+
+
+def _ngrams(text: str) -> List[str]:
+    normalized = f" {_WHITESPACE.sub(' ', text.lower()).strip()} "
+    grams = []
+    for n in range(NGRAM_RANGE[0], NGRAM_RANGE[1] + 1):
+        grams.extend(normalized[i:i + n] for i in range(len(normalized) - n + 1))
+    return grams
+
+
+def _question_text(question: Dict[str, Any]) -> str:
+    return f"{question.get('topic', '')} {question.get('question', '')}"
+
+
+def resume_tech_weights(resume_data: Dict[str, Any]) -> Dict[str, float]:
+    """이력서 기술 스택별 가중치 (프로젝트 등장 횟수 + 보유 기술 목록 1회)"""
+    weights: Dict[str, float] = {}
+    for key in ("work_experiences", "personal_projects"):
+        for item in resume_data.get(key, []) or []:
+            for tech in item.get("tech_stack", []) or []:
+                weights[tech] = weights.get(tech, 0.0) + 1.0
+    for techs in (resume_data.get("technical_skills") or {}).values():
+        for tech in techs or []:
+            weights[tech] = weights.get(tech, 0.0) + 1.0
+    return weights
+
+
+def tfidf_vectors(texts: Sequence[str], query_weights: Optional[Dict[str, float]] = None):
+    """
+    문자 n-gram TF-IDF 행렬과 기술 스택 질의 벡터 (둘 다 L2 정규화)
+
+    Returns:
+        (matrix, query): matrix는 (len(texts), vocab), query는 (vocab,) — 질의가 없으면 영벡터
+    """
+    vocabulary: Dict[str, int] = {}
+    rows = []
+    for text in texts:
+        counts: Dict[int, int] = {}
+        for gram in _ngrams(text):
+            column = vocabulary.setdefault(gram, len(vocabulary))
+            counts[column] = counts.get(column, 0) + 1
+        rows.append(counts)
+
+    matrix = np.zeros((len(texts), max(len(vocabulary), 1)))
+    for row, counts in enumerate(rows):
+        matrix[row, list(counts)] = list(counts.values())
+
+    document_frequency = np.count_nonzero(matrix, axis=0)
+    idf = np.log((1 + len(texts)) / (1 + document_frequency)) + 1.0
+    matrix = np.log1p(matrix) * idf
+
+    query = np.zeros(matrix.shape[1])
+    for term, weight in (query_weights or {}).items():
+        for gram in _ngrams(term):
+            column = vocabulary.get(gram)
+            if column is not None:
+                query[column] += weight
+    query *= idf
+
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    matrix = matrix / np.where(norms == 0, 1.0, norms)
+    query_norm = np.linalg.norm(query)
+    if query_norm:
+        query = query / query_norm
+    return matrix, query
+
+
+def mmr_select(matrix: np.ndarray, relevance: np.ndarray, k: int, mmr_lambda: float = DEFAULT_MMR_LAMBDA) -> List[int]:
+    """MMR 선택 순서대로 행 인덱스 반환 (λ=1이면 관련도만, λ=0이면 다양성만)"""
+    count = matrix.shape[0]
+    k = min(k, count)
+    if k <= 0:
+        return []
+
+    similarity = matrix @ matrix.T
+    selected = [int(np.argmax(relevance))]
+    max_similarity = similarity[selected[0]].copy()
+    available = np.ones(count, dtype=bool)
+    available[selected[0]] = False
+
+    while len(selected) < k:
+        scores = mmr_lambda * relevance - (1 - mmr_lambda) * max_similarity
+        scores[~available] = -np.inf
+        chosen = int(np.argmax(scores))
+        selected.append(chosen)
+        available[chosen] = False
+        np.maximum(max_similarity, similarity[chosen], out=max_similarity)
+    return selected
+
+
+def select_diverse_questions(questions: List[Dict[str, Any]], resume_data: Dict[str, Any], k: int,
+                             mmr_lambda: float = DEFAULT_MMR_LAMBDA) -> Dict[str, Any]:
+    """
+    후보 질문에서 관련도/다양성 기준으로 k개 선택
+
+    Returns:
+        Dict[str, Any]: questions(원래 순서 유지), indices(선택된 후보 위치), selection_ms
+    """
+    started = time.perf_counter()
+    candidates = [q for q in questions if isinstance(q, dict) and q.get("question")]
+    if len(candidates) <= k:
+        fallback = (candidates or questions)[:k]
+        return {"questions": fallback, "indices": list(range(len(fallback))), "selection_ms": 0.0}
+
+    matrix, query = tfidf_vectors([_question_text(q) for q in candidates], resume_tech_weights(resume_data))
+    relevance = matrix @ query
+    indices = sorted(mmr_select(matrix, relevance, k, mmr_lambda))
+    return {
+        "questions": [candidates[i] for i in indices],
+        "indices": indices,
+        "selection_ms": round((time.perf_counter() - started) * 1000, 3),
+    }
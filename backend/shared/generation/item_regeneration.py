@@ -0,0 +1,178 @@
+"""
+생성 결과 부분 재생성 (면접 질문/학습 경로 항목 하나만 다시 생성)
+
+- 원래 생성에 쓰인 프롬프트 지침을 그대로 쓰고, 출력은 교체할 항목 하나로 제한
+- 나머지 항목은 중복 방지를 위한 컨텍스트로 함께 전달
+- 결과는 교체되지 않은 항목을 그대로 공유하는 새 리비전 문서로 저장 (원본 문서는 변경하지 않음)
+
+저장은 호출 측(API 서비스는 Motor)이 담당한다.
+"""
+
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from shared.config.base import get_settings
+from shared.llm.router import llm_router
+from shared.llm.summarizer import condense_resume
+from shared.prompts.loader import get_prompt_loader, prompt_version_of
+from shared.utils.json_parser import parse_llm_json_response
+from shared.utils.logger import setup_logger
+from shared.utils.resume_formatter import PROMPT_FORMATTERS
+from shared.utils.token_estimator import estimate_message_tokens
+
+settings = get_settings()
+logger = setup_logger("item-regeneration", settings.log_level)
+
+# 생성 종류별 프롬프트 파일, 항목 필드, 주제 매칭에 쓰는 항목 키
+ITEM_KINDS: Dict[str, Dict[str, Any]] = {
+    "interview": {
+        "prompt": ("interview", "interview_questions.yaml"),
+        "items_field": "questions",
+        "topic_keys": ("topic", "question"),
+        "label": "면접 질문",
+    },
+    "learning": {
+        "prompt": ("learning", "learning_path.yaml"),
+        "items_field": "learning_paths",
+        "topic_keys": ("title", "category"),
+        "label": "학습 경로",
+    },
+}
+
+_ITEM_OUTPUT_INSTRUCTION = """
+[부분 재생성]
+시스템 지침의 전체 출력 형식 대신, 아래 지정된 번호의 {label} 1개만 새로 생성하세요.
+- 기존 항목들과 주제/내용이 겹치지 않아야 합니다
+- 항목 하나의 필드 구성은 시스템 지침 출력 형식의 항목과 동일해야 합니다
+- 출력은 다음 JSON 형식으로만 제공하세요: {{"item": {{ ... }}}}
+"""
+
+
+def resolve_item_index(kind: str, items: List[Dict[str, Any]], index: Optional[int] = None,
+                       topic: Optional[str] = None) -> int:
+    """
+    교체할 항목 위치 결정 (index 또는 topic 중 하나)
+
+    Raises:
+        ValueError: 둘 다 없거나 둘 다 지정된 경우, 범위를 벗어난 경우, 주제가 일치하는 항목이 없는 경우
+    """
+    if (index is None) == (topic is None):
+        raise ValueError("Specify exactly one of index or topic")
+    if index is not None:
+        if not 0 <= index < len(items):
+            raise ValueError(f"Item index out of range: {index} (0-{len(items) - 1})")
+        return index
+
+    needle = topic.strip().lower()
+    for position, item in enumerate(items):
+        for key in ITEM_KINDS[kind]["topic_keys"]:
+            if needle and needle in str(item.get(key, "")).lower():
+                return position
+    raise ValueError(f"No item matches topic: {topic}")
+
+
+def build_item_messages(kind: str, formatted_data: Dict[str, Any], items: List[Dict[str, Any]],
+                        index: int) -> List:
+    """항목 하나만 생성하도록 원래 프롬프트에 기존 항목과 교체 위치를 덧붙인 메시지"""
+    from langchain_core.messages import HumanMessage
+
+    spec = ITEM_KINDS[kind]
+    prompt = get_prompt_loader(spec["prompt"][0]).get_prompt(spec["prompt"][1])
+    # 시스템 프롬프트는 전체 생성과 같은 고정 접두부로 두고(프롬프트 캐시 공유), 부분 재생성 지시문은 휴먼 프롬프트에
+    system_message, human_message = prompt.build_messages(formatted_data)
+
+    kept = [
+        f"{position + 1}. {json.dumps(item, ensure_ascii=False)}"
+        for position, item in enumerate(items) if position != index
+    ]
+    human_prompt = "\n".join([
+        human_message.content,
+        _ITEM_OUTPUT_INSTRUCTION.format(label=spec["label"]),
+        f"유지할 기존 {spec['label']} (중복 금지):",
+        *kept,
+        "",
+        f"교체할 {index + 1}번 항목 (이와 다른 내용으로 새로 생성):",
+        json.dumps(items[index], ensure_ascii=False),
+    ])
+    return [system_message, HumanMessage(content=human_prompt)]
+
+
+def parse_item_payload(kind: str, response_text: str) -> Dict[str, Any]:
+    """응답에서 새 항목 하나 추출 ({"item": ...}, 전체 형식의 첫 항목, 항목 객체 자체 모두 허용)"""
+    items_field = ITEM_KINDS[kind]["items_field"]
+    payload = parse_llm_json_response(response_text, expected_keys=["item"],
+                                      fallback_keys={"item": [items_field]})
+    item = payload.get("item", payload) if isinstance(payload, dict) else payload
+    if isinstance(item, list):
+        item = item[0] if item else None
+    if not isinstance(item, dict) or not item:
+        raise ValueError("No valid item in response")
+    return item
+
+
+async def regenerate_item(kind: str, resume_data: Dict[str, Any], items: List[Dict[str, Any]], index: int,
+                          provider: Optional[str] = None) -> Dict[str, Any]:
+    """
+    항목 하나 재생성
+
+    Args:
+        kind: 'interview' | 'learning'
+        resume_data: 원본 이력서 데이터
+        items: 현재 리비전의 항목 목록
+        index: 교체할 항목 위치
+        provider: 우선 사용할 LLM 제공자 (None이면 라우터가 선택)
+
+    Returns:
+        Dict[str, Any]: item, provider, model, prompt_tokens, prompt_version
+    """
+    condensed = await condense_resume(resume_data)
+    formatted_data = PROMPT_FORMATTERS[kind](condensed)
+    messages = build_item_messages(kind, formatted_data, items, index)
+
+    response_text, llm_client = await llm_router.ainvoke(
+        messages, preferred=provider,
+        client_options={"max_tokens": settings.item_regeneration_max_tokens},
+        record_latency=False,  # 항목 하나 분량의 짧은 호출 지연이 본 생성 라우팅(p95)에 섞이지 않도록
+    )
+    try:
+        item = parse_item_payload(kind, response_text)
+    except ValueError:
+        llm_router.record_parse(llm_client, False)
+        raise
+    llm_router.record_parse(llm_client, True)
+
+    return {
+        "item": item,
+        "provider": llm_client.name,
+        "model": getattr(llm_client, "_model", None),
+        "prompt_tokens": estimate_message_tokens(messages, llm_client.name),
+        "prompt_version": prompt_version_of(messages),
+    }
+
+
+def build_revision(kind: str, parent: Dict[str, Any], index: int, regenerated: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    항목 하나를 교체한 새 리비전 문서 생성
+
+    교체되지 않은 항목과 나머지 필드(input_fingerprint 등)는 부모 문서에서 그대로 가져오므로
+    지문 기반 재사용 조회는 가장 최근 리비전을 반환한다.
+    """
+    items_field = ITEM_KINDS[kind]["items_field"]
+    items = list(parent[items_field])
+    items[index] = regenerated["item"]
+
+    revision = {key: value for key, value in parent.items() if key not in ("_id", "id")}
+    revision.update({
+        items_field: items,
+        "parent_id": str(parent.get("_id") or parent.get("id")),
+        "revision": parent.get("revision", 1) + 1,
+        "regenerated_item": {
+            "index": index,
+            "provider": regenerated["provider"],
+            "model": regenerated["model"],
+            "prompt_tokens": regenerated["prompt_tokens"],
+            "prompt_version": regenerated.get("prompt_version"),
+        },
+        "created_at": datetime.utcnow(),
+    })
+    return revision
@@ -0,0 +1,210 @@
+"""
+유사 이력서 탐지 (MinHash + LSH) 및 기존 생성 결과 재활용
+
+부트캠프 동기, 템플릿, 한 줄만 고친 재제출처럼 거의 같은 이력서의 생성 결과를 재사용한다.
+- 서명: 포맷터 출력(프로젝트/경력, 이름 제외)을 정규화한 문자 5-gram 집합의 MinHash
+- 색인: 서명을 밴드로 나눠 Redis 집합(버킷)에 저장, 이력서 생성/수정 시마다 갱신
+  (이력서당 서명 512바이트 + 밴드 수만큼의 집합 원소 → 수백만 건도 메모리에 유지 가능)
+- 조회: 밴드 버킷 후보를 한 번의 파이프라인으로 모은 뒤 서명 일치율(자카드 유사도 추정)로 필터
+- 활용: reuse(유사 이력서의 결과를 그대로 사용) 또는 draft(초안으로 넘겨 바뀐 항목만 생성)
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from shared.config.base import get_settings
+from shared.database.redis_client import get_redis_client
+from shared.utils.logger import setup_logger
+from shared.utils.metrics import observe_cache_lookup
+from shared.utils.resume_formatter import format_resume_for_ai
+
+settings = get_settings()
+logger = setup_logger("near-duplicate", settings.log_level)
+
+NEAR_DUPLICATE_OFF = "off"
+NEAR_DUPLICATE_REUSE = "reuse"
+NEAR_DUPLICATE_DRAFT = "draft"
+NEAR_DUPLICATE_MODES = (NEAR_DUPLICATE_OFF, NEAR_DUPLICATE_REUSE, NEAR_DUPLICATE_DRAFT)
+
+SHINGLE_SIZE = 5
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_WHITESPACE = re.compile(r"\s+")
+
+_DRAFT_INSTRUCTION = """
+
+[참고 초안]
+아래는 거의 같은 이력서로 생성된 기존 면접 질문입니다. 이 이력서에도 맞는 질문은 번호만 유지하고,
+맞지 않는 질문만 새로 생성하세요. 출력 형식: {{"keep": [유지할 초안 번호(0부터)], "questions": [새로 생성한 질문만]}}
+{draft}
+"""
+
+
+def _permutations(num_perm: int) -> Tuple[np.ndarray, np.ndarray]:
+    rng = np.random.RandomState(1)
+    a = rng.randint(1, 1 << 31, size=num_perm).astype(np.uint64)
+    b = rng.randint(0, 1 << 31, size=num_perm).astype(np.uint64)
+    return a, b
+
+
+_PERMUTATIONS = _permutations(int(settings.resume_lsh_num_perm))
+
+
+def resume_shingle_text(resume_data: Dict[str, Any]) -> str:
+    """유사도 비교용 텍스트 (포맷터 출력 중 경력/프로젝트만, 이름/연락처 제외)"""
+    formatted = format_resume_for_ai(resume_data)
+    text = f"{int(formatted.get('experience_months') or 0) // 12}y {formatted.get('projects', '')}"
+    return _WHITESPACE.sub(" ", text.lower()).strip()
+
+
+def minhash_signature(text: str) -> np.ndarray:
+    """문자 5-gram 집합의 MinHash 서명 (uint32, 길이 RESUME_LSH_NUM_PERM)"""
+    shingles = {text[i:i + SHINGLE_SIZE] for i in range(max(len(text) - SHINGLE_SIZE + 1, 1))}
+    hashes = np.frombuffer(
+        b"".join(hashlib.blake2b(s.encode(), digest_size=4).digest() for s in shingles), dtype="<u4"
+    ).astype(np.uint64)
+    a, b = _PERMUTATIONS
+    permuted = ((a[:, None] * hashes[None, :] + b[:, None]) % _MERSENNE_PRIME) & _MAX_HASH
+    return permuted.min(axis=1).astype(np.uint32)
+
+
+def resume_signature(resume_data: Dict[str, Any]) -> np.ndarray:
+    return minhash_signature(resume_shingle_text(resume_data))
+
+
+def estimate_similarity(signature: np.ndarray, others: np.ndarray) -> np.ndarray:
+    """서명 일치 비율 = 자카드 유사도 추정 (others: (n, num_perm))"""
+    return (others == signature).mean(axis=-1)
+
+
+def _band_keys(signature: np.ndarray) -> List[str]:
+    bands = int(settings.resume_lsh_bands)
+    rows = len(signature) // bands
+    return [
+        f"resume_lsh:{band}:{hashlib.blake2b(signature[band * rows:(band + 1) * rows].tobytes(), digest_size=8).hexdigest()}"
+        for band in range(bands)
+    ]
+
+
+def _signature_key(unique_key: str) -> str:
+    return f"resume_minhash:{unique_key}"
+
+
+def index_resume(resume_data: Dict[str, Any]) -> bool:
+    """
+    이력서 서명을 LSH 색인에 등록/갱신 (수정 시 이전 버킷에서 제거, 최선 노력)
+
+    Returns:
+        bool: 등록 성공 여부 (Redis 장애 시 False, 이력서 저장은 계속)
+    """
+    unique_key = resume_data["unique_key"]
+    try:
+        signature = resume_signature(resume_data)
+        redis_client = get_redis_client()
+        previous = redis_client.get(_signature_key(unique_key))
+
+        pipe = redis_client.pipeline()
+        if previous is not None:
+            for key in _band_keys(np.frombuffer(previous, dtype=np.uint32)):
+                pipe.srem(key, unique_key)
+        for key in _band_keys(signature):
+            pipe.sadd(key, unique_key)
+        pipe.set(_signature_key(unique_key), signature.tobytes())
+        pipe.execute()
+        return True
+    except Exception as e:
+        logger.warning(f"Failed to index resume {unique_key} for near-duplicate lookup: {e}")
+        return False
+
+
+def find_similar_resumes(resume_data: Dict[str, Any], threshold: Optional[float] = None,
+                         limit: int = 5) -> List[Tuple[str, float]]:
+    """
+    유사도가 threshold 이상인 다른 이력서 (유사도 내림차순)
+
+    Returns:
+        List[Tuple[str, float]]: (unique_key, 추정 자카드 유사도)
+    """
+    threshold = float(settings.resume_near_duplicate_threshold if threshold is None else threshold)
+    unique_key = resume_data.get("unique_key")
+    signature = resume_signature(resume_data)
+    redis_client = get_redis_client()
+
+    pipe = redis_client.pipeline()
+    for key in _band_keys(signature):
+        pipe.smembers(key)
+    candidates = set()
+    for members in pipe.execute():
+        candidates.update(m.decode() if isinstance(m, bytes) else m for m in members)
+    candidates.discard(unique_key)
+    if not candidates:
+        return []
+
+    keys = sorted(candidates)
+    stored = redis_client.mget([_signature_key(key) for key in keys])
+    present = [(key, raw) for key, raw in zip(keys, stored) if raw is not None and len(raw) == signature.nbytes]
+    if not present:
+        return []
+
+    others = np.frombuffer(b"".join(raw for _, raw in present), dtype=np.uint32).reshape(len(present), -1)
+    similarities = estimate_similarity(signature, others)
+    ranked = sorted(
+        ((key, float(similarity)) for (key, _), similarity in zip(present, similarities) if similarity >= threshold),
+        key=lambda item: -item[1]
+    )
+    return ranked[:limit]
+
+
+async def find_near_duplicate_generation(collection, resume_data: Dict[str, Any],
+                                         threshold: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    """
+    유사 이력서의 최신 생성 결과 조회 (Motor 컬렉션, 질문 은행 구성분 제외)
+
+    Returns:
+        Optional[Dict[str, Any]]: document, unique_key(유사 이력서), similarity — 없거나 조회 실패 시 None
+    """
+    try:
+        # 동기 Redis 조회/서명 비교는 이벤트 루프 밖에서
+        similar = await asyncio.to_thread(find_similar_resumes, resume_data, threshold)
+    except Exception as e:
+        logger.warning(f"Near-duplicate lookup failed: {e}")
+        return None
+
+    for similar_key, similarity in similar:
+        document = await collection.find_one(
+            {"unique_key": similar_key, "source": {"$ne": "question_bank"}}, sort=[("created_at", -1)]
+        )
+        if document:
+            observe_cache_lookup("near_duplicate", True)
+            return {"document": document, "unique_key": similar_key, "similarity": round(similarity, 4)}
+    observe_cache_lookup("near_duplicate", False)
+    return None
+
+
+def resolve_near_duplicate_mode(requested: Optional[str]) -> str:
+    mode = requested or settings.resume_near_duplicate_mode
+    if mode not in NEAR_DUPLICATE_MODES:
+        raise ValueError(f"Near-duplicate mode must be one of {', '.join(NEAR_DUPLICATE_MODES)}")
+    return mode
+
+
+def draft_instruction(draft_questions: List[Dict[str, Any]]) -> str:
+    """휴먼 프롬프트 끝에 덧붙일 초안 지시문 (바뀐 질문만 출력하게 해 출력 토큰 절감)"""
+    numbered = "\n".join(f"{i}. {json.dumps(q, ensure_ascii=False)}" for i, q in enumerate(draft_questions))
+    return _DRAFT_INSTRUCTION.format(draft=numbered)
+
+
+def merge_draft_response(draft_questions: List[Dict[str, Any]], parsed: Any, limit: int = 5) -> List[Dict[str, Any]]:
+    """초안 응답 병합 (keep이 없으면 전체 질문 목록으로 응답한 것으로 간주)"""
+    if isinstance(parsed, list):
+        return parsed[:limit]
+    keep = parsed.get("keep") if isinstance(parsed, dict) else None
+    questions = parsed.get("questions", []) if isinstance(parsed, dict) else []
+    if not isinstance(keep, list):
+        return questions[:limit]
+    kept = [draft_questions[i] for i in keep if isinstance(i, int) and 0 <= i < len(draft_questions)]
+    return (kept + [q for q in questions if isinstance(q, dict)])[:limit]
@@ -0,0 +1,408 @@
+"""
+면접 질문 은행 (저장된 생성 결과 재활용, LLM 호출 없는 질문 세트 구성)
+
+- 수집: interview_questions의 새 생성 결과를 체크포인트(_id) 이후부터 증분 수집
+- 정규화: 공백/유니코드 정규화, topic을 기술 태그로 분리, 난이도 easy|medium|hard
+- 중복 제거: 문자 3-gram SimHash(64비트) 해밍 거리 기준 (전체 항목과 XOR + popcount를 벡터 연산으로 비교)
+- 색인: 태그별 포스팅 목록 + 난이도/빈도 배열을 단일 바이너리 파일로 저장
+  (mmap으로 열어 prefork 워커들이 페이지 캐시를 공유, 교체는 임시 파일 + os.replace)
+- 조회: 이력서 기술 스택 가중치로 점수화 후 태그/난이도가 겹치지 않게 k개 선택 (수 ms)
+
+파일 형식: MAGIC(8) | 헤더 길이(uint32) | 헤더 JSON | 8바이트 정렬된 배열들
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import time
+import unicodedata
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from shared.config.base import get_settings
+from shared.generation.diversity import resume_tech_weights
+from shared.utils.logger import setup_logger
+
+settings = get_settings()
+logger = setup_logger("question-bank", settings.log_level)
+
+MAGIC = b"QBIDX001"
+INDEX_VERSION = 1
+SOURCE_QUESTION_BANK = "question_bank"
+
+DIFFICULTIES = ("easy", "medium", "hard")
+# 세트 구성 시 난이도별 목표 개수 (5개 기준)
+DIFFICULTY_TARGETS = {"easy": 1, "medium": 3, "hard": 1}
+
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+_WHITESPACE = re.compile(r"\s+")
+_TAG_SEPARATORS = re.compile(r"[,/·|+]")
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def default_index_path() -> str:
+    """색인 파일 경로 (QUESTION_BANK_INDEX_PATH, 기본값 backend/data/question_bank.idx)"""
+    return settings.question_bank_index_path or os.path.join(BACKEND_DIR, "data", "question_bank.idx")
+
+
+# ---------- 정규화 / SimHash ----------
+
+def normalize_text(text: str) -> str:
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text or "")).strip()
+
+
+def normalize_tag(tag: str) -> str:
+    return normalize_text(tag).lower()
+
+
+def split_tags(topic: str) -> List[str]:
+    """topic 문자열('MSA, Kafka, Redis')을 정규화된 태그 목록으로 분리 (순서 유지, 중복 제거)"""
+    tags = []
+    for part in _TAG_SEPARATORS.split(topic or ""):
+        tag = normalize_tag(part)
+        if tag and tag not in tags:
+            tags.append(tag)
+    return tags
+
+
+def normalize_difficulty(value: Any) -> str:
+    value = normalize_tag(str(value or ""))
+    return value if value in DIFFICULTIES else "medium"
+
+
+def simhash(text: str) -> int:
+    """문자 3-gram 기반 64비트 SimHash"""
+    normalized = normalize_tag(text).replace(" ", "")
+    grams = {normalized[i:i + 3] for i in range(max(len(normalized) - 2, 1))}
+    hashes = np.frombuffer(
+        b"".join(hashlib.blake2b(gram.encode(), digest_size=8).digest() for gram in grams), dtype="<u8"
+    )
+    bits = (hashes[:, None] >> np.arange(64, dtype=np.uint64)) & np.uint64(1)
+    votes = 2 * bits.sum(axis=0, dtype=np.int64) - len(hashes)
+    return int(np.packbits(votes > 0, bitorder="little").view("<u8")[0])
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def hamming_distances(values: np.ndarray, fingerprint: int) -> np.ndarray:
+    """uint64 배열의 각 값과 fingerprint 사이 해밍 거리"""
+    xor = np.bitwise_xor(values, np.uint64(fingerprint))
+    return _POPCOUNT[xor.view(np.uint8)].reshape(-1, 8).sum(axis=1)
+
+
+# ---------- 수집 ----------
+
+class QuestionBankBuilder:
+    """정규화/중복 제거하며 질문을 누적 (기존 색인 항목에서 이어서 증분 수집 가능)"""
+
+    def __init__(self, entries: Optional[List[Dict[str, Any]]] = None, max_distance: Optional[int] = None):
+        self.max_distance = int(settings.question_bank_dedup_distance if max_distance is None else max_distance)
+        self.entries: List[Dict[str, Any]] = []
+        self._simhashes = np.zeros(max(len(entries or []), 1024), dtype=np.uint64)
+        self.added = 0
+        self.duplicates = 0
+        for entry in entries or []:
+            self._insert(entry)
+
+    def _insert(self, entry: Dict[str, Any]) -> None:
+        if len(self.entries) == len(self._simhashes):
+            self._simhashes = np.concatenate([self._simhashes, np.zeros_like(self._simhashes)])
+        self._simhashes[len(self.entries)] = entry["simhash"]
+        self.entries.append(entry)
+
+    def find_duplicate(self, fingerprint: int) -> Optional[int]:
+        if not self.entries:
+            return None
+        distances = hamming_distances(self._simhashes[:len(self.entries)], fingerprint)
+        nearest = int(np.argmin(distances))
+        return nearest if distances[nearest] <= self.max_distance else None
+
+    def add(self, question: Dict[str, Any]) -> bool:
+        """질문 하나 추가 (중복이면 기존 항목 빈도만 증가). 추가되면 True"""
+        text = normalize_text(question.get("question", "")) if isinstance(question, dict) else ""
+        if len(text) < 10:
+            return False
+
+        fingerprint = simhash(text)
+        duplicate = self.find_duplicate(fingerprint)
+        if duplicate is not None:
+            self.entries[duplicate]["count"] += 1
+            self.duplicates += 1
+            return False
+
+        self._insert({
+            "question": text,
+            "topic": normalize_text(question.get("topic", "")),
+            "tags": split_tags(question.get("topic", "")),
+            "difficulty": normalize_difficulty(question.get("difficulty")),
+            "what_good_answers_cover": list(question.get("what_good_answers_cover") or []),
+            "simhash": fingerprint,
+            "count": 1,
+        })
+        self.added += 1
+        return True
+
+
+def _generation_query(checkpoint: Optional[str]) -> Dict[str, Any]:
+    from bson import ObjectId
+
+    query: Dict[str, Any] = {"source": {"$ne": SOURCE_QUESTION_BANK}}
+    if checkpoint:
+        query["_id"] = {"$gt": ObjectId(checkpoint)}
+    return query
+
+
+def update_question_bank(db, path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    체크포인트 이후 생성된 면접 질문을 수집해 색인 파일 갱신 (Celery 태스크용, pymongo)
+
+    Returns:
+        Dict[str, Any]: entries, added, duplicates, generations, checkpoint, elapsed_ms
+    """
+    started = time.perf_counter()
+    path = path or default_index_path()
+    existing = QuestionBankIndex.open(path) if os.path.exists(path) else None
+    builder = QuestionBankBuilder(existing.entries() if existing else None)
+    checkpoint = existing.header.get("checkpoint") if existing else None
+    if existing:
+        existing.close()
+
+    generations = 0
+    cursor = db.interview_questions.find(_generation_query(checkpoint), {"questions": 1}).sort("_id", 1)
+    for generation in cursor:
+        generations += 1
+        checkpoint = str(generation["_id"])
+        for question in generation.get("questions") or []:
+            builder.add(question)
+
+    write_index(path, builder.entries, checkpoint)
+    stats = {
+        "entries": len(builder.entries),
+        "added": builder.added,
+        "duplicates": builder.duplicates,
+        "generations": generations,
+        "checkpoint": checkpoint,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+    logger.info(f"Question bank updated: {stats}")
+    return stats
+
+
+# ---------- 색인 파일 ----------
+
+def write_index(path: str, entries: List[Dict[str, Any]], checkpoint: Optional[str] = None) -> None:
+    """항목 목록을 색인 파일로 저장 (임시 파일에 쓴 뒤 원자적으로 교체)"""
+    tags = sorted({tag for entry in entries for tag in entry["tags"]})
+    tag_ids = {tag: i for i, tag in enumerate(tags)}
+    postings_by_tag: List[List[int]] = [[] for _ in tags]
+    for position, entry in enumerate(entries):
+        for tag in entry["tags"]:
+            postings_by_tag[tag_ids[tag]].append(position)
+
+    payloads = [json.dumps({k: v for k, v in entry.items() if k not in ("simhash", "count")},
+                           ensure_ascii=False).encode() for entry in entries]
+    arrays = {
+        "tag_offsets": np.cumsum([0] + [len(p) for p in postings_by_tag], dtype=np.int64),
+        "postings": np.array([p for postings in postings_by_tag for p in postings], dtype=np.int32),
+        "difficulty": np.array([DIFFICULTIES.index(e["difficulty"]) for e in entries], dtype=np.uint8),
+        "popularity": np.array([e["count"] for e in entries], dtype=np.uint32),
+        "simhash": np.array([e["simhash"] for e in entries], dtype=np.uint64),
+        "payload_offsets": np.cumsum([0] + [len(p) for p in payloads], dtype=np.int64),
+        "payload": np.frombuffer(b"".join(payloads), dtype=np.uint8),
+    }
+
+    layout, offset = {}, 0
+    for name, array in arrays.items():
+        layout[name] = [offset, array.dtype.str, int(array.size)]
+        offset += -(-array.nbytes // 8) * 8
+    header = json.dumps({
+        "version": INDEX_VERSION,
+        "built_at": datetime.utcnow().isoformat(),
+        "checkpoint": checkpoint,
+        "entries": len(entries),
+        "tags": tags,
+        "arrays": layout,
+    }, ensure_ascii=False).encode()
+    data_start = -(-(len(MAGIC) + 4 + len(header)) // 8) * 8
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC + struct.pack("<I", len(header)) + header)
+        for name, array in arrays.items():
+            f.seek(data_start + layout[name][0])
+            f.write(array.tobytes())
+        f.truncate(data_start + offset)
+    os.replace(tmp_path, path)
+
+
+class QuestionBankIndex:
+    """mmap으로 연 읽기 전용 색인 (배열은 복사 없이 파일 페이지를 참조)"""
+
+    def __init__(self, path: str, file, mapped: mmap.mmap, header: Dict[str, Any], data_start: int):
+        self.path = path
+        self.header = header
+        self.stat = os.fstat(file.fileno())
+        self.tag_ids = {tag: i for i, tag in enumerate(header["tags"])}
+        self._file = file
+        self._mmap = mapped
+        self.arrays: Dict[str, np.ndarray] = {
+            name: np.frombuffer(mapped, dtype=np.dtype(dtype), count=count, offset=data_start + offset)
+            for name, (offset, dtype, count) in header["arrays"].items()
+        }
+
+    @classmethod
+    def open(cls, path: str) -> "QuestionBankIndex":
+        file = open(path, "rb")
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            if mapped[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"Not a question bank index: {path}")
+            (header_len,) = struct.unpack_from("<I", mapped, len(MAGIC))
+            header_start = len(MAGIC) + 4
+            header = json.loads(mapped[header_start:header_start + header_len])
+            if header.get("version") != INDEX_VERSION:
+                raise ValueError(f"Unsupported question bank index version: {header.get('version')}")
+        except Exception:
+            file.close()
+            raise
+        return cls(path, file, mapped, header, -(-(header_start + header_len) // 8) * 8)
+
+    def close(self) -> None:
+        # frombuffer 배열이 mmap을 참조하므로 배열을 먼저 해제
+        self.arrays = {}
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass  # 외부에 남은 배열 참조가 있으면 GC 시 해제
+        self._file.close()
+
+    def __len__(self) -> int:
+        return int(self.header["entries"])
+
+    def entry(self, position: int) -> Dict[str, Any]:
+        offsets = self.arrays["payload_offsets"]
+        start, end = int(offsets[position]), int(offsets[position + 1])
+        entry = json.loads(self.arrays["payload"][start:end].tobytes())
+        entry["simhash"] = int(self.arrays["simhash"][position])
+        entry["count"] = int(self.arrays["popularity"][position])
+        return entry
+
+    def entries(self) -> List[Dict[str, Any]]:
+        return [self.entry(position) for position in range(len(self))]
+
+    def postings(self, tag: str) -> np.ndarray:
+        """태그가 붙은 항목 위치 배열 (없으면 빈 배열)"""
+        tag_id = self.tag_ids.get(normalize_tag(tag))
+        if tag_id is None:
+            return np.empty(0, dtype=np.int32)
+        offsets = self.arrays["tag_offsets"]
+        return self.arrays["postings"][int(offsets[tag_id]):int(offsets[tag_id + 1])]
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "entries": len(self),
+            "tags": len(self.header["tags"]),
+            "checkpoint": self.header.get("checkpoint"),
+            "built_at": self.header.get("built_at"),
+            "size_bytes": self.stat.st_size,
+        }
+
+
+_index_cache: Dict[str, QuestionBankIndex] = {}
+
+
+def get_question_bank(path: Optional[str] = None) -> Optional[QuestionBankIndex]:
+    """
+    프로세스별 색인 핸들 (파일이 교체되면 다시 열기, 파일이 없으면 None)
+
+    워커 fork 이후 처음 호출될 때 열리므로 각 프로세스가 같은 파일 페이지를 공유한다.
+    """
+    path = path or default_index_path()
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+
+    cached = _index_cache.get(path)
+    if cached and (cached.stat.st_ino, cached.stat.st_mtime_ns) == (stat.st_ino, stat.st_mtime_ns):
+        return cached
+    try:
+        index = QuestionBankIndex.open(path)
+    except Exception as e:
+        logger.warning(f"Failed to open question bank index {path}: {e}")
+        return cached
+    _index_cache[path] = index
+    if cached:
+        cached.close()
+    return index
+
+
+# ---------- 세트 구성 ----------
+
+def assemble_question_set(index: QuestionBankIndex, resume_data: Dict[str, Any], k: int = 5,
+                          require_match: bool = True) -> List[Dict[str, Any]]:
+    """
+    이력서 기술 스택에 맞춘 질문 k개를 색인에서 구성 (LLM 호출 없음)
+
+    Args:
+        require_match: True면 기술 태그가 하나도 겹치지 않는 항목은 쓰지 않음
+                       (False면 부족분을 빈도가 높은 질문으로 채움, 장애 시 degraded 모드용)
+
+    Returns:
+        List[Dict[str, Any]]: 질문 목록 (difficulty, topic, question, what_good_answers_cover)
+    """
+    if not len(index):
+        return []
+
+    scores = np.zeros(len(index), dtype=np.float32)
+    for tech, weight in resume_tech_weights(resume_data).items():
+        postings = index.postings(tech)
+        scores[postings] += weight
+    matched = scores > 0
+    scores += 0.1 * np.log1p(index.arrays["popularity"].astype(np.float32))
+    if require_match:
+        scores[~matched] = -np.inf
+
+    order = np.argsort(-scores, kind="stable")[:max(k * 10, 50)]
+    order = [int(p) for p in order if np.isfinite(scores[p])]
+
+    difficulties = index.arrays["difficulty"]
+    chosen: List[int] = []
+    used_tags: set = set()
+    per_difficulty = {difficulty: 0 for difficulty in DIFFICULTIES}
+    # 1차: 주 태그와 난이도 목표가 겹치지 않게, 2차: 남은 자리를 점수 순으로 채움
+    for strict in (True, False):
+        for position in order:
+            if len(chosen) >= k:
+                break
+            if position in chosen:
+                continue
+            entry_tags = index.entry(position)["tags"] if strict else []
+            difficulty = DIFFICULTIES[int(difficulties[position])]
+            if strict and ((entry_tags and entry_tags[0] in used_tags)
+                           or per_difficulty[difficulty] >= DIFFICULTY_TARGETS.get(difficulty, k)):
+                continue
+            chosen.append(position)
+            used_tags.update(entry_tags[:1])
+            per_difficulty[difficulty] += 1
+
+    questions = []
+    for position in chosen:
+        entry = index.entry(position)
+        questions.append({
+            "difficulty": entry["difficulty"],
+            "topic": entry["topic"],
+            "question": entry["question"],
+            "what_good_answers_cover": entry["what_good_answers_cover"],
+        })
+    return questions
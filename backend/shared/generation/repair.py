@@ -0,0 +1,212 @@
+"""
+생성 응답 부분 복구 (전체 재생성 대신 이어받기/항목 재요청)
+
+- 잘림: 제공자 종료 사유(출력 토큰 한도)로 감지하고, 마지막 완성 항목 다음부터 부족한 항목만 이어서 생성
+- 검증 실패: 항목 스키마에 맞지 않는 항목만 재요청하고 유효한 항목은 그대로 유지
+- 복구 호출은 같은 제공자 우선, 작은 출력 한도(LLM_REPAIR_MAX_TOKENS)와 호출 상한(LLM_REPAIR_MAX_ATTEMPTS) 적용
+- 상한 안에 복구되지 않은 항목은 버림 (유효 항목이 없으면 호출 측이 기존처럼 실패 처리)
+
+항목 스키마(Pydantic)는 각 서비스 schemas.py의 모델을 호출 측이 전달한다.
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Tuple, Type
+from pydantic import BaseModel, ValidationError
+from shared.config.base import get_settings
+from shared.generation.item_regeneration import ITEM_KINDS
+from shared.llm.base import is_truncated
+from shared.llm.router import llm_router
+from shared.llm.structured import parse_structured_response, uses_structured_output
+from shared.utils.json_parser import parse_llm_json_response
+from shared.utils.logger import setup_logger
+from shared.utils.token_estimator import estimate_message_tokens
+from shared.utils.tracing import traced
+
+settings = get_settings()
+logger = setup_logger("generation-repair", settings.log_level)
+
+_CONTINUATION_INSTRUCTION = """
+
+[이어서 생성]
+이전 응답이 출력 길이 한도로 잘렸습니다. 이미 받은 {label} {received}개 다음부터 나머지 {remaining}개만 생성하세요.
+- 이미 받은 항목과 주제/내용이 겹치지 않아야 합니다
+- 항목 하나의 필드 구성은 위 출력 형식의 항목과 동일해야 합니다
+- 출력은 다음 JSON 형식으로만 제공하세요: {{"items": [ ... ]}}
+
+이미 받은 {label} (마지막 항목 다음부터 이어서 생성):
+{received_items}
+"""
+
+_REASK_INSTRUCTION = """
+
+[항목 재요청]
+위 지침의 전체 출력 형식 대신, 형식 검증에 실패한 {label} {count}개만 같은 순서로 다시 생성하세요.
+- 실패 사유에 적힌 필드를 빠짐없이 올바른 타입으로 포함해야 합니다
+- 유지할 항목과 주제/내용이 겹치지 않아야 합니다
+- 출력은 다음 JSON 형식으로만 제공하세요: {{"items": [ ... ]}}
+
+유지할 {label} (수정 금지):
+{kept_items}
+
+다시 생성할 항목과 실패 사유:
+{failed_items}
+"""
+
+
+def _validation_error(item_model: Type[BaseModel], item: Any) -> Optional[str]:
+    """항목 스키마 검증 실패 사유 (통과하면 None)"""
+    if not isinstance(item, dict):
+        return "항목이 JSON 객체가 아님"
+    try:
+        item_model.model_validate(item)
+    except ValidationError as e:
+        return "; ".join(
+            f"{'.'.join(str(part) for part in error['loc']) or 'item'}: {error['msg']}" for error in e.errors()[:3]
+        )
+    return None
+
+
+def _numbered(items: List[Dict[str, Any]]) -> str:
+    return "\n".join(f"{i + 1}. {json.dumps(item, ensure_ascii=False)}" for i, item in enumerate(items)) or "(없음)"
+
+
+def _with_instruction(messages: List, instruction: str) -> List:
+    """원래 프롬프트의 마지막 메시지에 복구 지시문을 덧붙인 메시지 (원본 메시지는 변경하지 않음)"""
+    last = messages[-1]
+    return [*messages[:-1], last.__class__(content=last.content + instruction)]
+
+
+def build_continuation_messages(kind: str, messages: List, received: List[Dict[str, Any]], remaining: int) -> List:
+    """잘린 응답의 완성 항목 다음부터 부족한 항목만 생성하도록 지시한 메시지"""
+    return _with_instruction(messages, _CONTINUATION_INSTRUCTION.format(
+        label=ITEM_KINDS[kind]["label"], received=len(received), remaining=remaining,
+        received_items=_numbered(received),
+    ))
+
+
+def build_reask_messages(kind: str, messages: List, items: List[Any], invalid: Dict[int, str]) -> List:
+    """검증 실패 항목만 다시 생성하도록 지시한 메시지 (유효 항목은 중복 방지용 컨텍스트)"""
+    kept = [item for position, item in enumerate(items) if position not in invalid]
+    failed = "\n".join(
+        f"{n + 1}. {json.dumps(items[position], ensure_ascii=False)}\n   사유: {invalid[position]}"
+        for n, position in enumerate(sorted(invalid))
+    )
+    return _with_instruction(messages, _REASK_INSTRUCTION.format(
+        label=ITEM_KINDS[kind]["label"], count=len(invalid), kept_items=_numbered(kept), failed_items=failed,
+    ))
+
+
+async def _repair_call(kind: str, repair_messages: List, llm_client, repair: Dict[str, Any]) -> Tuple[List[Any], bool]:
+    """복구 호출 한 번 (같은 제공자 우선, 작은 출력 한도) → (항목 목록, 잘림 여부)"""
+    response_text, client = await llm_router.ainvoke(
+        repair_messages, preferred=llm_client.name,
+        client_options={"max_tokens": int(settings.llm_repair_max_tokens)},
+        record_latency=False,  # 작은 출력 한도의 복구 호출 지연이 본 생성 라우팅(p95)에 섞이지 않도록
+    )
+    repair["attempts"] += 1
+    repair["prompt_tokens"] += estimate_message_tokens(repair_messages, client.name)
+    try:
+        payload = parse_llm_json_response(response_text, expected_keys=["items"],
+                                          fallback_keys={"items": [ITEM_KINDS[kind]["items_field"]]})
+    except ValueError:
+        llm_router.record_parse(client, False)
+        return [], is_truncated(response_text)
+    llm_router.record_parse(client, True)
+    items = payload.get("items", []) if isinstance(payload, dict) else payload
+    return (items if isinstance(items, list) else []), is_truncated(response_text)
+
+
+@traced("response.parse")
+async def repair_response(kind: str, response_text: str, llm_client, messages: List,
+                          item_model: Type[BaseModel], required_count: int,
+                          response_model: Optional[Type[BaseModel]] = None,
+                          expected_keys: Optional[List[str]] = None,
+                          fallback_keys: Optional[Dict[str, List[str]]] = None) -> Tuple[Any, Optional[Dict[str, Any]]]:
+    """
+    응답 파싱 + 잘림/검증 실패 부분 복구
+
+    Args:
+        kind: 'interview' | 'learning'
+        response_text: 라우터 응답 (종료 사유가 있으면 잘림 감지에 사용)
+        llm_client: 응답한 클라이언트 (복구 호출에서 우선 사용)
+        messages: 원래 프롬프트 메시지
+        item_model: 항목 하나의 스키마
+        required_count: 잘렸을 때 이어서 채울 최소 항목 수
+        response_model: 구조화 출력 모델 (parse_structured_response와 동일)
+
+    Returns:
+        Tuple[Any, Optional[Dict[str, Any]]]: 파싱 결과, 복구 내역 (복구하지 않았으면 None)
+
+    Raises:
+        ValueError: 응답에서 JSON을 찾지 못한 경우 (복구할 부분이 없음)
+    """
+    max_attempts = int(settings.llm_repair_max_attempts)
+    if max_attempts <= 0:
+        return parse_structured_response(response_text, llm_client, response_model, expected_keys, fallback_keys), None
+
+    truncated = is_truncated(response_text)
+    structured = uses_structured_output(llm_client, response_model)
+    try:
+        parsed = parse_structured_response(response_text, llm_client, response_model, expected_keys, fallback_keys)
+        if structured and not truncated:
+            return parsed, None
+    except ValueError:
+        if not structured:
+            raise
+        # 구조화 응답이 잘렸거나 일부 항목만 스키마에 맞지 않음 → 관대한 파서로 유효 항목 회수
+        parsed = parse_llm_json_response(response_text, expected_keys=expected_keys, fallback_keys=fallback_keys)
+
+    items_field = ITEM_KINDS[kind]["items_field"]
+    items = parsed if isinstance(parsed, list) else parsed.get(items_field) if isinstance(parsed, dict) else None
+    if not isinstance(items, list):
+        return parsed, None
+
+    items = list(items)
+    reasons = [_validation_error(item_model, item) for item in items]
+    invalid = {position: reason for position, reason in enumerate(reasons) if reason is not None}
+    missing = max(required_count - (len(items) - len(invalid)), 0) if truncated else 0
+    if not invalid and not missing:
+        return parsed, None
+
+    repair = {
+        "truncated": truncated,
+        "invalid_items": len(invalid),
+        "reasked_items": 0,
+        "continued_items": 0,
+        "attempts": 0,
+        "prompt_tokens": 0,
+    }
+    while (invalid or missing) and repair["attempts"] < max_attempts:
+        try:
+            if invalid:
+                positions = sorted(invalid)
+                new_items, _ = await _repair_call(kind, build_reask_messages(kind, messages, items, invalid),
+                                                  llm_client, repair)
+                for position, item in zip(positions, new_items):
+                    reason = _validation_error(item_model, item)
+                    if reason is None:
+                        items[position] = item
+                        del invalid[position]
+                        repair["reasked_items"] += 1
+                    else:
+                        invalid[position] = reason
+            else:
+                received = [item for position, item in enumerate(items) if position not in invalid]
+                new_items, _ = await _repair_call(kind, build_continuation_messages(kind, messages, received, missing),
+                                                  llm_client, repair)
+                added = [item for item in new_items if _validation_error(item_model, item) is None][:missing]
+                items.extend(added)
+                missing -= len(added)
+                repair["continued_items"] += len(added)
+        except Exception as e:
+            logger.warning(f"Repair call failed, keeping salvaged {kind} items: {e}")
+            break
+
+    repair["dropped_items"] = len(invalid)
+    repair["missing_items"] = missing
+    items = [item for position, item in enumerate(items) if position not in invalid]
+    logger.info(f"Repaired {kind} response: {repair}")
+
+    if isinstance(parsed, list):
+        return items, repair
+    return {**parsed, items_field: items}, repair
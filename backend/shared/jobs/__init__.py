@@ -0,0 +1,3 @@
+"""
+공통 작업(Job) 모듈
+"""
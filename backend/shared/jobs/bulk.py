@@ -0,0 +1,391 @@
+"""
+대량(Bulk) 생성 작업 관리
+여러 이력서에 대한 생성 작업을 Celery chord로 분산 실행하고
+작업 전체 진행률을 Redis 해시 하나로 추적
+"""
+
+import json
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from celery import Celery, chord
+from celery.exceptions import SoftTimeLimitExceeded
+from shared.config.base import get_settings
+from shared.database.collections import Collections
+from shared.database.redis_client import get_redis_client
+from shared.jobs.cancellation import TaskCancelledError, request_task_cancel
+from shared.utils.logger import setup_logger
+
+settings = get_settings()
+logger = setup_logger("shared-bulk-jobs", settings.log_level)
+
+# 작업 유형별 Celery 태스크 및 큐 정보
+BULK_JOB_TYPES: Dict[str, Dict[str, str]] = {
+    "interview": {
+        "lane_task": "tasks.run_bulk_lane",
+        "finalize_task": "tasks.finalize_bulk_job",
+        "queue": "interview_queue.v2",
+    },
+    "learning": {
+        "lane_task": "learning_service.tasks.run_bulk_lane",
+        "finalize_task": "learning_service.tasks.finalize_bulk_job",
+        "queue": "learning_queue.v2",
+    },
+}
+
+# 종료 상태 (SSE 스트림 종료 조건)
+BULK_JOB_TERMINAL_STATES = ("SUCCESS", "FAILURE", "CANCELLED")
+
+
+def _job_key(job_id: str) -> str:
+    return f"bulk_job:{job_id}"
+
+
+def _failures_key(job_id: str) -> str:
+    return f"bulk_job:{job_id}:failures"
+
+
+def _running_tasks_key(job_id: str) -> str:
+    return f"bulk_job:{job_id}:running_tasks"
+
+
+def split_into_lanes(unique_keys: List[str], concurrency: int) -> List[List[str]]:
+    """
+    이력서 키 목록을 동시 실행 레인으로 분할
+
+    레인 하나는 키를 순차 처리하므로 동시에 실행되는 생성 작업 수는
+    레인 수(= concurrency)를 넘지 않는다.
+    """
+    if not unique_keys:
+        return []
+    lane_count = max(1, min(concurrency, len(unique_keys)))
+    lanes: List[List[str]] = [[] for _ in range(lane_count)]
+    for index, unique_key in enumerate(unique_keys):
+        lanes[index % lane_count].append(unique_key)
+    return lanes
+
+
+def lane_time_limits(item_count: int) -> Dict[str, int]:
+    """
+    레인 태스크 시간 제한 (항목 하나 기준 전역 제한 × 레인 항목 수)
+
+    레인은 항목들을 한 워커 프로세스에서 순차 실행하므로 전역 제한을 그대로 적용하면
+    레인 도중 강제 종료되어 chord 콜백(finalize_bulk_job)이 실행되지 않는다.
+    """
+    items = max(item_count, 1)
+    return {
+        "soft_time_limit": settings.celery_task_soft_time_limit * items,
+        "time_limit": settings.celery_task_time_limit * items,
+    }
+
+
+def build_resume_filter(resume_query: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    대량 작업 대상 이력서 조회 조건을 MongoDB 필터로 변환
+
+    Args:
+        resume_query: name, min_experience_months, max_experience_months 조건
+    """
+    resume_filter: Dict[str, Any] = {}
+    if resume_query.get("name"):
+        resume_filter["name"] = resume_query["name"]
+
+    experience_range = {}
+    if resume_query.get("min_experience_months") is not None:
+        experience_range["$gte"] = resume_query["min_experience_months"]
+    if resume_query.get("max_experience_months") is not None:
+        experience_range["$lte"] = resume_query["max_experience_months"]
+    if experience_range:
+        resume_filter["total_experience_months"] = experience_range
+
+    return resume_filter
+
+
+def create_bulk_job(
+    celery_app: Celery,
+    job_type: str,
+    unique_keys: List[str],
+    concurrency: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    대량 생성 작업 시작 (레인 group + 요약 콜백 chord)
+
+    Args:
+        celery_app: 작업을 발행할 Celery 앱
+        job_type: 작업 유형 ('interview' | 'learning')
+        unique_keys: 대상 이력서 고유 키 목록 (중복 제거됨)
+        concurrency: 최대 동시 실행 수 (기본값: 설정값)
+
+    Returns:
+        Dict: 생성된 작업 정보
+    """
+    if job_type not in BULK_JOB_TYPES:
+        raise ValueError(f"Unknown bulk job type: {job_type}")
+
+    task_info = BULK_JOB_TYPES[job_type]
+    unique_keys = list(dict.fromkeys(unique_keys))  # 순서 유지 중복 제거
+    concurrency = min(concurrency or settings.bulk_job_max_concurrency, settings.bulk_job_max_concurrency)
+    lanes = split_into_lanes(unique_keys, concurrency)
+
+    job_id = str(uuid.uuid4())
+    created_at = datetime.now().isoformat()
+
+    redis_client = get_redis_client()
+    redis_client.hset(_job_key(job_id), mapping={
+        "job_id": job_id,
+        "job_type": job_type,
+        "state": "PENDING",
+        "total": len(unique_keys),
+        "done": 0,
+        "failed": 0,
+        "skipped": 0,
+        "running": 0,
+        "concurrency": len(lanes),
+        "duration_sum": 0,
+        "cancelled": 0,
+        "created_at": created_at,
+    })
+    redis_client.expire(_job_key(job_id), settings.bulk_job_ttl_seconds)
+
+    header = [
+        celery_app.signature(task_info["lane_task"], args=[job_id, lane_keys], queue=task_info["queue"],
+                             **lane_time_limits(len(lane_keys)))
+        for lane_keys in lanes
+    ]
+    callback = celery_app.signature(task_info["finalize_task"], args=[job_id], queue=task_info["queue"])
+    chord(header, callback, app=celery_app).apply_async()
+
+    logger.info(f"Bulk job {job_id} started: type={job_type}, total={len(unique_keys)}, lanes={len(lanes)}")
+
+    return {
+        "job_id": job_id,
+        "job_type": job_type,
+        "total": len(unique_keys),
+        "concurrency": len(lanes),
+        "created_at": created_at,
+    }
+
+
+def _decode_hash(raw: Dict[Any, Any]) -> Dict[str, str]:
+    return {
+        (k.decode() if isinstance(k, bytes) else k): (v.decode() if isinstance(v, bytes) else v)
+        for k, v in raw.items()
+    }
+
+
+def build_progress_snapshot(job_id: str, raw: Dict[Any, Any]) -> Dict[str, Any]:
+    """
+    Redis 해시 원본 값으로 작업 진행률 스냅샷 구성 (ETA 포함)
+    """
+    if not raw:
+        return {
+            "job_id": job_id,
+            "state": "NOT_FOUND",
+            "progress": 0,
+            "message": "대량 작업을 찾을 수 없습니다",
+        }
+
+    data = _decode_hash(raw)
+    total = int(data.get("total", 0))
+    done = int(data.get("done", 0))
+    failed = int(data.get("failed", 0))
+    skipped = int(data.get("skipped", 0))
+    running = int(data.get("running", 0))
+    concurrency = max(1, int(data.get("concurrency", 1)))
+    duration_sum = float(data.get("duration_sum", 0))
+
+    finished = done + failed + skipped
+    remaining = max(0, total - finished)
+    progress = int(finished * 100 / total) if total else 100
+
+    # ETA: 처리 완료 건의 평균 소요 시간 x 남은 건수 / 동시 실행 레인 수
+    processed = done + failed
+    eta_seconds = None
+    if processed and remaining and data.get("state") not in BULK_JOB_TERMINAL_STATES:
+        eta_seconds = round(duration_sum / processed * remaining / concurrency, 1)
+
+    return {
+        "job_id": job_id,
+        "job_type": data.get("job_type"),
+        "state": data.get("state", "PENDING"),
+        "progress": progress,
+        "total": total,
+        "done": done,
+        "failed": failed,
+        "skipped": skipped,
+        "running": running,
+        "eta_seconds": eta_seconds,
+        "created_at": data.get("created_at"),
+        "finished_at": data.get("finished_at"),
+    }
+
+
+def get_bulk_job_progress(job_id: str) -> Dict[str, Any]:
+    """대량 작업 진행률 조회"""
+    redis_client = get_redis_client()
+    snapshot = build_progress_snapshot(job_id, redis_client.hgetall(_job_key(job_id)))
+    if snapshot["state"] in BULK_JOB_TERMINAL_STATES:
+        snapshot["failures"] = [
+            json.loads(item) for item in redis_client.lrange(_failures_key(job_id), 0, 49)
+        ]
+    return snapshot
+
+
+def cancel_bulk_job(job_id: str) -> bool:
+    """
+    대량 작업 취소 요청
+    아직 시작하지 않은 항목은 건너뛰고, 진행 중인 항목에는 작업 취소 신호를 전달한다.
+
+    Returns:
+        bool: 작업이 존재하고 취소 요청이 기록되었으면 True
+    """
+    redis_client = get_redis_client()
+    key = _job_key(job_id)
+    if not redis_client.exists(key):
+        return False
+    state = redis_client.hget(key, "state")
+    if state and state.decode() in BULK_JOB_TERMINAL_STATES:
+        return False
+    redis_client.hset(key, mapping={"cancelled": 1, "state": "CANCELLING"})
+    for task_id in redis_client.smembers(_running_tasks_key(job_id)):
+        request_task_cancel(task_id.decode())
+    logger.info(f"Bulk job {job_id} cancellation requested")
+    return True
+
+
+def is_bulk_job_cancelled(job_id: str) -> bool:
+    """대량 작업 취소 여부 확인"""
+    value = get_redis_client().hget(_job_key(job_id), "cancelled")
+    return value is not None and value.decode() == "1"
+
+
+def run_bulk_lane(job_id: str, unique_keys: List[str], generate_task) -> Dict[str, Any]:
+    """
+    레인 하나를 순차 실행 (워커 프로세스 내부에서 호출)
+
+    Args:
+        job_id: 대량 작업 ID
+        unique_keys: 레인에 할당된 이력서 키 목록
+        generate_task: 항목 하나를 생성하는 Celery 태스크 (로컬 apply 실행)
+
+    Returns:
+        Dict: 레인 처리 결과 (성공/실패/건너뜀 목록)
+    """
+    redis_client = get_redis_client()
+    key = _job_key(job_id)
+    lane_result = {"succeeded": [], "failed": [], "skipped": []}
+
+    redis_client.hsetnx(key, "started_at", datetime.now().isoformat())
+    if not is_bulk_job_cancelled(job_id):
+        redis_client.hset(key, "state", "PROGRESS")
+
+    # 레인 시간 제한(soft)은 항목 실행 중(태스크가 그대로 다시 발생시킴)이든 항목 사이 Redis 기록 중이든
+    # 이 루프 안에서 발생하므로, 남은 항목을 건너뜀으로 집계하고 반환해 강제 종료 전에 chord 콜백이 실행되도록 한다
+    handled = 0
+    in_flight = None
+    try:
+        for unique_key in unique_keys:
+            if is_bulk_job_cancelled(job_id):
+                redis_client.hincrby(key, "skipped", 1)
+                lane_result["skipped"].append(unique_key)
+                handled += 1
+                continue
+
+            child_task_id = str(uuid.uuid4())
+            redis_client.hincrby(key, "running", 1)
+            in_flight = child_task_id
+            redis_client.sadd(_running_tasks_key(job_id), child_task_id)
+            redis_client.expire(_running_tasks_key(job_id), settings.bulk_job_ttl_seconds)
+            started = time.perf_counter()
+            result = generate_task.apply(args=[unique_key], task_id=child_task_id)
+            elapsed = time.perf_counter() - started
+
+            pipe = redis_client.pipeline()
+            pipe.hincrby(key, "running", -1)
+            pipe.srem(_running_tasks_key(job_id), child_task_id)
+            if isinstance(result.result, TaskCancelledError):
+                # 실행 도중 취소된 항목은 실패가 아닌 건너뜀으로 집계
+                pipe.hincrby(key, "skipped", 1)
+                pipe.execute()
+                in_flight = None
+                lane_result["skipped"].append(unique_key)
+                handled += 1
+                continue
+
+            pipe.hincrbyfloat(key, "duration_sum", elapsed)
+            if result.successful():
+                pipe.hincrby(key, "done", 1)
+                outcome = ("succeeded", {"unique_key": unique_key, "task_id": result.id})
+            else:
+                error = str(result.result)
+                pipe.hincrby(key, "failed", 1)
+                pipe.rpush(_failures_key(job_id), json.dumps({"unique_key": unique_key, "error": error}))
+                pipe.expire(_failures_key(job_id), settings.bulk_job_ttl_seconds)
+                outcome = ("failed", {"unique_key": unique_key, "task_id": result.id, "error": error})
+            pipe.execute()
+            in_flight = None
+            lane_result[outcome[0]].append(outcome[1])
+            handled += 1
+
+            if isinstance(result.result, SoftTimeLimitExceeded):
+                raise result.result
+    except SoftTimeLimitExceeded:
+        if in_flight is not None:
+            redis_client.hincrby(key, "running", -1)
+            redis_client.srem(_running_tasks_key(job_id), in_flight)
+        remaining = unique_keys[handled:]
+        if remaining:
+            redis_client.hincrby(key, "skipped", len(remaining))
+            lane_result["skipped"].extend(remaining)
+        logger.warning(f"Bulk job {job_id} lane hit its time limit, skipped {len(remaining)} items")
+
+    return lane_result
+
+
+def finalize_bulk_job(job_id: str, lane_results: List[Dict[str, Any]], database) -> Dict[str, Any]:
+    """
+    chord 콜백: 레인 결과를 집계하고 요약 레코드 1건을 저장
+
+    Args:
+        job_id: 대량 작업 ID
+        lane_results: 각 레인의 처리 결과
+        database: 동기 MongoDB 데이터베이스
+    """
+    redis_client = get_redis_client()
+    key = _job_key(job_id)
+
+    succeeded = [item for lane in lane_results for item in lane.get("succeeded", [])]
+    failed = [item for lane in lane_results for item in lane.get("failed", [])]
+    skipped = [unique_key for lane in lane_results for unique_key in lane.get("skipped", [])]
+
+    if is_bulk_job_cancelled(job_id):
+        state = "CANCELLED"
+    elif failed and not succeeded:
+        state = "FAILURE"
+    else:
+        state = "SUCCESS"
+
+    finished_at = datetime.now().isoformat()
+    redis_client.hset(key, mapping={"state": state, "running": 0, "finished_at": finished_at})
+    snapshot = build_progress_snapshot(job_id, redis_client.hgetall(key))
+
+    summary = {
+        "job_id": job_id,
+        "job_type": snapshot["job_type"],
+        "state": state,
+        "total": snapshot["total"],
+        "succeeded": succeeded,
+        "failed": failed,
+        "skipped": skipped,
+        "created_at": snapshot["created_at"],
+        "finished_at": finished_at,
+    }
+    database[Collections.BULK_JOBS].insert_one(dict(summary))
+
+    logger.info(
+        f"Bulk job {job_id} finished: state={state}, "
+        f"succeeded={len(succeeded)}, failed={len(failed)}, skipped={len(skipped)}"
+    )
+    return summary
@@ -0,0 +1,168 @@
+"""
+협력적 작업 취소
+대기 중인 작업은 Celery revoke로 폐기하고, 실행 중인 작업은 Redis 신호로 중단 요청
+"""
+
+import asyncio
+from contextlib import suppress
+from datetime import datetime
+from typing import Any, Awaitable, Dict, Optional
+
+from celery import Celery, states
+from shared.config.base import get_settings
+from shared.database.redis_client import get_redis_client
+from shared.jobs.progress import (
+    get_task_progress_from_redis,
+    has_task_progress,
+    set_task_progress,
+    TASK_TERMINAL_STATES,
+)
+from shared.utils.logger import setup_logger
+from shared.utils.tracing import untraced
+
+settings = get_settings()
+logger = setup_logger("shared-task-cancellation", settings.log_level)
+
+# 취소 신호 키 TTL (진행률 TTL과 동일)
+TASK_CANCEL_TTL = 3600
+
+
+class TaskCancelledError(Exception):
+    """작업이 취소 요청으로 중단됨"""
+
+
+def _cancel_key(task_id: str) -> str:
+    return f"task_cancel:{task_id}"
+
+
+def request_task_cancel(task_id: str) -> None:
+    """실행 중인 작업에 취소 신호 전달"""
+    get_redis_client().setex(_cancel_key(task_id), TASK_CANCEL_TTL, 1)
+
+
+def is_task_cancelled(task_id: Optional[str]) -> bool:
+    """취소 신호 확인"""
+    if not task_id:
+        return False
+    try:
+        return bool(get_redis_client().exists(_cancel_key(task_id)))
+    except Exception as e:
+        logger.error(f"Failed to check cancellation for task {task_id}: {e}")
+        return False
+
+
+def raise_if_cancelled(task_id: Optional[str]) -> None:
+    """
+    단계 사이 취소 확인 지점
+
+    Raises:
+        TaskCancelledError: 취소 신호가 있는 경우
+    """
+    if is_task_cancelled(task_id):
+        raise TaskCancelledError(f"Task {task_id} was cancelled")
+
+
+def cancel_task(celery_app: Celery, task_id: str) -> Dict[str, Any]:
+    """
+    작업 취소 요청 (대기 중: revoke, 실행 중: Redis 신호)
+
+    진행률 기록이 없으면 Celery 결과 상태로 판단하고, 그마저 PENDING이면 알 수 없는 작업 ID로 보고
+    상태를 기록하지 않는다 (NOT_FOUND).
+
+    Args:
+        celery_app: revoke 명령을 보낼 Celery 앱
+        task_id: 작업 ID
+
+    Returns:
+        Dict: 취소 요청 결과 및 현재 상태
+    """
+    if has_task_progress(task_id):
+        state = get_task_progress_from_redis(task_id).get('state')
+    else:
+        state = celery_app.AsyncResult(task_id).state
+        if state == states.PENDING:
+            return {"task_id": task_id, "cancelled": False, "state": "NOT_FOUND"}
+    if state in TASK_TERMINAL_STATES or state in states.READY_STATES:
+        return {"task_id": task_id, "cancelled": False, "state": state}
+
+    # 큐에서 대기 중이면 워커가 수신 즉시 폐기, 실행 중이면 다음 확인 지점에서 중단
+    celery_app.control.revoke(task_id)
+    request_task_cancel(task_id)
+
+    if state == 'PENDING':
+        # 아직 시작하지 않은 작업은 워커가 진행률을 기록하지 않으므로 직접 종료 상태 기록
+        set_task_progress(task_id, {
+            'task_id': task_id,
+            'state': 'CANCELLED',
+            'progress': 0,
+            'message': '작업이 취소되었습니다',
+            'stage': 'cancelled',
+            'timestamp': datetime.now().isoformat()
+        })
+        state = 'CANCELLED'
+    else:
+        state = 'CANCELLING'
+
+    logger.info(f"Cancellation requested for task {task_id} (state: {state})")
+    return {"task_id": task_id, "cancelled": True, "state": state}
+
+
+# 워커 프로세스 단위 이벤트 루프 (LLM 클라이언트의 비동기 커넥션 풀 재사용)
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_worker_loop() -> asyncio.AbstractEventLoop:
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = asyncio.new_event_loop()
+    return _worker_loop
+
+
+def run_cancellable(coro: Awaitable[Any], task_id: Optional[str], poll_interval: Optional[float] = None) -> Any:
+    """
+    동기 컨텍스트(Celery 태스크)에서 코루틴을 실행하되 취소 신호가 오면 즉시 중단
+
+    LLM 호출(ainvoke/astream)처럼 오래 걸리는 코루틴을 감시 코루틴과 경쟁시켜,
+    취소 신호가 감지되면 진행 중인 호출을 cancel 한다.
+
+    Raises:
+        TaskCancelledError: 실행 도중 취소된 경우
+    """
+    poll_interval = poll_interval or settings.task_cancel_poll_interval
+
+    async def _watch_cancel():
+        while True:
+            await asyncio.sleep(poll_interval)
+            with untraced():
+                cancelled = await asyncio.to_thread(is_task_cancelled, task_id)
+            if cancelled:
+                return
+
+    async def _race(work, watcher):
+        done, _ = await asyncio.wait({work, watcher}, return_when=asyncio.FIRST_COMPLETED)
+
+        if work in done:
+            watcher.cancel()
+            with suppress(asyncio.CancelledError):
+                await watcher
+            return work.result()
+
+        work.cancel()
+        with suppress(asyncio.CancelledError):
+            await work
+        raise TaskCancelledError(f"Task {task_id} was cancelled during LLM call")
+
+    loop = _get_worker_loop()
+    work = loop.create_task(coro)
+    watcher = loop.create_task(_watch_cancel())
+    race = loop.create_task(_race(work, watcher))
+    try:
+        return loop.run_until_complete(race)
+    finally:
+        # SoftTimeLimitExceeded/KeyboardInterrupt로 중단되면 남은 태스크가 재사용 루프에 남아
+        # 다음 작업의 run_until_complete 안에서 이어 실행되므로 여기서 취소하고 정리한다
+        pending = [task for task in (race, work, watcher) if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
@@ -0,0 +1,85 @@
+"""
+작업 진행률 추적 (Redis 직접 사용)
+API 프로세스와 Celery 워커가 같은 키 형식으로 진행 상황을 공유
+"""
+
+import json
+import time
+from datetime import datetime
+from typing import Dict, Any
+from shared.config.base import get_settings
+from shared.database.redis_client import get_redis_client
+from shared.utils.logger import setup_logger
+from shared.utils.metrics import PROGRESS_WRITE_SECONDS
+from shared.utils.tracing import mark_stage
+
+settings = get_settings()
+logger = setup_logger("shared-task-progress", settings.log_level)
+
+# 진행률 키 TTL (1시간)
+TASK_PROGRESS_TTL = 3600
+
+# 종료 상태 (SSE 스트림 종료 조건)
+TASK_TERMINAL_STATES = ('SUCCESS', 'FAILURE', 'CANCELLED')
+
+def _progress_key(task_id: str) -> str:
+    return f"task_progress:{task_id}"
+
+def mark_task_queued(task_id: str):
+    """
+    작업 등록 직후 대기 상태 기록 (취소 요청 시 알 수 없는 작업 ID와 구분하기 위함)
+
+    워커가 먼저 진행률을 기록했으면 덮어쓰지 않는다.
+    """
+    try:
+        get_redis_client().set(_progress_key(task_id), json.dumps({
+            'task_id': task_id,
+            'state': 'PENDING',
+            'progress': 0,
+            'message': '작업 대기 중...',
+            'stage': 'pending',
+            'timestamp': datetime.now().isoformat()
+        }), ex=TASK_PROGRESS_TTL, nx=True)
+    except Exception as e:
+        logger.error(f"Failed to mark task {task_id} as queued: {e}")
+
+def has_task_progress(task_id: str) -> bool:
+    """진행률 기록 존재 여부 (등록/실행 기록이 없거나 만료된 작업이면 False)"""
+    return bool(get_redis_client().exists(_progress_key(task_id)))
+
+def set_task_progress(task_id: str, progress_data: Dict[str, Any]):
+    """Redis에 직접 task progress 저장 (stage가 바뀌면 트레이스의 작업 단계 스팬도 전환)"""
+    mark_stage(progress_data.get('stage'), terminal=progress_data.get('state') in TASK_TERMINAL_STATES)
+    started = time.perf_counter()
+    try:
+        key = _progress_key(task_id)
+        get_redis_client().setex(key, TASK_PROGRESS_TTL, json.dumps(progress_data))
+        PROGRESS_WRITE_SECONDS.labels("success").observe(time.perf_counter() - started)
+        logger.debug("Progress saved for task %s: %s%%", task_id, progress_data.get('progress', 0))
+    except Exception as e:
+        PROGRESS_WRITE_SECONDS.labels("error").observe(time.perf_counter() - started)
+        logger.error(f"Failed to save progress for task {task_id}: {e}")
+
+def get_task_progress_from_redis(task_id: str) -> Dict[str, Any]:
+    """Redis에서 직접 task progress 조회"""
+    try:
+        key = _progress_key(task_id)
+        data = get_redis_client().get(key)
+        if data:
+            return json.loads(data)
+        return {
+            'task_id': task_id,
+            'state': 'PENDING',
+            'progress': 0,
+            'message': '작업 대기 중...',
+            'stage': 'pending'
+        }
+    except Exception as e:
+        logger.error(f"Failed to get progress for task {task_id}: {e}")
+        return {
+            'task_id': task_id,
+            'state': 'ERROR',
+            'progress': 0,
+            'message': f'진행률 조회 오류: {str(e)}',
+            'stage': 'error'
+        }
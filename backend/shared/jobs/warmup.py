@@ -0,0 +1,136 @@
+"""
+쓰기 시점 생성 워밍업 (이력서 생성/수정 시 면접 질문/학습 경로 사전 생성)
+
+- 이력서 저장 직후 낮은 우선순위의 백그라운드 생성 작업을 등록해 첫 조회를 DB 읽기 한 번으로 처리
+- 이력서(unique_key)별 요청 수 제한, 진행 중인 워밍업 작업과 중복 방지
+- 포맷팅된 프롬프트 입력의 지문이 마지막 생성과 같으면 재생성하지 않음
+- 워밍업은 최선 노력(best-effort): Redis/브로커 장애가 이력서 저장을 실패시키지 않는다
+"""
+
+from typing import Any, Dict, Optional
+from shared.config.base import get_settings
+from shared.database.redis_client import get_redis_client
+from shared.utils.logger import setup_logger
+from shared.utils.resume_formatter import prompt_input_fingerprint
+
+settings = get_settings()
+logger = setup_logger("resume-warmup", settings.log_level)
+
+# 생성 종류별 태스크 이름과 큐
+WARMUP_TASKS: Dict[str, Dict[str, Any]] = {
+    "interview": {
+        "task_name": "tasks.generate_interview_questions_async",
+        "queue": "interview_queue.v2",
+    },
+    "learning": {
+        "task_name": "learning_service.tasks.generate_learning_path_async",
+        "queue": "learning_queue.v2",
+    },
+}
+
+# 건너뛴 이유
+SKIP_DISABLED = "disabled"
+SKIP_RATE_LIMITED = "rate_limited"
+SKIP_IN_FLIGHT = "in_flight"
+SKIP_UNCHANGED = "unchanged"
+SKIP_UNAVAILABLE = "unavailable"
+
+
+def _rate_key(unique_key: str) -> str:
+    return f"warmup:rate:{unique_key}"
+
+
+def _in_flight_key(kind: str, unique_key: str) -> str:
+    return f"warmup:in_flight:{kind}:{unique_key}"
+
+
+def _fingerprint_key(kind: str, unique_key: str) -> str:
+    return f"warmup:fingerprint:{kind}:{unique_key}"
+
+
+def _allow(unique_key: str) -> bool:
+    """이력서별 고정 윈도우 요청 수 제한 (이름은 개인정보이고 동명이인끼리 한도를 공유하므로 unique_key 기준)"""
+    redis_client = get_redis_client()
+    key = _rate_key(unique_key)
+    count = redis_client.incr(key)
+    if count == 1:
+        redis_client.expire(key, settings.resume_warmup_rate_window_seconds)
+    return count <= settings.resume_warmup_rate_limit
+
+
+def schedule_resume_warmup(celery_app, resume_data: Dict[str, Any], enabled: Optional[bool] = None) -> Dict[str, Any]:
+    """
+    이력서 저장 직후 면접 질문/학습 경로 사전 생성 작업 등록
+
+    Args:
+        celery_app: producer Celery 앱
+        resume_data: 저장된 이력서 (unique_key 포함)
+        enabled: 요청 단위 opt-in 여부 (None이면 RESUME_WARMUP_ENABLED 설정 사용)
+
+    Returns:
+        Dict[str, Any]: enqueued(종류별 task_id), skipped(종류별 건너뛴 이유)
+    """
+    result = {"enqueued": {}, "skipped": {}}
+    if not (settings.resume_warmup_enabled if enabled is None else enabled):
+        result["skipped"] = {kind: SKIP_DISABLED for kind in WARMUP_TASKS}
+        return result
+
+    unique_key = resume_data["unique_key"]
+    try:
+        redis_client = get_redis_client()
+        if not _allow(unique_key):
+            result["skipped"] = {kind: SKIP_RATE_LIMITED for kind in WARMUP_TASKS}
+            return result
+
+        in_flight_ttl = settings.resume_warmup_expires + settings.celery_task_time_limit
+        for kind, spec in WARMUP_TASKS.items():
+            fingerprint = prompt_input_fingerprint(kind, resume_data)
+            last = redis_client.get(_fingerprint_key(kind, unique_key))
+            if last is not None and (last.decode() if isinstance(last, bytes) else last) == fingerprint:
+                result["skipped"][kind] = SKIP_UNCHANGED
+                continue
+
+            # 진행 중인 워밍업 작업이 있으면 중복 등록하지 않음 (작업 종료 시 해제)
+            if not redis_client.set(_in_flight_key(kind, unique_key), "pending", nx=True, ex=in_flight_ttl):
+                result["skipped"][kind] = SKIP_IN_FLIGHT
+                continue
+
+            task = celery_app.send_task(
+                spec["task_name"],
+                args=[unique_key],
+                queue=spec["queue"],
+                priority=settings.resume_warmup_priority,
+                expires=settings.resume_warmup_expires
+            )
+            redis_client.set(_in_flight_key(kind, unique_key), task.id, ex=in_flight_ttl)
+            result["enqueued"][kind] = task.id
+
+    except Exception as e:
+        logger.warning(f"Resume warmup skipped for {unique_key}: {e}")
+        for kind in WARMUP_TASKS:
+            if kind not in result["enqueued"]:
+                result["skipped"].setdefault(kind, SKIP_UNAVAILABLE)
+
+    if result["enqueued"]:
+        logger.info(f"Resume warmup enqueued for {unique_key}: {result['enqueued']}")
+    return result
+
+
+def finish_generation(kind: str, unique_key: str, task_id: str, fingerprint: Optional[str] = None) -> None:
+    """
+    생성 작업 종료 처리 (워밍업/사용자 요청 공통)
+
+    Args:
+        fingerprint: 성공 시 생성에 사용한 프롬프트 입력 지문 (실패 시 None → 다음 워밍업에서 재시도)
+    """
+    try:
+        redis_client = get_redis_client()
+        key = _in_flight_key(kind, unique_key)
+        current = redis_client.get(key)
+        if current is not None and (current.decode() if isinstance(current, bytes) else current) == task_id:
+            redis_client.delete(key)
+        if fingerprint:
+            redis_client.set(_fingerprint_key(kind, unique_key), fingerprint,
+                             ex=settings.resume_warmup_fingerprint_ttl)
+    except Exception as e:
+        logger.warning(f"Failed to record generation state for {unique_key}: {e}")
@@ -3,10 +3,66 @@ LLM 클라이언트 기본 인터페이스
 """
 
 from abc import ABC, abstractmethod
-from typing import AsyncIterable
+from typing import AsyncIterable, Dict, List, Optional
+
+# 출력 토큰 한도에 걸려 응답이 잘렸음을 뜻하는 제공자별 종료 사유 (OpenAI, Claude, Gemini)
+TRUNCATION_FINISH_REASONS = {"length", "max_tokens", "MAX_TOKENS"}
+
+
+class LLMResponse(str):
+    """
+    응답 텍스트 + 제공자 종료 사유 + 입력 토큰 사용량
+
+    str 하위 클래스라 기존 호출 측은 문자열로 그대로 사용하고, 잘림 감지/캐시 추적이 필요한 곳만 속성을 읽는다.
+    usage: input_tokens(전체 입력), cached_tokens(프롬프트 캐시 적중), cache_write_tokens(캐시 생성) - 제공자가 알려준 값만
+    """
+
+    finish_reason: Optional[str] = None
+    usage: Optional[Dict[str, int]] = None
+
+    def __new__(cls, text: str, finish_reason: Optional[str] = None, usage: Optional[Dict[str, int]] = None):
+        response = super().__new__(cls, text)
+        response.finish_reason = finish_reason
+        response.usage = usage
+        return response
+
+
+def is_truncated(response) -> bool:
+    """종료 사유가 출력 토큰 한도인지 (종료 사유가 없는 일반 문자열은 False)"""
+    return getattr(response, "finish_reason", None) in TRUNCATION_FINISH_REASONS
+
+
+def as_messages(prompt) -> List:
+    """문자열 프롬프트를 메시지 목록으로 변환 (메시지 목록은 그대로)"""
+    from langchain_core.messages import HumanMessage
+
+    return [HumanMessage(content=prompt)] if isinstance(prompt, str) else list(prompt)
+
+
+def cached_prompt_tokens(response) -> int:
+    """응답의 프롬프트 캐시 적중 토큰 수 (사용량을 모르면 0)"""
+    return int((getattr(response, "usage", None) or {}).get("cached_tokens") or 0)
+
+
+def prompt_cache_hit_ratio(response) -> Optional[float]:
+    """입력 토큰 중 캐시 적중 비율 (사용량을 모르면 None)"""
+    usage = getattr(response, "usage", None) or {}
+    if not usage.get("input_tokens"):
+        return None
+    return min(cached_prompt_tokens(response) / usage["input_tokens"], 1.0)
+
+
+def response_from_generation(generation, usage: Optional[Dict[str, int]] = None) -> LLMResponse:
+    """LangChain ChatGeneration에서 텍스트와 종료 사유 추출"""
+    finish_reason = (generation.generation_info or {}).get("finish_reason")
+    return LLMResponse(generation.message.content, finish_reason, usage)
+
 
 class LLMClient(ABC):
     """LLM 클라이언트 기본 클래스"""
+
+    # 제공자 네이티브 구조화 출력 지원 여부 (미지원이면 관대한 JSON 파서로 처리)
+    supports_structured_output = False
     
     @property
     @abstractmethod
@@ -29,6 +85,10 @@ class LLMClient(ABC):
         """비동기 스트리밍 LLM 호출"""
         pass
     
+    async def ainvoke_structured(self, prompt, response_model, **kwargs) -> str:
+        """응답을 출력 모델의 JSON 스키마로 강제한 비동기 호출 (JSON 문자열 반환)"""
+        raise NotImplementedError(f"{self.name} does not support structured output")
+
     @abstractmethod
     def with_options(self, **opts) -> "LLMClient":
         """옵션을 변경한 새로운 클라이언트 인스턴스 반환"""
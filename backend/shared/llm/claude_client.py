@@ -2,16 +2,23 @@
 Anthropic Claude LLM 클라이언트
 """
 
-from typing import AsyncIterable
+import json
+from typing import AsyncIterable, Dict, Optional
+import anthropic
 from langchain_anthropic import ChatAnthropic
-from .base import LLMClient
-from shared.config.base import BaseAppSettings
+from .base import LLMClient, LLMResponse, as_messages
+from .pool import client_pool
+from .transport import get_http_client, get_async_http_client
+from .structured import structured_json_schema
+from .prompt_cache import split_cache_prefix, prompt_cache_enabled
+from shared.config.base import get_settings
 
-# 기본 설정 인스턴스 (실제로는 각 서비스에서 주입받아야 함)
-settings = BaseAppSettings()
+settings = get_settings()
 
 class ClaudeClient(LLMClient):
     """Anthropic Claude LLM 클라이언트"""
+
+    supports_structured_output = True
     
     def __init__(self, api_key: str, model: str, temperature: float, max_tokens: int, timeout: int):
         self._name = "claude"
@@ -27,6 +34,13 @@ class ClaudeClient(LLMClient):
             max_tokens=max_tokens,
             model_kwargs={"timeout": timeout}  # timeout을 model_kwargs로 전달
         )
+        # langchain_anthropic은 생성 시 SDK 클라이언트를 직접 만들므로 공유 HTTP 커넥션 풀로 교체
+        object.__setattr__(self._llm, "_client", anthropic.Client(
+            api_key=api_key, http_client=get_http_client(self._name)
+        ))
+        object.__setattr__(self._llm, "_async_client", anthropic.AsyncClient(
+            api_key=api_key, http_client=get_async_http_client(self._name)
+        ))
     
     @property
     def name(self) -> str:
@@ -42,13 +56,56 @@ class ClaudeClient(LLMClient):
             raise Exception(f"Claude API call failed: {e}")
 
     async def ainvoke(self, prompt: str, **kwargs) -> str:
-        """비동기 Claude LLM 호출"""
+        """
+        비동기 Claude LLM 호출 (응답에 종료 사유 포함)
+
+        langchain_anthropic은 stop_reason을 버리므로 요청 파라미터만 변환하고 SDK를 직접 호출
+        """
         try:
-            resp = await self._llm.ainvoke(prompt, **kwargs)
-            return getattr(resp, "content", str(resp))
+            data = await self._llm._async_client.messages.create(**self._request_params(prompt), **kwargs)
         except Exception as e:
             raise Exception(f"Claude API call failed: {e}")
+        text = "".join(block.text for block in data.content if getattr(block, "type", None) == "text")
+        return LLMResponse(text, data.stop_reason, self._usage(data))
+
+    def _request_params(self, prompt) -> Dict:
+        """SDK 요청 파라미터 (고정 접두부인 시스템 프롬프트는 cache_control 블록으로 표시)"""
+        messages = as_messages(prompt)
+        params = self._llm._format_params(messages=messages)
+        prefix, _ = split_cache_prefix(messages)
+        if prefix and params.get("system") and prompt_cache_enabled():
+            params["system"] = [{"type": "text", "text": params["system"], "cache_control": {"type": "ephemeral"}}]
+        return params
+
+    @staticmethod
+    def _usage(data) -> Optional[Dict[str, int]]:
+        """Claude input_tokens는 캐시 미적중분만 포함하므로 캐시 읽기/생성 토큰을 더해 전체 입력으로 환산"""
+        usage = getattr(data, "usage", None)
+        if usage is None:
+            return None
+        read = getattr(usage, "cache_read_input_tokens", None) or 0
+        write = getattr(usage, "cache_creation_input_tokens", None) or 0
+        return {"input_tokens": usage.input_tokens + read + write, "cached_tokens": read, "cache_write_tokens": write}
     
+    async def ainvoke_structured(self, prompt, response_model, **kwargs) -> str:
+        """출력 스키마를 입력으로 받는 도구 하나를 강제 호출하고 도구 입력을 JSON 문자열로 반환"""
+        tool_name = response_model.__name__
+        params = self._request_params(prompt)
+        params["tools"] = [{
+            "name": tool_name,
+            "description": (response_model.__doc__ or tool_name).strip(),
+            "input_schema": structured_json_schema(response_model),
+        }]
+        params["tool_choice"] = {"type": "tool", "name": tool_name}
+        try:
+            data = await self._llm._async_client.messages.create(**params, **kwargs)
+        except Exception as e:
+            raise Exception(f"Claude API call failed: {e}")
+        for block in data.content:
+            if getattr(block, "type", None) == "tool_use":
+                return LLMResponse(json.dumps(block.input, ensure_ascii=False), data.stop_reason, self._usage(data))
+        raise Exception("Claude API call returned no tool call for structured output")
+
     async def astream(self, prompt: str, **kwargs) -> AsyncIterable[str]:
         """비동기 스트리밍 Claude LLM 호출"""
         try:
@@ -62,14 +119,19 @@ class ClaudeClient(LLMClient):
 
     
     def with_options(self, **opts) -> "ClaudeClient":
-        """옵션을 변경한 새로운 Claude 클라이언트 인스턴스 반환"""
+        """옵션을 변경한 Claude 클라이언트 반환 (같은 옵션 조합은 풀에서 재사용)"""
         merged = {**self._opts, **opts}
-        return ClaudeClient(
-            api_key=self._api_key,
-            model=self._model,
-            temperature=merged.get("temperature", self._opts["temperature"]),
-            max_tokens=merged.get("max_tokens", self._opts["max_tokens"]),
-            timeout=self._timeout
+        temperature = merged.get("temperature", self._opts["temperature"])
+        max_tokens = merged.get("max_tokens", self._opts["max_tokens"])
+        return client_pool.get_or_create(
+            (self._name, self._model, temperature, max_tokens, self._timeout),
+            lambda: ClaudeClient(
+                api_key=self._api_key,
+                model=self._model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                timeout=self._timeout
+            )
         )
 
 def create_claude_client() -> ClaudeClient:
@@ -0,0 +1,163 @@
+"""
+가짜 LLM 클라이언트 (네트워크 없이 로컬 개발/테스트/부하 테스트)
+
+LLM_FAKE_PROVIDER=true일 때만 라우팅 대상("fake")이 된다.
+- 프롬프트 종류(면접 질문/학습 경로/커리어 번들/부분 재생성/복구 재요청)에 맞는 유효한 JSON을 결정적으로 생성
+- 제공자 프롬프트 캐시를 흉내: 고정 접두부를 프로세스 안에 기억하고 재사용되면 cached_tokens로 보고
+- 지연 = FAKE_LLM_LATENCY_MS + 캐시 미적중 입력 토큰 1천 개당 FAKE_LLM_MS_PER_1K_INPUT_TOKENS
+  (접두부 캐시가 입력 처리 시간/비용을 줄이는 효과를 재현)
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+import time
+from typing import AsyncIterable, Dict, List, Optional
+from shared.config.base import get_settings
+from shared.utils.token_estimator import estimate_tokens
+from .base import LLMClient, LLMResponse, as_messages
+from .pool import client_pool
+from .prompt_cache import split_cache_prefix, prefix_cache_key, prompt_cache_enabled
+
+settings = get_settings()
+
+_COUNT_PATTERN = re.compile(r"(\d+)개만")
+_CANDIDATE_PATTERN = re.compile(r"후보 질문 (\d+)개")
+_DIFFICULTIES = ("easy", "medium", "hard")
+
+
+class FakeClient(LLMClient):
+    """결정적 응답과 프롬프트 캐시 동작을 재현하는 가짜 제공자"""
+
+    # 제공자 측 접두부 캐시 (접두부 키 → 만료 시각, 모든 인스턴스 공유)
+    _prefix_cache: Dict[str, float] = {}
+
+    def __init__(self, api_key: str = "", model: Optional[str] = None, temperature: Optional[float] = None,
+                 max_tokens: Optional[int] = None, timeout: Optional[int] = None):
+        self._name = "fake"
+        self._model = model or "fake"
+        self._opts = dict(temperature=temperature, max_tokens=max_tokens)
+        self._timeout = timeout
+
+    @property
+    def name(self) -> str:
+        """클라이언트 이름"""
+        return self._name
+
+    @classmethod
+    def reset_cache(cls) -> None:
+        """접두부 캐시 비우기 (테스트/부하 테스트 시나리오 시작 시)"""
+        cls._prefix_cache.clear()
+
+    def _usage(self, messages: List) -> Dict[str, int]:
+        """입력 토큰과 접두부 캐시 적중 토큰 (적중하지 않은 접두부는 이번 호출로 캐시)"""
+        input_tokens = sum(estimate_tokens(str(message.content)) for message in messages)
+        prefix, _ = split_cache_prefix(messages)
+        if not prefix or not prompt_cache_enabled():
+            return {"input_tokens": input_tokens, "cached_tokens": 0}
+
+        key = prefix_cache_key(prefix)
+        now = time.monotonic()
+        hit = self._prefix_cache.get(key, 0.0) > now
+        self._prefix_cache[key] = now + float(settings.llm_prompt_cache_ttl_seconds)
+        prefix_tokens = sum(estimate_tokens(str(message.content)) for message in prefix)
+        return {
+            "input_tokens": input_tokens,
+            "cached_tokens": prefix_tokens if hit else 0,
+            "cache_write_tokens": 0 if hit else prefix_tokens,
+        }
+
+    @staticmethod
+    def _latency_seconds(usage: Dict[str, int]) -> float:
+        uncached = usage["input_tokens"] - usage["cached_tokens"]
+        latency_ms = float(settings.fake_llm_latency_ms) + uncached / 1000 * float(settings.fake_llm_ms_per_1k_input_tokens)
+        return latency_ms / 1000
+
+    def _respond(self, messages: List) -> LLMResponse:
+        usage = self._usage(messages)
+        return LLMResponse(fake_completion(messages), "stop", usage)
+
+    def invoke(self, prompt, **kwargs) -> str:
+        """동기 가짜 호출"""
+        response = self._respond(as_messages(prompt))
+        time.sleep(self._latency_seconds(response.usage))
+        return response
+
+    async def ainvoke(self, prompt, **kwargs) -> str:
+        """비동기 가짜 호출 (응답에 종료 사유/캐시 적중 토큰 포함)"""
+        response = self._respond(as_messages(prompt))
+        await asyncio.sleep(self._latency_seconds(response.usage))
+        return response
+
+    async def astream(self, prompt, **kwargs) -> AsyncIterable[str]:
+        """비동기 스트리밍 가짜 호출 (첫 청크까지 입력 처리 지연)"""
+        response = await self.ainvoke(prompt, **kwargs)
+        for start in range(0, len(response), 64):
+            yield response[start:start + 64]
+
+    def with_options(self, **opts) -> "FakeClient":
+        """옵션을 변경한 가짜 클라이언트 반환 (같은 옵션 조합은 풀에서 재사용)"""
+        merged = {**self._opts, **opts}
+        return client_pool.get_or_create(
+            (self._name, self._model, merged.get("temperature"), merged.get("max_tokens"), self._timeout),
+            lambda: FakeClient(model=self._model, temperature=merged.get("temperature"),
+                               max_tokens=merged.get("max_tokens"), timeout=self._timeout)
+        )
+
+
+def _fake_question(seed: str, n: int) -> Dict:
+    return {
+        "difficulty": _DIFFICULTIES[n % len(_DIFFICULTIES)],
+        "topic": f"주제 {seed[:4]}-{n}",
+        "question": f"프로젝트에서 주제 {seed[:4]}-{n}을(를) 적용하며 겪은 문제와 해결 과정을 설명해 주세요.",
+        "what_good_answers_cover": ["문제 상황", "선택한 해결책과 대안 비교", "결과 지표"],
+    }
+
+
+def _fake_learning_path(seed: str, n: int) -> Dict:
+    return {
+        "type": "strength" if n % 2 == 0 else "weakness",
+        "title": f"학습 경로 {seed[:4]}-{n}",
+        "description": f"학습 경로 {seed[:4]}-{n}의 목표와 진행 방법",
+        "reason": "이력서 분석 결과에 따른 추천",
+        "resources": ["공식 문서", "실습 프로젝트"],
+        "link": "https://example.com/learning",
+    }
+
+
+def _learning_payload(seed: str, count: int = 5) -> Dict:
+    return {
+        "analysis": {"strengths": ["백엔드 API 설계"], "weaknesses": ["운영/장애 대응"]},
+        "summary": "강점은 심화하고 약점은 보완하는 학습 전략",
+        "learning_paths": [_fake_learning_path(seed, n) for n in range(count)],
+    }
+
+
+def fake_completion(messages: List) -> str:
+    """프롬프트 종류에 맞는 결정적 응답 텍스트 (같은 프롬프트면 같은 응답)"""
+    text = "\n".join(str(message.content) for message in messages)
+    last = str(messages[-1].content) if messages else ""
+    seed = hashlib.sha256(last.encode("utf-8")).hexdigest()
+    is_learning = "learning_paths" in text and '"interview"' not in text
+
+    def item(n: int) -> Dict:
+        return _fake_learning_path(seed, n) if is_learning else _fake_question(seed, n)
+
+    if "[항목 재요청]" in last or "[이어서 생성]" in last:
+        match = _COUNT_PATTERN.search(last)
+        return json.dumps({"items": [item(n) for n in range(int(match.group(1)) if match else 1)]}, ensure_ascii=False)
+    if "[부분 재생성]" in text:
+        return json.dumps({"item": item(0)}, ensure_ascii=False)
+    if '"interview"' in text and '"learning"' in text:
+        return json.dumps({
+            "interview": {"questions": [_fake_question(seed, n) for n in range(5)]},
+            "learning": _learning_payload(seed),
+        }, ensure_ascii=False)
+    if is_learning:
+        return json.dumps(_learning_payload(seed), ensure_ascii=False)
+    if "questions" in text:
+        match = _CANDIDATE_PATTERN.search(last)
+        count = int(match.group(1)) if match else 5
+        return json.dumps({"questions": [_fake_question(seed, n) for n in range(count)]}, ensure_ascii=False)
+    return f"요약: {last[:200]}"
@@ -2,16 +2,23 @@
 Google Gemini LLM 클라이언트
 """
 
-from typing import AsyncIterable
-from .base import LLMClient
-from shared.config.base import BaseAppSettings
+from typing import AsyncIterable, List
+import httpx
+from .base import LLMClient, LLMResponse, as_messages, response_from_generation
+from .pool import client_pool
+from .transport import get_async_http_client
+from .prompt_cache import GEMINI_API_BASE, gemini_context_cache, split_cache_prefix, prompt_cache_enabled
+from shared.config.base import get_settings
 from langchain_google_genai import ChatGoogleGenerativeAI
 
-# 기본 설정 인스턴스 (실제로는 각 서비스에서 주입받아야 함)
-settings = BaseAppSettings()
+settings = get_settings()
 
 class GeminiClient(LLMClient):
     """Google Gemini LLM 클라이언트"""
+
+    # 고정된 google-generativeai(<0.5)의 GenerationConfig에는 response_mime_type/response_schema가 없어
+    # 구조화 출력을 지원하지 않음 (관대한 JSON 파서로 처리)
+    supports_structured_output = False
     
     def __init__(self, api_key: str, model: str, temperature: float, max_tokens: int, timeout: int):
         self._name = "gemini"
@@ -20,7 +27,7 @@ class GeminiClient(LLMClient):
         self._model = model
         self._timeout = timeout
         
-        # LangChain Google GenAI 설정
+        # LangChain Google GenAI 설정 (google-generativeai는 프로세스 전역 gRPC 채널을 사용)
         self._llm = ChatGoogleGenerativeAI(
             google_api_key=api_key,
             model=model,
@@ -44,12 +51,61 @@ class GeminiClient(LLMClient):
             raise Exception(f"Gemini API call failed: {e}")
 
     async def ainvoke(self, prompt: str, **kwargs) -> str:
-        """비동기 Gemini LLM 호출"""
+        """
+        비동기 Gemini LLM 호출 (응답에 종료 사유 포함)
+
+        고정 접두부가 있으면 cachedContents 핸들을 참조해 접두부 없이 요청 (핸들을 쓸 수 없으면 일반 호출)
+        """
         try:
-            resp = await self._llm.ainvoke(prompt, **kwargs)
-            return getattr(resp, "content", str(resp))
+            messages = as_messages(prompt)
+            prefix, rest = split_cache_prefix(messages)
+            if prefix and rest and prompt_cache_enabled():
+                handle = await gemini_context_cache.handle_for(
+                    get_async_http_client(self._name), self._api_key, self._model,
+                    "\n\n".join(str(message.content) for message in prefix), self._timeout
+                )
+                if handle:
+                    try:
+                        return await self._agenerate_cached(handle, rest)
+                    except httpx.HTTPStatusError as e:
+                        if e.response.status_code not in (403, 404):
+                            raise
+                        # 만료/삭제된 핸들: 다음 호출에서 다시 생성하고 이번에는 캐시 없이 호출
+                        gemini_context_cache.invalidate(handle)
+            result = await self._llm.agenerate([messages], **kwargs)
+            return response_from_generation(result.generations[0][0])
         except Exception as e:
             raise Exception(f"Gemini API call failed: {e}")
+
+    async def _agenerate_cached(self, handle: str, messages: List) -> LLMResponse:
+        """cachedContents 핸들을 참조하는 generateContent REST 호출 (공유 HTTP 커넥션 풀)"""
+        from langchain_core.messages import AIMessage
+
+        response = await get_async_http_client(self._name).post(
+            f"{GEMINI_API_BASE}/models/{self._model}:generateContent", params={"key": self._api_key},
+            timeout=self._timeout,
+            json={
+                "cachedContent": handle,
+                "contents": [
+                    {"role": "model" if isinstance(message, AIMessage) else "user",
+                     "parts": [{"text": str(message.content)}]}
+                    for message in messages
+                ],
+                "generationConfig": {
+                    "temperature": self._opts["temperature"],
+                    "maxOutputTokens": self._opts["max_tokens"],
+                },
+            }
+        )
+        response.raise_for_status()
+        data = response.json()
+        candidate = (data.get("candidates") or [{}])[0]
+        text = "".join(part.get("text", "") for part in candidate.get("content", {}).get("parts", []))
+        metadata = data.get("usageMetadata", {})
+        return LLMResponse(text, candidate.get("finishReason"), {
+            "input_tokens": metadata.get("promptTokenCount", 0),
+            "cached_tokens": metadata.get("cachedContentTokenCount", 0),
+        })
     
     async def astream(self, prompt: str, **kwargs) -> AsyncIterable[str]:
         """비동기 스트리밍 Gemini LLM 호출"""
@@ -63,14 +119,19 @@ class GeminiClient(LLMClient):
             raise Exception(f"Gemini API streaming failed: {e}")
         
     def with_options(self, **opts) -> "GeminiClient":
-        """옵션을 변경한 새로운 Gemini 클라이언트 인스턴스 반환"""
+        """옵션을 변경한 Gemini 클라이언트 반환 (같은 옵션 조합은 풀에서 재사용)"""
         merged = {**self._opts, **opts}
-        return GeminiClient(
-            api_key=self._api_key,
-            model=self._model,
-            temperature=merged.get("temperature", self._opts["temperature"]),
-            max_tokens=merged.get("max_tokens", self._opts["max_tokens"]),
-            timeout=self._timeout
+        temperature = merged.get("temperature", self._opts["temperature"])
+        max_tokens = merged.get("max_tokens", self._opts["max_tokens"])
+        return client_pool.get_or_create(
+            (self._name, self._model, temperature, max_tokens, self._timeout),
+            lambda: GeminiClient(
+                api_key=self._api_key,
+                model=self._model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                timeout=self._timeout
+            )
         )
 
 def create_gemini_client() -> GeminiClient:
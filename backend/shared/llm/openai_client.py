@@ -1,21 +1,31 @@
+import openai
 from langchain_openai import ChatOpenAI
-from .base import LLMClient
-from shared.config.base import BaseAppSettings
-from typing import AsyncIterable
-
-# 기본 설정 인스턴스 (실제로는 각 서비스에서 주입받아야 함)
-settings = BaseAppSettings()
+from .base import LLMClient, as_messages, response_from_generation
+from .pool import client_pool
+from .transport import get_http_client, get_async_http_client
+from .structured import structured_json_schema
+from .prompt_cache import split_cache_prefix, prefix_cache_key, prompt_cache_enabled
+from typing import AsyncIterable, Dict, Optional
 
 class OpenAIClient(LLMClient):
+    supports_structured_output = True
+
     def __init__(self, api_key: str, model: str, temperature: float, max_tokens: int, timeout: int):
         self._name = "openai"
-        self._model = model 
+        self._api_key = api_key
+        self._model = model
+        self._timeout = timeout
         self._opts = dict(temperature=temperature, max_tokens=max_tokens)
+
+        # 공유 HTTP 커넥션 풀 위에 SDK 클라이언트 구성 (새 TLS 핸드셰이크 없음)
+        client_params = dict(api_key=api_key, timeout=timeout, max_retries=3)
         self._llm = ChatOpenAI(
-            api_key=settings.openai_api_key,   # 최신 langchain_openai는 api_key 인자 지원
+            api_key=api_key,
             model=model,
             timeout=timeout,
             max_retries=3,
+            client=openai.OpenAI(**client_params, http_client=get_http_client(self._name)).chat.completions,
+            async_client=openai.AsyncOpenAI(**client_params, http_client=get_async_http_client(self._name)).chat.completions,
             **self._opts
         )
 
@@ -35,21 +45,64 @@ class OpenAIClient(LLMClient):
         return getattr(resp, "content", str(resp))
 
     async def ainvoke(self, prompt: str, **kwargs) -> str:
-        """비동기 OpenAI LLM 호출"""
-        resp = await self._llm.ainvoke(prompt, **kwargs)
-        return getattr(resp, "content", str(resp))
+        """비동기 OpenAI LLM 호출 (응답에 종료 사유/캐시 적중 토큰 포함)"""
+        result = await self._llm.agenerate([as_messages(prompt)], **self._cache_kwargs(prompt, kwargs))
+        return response_from_generation(result.generations[0][0], self._usage(result))
+
+    @staticmethod
+    def _cache_kwargs(prompt, kwargs: Dict) -> Dict:
+        """
+        고정 접두부가 있으면 prompt_cache_key 지정
+
+        OpenAI는 1024 토큰 이상의 동일 접두부를 자동 캐시하므로 접두부를 맨 앞에 고정하고,
+        같은 접두부 요청이 같은 캐시로 라우팅되도록 키만 붙인다.
+        """
+        prefix, _ = split_cache_prefix(prompt)
+        if prefix and prompt_cache_enabled():
+            kwargs = {"prompt_cache_key": prefix_cache_key(prefix), **kwargs}
+        return kwargs
+
+    @staticmethod
+    def _usage(result) -> Optional[Dict[str, int]]:
+        token_usage = (result.llm_output or {}).get("token_usage") or {}
+        if not token_usage:
+            return None
+        details = token_usage.get("prompt_tokens_details") or {}
+        return {
+            "input_tokens": token_usage.get("prompt_tokens", 0),
+            "cached_tokens": details.get("cached_tokens") or 0,
+        }
+
+    async def ainvoke_structured(self, prompt, response_model, **kwargs) -> str:
+        """JSON 스키마 response_format(strict)으로 OpenAI 호출"""
+        response_format = {
+            "type": "json_schema",
+            "json_schema": {
+                "name": response_model.__name__,
+                "schema": structured_json_schema(response_model),
+                "strict": True,
+            },
+        }
+        result = await self._llm.agenerate([as_messages(prompt)], response_format=response_format,
+                                           **self._cache_kwargs(prompt, kwargs))
+        return response_from_generation(result.generations[0][0], self._usage(result))
 
     async def astream(self, prompt: str, **kwargs) -> AsyncIterable[str]:
         async for chunk in self._llm.astream(prompt, **kwargs):
             yield getattr(chunk, "content", str(chunk))
 
     def with_options(self, **opts) -> "OpenAIClient":
+        """옵션을 변경한 클라이언트 반환 (같은 옵션 조합은 풀에서 재사용)"""
         merged = {**self._opts, **opts}
-        clone = OpenAIClient(
-            api_key=self._llm.api_key,  # 내부 보유 값
-            model=self._llm.model_name,
-            temperature=merged.get("temperature", self._opts["temperature"]),
-            max_tokens=merged.get("max_tokens", self._opts["max_tokens"]),
-            timeout=self._llm.timeout
+        temperature = merged.get("temperature", self._opts["temperature"])
+        max_tokens = merged.get("max_tokens", self._opts["max_tokens"])
+        return client_pool.get_or_create(
+            (self._name, self._model, temperature, max_tokens, self._timeout),
+            lambda: OpenAIClient(
+                api_key=self._api_key,
+                model=self._model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                timeout=self._timeout
+            )
         )
-        return clone
@@ -0,0 +1,66 @@
+"""
+LLM 클라이언트 인스턴스 풀
+(provider, model, temperature, max_tokens, timeout) 단위로 인스턴스를 재사용하고 LRU로 개수 제한
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional
+from shared.config.base import get_settings
+from shared.utils.logger import setup_logger
+from .base import LLMClient
+
+settings = get_settings()
+logger = setup_logger("shared-llm", settings.log_level)
+
+
+class LLMClientPool:
+    """옵션 조합별 LLM 클라이언트 LRU 풀"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._clients: "OrderedDict[Hashable, LLMClient]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Optional[LLMClient]]) -> Optional[LLMClient]:
+        """
+        풀에서 클라이언트 반환, 없으면 생성 후 등록
+
+        Args:
+            key: (provider, model, temperature, max_tokens, timeout)
+            factory: 클라이언트 생성 함수 (None 반환 시 풀에 저장하지 않음)
+        """
+        with self._lock:
+            if key in self._clients:
+                self._clients.move_to_end(key)
+                return self._clients[key]
+
+        client = factory()
+        if client is None:
+            return None
+
+        with self._lock:
+            # 동시에 생성된 경우 먼저 등록된 인스턴스 사용
+            existing = self._clients.get(key)
+            if existing is not None:
+                self._clients.move_to_end(key)
+                return existing
+            self._clients[key] = client
+            while len(self._clients) > self.maxsize:
+                evicted_key, _ = self._clients.popitem(last=False)
+                logger.info(f"LLM client evicted from pool: {evicted_key}")
+        return client
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._clients
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clients.clear()
+
+
+# 전역 클라이언트 풀
+client_pool = LLMClientPool(settings.llm_client_pool_size)
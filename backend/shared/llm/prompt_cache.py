@@ -0,0 +1,133 @@
+"""
+제공자 프롬프트 캐시 활용 (고정 접두부 표시)
+
+프롬프트 로더가 모든 요청에서 동일한 시스템 프롬프트를 메시지 목록 맨 앞의 고정 접두부로 표시하면
+클라이언트가 제공자별 방식으로 캐시한다.
+- Claude: system 블록에 cache_control(ephemeral) 표시
+- OpenAI: 1024 토큰 이상 동일 접두부는 자동 캐시 → 접두부를 맨 앞에 고정하고 prompt_cache_key로 같은 캐시로 라우팅
+- Gemini: 접두부로 cachedContents 핸들을 만들어 재사용하고 만료 전에 TTL 갱신
+  (고정된 google-generativeai(<0.5)에 캐시 API가 없어 공유 HTTP 커넥션 풀로 REST 호출)
+
+요청마다 바뀌는 내용(이력서, 후보 수/부분 재생성/복구 지시문)은 항상 접두부 뒤 휴먼 메시지에 붙여 접두부를 유지한다.
+캐시 적중 토큰은 응답(LLMResponse.usage)에 담겨 라우터 통계와 생성 문서에 기록된다.
+"""
+
+import hashlib
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from shared.config.base import get_settings
+from shared.utils.logger import setup_logger
+from shared.utils.token_estimator import estimate_tokens
+
+settings = get_settings()
+logger = setup_logger("prompt-cache", settings.log_level)
+
+# 메시지 additional_kwargs의 고정 접두부 표시 (제공자 요청에는 전달되지 않음)
+CACHE_PREFIX_FLAG = "cache_prefix"
+
+GEMINI_API_BASE = "https://generativelanguage.googleapis.com/v1beta"
+
+
+def prompt_cache_enabled() -> bool:
+    return bool(settings.llm_prompt_cache)
+
+
+def mark_cache_prefix(message):
+    """메시지를 캐시할 고정 접두부로 표시 (같은 메시지 반환)"""
+    message.additional_kwargs[CACHE_PREFIX_FLAG] = True
+    return message
+
+
+def split_cache_prefix(messages) -> Tuple[List, List]:
+    """(맨 앞의 연속된 고정 접두부 메시지, 나머지) - 문자열 프롬프트는 접두부 없음"""
+    if isinstance(messages, str):
+        return [], [messages]
+    messages = list(messages)
+    count = 0
+    while count < len(messages) and getattr(messages[count], "additional_kwargs", {}).get(CACHE_PREFIX_FLAG):
+        count += 1
+    return messages[:count], messages[count:]
+
+
+def prefix_cache_key(prefix: List) -> str:
+    """고정 접두부 내용의 키 (같은 프롬프트 파일이면 프로세스/서비스가 달라도 같은 값)"""
+    digest = hashlib.sha256("\x1e".join(str(message.content) for message in prefix).encode("utf-8"))
+    return digest.hexdigest()[:24]
+
+
+class GeminiContextCache:
+    """
+    Gemini cachedContents 핸들 관리 (프로세스 단위)
+
+    - 접두부별 핸들을 만들어 LLM_PROMPT_CACHE_TTL_SECONDS 동안 재사용
+    - 만료 LLM_PROMPT_CACHE_REFRESH_SECONDS 전부터는 사용 시 TTL을 갱신 (갱신 주기 = TTL - 여유 시간)
+    - 생성 실패(최소 토큰 미달, 모델 미지원 등)는 TTL 동안 다시 시도하지 않고 캐시 없이 호출
+    - 생성 중인 접두부는 다른 요청이 기다리지 않고 캐시 없이 호출 (중복 생성 방지)
+    """
+
+    def __init__(self):
+        self._handles: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._failed_until: Dict[Tuple[str, str], float] = {}
+        self._creating = set()
+
+    @staticmethod
+    def _ttl() -> str:
+        return f"{int(settings.llm_prompt_cache_ttl_seconds)}s"
+
+    async def handle_for(self, http_client, api_key: str, model: str, system_text: str,
+                         timeout: float) -> Optional[str]:
+        """
+        접두부의 cachedContents 이름 (사용할 수 없으면 None)
+
+        Args:
+            http_client: 공유 httpx.AsyncClient
+            system_text: 캐시할 시스템 프롬프트
+        """
+        key = (model, hashlib.sha256(system_text.encode("utf-8")).hexdigest()[:24])
+        now = time.monotonic()
+        if self._failed_until.get(key, 0.0) > now or key in self._creating:
+            return None
+        if estimate_tokens(system_text, "gemini") < int(settings.gemini_cache_min_tokens):
+            return None
+
+        entry = self._handles.get(key)
+        if entry and now < entry["expires_at"] - float(settings.llm_prompt_cache_refresh_seconds):
+            return entry["name"]
+
+        self._creating.add(key)
+        try:
+            if entry and now < entry["expires_at"]:
+                response = await http_client.patch(
+                    f"{GEMINI_API_BASE}/{entry['name']}", params={"key": api_key, "updateMask": "ttl"},
+                    json={"ttl": self._ttl()}, timeout=timeout
+                )
+            else:
+                response = await http_client.post(
+                    f"{GEMINI_API_BASE}/cachedContents", params={"key": api_key}, timeout=timeout,
+                    json={
+                        "model": f"models/{model}",
+                        "systemInstruction": {"parts": [{"text": system_text}]},
+                        "ttl": self._ttl(),
+                    }
+                )
+            response.raise_for_status()
+            name = response.json()["name"]
+            self._handles[key] = {"name": name, "expires_at": now + float(settings.llm_prompt_cache_ttl_seconds)}
+            logger.info(f"Gemini context cache {'refreshed' if entry else 'created'}: {name}")
+            return name
+        except Exception as e:
+            logger.warning(f"Gemini context cache unavailable for {model}, calling without cache: {e}")
+            self._handles.pop(key, None)
+            self._failed_until[key] = now + float(settings.llm_prompt_cache_ttl_seconds)
+            return None
+        finally:
+            self._creating.discard(key)
+
+    def invalidate(self, name: str) -> None:
+        """제공자가 핸들을 찾지 못한 경우(만료/삭제) 다음 호출에서 다시 생성"""
+        for key, entry in list(self._handles.items()):
+            if entry["name"] == name:
+                del self._handles[key]
+
+
+gemini_context_cache = GeminiContextCache()
@@ -2,14 +2,14 @@
 LLM 클라이언트 레지스트리 - 다중 제공자 관리 및 폴백 시스템
 """
 
-from typing import Dict, List, Optional, Type
+import importlib
+from typing import Any, Dict, List, Optional, Type, Union
 from shared.utils.logger import setup_logger
 from .base import LLMClient
-from shared.config.base import BaseAppSettings
-from config import settings
+from .pool import client_pool
+from shared.config.base import get_settings
 
-# 임시 설정 인스턴스 (각 서비스에서 주입받아 사용)
-settings = BaseAppSettings()
+settings = get_settings()
 
 logger = setup_logger("shared-llm", settings.log_level)
 
@@ -17,71 +17,71 @@ class LLMRegistry:
     """LLM 클라이언트 레지스트리"""
     
     def __init__(self):
-        self._clients: Dict[str, Type[LLMClient]] = {}
-        self._instances: Dict[str, LLMClient] = {}
+        # 클라이언트 클래스 또는 "모듈경로:클래스명" (SDK는 최초 사용 시 import)
+        self._clients: Dict[str, Union[Type[LLMClient], str]] = {}
         
-    def register(self, name: str, client_class: Type[LLMClient]) -> None:
-        """LLM 클라이언트 클래스 등록"""
+    def register(self, name: str, client_class: Union[Type[LLMClient], str]) -> None:
+        """LLM 클라이언트 클래스 등록 ("모듈경로:클래스명" 문자열이면 지연 로드)"""
         self._clients[name] = client_class
         logger.info(f"LLM client '{name}' registered")
     
-    def create_client(self, name: str) -> Optional[LLMClient]:
-        """클라이언트 인스턴스 생성"""
+    def _resolve_client_class(self, name: str) -> Type[LLMClient]:
+        """등록된 클라이언트 클래스 반환 (지연 등록된 경우 이때 SDK 모듈 import)"""
+        client_class = self._clients[name]
+        if isinstance(client_class, str):
+            module_path, class_name = client_class.split(":")
+            client_class = getattr(importlib.import_module(module_path), class_name)
+            self._clients[name] = client_class
+            logger.info(f"LLM client '{name}' loaded")
+        return client_class
+    
+    def _client_config(self, name: str) -> Dict[str, Any]:
+        """설정에서 제공자별 클라이언트 생성 인자 구성 (설정이 없는 제공자(fake)는 None)"""
+        return dict(
+            api_key=getattr(settings, f"{name}_api_key", None) or "",
+            model=getattr(settings, f"{name}_model", None),
+            temperature=getattr(settings, f"{name}_temperature", None),
+            max_tokens=getattr(settings, f"{name}_max_tokens", None),
+            timeout=getattr(settings, f"{name}_timeout", None)
+        )
+    
+    def create_client(self, name: str, **overrides) -> Optional[LLMClient]:
+        """클라이언트 인스턴스 생성 (HTTP 커넥션 풀은 제공자 단위로 공유)"""
         if name not in self._clients:
             logger.error(f"Unknown LLM client: {name}")
             return None
             
         try:
-            client_class = self._clients[name]
-            
-            if name == "openai":
-                from .openai_client import OpenAIClient
-                return OpenAIClient(
-                    api_key=settings.openai_api_key or "",
-                    model=settings.openai_model,
-                    temperature=settings.openai_temperature,
-                    max_tokens=settings.openai_max_tokens,
-                    timeout=settings.openai_timeout
-                )
-            elif name == "claude":
-                from .claude_client import ClaudeClient
-                return ClaudeClient(
-                    api_key=settings.claude_api_key,
-                    model=settings.claude_model,
-                    temperature=settings.claude_temperature,
-                    max_tokens=settings.claude_max_tokens,
-                    timeout=settings.claude_timeout
-                )
-            elif name == "gemini":
-                from .gemini_client import GeminiClient
-                return GeminiClient(
-                    api_key=settings.gemini_api_key,
-                    model=settings.gemini_model,
-                    temperature=settings.gemini_temperature,
-                    max_tokens=settings.gemini_max_tokens,
-                    timeout=settings.gemini_timeout
-                )
-            else:
-                logger.error(f"No factory method for client: {name}")
-                return None
-                
+            client_class = self._resolve_client_class(name)
+            return client_class(**{**self._client_config(name), **overrides})
         except Exception as e:
             logger.error(f"Failed to create LLM client '{name}': {e}")
             return None
     
-    def get_client(self, name: str, use_cache: bool = True) -> Optional[LLMClient]:
-        """클라이언트 인스턴스 반환 (캐시 사용 가능)"""
-        if use_cache and name in self._instances:
-            return self._instances[name]
-            
-        client = self.create_client(name)
-        if client and use_cache:
-            self._instances[name] = client
+    def get_client(self, name: str, use_cache: bool = True, **overrides) -> Optional[LLMClient]:
+        """
+        클라이언트 인스턴스 반환
+        
+        Args:
+            name: 제공자 이름
+            use_cache: False면 풀을 거치지 않고 새 인스턴스 생성
+            **overrides: temperature, max_tokens 등 옵션 (옵션 조합별로 풀에서 재사용)
+        """
+        if name not in self._clients:
+            logger.error(f"Unknown LLM client: {name}")
+            return None
+        if not use_cache:
+            return self.create_client(name, **overrides)
             
-        return client
+        config = {**self._client_config(name), **overrides}
+        key = (name, config["model"], config["temperature"], config["max_tokens"], config["timeout"])
+        return client_pool.get_or_create(key, lambda: self.create_client(name, **overrides))
     
     def get_available_clients(self) -> List[str]:
-        """사용 가능한 클라이언트 목록 반환 (API 키 확인)"""
+        """사용 가능한 클라이언트 목록 반환 (API 키 확인, 가짜 제공자 사용 시 가짜 제공자만)"""
+        if settings.llm_fake_provider:
+            return ["fake"]
+
         available = []
         
         # OpenAI 확인
@@ -98,6 +98,17 @@ class LLMRegistry:
             
         return available
     
+    def warm_up(self) -> List[str]:
+        """
+        API 키가 설정된 클라이언트만 미리 생성 (서비스 시작 시 호출)
+        
+        Returns:
+            List[str]: 생성에 성공한 클라이언트 이름 목록
+        """
+        warmed = [name for name in self.get_available_clients() if self.get_client(name)]
+        logger.info(f"LLM clients warmed up: {warmed}")
+        return warmed
+    
     def get_client_with_fallback(self, 
                                 preferred_order: Optional[List[str]] = None) -> Optional[LLMClient]:
         """폴백 지원 클라이언트 반환"""
@@ -211,14 +222,11 @@ registry = LLMRegistry()
 
 # 클라이언트 등록
 def setup_registry():
-    """레지스트리 초기 설정"""
-    from .openai_client import OpenAIClient
-    from .claude_client import ClaudeClient  
-    from .gemini_client import GeminiClient
-    
-    registry.register("openai", OpenAIClient)
-    registry.register("claude", ClaudeClient)
-    registry.register("gemini", GeminiClient)
+    """레지스트리 초기 설정 (제공자 SDK는 클라이언트 최초 생성 시 import)"""
+    registry.register("openai", "shared.llm.openai_client:OpenAIClient")
+    registry.register("claude", "shared.llm.claude_client:ClaudeClient")
+    registry.register("gemini", "shared.llm.gemini_client:GeminiClient")
+    registry.register("fake", "shared.llm.fake_client:FakeClient")
     
     logger.info("LLM Registry setup completed")
 
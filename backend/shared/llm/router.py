@@ -0,0 +1,404 @@
+"""
+지연 시간/오류율 기반 적응형 LLM 제공자 라우터
+
+- 제공자/모델별 지연 시간, 오류율, 파싱 성공률의 EWMA를 실제 호출로 갱신
+- 통계는 Redis 해시에 저장해 API 프로세스와 워커가 함께 사용 (Redis 장애 시 프로세스 로컬 통계)
+- 이벤트 루프 안에서는 Redis 조회/저장을 스레드로 넘겨 호출 경로에서는 메모리 내 EWMA 갱신만 수행
+- 요청마다 목표(objective)에 따라 제공자 순서를 결정하고 최근 결정을 /debug/llm에 노출
+"""
+
+import asyncio
+import math
+import random
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Type
+from shared.config.base import get_settings
+from shared.database.redis_client import get_redis_client
+from shared.utils.logger import setup_logger
+from shared.utils.metrics import observe_llm_call, observe_llm_parse
+from shared.utils.tracing import start_span
+from .base import LLMClient, prompt_cache_hit_ratio
+from .registry import registry
+from .structured import uses_structured_output
+
+settings = get_settings()
+logger = setup_logger("shared-llm", settings.log_level)
+
+OBJECTIVE_LOWEST_P95 = "lowest_p95"
+OBJECTIVE_CHEAPEST_UNDER_SLO = "cheapest_under_slo"
+OBJECTIVE_WEIGHTED_ROUND_ROBIN = "weighted_round_robin"
+ROUTER_OBJECTIVES = (OBJECTIVE_LOWEST_P95, OBJECTIVE_CHEAPEST_UNDER_SLO, OBJECTIVE_WEIGHTED_ROUND_ROBIN)
+
+# 정규분포 가정 시 95 백분위수 계수
+P95_Z = 1.645
+
+# 통계 키 TTL (7일간 호출이 없으면 초기화)
+STATS_TTL = 7 * 24 * 3600
+
+
+def parse_provider_costs(raw: str) -> Dict[str, float]:
+    """"gemini:1,openai:3" 형식의 상대 비용 설정 파싱"""
+    costs = {}
+    for item in (raw or "").split(","):
+        if ":" in item:
+            name, cost = item.split(":", 1)
+            costs[name.strip()] = float(cost)
+    return costs
+
+
+def update_ewma_stats(stats: Dict[str, float], alpha: float, latency_ms: Optional[float] = None,
+                      error: Optional[bool] = None, parsed: Optional[bool] = None,
+                      structured_parsed: Optional[bool] = None,
+                      cache_hit_ratio: Optional[float] = None) -> Dict[str, float]:
+    """
+    EWMA 통계 갱신 (지연 시간은 평균/분산을 함께 추적해 p95 추정)
+
+    Args:
+        stats: 기존 통계 (빈 dict면 첫 관측값으로 초기화)
+        alpha: 평활 계수 (클수록 최근 값 반영이 빠름)
+        latency_ms: 성공한 호출의 지연 시간
+        error: 호출 실패 여부
+        parsed: 응답 파싱 성공 여부
+        structured_parsed: 구조화 출력 응답의 검증 성공 여부 (구조화 출력 호출에만 기록)
+        cache_hit_ratio: 입력 토큰 중 프롬프트 캐시 적중 비율 (제공자가 사용량을 알려준 호출에만 기록)
+
+    Returns:
+        Dict[str, float]: 갱신된 통계
+    """
+    stats = dict(stats)
+    if latency_ms is not None:
+        if not stats.get("latency_samples"):
+            stats["latency_mean"] = latency_ms
+            stats["latency_var"] = 0.0
+        else:
+            diff = latency_ms - stats["latency_mean"]
+            incr = alpha * diff
+            stats["latency_mean"] += incr
+            stats["latency_var"] = (1 - alpha) * (stats["latency_var"] + diff * incr)
+        stats["latency_samples"] = stats.get("latency_samples", 0) + 1
+
+    for field, value in (("error_rate", error), ("parse_success", parsed),
+                         ("structured_parse_success", structured_parsed),
+                         ("prompt_cache_hit_ratio", cache_hit_ratio)):
+        if value is None:
+            continue
+        sample = float(value)
+        if not stats.get(f"{field}_samples"):
+            stats[field] = sample
+        else:
+            stats[field] += alpha * (sample - stats[field])
+        stats[f"{field}_samples"] = stats.get(f"{field}_samples", 0) + 1
+
+    stats["updated_at"] = time.time()
+    return stats
+
+
+def estimate_p95(stats: Dict[str, float]) -> Optional[float]:
+    """EWMA 평균/분산으로 p95 지연 시간 추정 (관측 없으면 None)"""
+    if not stats.get("latency_samples"):
+        return None
+    return stats["latency_mean"] + P95_Z * math.sqrt(max(stats.get("latency_var", 0.0), 0.0))
+
+
+def _failure_rate(success: Optional[float]) -> Optional[float]:
+    return None if success is None else round(1.0 - success, 4)
+
+
+class LLMRouter:
+    """요청 단위 제공자 선택기"""
+
+    def __init__(self, objective: str = OBJECTIVE_LOWEST_P95):
+        if objective not in ROUTER_OBJECTIVES:
+            logger.warning(f"Unknown router objective '{objective}', using {OBJECTIVE_LOWEST_P95}")
+            objective = OBJECTIVE_LOWEST_P95
+        self.objective = objective
+        self.alpha = settings.llm_router_ewma_alpha
+        self.slo_p95_ms = settings.llm_router_slo_p95_ms
+        self.max_error_rate = settings.llm_router_max_error_rate
+        self.probe_rate = settings.llm_router_probe_rate
+        self.costs = parse_provider_costs(settings.llm_provider_costs)
+        self.refresh_seconds = settings.llm_router_stats_refresh_seconds
+
+        self._local_stats: Dict[str, Dict[str, float]] = {}
+        self._cache: Dict[str, Dict[str, float]] = {}
+        self._cache_loaded_at = 0.0
+        self._rr_weights: Dict[str, float] = {}
+        self._decisions = deque(maxlen=50)
+        self._lock = threading.Lock()
+
+    # ---------- 통계 저장소 ----------
+
+    @staticmethod
+    def _stats_key(provider: str, model: str) -> str:
+        return f"llm_stats:{provider}:{model}"
+
+    @staticmethod
+    def _model_of(provider: str) -> str:
+        return getattr(settings, f"{provider}_model", None) or "default"
+
+    def _cache_fresh(self, providers: List[str]) -> bool:
+        return (time.time() - self._cache_loaded_at < self.refresh_seconds
+                and all(p in self._cache for p in providers))
+
+    def _load_stats(self, providers: List[str]) -> Dict[str, Dict[str, float]]:
+        """제공자별 통계 조회 (refresh 주기 동안 프로세스 내 캐시 사용)"""
+        if self._cache_fresh(providers):
+            return self._cache
+
+        now = time.time()
+        try:
+            pipe = get_redis_client().pipeline()
+            for provider in providers:
+                pipe.hgetall(self._stats_key(provider, self._model_of(provider)))
+            rows = pipe.execute()
+            loaded = {
+                provider: {k.decode() if isinstance(k, bytes) else k: float(v) for k, v in row.items()}
+                for provider, row in zip(providers, rows)
+            }
+        except Exception as e:
+            logger.warning(f"Failed to load shared LLM stats, using local stats: {e}")
+            loaded = {provider: dict(self._local_stats.get(provider, {})) for provider in providers}
+
+        self._cache = loaded
+        self._cache_loaded_at = now
+        return loaded
+
+    async def _aload_stats(self, providers: List[str]) -> Dict[str, Dict[str, float]]:
+        """_load_stats의 비동기 버전 (캐시가 만료됐을 때만 Redis 조회를 스레드에서 실행)"""
+        if self._cache_fresh(providers):
+            return self._cache
+        return await asyncio.to_thread(self._load_stats, providers)
+
+    def record(self, provider: str, model: Optional[str] = None, latency_ms: Optional[float] = None,
+               error: Optional[bool] = None, parsed: Optional[bool] = None,
+               structured_parsed: Optional[bool] = None, cache_hit_ratio: Optional[float] = None) -> None:
+        """
+        실제 호출 결과로 통계 갱신
+
+        프로세스 로컬 통계는 즉시 갱신하고, 공유 통계(Redis) 저장은 이벤트 루프 안에서 호출되면
+        기본 실행기 스레드로 넘겨 기다리지 않는다 (루프 밖 - Celery 태스크 등 - 에서는 바로 저장).
+        동시 갱신 시 일부 관측값이 유실될 수 있으나 EWMA 특성상 허용한다.
+        """
+        model = model or self._model_of(provider)
+        sample = (latency_ms, error, parsed, structured_parsed, cache_hit_ratio)
+        with self._lock:
+            self._local_stats[provider] = update_ewma_stats(self._local_stats.get(provider, {}), self.alpha,
+                                                            *sample)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._persist(provider, model, sample)
+            return
+        loop.run_in_executor(None, self._persist, provider, model, sample)
+
+    def _persist(self, provider: str, model: str, sample: Tuple) -> None:
+        """관측값 하나를 공유 통계(Redis)에 반영"""
+        try:
+            client = get_redis_client()
+            key = self._stats_key(provider, model)
+            current = {k.decode(): float(v) for k, v in client.hgetall(key).items()}
+            updated = update_ewma_stats(current, self.alpha, *sample)
+            pipe = client.pipeline()
+            pipe.hset(key, mapping=updated)
+            pipe.expire(key, STATS_TTL)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to record shared LLM stats for {provider}: {e}")
+
+    def record_parse(self, client: LLMClient, parsed: bool, structured: bool = False) -> None:
+        """응답 파싱 성공 여부 기록 (structured=True면 구조화 출력 검증 성공률도 함께 갱신)"""
+        model = getattr(client, "_model", None) or self._model_of(client.name)
+        observe_llm_parse(client.name, model, parsed, structured)
+        self.record(client.name, model, parsed=parsed, structured_parsed=parsed if structured else None)
+
+    # ---------- 선택 ----------
+
+    def _is_healthy(self, stats: Dict[str, float]) -> bool:
+        return stats.get("error_rate", 0.0) <= self.max_error_rate
+
+    def _effective_p95(self, stats: Dict[str, float]) -> float:
+        """파싱 실패(재시도 비용)를 반영한 p95. 관측이 없으면 0 (우선 탐색)"""
+        p95 = estimate_p95(stats)
+        if p95 is None:
+            return 0.0
+        return p95 / max(stats.get("parse_success", 1.0), 0.1)
+
+    def _weighted_round_robin(self, candidates: List[str], stats: Dict[str, Dict[str, float]]) -> List[str]:
+        """smooth weighted round-robin (가중치 = 성공률 / 지연 시간)"""
+        weights = {}
+        for provider in candidates:
+            provider_stats = stats.get(provider, {})
+            success = (1 - provider_stats.get("error_rate", 0.0)) * provider_stats.get("parse_success", 1.0)
+            latency = provider_stats.get("latency_mean") or self.slo_p95_ms / 2
+            weights[provider] = max(success, 0.01) / max(latency, 1.0)
+
+        total = sum(weights.values())
+        with self._lock:
+            for provider, weight in weights.items():
+                self._rr_weights[provider] = self._rr_weights.get(provider, 0.0) + weight
+            chosen = max(candidates, key=lambda p: self._rr_weights[p])
+            self._rr_weights[chosen] -= total
+        return [chosen] + sorted((p for p in candidates if p != chosen), key=lambda p: -weights[p])
+
+    def rank(self, preferred: Optional[str] = None, objective: Optional[str] = None) -> List[str]:
+        """
+        사용 가능한 제공자를 시도 순서대로 정렬
+
+        Args:
+            preferred: 명시적으로 요청된 제공자 (사용 가능하면 첫 번째)
+            objective: 이번 요청의 선택 기준 (기본: 설정값)
+
+        Returns:
+            List[str]: 시도 순서
+        """
+        available = registry.get_available_clients()
+        if not available:
+            return []
+        return self._order(available, self._load_stats(available), preferred, objective)
+
+    async def arank(self, preferred: Optional[str] = None, objective: Optional[str] = None) -> List[str]:
+        """rank의 비동기 버전 (통계 조회가 이벤트 루프를 막지 않음)"""
+        available = registry.get_available_clients()
+        if not available:
+            return []
+        return self._order(available, await self._aload_stats(available), preferred, objective)
+
+    def _order(self, available: List[str], stats: Dict[str, Dict[str, float]], preferred: Optional[str],
+               objective: Optional[str]) -> List[str]:
+        objective = objective if objective in ROUTER_OBJECTIVES else self.objective
+        healthy = [p for p in available if self._is_healthy(stats.get(p, {}))]
+        unhealthy = [p for p in available if p not in healthy]
+
+        # 비정상 제공자도 가끔 탐색해 회복 여부 확인
+        if unhealthy and random.random() < self.probe_rate:
+            healthy, unhealthy = healthy + unhealthy[:1], unhealthy[1:]
+        candidates = healthy or available
+
+        by_p95 = sorted(candidates, key=lambda p: self._effective_p95(stats.get(p, {})))
+        if objective == OBJECTIVE_CHEAPEST_UNDER_SLO:
+            within_slo = [p for p in candidates if self._effective_p95(stats.get(p, {})) <= self.slo_p95_ms]
+            cheapest = sorted(within_slo, key=lambda p: self.costs.get(p, float("inf")))
+            order = cheapest + [p for p in by_p95 if p not in cheapest]
+            reason = "cheapest within SLO" if cheapest else "no provider within SLO, lowest p95"
+        elif objective == OBJECTIVE_WEIGHTED_ROUND_ROBIN:
+            order = self._weighted_round_robin(candidates, stats)
+            reason = "weighted round-robin"
+        else:
+            order = by_p95
+            reason = "lowest p95"
+
+        order += [p for p in available if p not in order]
+        if preferred in order:
+            order.remove(preferred)
+            order.insert(0, preferred)
+            reason = f"preferred provider ({reason} otherwise)"
+
+        self._decisions.append({
+            "timestamp": datetime.now().isoformat(),
+            "objective": objective,
+            "order": order,
+            "reason": reason,
+            "p95_ms": {p: estimate_p95(stats.get(p, {})) for p in available},
+            "error_rate": {p: stats.get(p, {}).get("error_rate") for p in available},
+        })
+        return order
+
+    def all_circuits_open(self) -> bool:
+        """사용 가능한 제공자가 없거나 모두 오류율 한도를 넘었는지 (degraded 모드 판단)"""
+        available = registry.get_available_clients()
+        if not available:
+            return True
+        stats = self._load_stats(available)
+        return not any(self._is_healthy(stats.get(p, {})) for p in available)
+
+    async def aall_circuits_open(self) -> bool:
+        """all_circuits_open의 비동기 버전 (통계 조회가 이벤트 루프를 막지 않음)"""
+        available = registry.get_available_clients()
+        if not available:
+            return True
+        stats = await self._aload_stats(available)
+        return not any(self._is_healthy(stats.get(p, {})) for p in available)
+
+    async def ainvoke(self, prompt, preferred: Optional[str] = None, objective: Optional[str] = None,
+                      client_options: Optional[Dict[str, Any]] = None, response_model: Optional[Type] = None,
+                      record_latency: bool = True, **kwargs) -> Tuple[str, LLMClient]:
+        """
+        선택된 순서대로 호출하며 결과를 통계에 기록 (실패 시 다음 제공자로 폴백)
+
+        Args:
+            client_options: 이번 호출에만 적용할 클라이언트 옵션 (max_tokens, temperature 등)
+            response_model: 출력 Pydantic 모델 (지원하는 제공자는 네이티브 구조화 출력으로 호출)
+            record_latency: False면 성공 호출의 지연 시간/캐시 적중률을 라우팅 통계에 반영하지 않음
+                (요약처럼 본 생성과 입력/출력 규모가 다른 보조 호출이 p95 추정을 왜곡하지 않도록, 오류율은 기록)
+
+        Returns:
+            Tuple[str, LLMClient]: 응답 텍스트, 실제 응답한 클라이언트
+        """
+        last_error = None
+        for provider in await self.arank(preferred, objective):
+            client = registry.get_client(provider, **(client_options or {}))
+            if not client:
+                continue
+            model = getattr(client, "_model", None) or self._model_of(provider)
+            structured = uses_structured_output(client, response_model)
+            with start_span("llm.call", kind="client", attributes={
+                "llm.provider": provider, "llm.model": model, "llm.structured": structured,
+            }) as span:
+                started = time.perf_counter()
+                try:
+                    if structured:
+                        response = await client.ainvoke_structured(prompt, response_model, **kwargs)
+                    else:
+                        response = await client.ainvoke(prompt, **kwargs)
+                except Exception as e:
+                    last_error = e
+                    span.record_exception(e)
+                    observe_llm_call(provider, model, time.perf_counter() - started, error=e)
+                    self.record(provider, model, error=True)
+                    logger.warning(f"LLM provider '{provider}' failed, trying next: {e}")
+                    continue
+                elapsed = time.perf_counter() - started
+                tokens = observe_llm_call(provider, model, elapsed, prompt, response)
+                span.set_attributes({f"llm.tokens.{kind}": count for kind, count in tokens.items()})
+                span.set_attribute("llm.finish_reason", getattr(response, "finish_reason", None))
+            if record_latency:
+                self.record(provider, model, latency_ms=elapsed * 1000, error=False,
+                            cache_hit_ratio=prompt_cache_hit_ratio(response))
+            else:
+                self.record(provider, model, error=False)
+            return response, client
+
+        raise Exception(f"All LLM clients failed: {last_error}")
+
+    def describe(self) -> Dict[str, Any]:
+        """현재 통계와 최근 라우팅 결정 (/debug/llm 용)"""
+        available = registry.get_available_clients()
+        stats = self._load_stats(available) if available else {}
+        return {
+            "objective": self.objective,
+            "slo_p95_ms": self.slo_p95_ms,
+            "max_error_rate": self.max_error_rate,
+            "costs": self.costs,
+            "providers": {
+                provider: {
+                    "model": self._model_of(provider),
+                    "p95_ms": estimate_p95(stats.get(provider, {})),
+                    "latency_mean_ms": stats.get(provider, {}).get("latency_mean"),
+                    "error_rate": stats.get(provider, {}).get("error_rate"),
+                    "parse_success": stats.get(provider, {}).get("parse_success"),
+                    "parse_failure_rate": _failure_rate(stats.get(provider, {}).get("parse_success")),
+                    "structured_parse_success": stats.get(provider, {}).get("structured_parse_success"),
+                    "prompt_cache_hit_ratio": stats.get(provider, {}).get("prompt_cache_hit_ratio"),
+                    "healthy": self._is_healthy(stats.get(provider, {})),
+                }
+                for provider in available
+            },
+            "recent_decisions": list(self._decisions)[-10:],
+        }
+
+
+# 전역 라우터 인스턴스
+llm_router = LLMRouter(settings.llm_router_objective)
@@ -0,0 +1,76 @@
+"""
+제공자 네이티브 구조화 출력 (응답을 JSON 스키마로 강제)
+
+- OpenAI: response_format json_schema (strict)
+- Claude: 출력 스키마를 입력으로 받는 도구 하나를 강제 호출(tool_choice)하고 도구 입력을 응답으로 사용
+- Gemini: 고정된 google-generativeai(<0.5)에 response_mime_type/response_schema가 없어 미지원
+
+구조화 응답은 Pydantic 검증 한 번으로 끝내고(복구 없음), 미지원 클라이언트는 관대한 JSON 파서로 처리한다.
+출력 모델은 각 서비스 schemas.py의 항목 스키마로 구성한다.
+"""
+
+from typing import Any, Dict, List, Optional, Type
+from pydantic import BaseModel
+from shared.config.base import get_settings
+from shared.utils.json_parser import parse_llm_json_response
+
+settings = get_settings()
+
+# OpenAI strict 모드와 Claude input_schema가 공통으로 지원하는 키워드만 유지
+_SCHEMA_KEYWORDS = {"type", "properties", "required", "items", "enum", "anyOf", "description", "additionalProperties"}
+
+_schema_cache: Dict[Type[BaseModel], Dict[str, Any]] = {}
+
+
+def structured_json_schema(response_model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Pydantic 모델의 strict JSON 스키마 ($ref 인라인, 모든 속성 필수, 추가 속성 금지)
+
+    기본값이 있는 필드도 필수로 표시되므로 모델은 항상 모든 필드를 출력한다.
+    """
+    if response_model not in _schema_cache:
+        schema = response_model.model_json_schema()
+        _schema_cache[response_model] = _strict(schema, schema.get("$defs", {}))
+    return _schema_cache[response_model]
+
+
+def _strict(node: Any, definitions: Dict[str, Any]) -> Any:
+    if isinstance(node, list):
+        return [_strict(item, definitions) for item in node]
+    if not isinstance(node, dict):
+        return node
+    if "$ref" in node:
+        return _strict(definitions[node["$ref"].rsplit("/", 1)[-1]], definitions)
+    if "allOf" in node and len(node["allOf"]) == 1:
+        # Pydantic은 설명이 붙은 중첩 모델을 allOf 하나로 감쌈
+        return _strict({**node["allOf"][0], **{k: v for k, v in node.items() if k != "allOf"}}, definitions)
+
+    strict = {key: _strict(value, definitions) for key, value in node.items() if key in _SCHEMA_KEYWORDS}
+    if "properties" in node:
+        strict["properties"] = {name: _strict(value, definitions) for name, value in node["properties"].items()}
+        strict["required"] = list(node["properties"])
+        strict["additionalProperties"] = False
+    return strict
+
+
+def uses_structured_output(client, response_model: Optional[Type[BaseModel]]) -> bool:
+    """이번 호출이 구조화 출력 경로인지 (출력 모델 지정 + 설정 활성 + 클라이언트 지원)"""
+    return (
+        response_model is not None
+        and settings.llm_structured_output
+        and getattr(client, "supports_structured_output", False)
+    )
+
+
+def parse_structured_response(response_text: str, client, response_model: Optional[Type[BaseModel]],
+                              expected_keys: Optional[List[str]] = None,
+                              fallback_keys: Optional[Dict[str, List[str]]] = None) -> Any:
+    """
+    응답 파싱 (구조화 출력이면 모델 검증 한 번, 아니면 관대한 JSON 파서)
+
+    Raises:
+        ValueError: 파싱/검증 실패 (pydantic ValidationError 포함)
+    """
+    if uses_structured_output(client, response_model):
+        return response_model.model_validate_json(response_text).model_dump()
+    return parse_llm_json_response(response_text, expected_keys=expected_keys, fallback_keys=fallback_keys)
@@ -0,0 +1,188 @@
+"""
+대형 이력서 map-reduce 요약
+
+- map: 성과가 긴 경력/프로젝트 섹션을 짧고 저렴한 LLM 호출로 병렬 요약 (asyncio.gather)
+- 섹션 요약은 섹션 내용 해시로 Redis에 캐시해 변경되지 않은 섹션은 다시 요약하지 않음
+- reduce: 요약된 섹션으로 구성한 축약 이력서를 기존 포맷터/최종 프롬프트에 그대로 전달
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+from shared.config.base import get_settings
+from shared.database.redis_client import get_redis_client
+from shared.utils.logger import setup_logger
+from shared.utils.resume_formatter import format_resume_for_ai
+from shared.utils.token_estimator import estimate_tokens
+from shared.utils.tracing import traced
+from .router import llm_router, OBJECTIVE_CHEAPEST_UNDER_SLO
+
+settings = get_settings()
+logger = setup_logger("shared-llm", settings.log_level)
+
+# 요약 프롬프트가 바뀌면 올려서 기존 캐시 무효화
+SUMMARY_PROMPT_VERSION = "v1"
+# 섹션당 요약 성과 최대 개수
+SUMMARY_MAX_ITEMS = 3
+
+# 섹션 종류별 (목록 키, 성과 키, 요약에 함께 접어 넣을 키)
+SECTION_KINDS = {
+    "work_experiences": ("achievements", ()),
+    "personal_projects": ("key_achievements", ("architecture_highlights",)),
+}
+
+_SUMMARY_SYSTEM_PROMPT = """
+당신은 백엔드 개발자 이력서를 압축하는 편집자입니다.
+주어진 경력/프로젝트의 성과를 면접과 학습 계획에 가장 유용한 핵심 성과 최대 3개로 요약하세요.
+
+규칙:
+- 수치(처리량, 응답 시간, 비율 등)와 사용한 기술 이름은 반드시 보존
+- 한 줄에 성과 하나, 각 줄은 "- "로 시작
+- 설명, 머리말, 마크다운 강조 없이 목록만 출력
+"""
+
+_BULLET_PATTERN = re.compile(r"^\s*(?:[-*•]|\d+[.)])\s*")
+
+
+def section_hash(section: Dict[str, Any]) -> str:
+    """섹션 내용 해시 (키 순서와 무관, 요약 프롬프트 버전 포함)"""
+    payload = json.dumps(section, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(f"{SUMMARY_PROMPT_VERSION}:{payload}".encode("utf-8")).hexdigest()
+
+
+def _cache_key(digest: str) -> str:
+    return f"resume_section_summary:{digest}"
+
+
+def _section_items(section: Dict[str, Any], kind: str) -> List[str]:
+    achievements_key, extra_keys = SECTION_KINDS[kind]
+    items = list(section.get(achievements_key) or [])
+    for key in extra_keys:
+        items.extend(section.get(key) or [])
+    return [item for item in items if item]
+
+
+def parse_summary(text: str) -> List[str]:
+    """요약 응답을 성과 목록으로 변환 (글머리표 제거, 최대 SUMMARY_MAX_ITEMS개)"""
+    items = []
+    for line in (text or "").splitlines():
+        item = _BULLET_PATTERN.sub("", line).strip()
+        if item:
+            items.append(item)
+    return items[:SUMMARY_MAX_ITEMS]
+
+
+def needs_summary(resume_data: Dict[str, Any]) -> bool:
+    """전체 이력서를 예산 없이 포맷팅했을 때 추정 토큰 수가 임계값을 넘는지 여부"""
+    formatted = format_resume_for_ai(resume_data)
+    return formatted["estimated_tokens"] > settings.resume_summary_threshold_tokens
+
+
+def _summary_targets(resume_data: Dict[str, Any]) -> List[Tuple[str, int, Dict[str, Any]]]:
+    """요약 대상 섹션 (성과 목록이 섹션 최소 토큰 수보다 긴 섹션만)"""
+    targets = []
+    for kind in SECTION_KINDS:
+        for index, section in enumerate(resume_data.get(kind) or []):
+            items = _section_items(section, kind)
+            if len(items) > 1 and estimate_tokens("\n".join(items)) > settings.resume_summary_section_min_tokens:
+                targets.append((kind, index, section))
+    return targets
+
+
+def _get_cached_summary(digest: str) -> Optional[List[str]]:
+    try:
+        cached = get_redis_client().get(_cache_key(digest))
+        return json.loads(cached) if cached else None
+    except Exception as e:
+        logger.warning(f"Section summary cache read failed: {e}")
+        return None
+
+
+def _set_cached_summary(digest: str, summary: List[str]) -> None:
+    try:
+        get_redis_client().setex(_cache_key(digest), settings.resume_summary_cache_ttl,
+                                 json.dumps(summary, ensure_ascii=False))
+    except Exception as e:
+        logger.warning(f"Section summary cache write failed: {e}")
+
+
+async def summarize_section(section: Dict[str, Any], kind: str) -> Optional[List[str]]:
+    """
+    섹션 하나를 요약 (캐시 우선)
+
+    Returns:
+        Optional[List[str]]: 요약된 성과 목록 (실패 시 None → 원본 섹션 유지)
+    """
+    from langchain_core.messages import SystemMessage, HumanMessage
+
+    digest = section_hash(section)
+    cached = await asyncio.to_thread(_get_cached_summary, digest)
+    if cached:
+        return cached
+
+    name = section.get("project_name") or section.get("name") or ""
+    tech = ", ".join(section.get("tech_stack") or [])
+    items = "\n".join(f"- {item}" for item in _section_items(section, kind))
+    messages = [
+        SystemMessage(content=_SUMMARY_SYSTEM_PROMPT),
+        HumanMessage(content=f"프로젝트: {name}\n기술: {tech}\n성과:\n{items}"),
+    ]
+    try:
+        response, _ = await llm_router.ainvoke(
+            messages,
+            objective=OBJECTIVE_CHEAPEST_UNDER_SLO,
+            client_options={"max_tokens": settings.resume_summary_max_tokens, "temperature": 0.2},
+            record_latency=False,  # 짧은 요약 호출 지연이 본 생성 라우팅(p95)에 섞이지 않도록
+        )
+    except Exception as e:
+        logger.warning(f"Section summary failed for '{name}': {e}")
+        return None
+
+    summary = parse_summary(response)
+    if not summary:
+        return None
+    await asyncio.to_thread(_set_cached_summary, digest, summary)
+    return summary
+
+
+@traced("resume.condense")
+async def condense_resume(resume_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    대형 이력서를 섹션별 요약으로 축약 (작은 이력서는 그대로 반환)
+
+    Args:
+        resume_data: 원본 이력서 데이터
+
+    Returns:
+        Dict[str, Any]: 요약된 섹션으로 성과 목록을 대체한 이력서 사본
+    """
+    if not needs_summary(resume_data):
+        return resume_data
+
+    targets = _summary_targets(resume_data)
+    if not targets:
+        return resume_data
+
+    semaphore = asyncio.Semaphore(max(1, int(settings.resume_summary_concurrency)))
+
+    async def summarize(kind: str, section: Dict[str, Any]) -> Optional[List[str]]:
+        async with semaphore:
+            return await summarize_section(section, kind)
+
+    summaries = await asyncio.gather(*(summarize(kind, section) for kind, _, section in targets))
+
+    condensed = {**resume_data, **{kind: list(resume_data.get(kind) or []) for kind in SECTION_KINDS}}
+    applied = 0
+    for (kind, index, section), summary in zip(targets, summaries):
+        if not summary:
+            continue
+        achievements_key, extra_keys = SECTION_KINDS[kind]
+        replaced = {key: value for key, value in section.items() if key not in extra_keys}
+        replaced[achievements_key] = summary
+        condensed[kind][index] = replaced
+        applied += 1
+
+    logger.info(f"Resume condensed: {applied}/{len(targets)} sections summarized")
+    return condensed
@@ -0,0 +1,46 @@
+"""
+LLM 제공자별 공유 HTTP 전송 계층
+같은 제공자의 모든 클라이언트 인스턴스가 하나의 keep-alive 커넥션 풀을 사용
+"""
+
+from typing import Dict
+import httpx
+from shared.config.base import get_settings
+
+settings = get_settings()
+
+_sync_clients: Dict[str, httpx.Client] = {}
+_async_clients: Dict[str, httpx.AsyncClient] = {}
+
+
+def _limits() -> httpx.Limits:
+    """프로세스 동시성에 맞춘 커넥션 제한 (제공자당)"""
+    return httpx.Limits(
+        max_connections=settings.llm_http_max_connections,
+        max_keepalive_connections=settings.llm_http_max_connections,
+        keepalive_expiry=settings.llm_http_keepalive_expiry,
+    )
+
+
+def get_http_client(provider: str) -> httpx.Client:
+    """제공자별 공유 동기 HTTP 클라이언트 반환 (타임아웃은 SDK가 요청 단위로 지정)"""
+    if provider not in _sync_clients:
+        _sync_clients[provider] = httpx.Client(limits=_limits())
+    return _sync_clients[provider]
+
+
+def get_async_http_client(provider: str) -> httpx.AsyncClient:
+    """제공자별 공유 비동기 HTTP 클라이언트 반환"""
+    if provider not in _async_clients:
+        _async_clients[provider] = httpx.AsyncClient(limits=_limits())
+    return _async_clients[provider]
+
+
+async def close_http_clients() -> None:
+    """공유 HTTP 클라이언트 종료 (서비스 종료 시 호출)"""
+    for client in _sync_clients.values():
+        client.close()
+    for client in _async_clients.values():
+        await client.aclose()
+    _sync_clients.clear()
+    _async_clients.clear()
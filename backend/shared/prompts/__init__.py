@@ -3,6 +3,6 @@ Shared Prompts 모듈
 프롬프트 로딩 및 템플릿 렌더링 유틸리티
 """
 
-from .loader import PromptLoader, get_prompt_loader
+from .loader import PromptLoader, CompiledPrompt, get_prompt_loader, prompt_version_of
 
-__all__ = ['PromptLoader', 'get_prompt_loader']
+__all__ = ['PromptLoader', 'CompiledPrompt', 'get_prompt_loader', 'prompt_version_of']
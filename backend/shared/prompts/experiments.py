@@ -0,0 +1,383 @@
+"""
+프롬프트 변형 실험
+
+- 트래픽 배정: PROMPT_EXPERIMENTS에 기준 프롬프트 파일별 변형 파일과 가중치를 지정하면
+  배정 단위(이력서 unique_key) 해시로 변형을 결정적으로 고른다 (같은 이력서는 항상 같은 변형)
+  예: {"interview_questions.yaml": {"interview_questions.yaml": 90, "interview_questions.concise.yaml": 10}}
+- 오프라인 실행: 저장된 이력서 묶음을 변형별로 실행해 입력/출력 토큰, 첫 토큰까지 시간(TTFT), 전체 지연,
+  파싱 성공, 답변 길이를 기록하고 95% 신뢰구간을 붙인 비교 보고서 생성
+- 실제 제공자 없이 기록된 카세트(재생) 또는 가짜 제공자(fake)로 실행 가능
+
+사용법:
+    python -m shared.prompts.experiments interview resumes.json interview_questions.yaml interview_questions.concise.yaml
+        [--provider fake] [--cassette cassette.json [--record]] [--assign] [--output report.json]
+"""
+
+import hashlib
+import json
+import math
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from shared.config.base import get_settings
+from shared.utils.logger import setup_logger
+from .loader import CompiledPrompt, PromptLoader
+
+settings = get_settings()
+logger = setup_logger("prompt-experiments", settings.log_level)
+
+Z_95 = 1.96
+
+# 생성 종류별 파싱 기준 키와 답변 길이를 잴 항목 필드
+_PARSE_OPTIONS = {
+    "interview": dict(expected_keys=["questions"], fallback_keys={"questions": ["interview_questions", "result"]}),
+    "learning": dict(expected_keys=["analysis", "summary", "learning_paths"],
+                     fallback_keys={"learning_paths": ["paths", "recommendations"]}),
+}
+_ANSWER_FIELDS = {"interview": "question", "learning": "description"}
+
+METRICS = ("input_tokens", "output_tokens", "ttft_ms", "latency_ms", "items", "answer_chars")
+
+
+@lru_cache(maxsize=4)
+def _parse_experiments(raw: str) -> Dict[str, Dict[str, float]]:
+    if not raw:
+        return {}
+    try:
+        experiments = json.loads(raw)
+        return {base: {variant: float(weight) for variant, weight in variants.items()}
+                for base, variants in experiments.items()}
+    except (ValueError, AttributeError, TypeError) as e:
+        logger.warning(f"Invalid PROMPT_EXPERIMENTS, experiments disabled: {e}")
+        return {}
+
+
+def assign_variant(experiment: str, unit_key: str, variants: Dict[str, float]) -> str:
+    """
+    배정 단위 키 해시로 가중치에 비례해 변형 선택 (프로세스/재시작과 무관하게 결정적)
+
+    Args:
+        experiment: 실험 이름 (같은 키라도 실험마다 독립적으로 배정)
+        unit_key: 배정 단위 (이력서 unique_key)
+        variants: 변형 → 가중치 (순서 유지)
+    """
+    weights = [(variant, max(float(weight), 0.0)) for variant, weight in variants.items()]
+    total = sum(weight for _, weight in weights)
+    if total <= 0:
+        raise ValueError(f"Experiment '{experiment}' has no positive weights")
+    digest = hashlib.sha256(f"{experiment}:{unit_key}".encode("utf-8")).digest()
+    point = int.from_bytes(digest[:8], "big") / 2 ** 64 * total
+    for variant, weight in weights:
+        point -= weight
+        if point < 0:
+            return variant
+    return weights[-1][0]
+
+
+def select_prompt(loader: PromptLoader, prompt_file: str,
+                  unit_key: Optional[str] = None) -> Tuple[CompiledPrompt, Optional[Dict[str, str]]]:
+    """
+    실험 중인 프롬프트면 배정된 변형, 아니면 기준 프롬프트
+
+    Returns:
+        Tuple: 컴파일된 프롬프트, 실험 배정 ({"experiment", "variant"}, 실험 대상이 아니면 None)
+    """
+    variants = _parse_experiments(str(settings.prompt_experiments or "")).get(prompt_file)
+    if not variants or unit_key is None:
+        return loader.get_prompt(prompt_file), None
+
+    experiment = Path(prompt_file).stem
+    variant_file = assign_variant(experiment, unit_key, variants)
+    try:
+        prompt = loader.get_prompt(variant_file)
+    except Exception as e:
+        logger.warning(f"Prompt variant {variant_file} unavailable, using {prompt_file}: {e}")
+        return loader.get_prompt(prompt_file), None
+    return prompt, {"experiment": experiment, "variant": Path(variant_file).stem}
+
+
+def selected_prompt_version(loader: PromptLoader, prompt_file: str,
+                            unit_key: Optional[str] = None) -> Optional[Dict[str, str]]:
+    """
+    지금 생성하면 결과에 기록될 프롬프트 버전 표시 (select_prompt와 같은 배정, 생성 결과 재사용 조회용)
+
+    프롬프트를 로드할 수 없으면 None (서비스는 버전 표시 없는 폴백 프롬프트로 생성)
+    """
+    try:
+        prompt, experiment = select_prompt(loader, prompt_file, unit_key)
+    except Exception as e:
+        logger.warning(f"Prompt {prompt_file} unavailable for reuse lookup: {e}")
+        return None
+    return {**prompt.version_info, **(experiment or {})}
+
+
+def _cassette_key(messages: List) -> str:
+    return hashlib.sha256("\x1e".join(str(message.content) for message in messages).encode("utf-8")).hexdigest()
+
+
+async def timed_call(client, messages: List) -> Dict[str, Any]:
+    """스트리밍 호출로 응답 텍스트, 첫 토큰까지 시간, 전체 지연 측정 (카세트는 기록된 값)"""
+    recorded = getattr(client, "timed_call", None)
+    if recorded is not None:
+        return await recorded(messages)
+
+    started = time.perf_counter()
+    first = None
+    chunks = []
+    async for chunk in client.astream(messages):
+        if first is None and chunk:
+            first = time.perf_counter()
+        chunks.append(chunk)
+    ended = time.perf_counter()
+    return {
+        "text": "".join(chunks),
+        "ttft_ms": round(((first or ended) - started) * 1000, 1),
+        "latency_ms": round((ended - started) * 1000, 1),
+    }
+
+
+class PromptCassette:
+    """
+    실험 호출 기록/재생 (프롬프트 메시지 내용 해시 → 응답 텍스트와 측정 시간)
+
+    record=True면 실제 클라이언트로 호출해 기록하고, 아니면 기록된 응답만 재생한다 (없는 요청은 KeyError).
+    """
+
+    def __init__(self, path: str, client=None, record: bool = False):
+        self.path = Path(path)
+        self.record = record
+        self._client = client
+        data = json.loads(self.path.read_text(encoding="utf-8")) if self.path.exists() else {}
+        self.name = client.name if client is not None else data.get("provider", "cassette")
+        self._model = getattr(client, "_model", None) or data.get("model")
+        self._entries: Dict[str, Dict[str, Any]] = data.get("entries", {})
+
+    async def timed_call(self, messages: List) -> Dict[str, Any]:
+        key = _cassette_key(messages)
+        if not self.record:
+            if key not in self._entries:
+                raise KeyError(f"Request not recorded in cassette {self.path} (record it first)")
+            return dict(self._entries[key])
+        result = await timed_call(self._client, messages)
+        self._entries[key] = result
+        return result
+
+    def save(self) -> None:
+        self.path.write_text(json.dumps(
+            {"provider": self.name, "model": self._model, "entries": self._entries}, ensure_ascii=False, indent=1
+        ), encoding="utf-8")
+
+
+def evaluate_response(kind: str, text: str) -> Dict[str, Any]:
+    """응답 파싱 성공 여부와 답변 길이 (항목 수, 항목 본문 평균 글자 수)"""
+    from shared.generation.item_regeneration import ITEM_KINDS
+    from shared.utils.json_parser import parse_llm_json_response
+
+    try:
+        payload = parse_llm_json_response(text, **_PARSE_OPTIONS[kind])
+    except ValueError:
+        return {"parsed": False, "items": 0, "answer_chars": None}
+    items = payload if isinstance(payload, list) else payload.get(ITEM_KINDS[kind]["items_field"])
+    items = [item for item in items if isinstance(item, dict)] if isinstance(items, list) else []
+    lengths = [len(str(item.get(_ANSWER_FIELDS[kind], ""))) for item in items]
+    return {
+        "parsed": bool(items),
+        "items": len(items),
+        "answer_chars": round(sum(lengths) / len(lengths), 1) if lengths else None,
+    }
+
+
+async def run_experiment(kind: str, resumes: List[Dict[str, Any]], prompt_files: List[str], client,
+                         assign: bool = False) -> List[Dict[str, Any]]:
+    """
+    이력서 묶음을 프롬프트 변형별로 실행 (지연 측정이 섞이지 않도록 순차 실행)
+
+    Args:
+        kind: 'interview' | 'learning'
+        resumes: 저장된 이력서 문서 목록
+        prompt_files: 변형 프롬프트 파일 (첫 번째가 기준, 서비스 프롬프트 디렉토리 기준 상대 경로 또는 절대 경로)
+        client: LLM 클라이언트 또는 PromptCassette
+        assign: True면 이력서마다 배정된 변형 하나만 실행, False면 모든 변형 실행 (같은 이력서로 비교)
+
+    Returns:
+        List[Dict[str, Any]]: 호출별 측정 결과
+    """
+    from shared.generation.item_regeneration import ITEM_KINDS
+    from shared.utils.resume_formatter import PROMPT_FORMATTERS
+    from shared.utils.token_estimator import estimate_message_tokens, estimate_tokens
+    from .loader import get_prompt_loader
+
+    loader = get_prompt_loader(ITEM_KINDS[kind]["prompt"][0])
+    experiment = Path(prompt_files[0]).stem
+    weights = {prompt_file: 1.0 for prompt_file in prompt_files}
+    samples = []
+    for position, resume in enumerate(resumes):
+        unit_key = str(resume.get("unique_key") or position)
+        formatted = PROMPT_FORMATTERS[kind](resume)
+        variants = [assign_variant(experiment, unit_key, weights)] if assign else prompt_files
+        for prompt_file in variants:
+            prompt = loader.get_prompt(prompt_file)
+            messages = prompt.build_messages(formatted)
+            sample = {
+                "variant": Path(prompt_file).stem,
+                "unit_key": unit_key,
+                "prompt_version": prompt.version_info,
+                "input_tokens": estimate_message_tokens(messages, client.name),
+            }
+            try:
+                call = await timed_call(client, messages)
+            except Exception as e:
+                logger.warning(f"Experiment call failed ({sample['variant']}, {unit_key}): {e}")
+                samples.append({**sample, "error": str(e), "parsed": False})
+                continue
+            samples.append({
+                **sample,
+                "output_tokens": estimate_tokens(call["text"], client.name),
+                "ttft_ms": call["ttft_ms"],
+                "latency_ms": call["latency_ms"],
+                **evaluate_response(kind, call["text"]),
+            })
+    return samples
+
+
+def _values(samples: List[Dict[str, Any]], metric: str) -> List[float]:
+    return [sample[metric] for sample in samples if sample.get(metric) is not None]
+
+
+def _variance_of_mean(values: List[float]) -> Optional[float]:
+    """표본 평균의 분산 (표본 2개 미만이면 None)"""
+    n = len(values)
+    if n < 2:
+        return None
+    mean = sum(values) / n
+    return sum((value - mean) ** 2 for value in values) / (n - 1) / n
+
+
+def _mean_ci(values: List[float]) -> Dict[str, Any]:
+    """평균과 95% 신뢰구간 (정규 근사, 표본 2개 미만이면 구간 없음)"""
+    if not values:
+        return {"n": 0, "mean": None, "ci": None}
+    mean = sum(values) / len(values)
+    variance = _variance_of_mean(values)
+    if variance is None:
+        return {"n": len(values), "mean": round(mean, 2), "ci": None}
+    margin = Z_95 * math.sqrt(variance)
+    return {"n": len(values), "mean": round(mean, 2), "ci": [round(mean - margin, 2), round(mean + margin, 2)]}
+
+
+def _rate_ci(successes: int, n: int) -> Dict[str, Any]:
+    """비율과 95% Wilson 신뢰구간 (표본이 적거나 비율이 0/1에 가까워도 구간이 [0, 1] 안에 있음)"""
+    if not n:
+        return {"n": 0, "rate": None, "ci": None}
+    rate = successes / n
+    denominator = 1 + Z_95 ** 2 / n
+    center = (rate + Z_95 ** 2 / (2 * n)) / denominator
+    margin = Z_95 * math.sqrt(rate * (1 - rate) / n + Z_95 ** 2 / (4 * n * n)) / denominator
+    return {"n": n, "rate": round(rate, 4), "ci": [round(center - margin, 4), round(center + margin, 4)]}
+
+
+def _difference(treatment: Optional[float], control: Optional[float], variance: Optional[float]) -> Dict[str, Any]:
+    """변형 - 기준 차이와 95% 신뢰구간 (Welch 정규 근사, 구간이 0을 포함하지 않으면 유의)"""
+    if treatment is None or control is None:
+        return {"diff": None, "ci": None, "significant": False}
+    diff = treatment - control
+    if variance is None:
+        return {"diff": round(diff, 4), "ci": None, "significant": False}
+    low, high = diff - Z_95 * math.sqrt(variance), diff + Z_95 * math.sqrt(variance)
+    return {"diff": round(diff, 4), "ci": [round(low, 4), round(high, 4)], "significant": low > 0 or high < 0}
+
+
+def build_report(samples: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    변형별 요약과 기준(첫 변형) 대비 비교 보고서
+
+    Returns:
+        Dict: variants(변형별 지표 평균/신뢰구간, 파싱 성공률), comparisons(기준 대비 차이/신뢰구간/유의 여부)
+    """
+    order = list(dict.fromkeys(sample["variant"] for sample in samples))
+    grouped = {variant: [sample for sample in samples if sample["variant"] == variant] for variant in order}
+
+    variants = {}
+    for variant, group in grouped.items():
+        summary = {
+            "prompt_version": group[0]["prompt_version"],
+            "calls": len(group),
+            "errors": sum(1 for sample in group if sample.get("error")),
+            "parse_success": _rate_ci(sum(1 for sample in group if sample["parsed"]), len(group)),
+        }
+        for metric in METRICS:
+            summary[metric] = _mean_ci(_values(group, metric))
+        variants[variant] = summary
+
+    comparisons = {}
+    for variant in order[1:]:
+        control = order[0]
+        comparison = {}
+        for metric in METRICS:
+            variances = [_variance_of_mean(_values(grouped[name], metric)) for name in (variant, control)]
+            comparison[metric] = _difference(
+                variants[variant][metric]["mean"], variants[control][metric]["mean"],
+                None if None in variances else sum(variances)
+            )
+        treatment_rate, control_rate = variants[variant]["parse_success"], variants[control]["parse_success"]
+        comparison["parse_success"] = _difference(
+            treatment_rate["rate"], control_rate["rate"],
+            sum(rate["rate"] * (1 - rate["rate"]) / rate["n"] for rate in (treatment_rate, control_rate))
+        )
+        comparisons[variant] = comparison
+
+    return {"control": order[0] if order else None, "variants": variants, "comparisons": comparisons}
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """보고서를 사람이 읽는 표 형식으로"""
+    def _cell(stat: Dict[str, Any], key: str = "mean") -> str:
+        if stat[key] is None:
+            return "-"
+        return f"{stat[key]} [{stat['ci'][0]}, {stat['ci'][1]}]" if stat["ci"] else str(stat[key])
+
+    lines = []
+    for variant, summary in report["variants"].items():
+        version = summary["prompt_version"]
+        lines.append(f"{variant} (version {version['version']}, hash {version['hash']}) "
+                     f"calls={summary['calls']} errors={summary['errors']}")
+        lines.append(f"  parse_success: {_cell(summary['parse_success'], 'rate')}")
+        for metric in METRICS:
+            lines.append(f"  {metric}: {_cell(summary[metric])}")
+    for variant, comparison in report["comparisons"].items():
+        lines.append(f"{variant} vs {report['control']}")
+        for metric, diff in comparison.items():
+            marker = " *" if diff["significant"] else ""
+            lines.append(f"  {metric}: {_cell(diff, 'diff')}{marker}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import argparse
+    import asyncio
+    from shared.llm.registry import registry
+
+    parser = argparse.ArgumentParser(description="프롬프트 변형 오프라인 실험")
+    parser.add_argument("kind", choices=sorted(_PARSE_OPTIONS))
+    parser.add_argument("resumes", help="이력서 문서 JSON 배열 파일")
+    parser.add_argument("prompt_files", nargs="+", help="변형 프롬프트 파일 (첫 번째가 기준)")
+    parser.add_argument("--provider", default="fake")
+    parser.add_argument("--cassette", help="기록/재생할 카세트 파일")
+    parser.add_argument("--record", action="store_true", help="제공자를 호출해 카세트에 기록")
+    parser.add_argument("--assign", action="store_true", help="이력서마다 배정된 변형 하나만 실행")
+    parser.add_argument("--output", help="보고서 JSON 저장 경로")
+    args = parser.parse_args()
+
+    resumes = json.loads(Path(args.resumes).read_text(encoding="utf-8"))
+    client = None if args.cassette and not args.record else registry.get_client(args.provider)
+    if args.cassette:
+        client = PromptCassette(args.cassette, client=client, record=args.record)
+    samples = asyncio.run(run_experiment(args.kind, resumes, args.prompt_files, client, assign=args.assign))
+    if isinstance(client, PromptCassette) and args.record:
+        client.save()
+
+    report = build_report(samples)
+    print(format_report(report))
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
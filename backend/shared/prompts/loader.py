@@ -1,114 +1,299 @@
 """
 프롬프트 로더 유틸리티
 YAML 기반 프롬프트 파일을 로드하고 템플릿을 렌더링
+
+- 파일을 처음 로드할 때 휴먼 프롬프트 템플릿을 한 번만 파싱해 렌더 함수로 컴파일 (자리표시자 검증 포함)
+- PROMPT_RELOAD_CHECK_SECONDS 주기로 파일 mtime/크기를 확인해 바뀐 경우만 다시 컴파일하고 원자적으로 교체
+  (재로드에 실패하면 이전 버전을 계속 사용)
+- 프롬프트 버전(YAML version)과 내용 해시를 시스템 메시지에 표시해 생성 결과에 기록
 """
 
+import hashlib
+import json
 import os
+import string
+import threading
+import time
 import yaml
-from typing import Dict, Any
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 from pathlib import Path
+from shared.config.base import get_settings
 from shared.utils.logger import setup_logger
+from shared.utils.tracing import start_span
 
+settings = get_settings()
 logger = setup_logger(__name__)
 
+# 메시지 additional_kwargs의 프롬프트 버전 표시 (제공자 요청에는 전달되지 않음)
+PROMPT_VERSION_KEY = "prompt_version"
+
+_FORMATTER = string.Formatter()
+
+
+class CompiledTemplate:
+    """
+    str.format 형식 템플릿을 한 번 파싱해 만든 렌더 함수
+
+    자리표시자는 이름만 허용 ({name}, 형식 지정자/변환 포함) - 위치 인자({}/{0}), 속성/인덱스 접근({a.b}, {a[0]})은
+    컴파일 시 ValueError. 렌더 시 누락된 값은 기존 str.format과 같이 KeyError.
+    """
+
+    __slots__ = ("source", "fields", "_parts")
+
+    def __init__(self, source: str):
+        parts = []
+        fields = []
+        for literal, field_name, format_spec, conversion in _FORMATTER.parse(source):
+            if literal:
+                parts.append(literal)
+            if field_name is None:
+                continue
+            if not field_name.isidentifier():
+                raise ValueError(f"지원하지 않는 자리표시자: {{{field_name}}} (이름만 사용 가능)")
+            if format_spec and "{" in format_spec:
+                raise ValueError(f"중첩 자리표시자는 지원하지 않음: {{{field_name}:{format_spec}}}")
+            parts.append((field_name, conversion, format_spec or ""))
+            fields.append(field_name)
+        self.source = source
+        self.fields = frozenset(fields)
+        self._parts = tuple(parts)
+
+    def render(self, values: Mapping[str, Any]) -> str:
+        missing = self.fields.difference(values)
+        if missing:
+            raise KeyError(f"프롬프트 자리표시자 값 누락: {', '.join(sorted(missing))}")
+        out = []
+        for part in self._parts:
+            if part.__class__ is str:
+                out.append(part)
+                continue
+            name, conversion, format_spec = part
+            value = values[name]
+            if conversion:
+                value = _FORMATTER.convert_field(value, conversion)
+            out.append(format(value, format_spec))
+        return "".join(out)
+
+
+class CompiledPrompt:
+    """YAML 프롬프트 파일 하나를 컴파일한 결과 (불변, 파일이 바뀌면 새 인스턴스로 교체)"""
+
+    def __init__(self, config: Dict[str, Any], content_hash: str, name: Optional[str] = None,
+                 file_stamp: Optional[Tuple[int, int]] = None):
+        self.config = PromptConfig(config, self)
+        self.name = str(config.get("name") or name or "prompt")
+        self.version = str(config.get("version", ""))
+        self.content_hash = content_hash
+        self.file_stamp = file_stamp
+        self.system_prompt = config.get("system_prompt_template", "")
+        self.human_template = CompiledTemplate(config.get("human_prompt_template", ""))
+
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> "CompiledPrompt":
+        """파일 없이 전달된 설정 (내용 해시는 설정 JSON 기준)"""
+        digest = hashlib.sha256(json.dumps(config, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8"))
+        return cls(config, digest.hexdigest()[:12])
+
+    @classmethod
+    def from_file(cls, file_path: Path) -> "CompiledPrompt":
+        stat = file_path.stat()
+        raw = file_path.read_bytes()
+        config = yaml.safe_load(raw)
+        if not isinstance(config, dict):
+            raise ValueError(f"프롬프트 파일 형식 오류 (매핑이 아님): {file_path}")
+        return cls(config, hashlib.sha256(raw).hexdigest()[:12], name=file_path.stem,
+                   file_stamp=(stat.st_mtime_ns, stat.st_size))
+
+    @property
+    def version_info(self) -> Dict[str, str]:
+        """생성 결과에 기록할 프롬프트 식별 정보"""
+        return {"name": self.name, "version": self.version, "hash": self.content_hash}
+
+    def render_human(self, values: Mapping[str, Any]) -> str:
+        return self.human_template.render(values)
+
+    def build_messages(self, values: Mapping[str, Any], experiment: Optional[Dict[str, str]] = None) -> List:
+        """
+        [시스템 프롬프트(고정 접두부, 버전 표시), 휴먼 프롬프트] 메시지 목록
+
+        Args:
+            values: 휴먼 프롬프트 자리표시자 값
+            experiment: 프롬프트 변형 실험 배정 (버전 표시에 함께 기록)
+        """
+        from langchain_core.messages import SystemMessage, HumanMessage
+        from shared.llm.prompt_cache import mark_cache_prefix
+
+        version = {**self.version_info, **(experiment or {})}
+        with start_span("prompt.render", attributes={"prompt.name": version.get("name"),
+                                                     "prompt.version": version.get("version")}):
+            system_message = mark_cache_prefix(SystemMessage(content=self.system_prompt))
+            system_message.additional_kwargs[PROMPT_VERSION_KEY] = version
+            return [system_message, HumanMessage(content=self.render_human(values))]
+
+
+class PromptConfig(dict):
+    """load_prompt_config가 반환하는 설정 (렌더링 시 컴파일된 프롬프트 재사용)"""
+
+    __slots__ = ("prompt",)
+
+    def __init__(self, config: Dict[str, Any], prompt: CompiledPrompt):
+        super().__init__(config)
+        self.prompt = prompt
+
+
+def prompt_version_of(messages) -> Any:
+    """메시지 목록에 표시된 프롬프트 버전 (로더로 만들지 않은 프롬프트면 None)"""
+    if isinstance(messages, str):
+        return None
+    for message in messages:
+        version = getattr(message, "additional_kwargs", {}).get(PROMPT_VERSION_KEY)
+        if version is not None:
+            return version
+    return None
+
+
 class PromptLoader:
     """YAML 기반 프롬프트 로더"""
-    
+
     def __init__(self, prompts_dir: str):
         """
         Args:
             prompts_dir: 프롬프트 파일들이 위치한 디렉토리 경로
         """
         self.prompts_dir = Path(prompts_dir)
-        self._cache = {}  # 로드된 프롬프트 캐시
-    
-    def load_prompt_config(self, prompt_file: str) -> Dict[str, Any]:
+        self._cache: Dict[str, CompiledPrompt] = {}  # 컴파일된 프롬프트 (파일이 바뀌면 통째로 교체)
+        self._checked_at: Dict[str, float] = {}  # 파일별 마지막 변경 확인 시각
+        self._lock = threading.Lock()
+
+    def _reload_due(self, prompt_file: str) -> bool:
+        interval = float(settings.prompt_reload_check_seconds)
+        if interval < 0:
+            return False
+        now = time.monotonic()
+        if now - self._checked_at.get(prompt_file, 0.0) < interval:
+            return False
+        self._checked_at[prompt_file] = now
+        return True
+
+    def get_prompt(self, prompt_file: str) -> CompiledPrompt:
         """
-        YAML 프롬프트 파일 로드
-        
+        컴파일된 프롬프트 반환 (확인 주기가 지났고 파일이 바뀌었으면 다시 컴파일)
+
         Args:
             prompt_file: 프롬프트 파일명 (예: 'interview_questions.yaml')
-            
+
         Returns:
-            Dict: 프롬프트 설정 데이터
+            CompiledPrompt: 컴파일된 프롬프트 (호출 측은 받은 인스턴스 하나로 렌더링/버전 기록)
         """
-        if prompt_file in self._cache:
-            logger.error(f"Using cached config for {prompt_file}")
-            return self._cache[prompt_file]
-            
+        prompt = self._cache.get(prompt_file)
+        if prompt is not None and not self._reload_due(prompt_file):
+            return prompt
+        return self._refresh(prompt_file, prompt)
+
+    def _refresh(self, prompt_file: str, current: Optional[CompiledPrompt]) -> CompiledPrompt:
         file_path = self.prompts_dir / prompt_file
-        logger.error(f"Loading prompt file from: {file_path}")
-        
-        if not file_path.exists():
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            if current is not None:
+                logger.warning(f"프롬프트 파일이 사라져 이전 버전 유지: {file_path}")
+                return current
             logger.error(f"Prompt file does not exist: {file_path}")
             raise FileNotFoundError(f"프롬프트 파일을 찾을 수 없습니다: {file_path}")
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-            
-            logger.error(f"YAML config loaded: {type(config)}, keys: {list(config.keys()) if config else 'None'}")
-            self._cache[prompt_file] = config
-            logger.error(f"프롬프트 파일 로드 성공: {prompt_file}")
-            return config
-            
-        except yaml.YAMLError as e:
-            logger.error(f"YAML 파싱 오류 ({prompt_file}): {e}")
-            raise
-        except Exception as e:
-            logger.error(f"프롬프트 파일 로드 실패 ({prompt_file}): {e}")
-            raise
-    
+
+        if current is not None and current.file_stamp == (stat.st_mtime_ns, stat.st_size):
+            return current
+
+        with self._lock:
+            # 다른 스레드가 이미 교체했으면 그 결과 사용
+            latest = self._cache.get(prompt_file)
+            if latest is not None and latest is not current:
+                return latest
+            try:
+                compiled = CompiledPrompt.from_file(file_path)
+            except Exception as e:
+                if current is None:
+                    logger.error(f"프롬프트 파일 로드 실패 ({prompt_file}): {e}")
+                    raise
+                logger.error(f"프롬프트 재로드 실패, 이전 버전 유지 ({prompt_file}): {e}")
+                return current
+            self._cache[prompt_file] = compiled
+            self._checked_at[prompt_file] = time.monotonic()
+
+        logger.info(f"프롬프트 {'재로드' if current else '로드'}: {prompt_file} "
+                    f"(version {compiled.version}, hash {compiled.content_hash})")
+        return compiled
+
+    def load_prompt_config(self, prompt_file: str) -> Dict[str, Any]:
+        """
+        YAML 프롬프트 파일 로드
+
+        Args:
+            prompt_file: 프롬프트 파일명 (예: 'interview_questions.yaml')
+
+        Returns:
+            Dict: 프롬프트 설정 데이터
+        """
+        return self.get_prompt(prompt_file).config
+
+    @staticmethod
+    def _compiled(config: Dict[str, Any]) -> CompiledPrompt:
+        prompt = getattr(config, "prompt", None)
+        return prompt if prompt is not None else CompiledPrompt.from_dict(config)
+
     def render_system_prompt(self, config: Dict[str, Any], context: Dict[str, Any] = None) -> str:
         """
         시스템 프롬프트 렌더링
-        
+
         Args:
             config: 프롬프트 설정
             context: 추가 컨텍스트 변수
-            
+
         Returns:
             str: 렌더링된 시스템 프롬프트
         """
-        template = config.get('system_prompt_template', '')
-        
         # 간단한 템플릿이므로 그대로 반환
-        return template
-    
+        return config.get('system_prompt_template', '')
+
     def render_human_prompt(self, config: Dict[str, Any], resume_data: Dict[str, Any]) -> str:
         """
-        휴먼 프롬프트 렌더링
-        
+        휴먼 프롬프트 렌더링 (컴파일된 템플릿 사용)
+
         Args:
             config: 프롬프트 설정
             resume_data: 이력서 데이터
-            
+
         Returns:
             str: 렌더링된 휴먼 프롬프트
+
+        Raises:
+            KeyError: 템플릿 자리표시자 값이 없는 경우
         """
-        template = config.get('human_prompt_template', '')
-        logger.error(f"Human prompt template: {template}")
-        logger.error(f"Resume data for formatting: {resume_data}")
-        logger.error(f"Resume data type: {type(resume_data)}")
-        
-        try:
-            result = template.format(**resume_data)
-            logger.error(f"Human prompt formatted successfully")
-            return result
-        except KeyError as e:
-            logger.error(f"휴먼 프롬프트 렌더링 실패 - 누락된 변수: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"휴먼 프롬프트 렌더링 실패: {e}")
-            raise
-    
+        return self._compiled(config).render_human(resume_data)
+
+    def build_messages(self, config: Dict[str, Any], resume_data: Dict[str, Any]) -> List:
+        """
+        [시스템 프롬프트, 휴먼 프롬프트] 메시지 목록
+
+        시스템 프롬프트는 요청마다 동일하므로 제공자 프롬프트 캐시용 고정 접두부로 표시한다.
+        요청별 지시문은 접두부가 바뀌지 않도록 휴먼 프롬프트 뒤에 덧붙여야 한다.
+
+        Args:
+            config: 프롬프트 설정
+            resume_data: 이력서 데이터
+
+        Returns:
+            List: LangChain 메시지 목록
+        """
+        return self._compiled(config).build_messages(resume_data)
+
     def get_experience_level(self, years: int) -> str:
         """
         경력 연수에 따른 레벨 결정
-        
+
         Args:
             years: 경력 연수
-            
+
         Returns:
             str: 경력 레벨 ('junior', 'mid', 'senior')
         """
@@ -118,7 +303,7 @@ class PromptLoader:
             return 'mid'
         else:
             return 'senior'
-    
+
 
 
 # 전역 로더 인스턴스들
@@ -127,10 +312,10 @@ _loaders = {}
 def get_prompt_loader(service_name: str) -> PromptLoader:
     """
     서비스별 프롬프트 로더 반환
-    
+
     Args:
         service_name: 서비스명 ('interview', 'learning' 등)
-        
+
     Returns:
         PromptLoader: 해당 서비스의 프롬프트 로더
     """
@@ -139,8 +324,8 @@ def get_prompt_loader(service_name: str) -> PromptLoader:
         # /app/shared/prompts/loader.py에서 /app/{service_name}-service/prompts로
         base_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))  # /app
         prompts_dir = os.path.join(base_dir, f'{service_name}-service', 'prompts')
-        
+
         logger.info(f"프롬프트 디렉토리 경로: {prompts_dir}")
         _loaders[service_name] = PromptLoader(prompts_dir)
-    
+
     return _loaders[service_name]
@@ -24,12 +24,15 @@ class ErrorCode(Enum):
     INTERVIEW_NOT_FOUND = "INTERVIEW_NOT_FOUND"
     INTERVIEW_TASK_FAILED = "INTERVIEW_TASK_FAILED"
     INTERVIEW_LLM_ERROR = "INTERVIEW_LLM_ERROR"
+    INTERVIEW_VALIDATION_ERROR = "INTERVIEW_VALIDATION_ERROR"
     
     # Learning Service Errors (3000-3999)
     LEARNING_PATH_GENERATION_FAILED = "LEARNING_PATH_GENERATION_FAILED"
     LEARNING_PATH_NOT_FOUND = "LEARNING_PATH_NOT_FOUND"
     LEARNING_TASK_FAILED = "LEARNING_TASK_FAILED"
     LEARNING_LLM_ERROR = "LEARNING_LLM_ERROR"
+    LEARNING_NOT_FOUND = "LEARNING_NOT_FOUND"
+    LEARNING_VALIDATION_ERROR = "LEARNING_VALIDATION_ERROR"
     
     # LLM Service Errors (4000-4999)
     LLM_PROVIDER_NOT_AVAILABLE = "LLM_PROVIDER_NOT_AVAILABLE"
@@ -48,6 +51,7 @@ class ErrorCode(Enum):
     TASK_EXECUTION_FAILED = "TASK_EXECUTION_FAILED"
     TASK_TIMEOUT = "TASK_TIMEOUT"
     TASK_RETRY_EXHAUSTED = "TASK_RETRY_EXHAUSTED"
+    BULK_JOB_NOT_FOUND = "BULK_JOB_NOT_FOUND"
     
     # General Errors (9000-9999)
     VALIDATION_ERROR = "VALIDATION_ERROR"
@@ -207,6 +211,15 @@ class ResumeErrors:
             details={"reason": reason}
         )
     
+    @staticmethod
+    def update_failed(unique_key: str, reason: str) -> APIError:
+        return APIError(
+            message=f"Failed to update resume '{unique_key}': {reason}",
+            error_code=ErrorCode.RESUME_UPDATE_FAILED,
+            status_code=500,
+            details={"unique_key": unique_key, "reason": reason}
+        )
+    
     @staticmethod
     def validation_error(field: str, message: str) -> APIError:
         return APIError(
@@ -406,3 +419,12 @@ class CeleryErrors:
             status_code=503,
             details={"queue_name": queue_name, "reason": reason}
         )
+    
+    @staticmethod
+    def bulk_job_not_found(job_id: str) -> APIError:
+        return APIError(
+            message=f"Bulk job not found: {job_id}",
+            error_code=ErrorCode.BULK_JOB_NOT_FOUND,
+            status_code=404,
+            details={"job_id": job_id}
+        )
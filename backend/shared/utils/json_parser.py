@@ -3,9 +3,10 @@ LLM 응답 JSON 파싱 공통 유틸리티
 """
 
 import json
+import logging
 import re
 from shared.utils.logger import setup_logger
-from typing import Dict, Any, List, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
 try:
     from config import settings
     log_level = settings.log_level
@@ -14,6 +15,21 @@ except ImportError:
 
 logger = setup_logger("shared-json-parser", log_level)
 
+_DECODER = json.JSONDecoder(strict=False)
+_VALUE_START = re.compile(r"[\[{]")
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRING_CHUNK = re.compile(r'[^"\\]*')
+_NUMBER = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?")
+_BARE_KEY = re.compile(r"[A-Za-z_][\w-]*")
+_ESCAPE_SEQUENCE = re.compile(r"\\(u[0-9a-fA-F]{4}|.)", re.DOTALL)
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+_LITERALS = {"true": True, "false": False, "null": None, "True": True, "False": False, "None": None}
+_STRING_END_FOLLOWERS = frozenset(',:}]"')
+_C_DECODE_MAX_DEPTH = 3
+
+# 토크나이저 상태
+_EXPECT_VALUE, _EXPECT_VALUE_OR_END, _EXPECT_KEY, _EXPECT_COLON, _EXPECT_COMMA_OR_END = range(5)
+
 
 def parse_llm_json_response(
     response_text: Union[str, Dict, List],
@@ -34,103 +50,266 @@ def parse_llm_json_response(
     Raises:
         ValueError: JSON 파싱 실패 시
     """
-    logger.info(f"About to parse JSON from LLM response. Type: {type(response_text)}")
     original_response = response_text
     
     try:
         # Step 0: 이미 파싱된 객체인지 확인
         if isinstance(response_text, (dict, list)):
-            logger.info(f"Response is already parsed as {type(response_text)}")
             parsed_response = response_text
         else:
             # 문자열인 경우 기존 파싱 로직 수행
-            logger.info(f"Response is string, parsing...")
             parsed_response = _parse_string_response(str(response_text))
         
         # Step 6: 키 매핑 및 정규화 (옵션)
         if expected_keys and fallback_keys:
             parsed_response = _normalize_response_keys(parsed_response, expected_keys, fallback_keys)
         
-        # 디버깅용 로그
-        if isinstance(parsed_response, dict):
-            for key in parsed_response.keys():
-                value = parsed_response[key]
-                value_info = f"{len(value)} items" if isinstance(value, list) else str(type(value).__name__)
-                logger.info(f"Response key found: '{key}' with {value_info}")
+        # 디버깅용 로그 (DEBUG 레벨이 켜진 경우만 키 요약 계산)
+        if isinstance(parsed_response, dict) and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response keys: %s", {
+                key: f"{len(value)} items" if isinstance(value, list) else type(value).__name__
+                for key, value in parsed_response.items()
+            })
         
         return parsed_response
         
     except Exception as e:
-        logger.error(f"Failed to parse LLM JSON response: {e}")
-        logger.error(f"Original response type: {type(original_response)}, value: {str(original_response)[:500]}")
+        logger.warning("Failed to parse LLM JSON response: %s", e)
+        logger.debug("Unparsed response (%s): %.500s", type(original_response).__name__, original_response)
         raise ValueError(f"Failed to parse LLM JSON response: {e}")
 
 
 def _parse_string_response(response_text: str) -> Union[Dict, List]:
-    """문자열 응답을 파싱하는 함수"""
+    """문자열 응답에서 첫 JSON 값을 추출 (코드 펜스/설명 무시, 잘린 구조는 닫아서 복구)"""
+    value, complete = extract_json(response_text)
+    if not complete:
+        logger.warning(f"Salvaged truncated JSON response (length {len(response_text)})")
+    return value
+
+
+def extract_json(text: str) -> Tuple[Union[Dict, List], bool]:
+    """
+    텍스트에서 첫 JSON 객체/배열 추출
+
+    정상 JSON은 C 구현(raw_decode) 한 번으로 끝나고, 실패하면 같은 위치부터 관대한 토크나이저로 한 번 더 훑는다
+    (이전의 펜스/마크다운 정규식, 전역 치환, 개행 제거 재시도, questions 전용 복구를 대체).
+    - 앞뒤 설명, 코드 펜스 무시 (```json 펜스가 있으면 그 안을 우선)
+    - 문자열 안의 이스케이프되지 않은 개행/따옴표, 통째로 이스케이프된 JSON({\\"key\\": ...}) 허용
+    - 후행 쉼표, 객체/배열 사이 빠진 쉼표 허용
+    - 잘린 응답: 열린 구조를 닫고, 배열 안의 미완성 항목과 값이 잘린 키는 버림 (최상위 키 종류와 무관)
+
+    Returns:
+        Tuple[value, complete]: complete=False면 잘린 응답을 복구한 결과
+
+    Raises:
+        ValueError: JSON 값을 찾지 못한 경우
+    """
+    fence = text.find("```json")
+    position = fence if fence != -1 else 0
+    fast_path = True
+    while True:
+        match = _VALUE_START.search(text, position)
+        if not match:
+            raise ValueError("No JSON value found in response")
+        start = match.start()
+        if fast_path:
+            # 전체 C 디코드는 첫 후보에만 시도 (후보마다 끝까지 훑고 실패하면 이차 시간)
+            fast_path = False
+            try:
+                return _DECODER.raw_decode(text, start)[0], True
+            except (json.JSONDecodeError, RecursionError):
+                # 깊은 중첩은 C 디코더가 재귀 한도에 걸리므로 스택 기반 파서로 처리
+                pass
+        try:
+            return _parse_tolerant(text, start)
+        except _JSONSyntaxError as e:
+            # 실패한 구간 안의 조각은 건너뛰고 오류 위치부터 다음 후보 탐색 (전체 선형 시간)
+            position = max(e.position, start + 1)
+
+
+class _JSONSyntaxError(Exception):
+    def __init__(self, position: int):
+        super().__init__(f"Unrecoverable JSON syntax at position {position}")
+        self.position = position
+
+
+def _unescape(match) -> str:
+    sequence = match.group(1)
+    if sequence[0] == "u" and len(sequence) == 5:
+        return chr(int(sequence[1:], 16))
+    return _ESCAPES.get(sequence, sequence)
+
+
+def _decode_at(text: str, position: int) -> Optional[Tuple[Any, int]]:
     try:
-        # Step 1: 마크다운 블록 추출
-        if "```json" in response_text:
-            start_marker = "```json"
-            start = response_text.find(start_marker)
-            if start != -1:
-                start += len(start_marker)
-                # 개행문자 건너뛰기
-                while start < len(response_text) and response_text[start] in ['\n', '\r', ' ']:
-                    start += 1
-                
-                # 종료 ``` 찾기
-                end = response_text.find("```", start)
-                if end != -1:
-                    response_text = response_text[start:end].strip()
+        return _DECODER.raw_decode(text, position)
+    except (json.JSONDecodeError, RecursionError):
+        return None
+
+
+def _read_string(text: str, position: int) -> Tuple[Optional[str], int]:
+    """
+    position의 여는 따옴표부터 문자열 읽기
+
+    Returns:
+        (value, 다음 위치): 텍스트 끝에서 잘렸으면 value는 None
+    """
+    length = len(text)
+    if text[position] == "\\":
+        # 통째로 이스케이프된 JSON: \" ... \" 사이를 한 단계 풀어서 해석
+        end = text.find('\\"', position + 2)
+        if end == -1:
+            return None, length
+        raw = text[position + 2:end].replace("\\\\", "\\")
+        return _ESCAPE_SEQUENCE.sub(_unescape, raw), end + 2
+
+    parts = []
+    position += 1
+    while True:
+        chunk = _STRING_CHUNK.match(text, position)
+        parts.append(chunk.group())
+        position = chunk.end()
+        if position >= length:
+            return None, length
+        if text[position] == "\\":
+            if position + 1 >= length:
+                return None, length
+            escape = _ESCAPE_SEQUENCE.match(text, position)
+            parts.append(_unescape(escape))
+            position = escape.end()
+            continue
+        # 닫는 따옴표 뒤가 구분자가 아니면 문자열 안의 이스케이프되지 않은 따옴표로 간주
+        following = _WHITESPACE.match(text, position + 1).end()
+        if following >= length or text[following] in _STRING_END_FOLLOWERS:
+            return "".join(parts), position + 1
+        parts.append('"')
+        position += 1
+
+
+def _parse_tolerant(text: str, position: int) -> Tuple[Union[Dict, List], bool]:
+    """
+    관대한 단일 패스 파서 (명시적 스택, 재귀 없음)
+
+    Returns:
+        (value, complete)
+
+    Raises:
+        _JSONSyntaxError: 문법 오류로 복구할 수 없는 경우
+    """
+    length = len(text)
+    stack: List[Any] = []  # [container, 대기 중인 키]
+    expect = _EXPECT_VALUE
+
+    while True:
+        position = _WHITESPACE.match(text, position).end()
+        if position >= length:
+            return _close_truncated(stack)
+        char = text[position]
+
+        if expect in (_EXPECT_VALUE, _EXPECT_VALUE_OR_END):
+            if char == "]" and expect == _EXPECT_VALUE_OR_END:
+                value = stack.pop()[0]
+                position += 1
+            elif char in "{[" and 0 < len(stack) <= _C_DECODE_MAX_DEPTH \
+                    and (decoded := _decode_at(text, position)) is not None:
+                # 얕은 깊이의 완성된 하위 값(질문/학습 경로 항목)은 C 디코더로 한 번에 읽고,
+                # 실패한 구간만 문자 단위로 처리 (깊이 제한으로 재시도 비용은 선형 유지)
+                value, position = decoded
+            elif char == "{":
+                stack.append([{}, None])
+                expect = _EXPECT_KEY
+                position += 1
+                continue
+            elif char == "[":
+                stack.append([[], None])
+                expect = _EXPECT_VALUE_OR_END
+                position += 1
+                continue
+            elif char == '"' or text.startswith('\\"', position):
+                value, position = _read_string(text, position)
+                if value is None:
+                    return _close_truncated(stack)
+            else:
+                number = _NUMBER.match(text, position)
+                if number:
+                    if number.end() >= length:
+                        return _close_truncated(stack)
+                    literal = number.group()
+                    value = int(literal) if literal.lstrip("-").isdigit() else float(literal)
+                    position = number.end()
                 else:
-                    response_text = response_text[start:].strip()
-        
-        # Step 2: 기본 정리
-        response_text = response_text.strip()
-        if response_text.startswith('```'):
-            response_text = response_text[3:].strip()
-        if response_text.endswith('```'):
-            response_text = response_text[:-3].strip()
-        
-        # Step 3: 마크다운 및 특수문자 정리
-        # 마크다운 볼드(**text**) 제거
-        response_text = re.sub(r'\*\*(.*?)\*\*', r'\1', response_text)
-        # 마크다운 이탤릭(*text*) 제거  
-        response_text = re.sub(r'\*(.*?)\*', r'\1', response_text)
-        # 백슬래시 이스케이프 처리
-        response_text = response_text.replace('\\"', '"')
-        
-        logger.info(f"Cleaned JSON (first 200 chars): {response_text[:200]}")
-        
-        # Step 4: 빈 응답 체크
-        if not response_text:
-            raise ValueError("Empty JSON response after extraction")
-        
-        # Step 5: JSON 파싱 시도
-        try:
-            return json.loads(response_text)
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON decode error: {e}")
-            logger.error(f"Problematic JSON around error: {response_text[max(0, e.pos-50):e.pos+50]}")
-            
-            # 추가 정리 시도: 개행문자를 공백으로
-            response_text_cleaned = response_text.replace('\n', ' ').replace('\r', ' ')
-            # 연속 공백 제거
-            response_text_cleaned = re.sub(r'\s+', ' ', response_text_cleaned)
-            logger.info(f"Retry with cleaned newlines")
-            
-            try:
-                return json.loads(response_text_cleaned)
-            except json.JSONDecodeError as e2:
-                logger.error(f"Failed to parse string response: {e2}")
-                
-                # 마지막 시도: 잘린 JSON 복구
-                return _repair_truncated_json(response_text_cleaned)
-        
-    except Exception as e:
-        logger.error(f"Failed to parse string response: {e}")
-        raise
+                    word = _BARE_KEY.match(text, position)
+                    if not word:
+                        raise _JSONSyntaxError(position)
+                    if word.group() not in _LITERALS:
+                        if word.end() >= length and any(l.startswith(word.group()) for l in _LITERALS):
+                            return _close_truncated(stack)
+                        raise _JSONSyntaxError(position)
+                    value = _LITERALS[word.group()]
+                    position = word.end()
+
+        elif expect == _EXPECT_KEY:
+            if char == "}":
+                value = stack.pop()[0]
+                position += 1
+            else:
+                if char == '"' or text.startswith('\\"', position):
+                    key, position = _read_string(text, position)
+                    if key is None:
+                        return _close_truncated(stack)
+                else:
+                    word = _BARE_KEY.match(text, position)
+                    if not word:
+                        raise _JSONSyntaxError(position)
+                    key, position = word.group(), word.end()
+                stack[-1][1] = key
+                expect = _EXPECT_COLON
+                continue
+
+        elif expect == _EXPECT_COLON:
+            if char != ":":
+                raise _JSONSyntaxError(position)
+            expect = _EXPECT_VALUE
+            position += 1
+            continue
+
+        else:  # _EXPECT_COMMA_OR_END
+            in_object = isinstance(stack[-1][0], dict)
+            if char == ",":
+                expect = _EXPECT_KEY if in_object else _EXPECT_VALUE_OR_END
+                position += 1
+                continue
+            if char in "}]":
+                # 괄호 종류가 어긋나도 현재 구조를 닫음
+                value = stack.pop()[0]
+                position += 1
+            elif char == '"' or (not in_object and char != ":"):
+                # 빠진 쉼표
+                expect = _EXPECT_KEY if in_object else _EXPECT_VALUE
+                continue
+            else:
+                raise _JSONSyntaxError(position)
+
+        # 완성된 값을 부모 구조에 연결
+        if not stack:
+            return value, True
+        container, key = stack[-1]
+        if isinstance(container, dict):
+            container[key] = value
+        else:
+            container.append(value)
+        expect = _EXPECT_COMMA_OR_END
+
+
+def _close_truncated(stack: List[Any]) -> Tuple[Union[Dict, List], bool]:
+    """텍스트 끝에서 열린 구조를 안쪽부터 닫기 (배열 안의 미완성 항목은 버리고, 객체 값이면 유지)"""
+    value = stack.pop()[0]
+    while stack:
+        container, key = stack[-1]
+        if isinstance(container, dict):
+            container[key] = value
+        value = stack.pop()[0]
+    return value, False
 
 
 def _normalize_response_keys(
@@ -154,7 +333,7 @@ def _normalize_response_keys(
                 if fallback_key in parsed_response:
                     normalized[expected_key] = parsed_response[fallback_key]
                     found = True
-                    logger.info(f"Used fallback key '{fallback_key}' for '{expected_key}'")
+                    logger.info("Used fallback key '%s' for '%s'", fallback_key, expected_key)
                     break
         
         # 3. 키를 찾지 못한 경우
@@ -168,98 +347,3 @@ def _normalize_response_keys(
             normalized[key] = value
     
     return normalized
-
-
-def _repair_truncated_json(json_text: str) -> Dict[str, Any]:
-    """잘린 JSON을 복구하는 함수"""
-    logger.warning("Attempting to repair truncated JSON")
-    
-    try:
-        # questions 배열이 있는지 확인
-        if '"questions"' in json_text and '[' in json_text:
-            # questions 배열의 시작 위치 찾기
-            questions_start = json_text.find('"questions"')
-            array_start = json_text.find('[', questions_start)
-            
-            if array_start != -1:
-                # 배열의 끝을 찾기 위해 중괄호와 대괄호 카운트
-                brace_count = 0
-                bracket_count = 1  # 이미 [를 찾았으므로 1부터 시작
-                end_pos = array_start + 1
-                
-                for i, char in enumerate(json_text[array_start + 1:], array_start + 1):
-                    if char == '[':
-                        bracket_count += 1
-                    elif char == ']':
-                        bracket_count -= 1
-                    elif char == '{':
-                        brace_count += 1
-                    elif char == '}':
-                        brace_count -= 1
-                    
-                    if bracket_count == 0 and brace_count == 0:
-                        end_pos = i + 1
-                        break
-                
-                # 복구된 JSON 생성
-                repaired_json = json_text[:end_pos] + ']}'
-                logger.info(f"Repaired JSON (first 200 chars): {repaired_json[:200]}")
-                
-                return json.loads(repaired_json)
-        
-        # 기본 복구: 마지막 완전한 객체까지만 사용
-        if '"questions"' in json_text:
-            # 마지막 완전한 질문 객체 찾기
-            last_complete_question = _find_last_complete_question(json_text)
-            if last_complete_question:
-                repaired_json = '{"questions": [' + last_complete_question + ']}'
-                logger.info(f"Using last complete question: {repaired_json[:200]}")
-                return json.loads(repaired_json)
-        
-        # 최후의 수단: 빈 questions 배열 반환
-        logger.warning("Could not repair JSON, returning empty questions array")
-        return {"questions": []}
-        
-    except Exception as e:
-        logger.error(f"Failed to repair JSON: {e}")
-        return {"questions": []}
-
-
-def _find_last_complete_question(json_text: str) -> str:
-    """마지막 완전한 질문 객체를 찾는 함수"""
-    try:
-        # questions 배열 내의 각 질문 객체 찾기
-        questions_start = json_text.find('"questions"')
-        array_start = json_text.find('[', questions_start)
-        
-        if array_start == -1:
-            return None
-        
-        # 각 질문 객체의 시작과 끝 찾기
-        brace_count = 0
-        question_start = None
-        questions = []
-        
-        for i, char in enumerate(json_text[array_start + 1:], array_start + 1):
-            if char == '{':
-                if brace_count == 0:
-                    question_start = i
-                brace_count += 1
-            elif char == '}':
-                brace_count -= 1
-                if brace_count == 0 and question_start is not None:
-                    question = json_text[question_start:i + 1]
-                    # 간단한 유효성 검사
-                    if '"question"' in question and '"difficulty"' in question:
-                        questions.append(question)
-                    question_start = None
-        
-        # 마지막 완전한 질문 반환
-        if questions:
-            return questions[-1]
-        
-        return None
-        
-    except Exception as e:
-        logger.error(f"Error finding last complete question: {e}")
-        return None
@@ -1,30 +1,192 @@
 """
 공통 로거 설정
+
+- LOG_FORMAT=json이면 한 줄 JSON(ts, level, logger, message, extra 필드), text면 사람이 읽는 한 줄 형식
+- 레코드는 큐에만 넣고 별도 스레드(QueueListener)가 포맷/출력 → 호출 측(이벤트 루프)은 stdout I/O로 막히지 않음
+- 메시지 인자는 %-스타일로 넘기면 레벨이 꺼져 있거나 샘플링에서 빠질 때 포맷하지 않음
+  (logger.info("Selected %d candidates", count) - f-string은 호출 시점에 항상 포맷됨)
+- LOG_SAMPLE_RATES로 로거별 INFO 이하 레코드 샘플링 (WARNING 이상은 항상 기록)
+- LOG_REDACT_PII면 출력 직전 이력서 PII(이메일/전화번호, 이름/연락처 필드)를 마스킹
 """
 
+import atexit
+import json
 import logging
+import os
+import queue
+import random
+import re
 import sys
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+
+REDACTED = "***"
+
+_EMAIL = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+# 국내(010-1234-5678)와 국가번호(+82 10 1234 5678) 형식
+_PHONE = re.compile(r"(?<![\d+])(?:\+82[-\s]?0?|0)\d{1,2}[-\s.]?\d{3,4}[-\s.]?\d{4}(?!\d)")
+# 값 전체를 가리는 이력서 필드 (dict/extra 키 기준)
+_PII_KEYS = frozenset({"name", "email", "phone", "contact", "address", "github", "blog", "linkedin"})
+
+# LogRecord 기본 속성 (나머지는 extra로 넘긴 구조화 필드)
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "taskName"}
+
+_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_listener: Optional[QueueListener] = None
+_listener_lock = threading.Lock()
+
+
+def redact(value: Any) -> Any:
+    """문자열의 이메일/전화번호, dict의 PII 필드 값을 마스킹 (원본은 변경하지 않음)"""
+    if isinstance(value, str):
+        return _PHONE.sub(REDACTED, _EMAIL.sub(REDACTED, value))
+    if isinstance(value, dict):
+        return {key: REDACTED if str(key).lower() in _PII_KEYS else redact(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [redact(item) for item in value]
+    return value
+
+
+def _settings():
+    """공통 설정 (설정을 불러올 수 없는 환경에서는 None → 기본값 사용)"""
+    try:
+        from shared.config.base import get_settings
+        return get_settings()
+    except Exception:
+        return None
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON 레코드 (extra 필드는 최상위 키로)"""
+
+    def __init__(self, redact_pii: bool = True):
+        super().__init__()
+        self.redact_pii = redact_pii
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        payload: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": message,
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        if self.redact_pii:
+            payload = redact(payload)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """사람이 읽는 한 줄 형식 (로컬 개발용)"""
+
+    def __init__(self, redact_pii: bool = True):
+        super().__init__('%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+        self.redact_pii = redact_pii
+
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)
+        return redact(text) if self.redact_pii else text
+
+
+class SamplingFilter(logging.Filter):
+    """INFO 이하 레코드를 비율만큼만 통과 (WARNING 이상은 항상 통과)"""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.WARNING or random.random() < self.rate
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """레코드를 포맷하지 않고 큐에 넣음 (메시지 포맷/PII 마스킹/직렬화는 출력 스레드에서)"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if _listener is None:
+            _start_listener()
+        _queue.put_nowait(record)
+
+
+def parse_sample_rates(raw: str) -> Dict[str, float]:
+    """'interview-service=0.1,shared-llm=0.5' → {로거명: 비율}"""
+    rates = {}
+    for entry in (raw or "").split(","):
+        name, _, rate = entry.partition("=")
+        if name.strip() and rate.strip():
+            rates[name.strip()] = min(max(float(rate), 0.0), 1.0)
+    return rates
+
+
+def _start_listener() -> None:
+    """프로세스 공용 출력 스레드 시작 (첫 레코드에서, fork된 자식 프로세스에서는 다시)"""
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            return
+        settings = _settings()
+        redact_pii = bool(getattr(settings, "log_redact_pii", True))
+        formatter = TextFormatter if str(getattr(settings, "log_format", "json")).lower() == "text" else JsonFormatter
+        output = logging.StreamHandler(sys.stdout)
+        output.setFormatter(formatter(redact_pii))
+        listener = QueueListener(_queue, output, respect_handler_level=False)
+        listener.start()
+        _listener = listener
+
+
+def flush_logs() -> None:
+    """큐에 남은 레코드를 모두 출력 (이후 레코드는 새 큐에 쌓이고 출력 스레드는 다음 레코드에서 다시 시작)"""
+    global _queue, _listener
+    with _listener_lock:
+        listener, _listener = _listener, None
+        _queue = queue.SimpleQueue()
+    if listener is not None:
+        listener.stop()
+
+
+def _reset_after_fork() -> None:
+    """fork된 자식(Celery prefork 워커)에는 출력 스레드가 없으므로 새 큐로 교체"""
+    global _queue, _listener, _listener_lock
+    _queue = queue.SimpleQueue()
+    _listener = None
+    _listener_lock = threading.Lock()
+
+
+atexit.register(flush_logs)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
 
 def setup_logger(service_name: str, log_level: str = "INFO") -> logging.Logger:
-    """서비스별 표준화된 로거 설정"""
-    
+    """
+    서비스별 표준화된 로거 설정
+
+    Args:
+        service_name: 로거 이름 (LOG_SAMPLE_RATES의 키)
+        log_level: 로그 레벨
+    """
     logger = logging.getLogger(service_name)
     logger.setLevel(getattr(logging, log_level.upper()))
-    
+
     # 중복 핸들러 방지
     if not logger.handlers:
-        # 콘솔 핸들러
-        handler = logging.StreamHandler(sys.stdout)
-        
-        # 포맷터 설정
-        formatter = logging.Formatter(
-            f'%(asctime)s - {service_name} - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        
+        logger.addHandler(_DeferredQueueHandler(_queue))
+
+        rate = parse_sample_rates(str(getattr(_settings(), "log_sample_rates", "") or "")).get(service_name)
+        if rate is not None and rate < 1.0:
+            logger.addFilter(SamplingFilter(rate))
+
         # 루트 로거와 분리
         logger.propagate = False
-    
+
     return logger
@@ -0,0 +1,363 @@
+"""
+Prometheus 메트릭
+
+- API: install_metrics(app, service)로 /metrics 엔드포인트와 라우트별 지연 시간/동시 요청 수 미들웨어 등록
+- 워커: install_worker_metrics()로 작업 대기/실행 시간 기록, 워커 메인 프로세스가 METRICS_WORKER_PORT로 노출
+  (prefork 자식 프로세스 값은 PROMETHEUS_MULTIPROC_DIR 멀티프로세스 모드로 합산)
+- LLM 호출(제공자/모델별 지연, 토큰, 오류, 파싱 실패), 캐시 적중, MongoDB 명령, Redis 진행률 쓰기, 큐 길이
+- 레이블은 라우트 템플릿, 상태 클래스, 제공자/모델, 작업/큐 이름 등 코드와 설정으로 정해지는 값만 사용
+  (이력서 키, 원본 경로 등 요청마다 달라지는 값은 레이블로 쓰지 않음)
+"""
+
+import os
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.core import GaugeMetricFamily
+from pymongo import monitoring
+
+from shared.config.base import get_settings
+from shared.utils.logger import setup_logger
+
+settings = get_settings()
+logger = setup_logger("shared-metrics", settings.log_level)
+
+MULTIPROC_DIR = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+if MULTIPROC_DIR:
+    os.makedirs(MULTIPROC_DIR, exist_ok=True)
+
+# 지연 시간 버킷 (초) - HTTP/DB는 짧게, LLM은 수십 초까지
+FAST_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+REQUEST_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120)
+LLM_BUCKETS = (0.25, 0.5, 1, 2, 4, 6, 8, 10, 15, 20, 30, 45, 60, 90, 120)
+QUEUE_WAIT_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800, 3600)
+
+HTTP_METHODS = frozenset({"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"})
+# 레이블로 구분할 MongoDB 명령 (그 외는 other)
+MONGO_COMMANDS = frozenset({
+    "find", "getMore", "insert", "update", "delete", "findAndModify", "aggregate", "count", "distinct",
+    "createIndexes", "bulkWrite",
+})
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간 (라우트 템플릿별)",
+    ["service", "method", "route", "status"], buckets=REQUEST_BUCKETS,
+)
+HTTP_IN_FLIGHT = Gauge(
+    "http_requests_in_flight", "처리 중인 HTTP 요청 수", ["service"], multiprocess_mode="livesum",
+)
+LLM_REQUEST_SECONDS = Histogram(
+    "llm_request_duration_seconds", "LLM 제공자 호출 시간", ["provider", "model", "outcome"], buckets=LLM_BUCKETS,
+)
+LLM_TOKENS = Counter(
+    "llm_tokens_total", "LLM 토큰 수 (input: 전체 입력, cached: 프롬프트 캐시 적중 입력, output: 출력 추정)",
+    ["provider", "model", "kind"],
+)
+LLM_ERRORS = Counter("llm_errors_total", "LLM 제공자 호출 실패", ["provider", "model", "error"])
+LLM_PARSE = Counter(
+    "llm_parse_total", "LLM 응답 파싱 결과", ["provider", "model", "result", "structured"],
+)
+CACHE_LOOKUPS = Counter(
+    "generation_cache_lookups_total", "생성 결과 캐시 조회 (generation: 입력 지문, near_duplicate: 유사 이력서, "
+    "question_bank: 질문 은행)", ["cache", "result"],
+)
+MONGO_SECONDS = Histogram(
+    "mongo_operation_duration_seconds", "MongoDB 명령 처리 시간", ["command", "collection", "outcome"],
+    buckets=FAST_BUCKETS,
+)
+PROGRESS_WRITE_SECONDS = Histogram(
+    "task_progress_write_duration_seconds", "Redis 작업 진행률 쓰기 시간", ["outcome"], buckets=FAST_BUCKETS,
+)
+TASK_QUEUE_WAIT_SECONDS = Histogram(
+    "celery_task_queue_wait_seconds", "작업 등록(또는 예약 시각)부터 워커 실행 시작까지 대기 시간", ["task"],
+    buckets=QUEUE_WAIT_BUCKETS,
+)
+TASK_SECONDS = Histogram(
+    "celery_task_duration_seconds", "작업 실행 시간", ["task", "state"], buckets=REQUEST_BUCKETS,
+)
+
+# 작업 등록 시각 메시지 헤더 (워커에서 task.request 속성으로 전달됨)
+PUBLISHED_AT_HEADER = "published_at"
+
+
+def exposition_registry() -> CollectorRegistry:
+    """노출용 레지스트리 (멀티프로세스 모드면 프로세스별 파일을 합산)"""
+    if not MULTIPROC_DIR:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+# ---------- LLM / 캐시 ----------
+
+def observe_llm_call(provider: str, model: Optional[str], seconds: float, prompt: Any = None,
+                     response: Any = None, error: Optional[BaseException] = None) -> Dict[str, int]:
+    """
+    LLM 호출 한 번의 지연 시간/토큰/오류 기록
+
+    입력 토큰은 제공자가 알려준 사용량을 우선 사용하고, 없으면 로컬 추정값을 사용한다.
+    출력 토큰은 응답 텍스트 기준 추정값이다.
+
+    Returns:
+        Dict[str, int]: 기록한 토큰 수 (input, cached, output - 트레이스 스팬 속성용)
+    """
+    from shared.utils.token_estimator import estimate_message_tokens, estimate_tokens
+
+    model = model or "default"
+    if error is not None:
+        LLM_REQUEST_SECONDS.labels(provider, model, "error").observe(seconds)
+        LLM_ERRORS.labels(provider, model, type(error).__name__).inc()
+        return {}
+
+    LLM_REQUEST_SECONDS.labels(provider, model, "success").observe(seconds)
+    usage = getattr(response, "usage", None) or {}
+    input_tokens = usage.get("input_tokens")
+    if input_tokens is None and prompt is not None:
+        input_tokens = estimate_tokens(prompt, provider) if isinstance(prompt, str) else \
+            estimate_message_tokens(prompt, provider)
+    tokens = {
+        "input": input_tokens or 0,
+        "cached": usage.get("cached_tokens") or 0,
+        "output": estimate_tokens(str(response), provider) if response else 0,
+    }
+    for kind, count in tokens.items():
+        if count:
+            LLM_TOKENS.labels(provider, model, kind).inc(count)
+    return tokens
+
+
+def observe_llm_parse(provider: str, model: Optional[str], parsed: bool, structured: bool = False) -> None:
+    LLM_PARSE.labels(provider, model or "default", "success" if parsed else "failure",
+                     "true" if structured else "false").inc()
+
+
+def observe_cache_lookup(cache: str, hit: bool) -> None:
+    """생성 결과 캐시 조회 결과 기록 (적중률 = hit / (hit + miss))"""
+    CACHE_LOOKUPS.labels(cache, "hit" if hit else "miss").inc()
+
+
+# ---------- HTTP ----------
+
+def route_template(scope: Dict[str, Any]) -> str:
+    """요청 경로와 일치하는 라우트 템플릿 (/interview/{unique_key} 등, 없으면 unmatched)"""
+    from starlette.routing import Match
+
+    app = scope.get("app")
+    for route in getattr(app, "routes", ()):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return getattr(route, "path", "unmatched")
+    return "unmatched"
+
+
+class MetricsMiddleware:
+    """라우트별 요청 지연 시간/동시 요청 수 ASGI 미들웨어 (응답 본문은 건드리지 않음)"""
+
+    def __init__(self, app, service: str):
+        self.app = app
+        self.service = service
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = [500]
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        in_flight = HTTP_IN_FLIGHT.labels(self.service)
+        in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_flight.dec()
+            method = scope["method"] if scope["method"] in HTTP_METHODS else "other"
+            HTTP_REQUEST_SECONDS.labels(self.service, method, route_template(scope), f"{status[0] // 100}xx") \
+                .observe(time.perf_counter() - started)
+
+
+def install_metrics(app, service: str) -> None:
+    """FastAPI 앱에 메트릭 미들웨어와 /metrics 엔드포인트 등록"""
+    from fastapi import Response
+
+    install_mongo_metrics()
+    app.add_middleware(MetricsMiddleware, service=service)
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """Prometheus 스크레이프 엔드포인트"""
+        return Response(generate_latest(exposition_registry()), media_type=CONTENT_TYPE_LATEST)
+
+
+# ---------- MongoDB ----------
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """pymongo 명령 모니터링으로 Motor/pymongo 명령 처리 시간 기록"""
+
+    def __init__(self):
+        self._pending: Dict[Any, tuple] = {}
+
+    def started(self, event):
+        command = event.command_name if event.command_name in MONGO_COMMANDS else "other"
+        collection = event.command.get(event.command_name)
+        if command == "getMore":
+            collection = event.command.get("collection")
+        self._pending[(event.connection_id, event.request_id)] = (
+            command, collection if isinstance(collection, str) else "",
+        )
+
+    def _finish(self, event, outcome: str):
+        pending = self._pending.pop((event.connection_id, event.request_id), None)
+        if pending is not None:
+            MONGO_SECONDS.labels(pending[0], pending[1], outcome).observe(event.duration_micros / 1e6)
+
+    def succeeded(self, event):
+        self._finish(event, "success")
+
+    def failed(self, event):
+        self._finish(event, "error")
+
+
+_mongo_listener: Optional[MongoCommandMetrics] = None
+
+
+def install_mongo_metrics() -> None:
+    """명령 모니터링 리스너 등록 (이후 생성되는 클라이언트에 적용, 중복 등록 안 함)"""
+    global _mongo_listener
+    if _mongo_listener is None:
+        _mongo_listener = MongoCommandMetrics()
+        monitoring.register(_mongo_listener)
+
+
+# ---------- Celery ----------
+
+def stamp_published_at(headers: Optional[Dict[str, Any]] = None, **_) -> None:
+    """before_task_publish: 등록 시각을 메시지 헤더에 기록"""
+    if headers is not None:
+        headers.setdefault(PUBLISHED_AT_HEADER, time.time())
+
+
+def queue_wait_seconds(request: Any, now: Optional[float] = None) -> Optional[float]:
+    """등록 시각(예약 작업은 예약 시각)부터 지금까지 대기 시간 (헤더가 없으면 None)"""
+    published_at = getattr(request, PUBLISHED_AT_HEADER, None)
+    if published_at is None:
+        return None
+    ready_at = float(published_at)
+    eta = getattr(request, "eta", None)
+    if eta:
+        try:
+            ready_at = max(ready_at, datetime.fromisoformat(str(eta)).timestamp())
+        except ValueError:
+            pass
+    return max((now or time.time()) - ready_at, 0.0)
+
+
+_task_started: Dict[str, float] = {}
+
+
+def _on_task_prerun(task_id=None, task=None, **_):
+    _task_started[task_id] = time.perf_counter()
+    wait = queue_wait_seconds(task.request)
+    if wait is not None:
+        TASK_QUEUE_WAIT_SECONDS.labels(task.name).observe(wait)
+
+
+def _on_task_postrun(task_id=None, task=None, state=None, **_):
+    started = _task_started.pop(task_id, None)
+    if started is not None:
+        TASK_SECONDS.labels(task.name, state or "UNKNOWN").observe(time.perf_counter() - started)
+
+
+def _on_worker_process_shutdown(pid=None, **_):
+    if MULTIPROC_DIR:
+        multiprocess.mark_process_dead(pid or os.getpid())
+
+
+class QueueDepthCollector:
+    """스크레이프 시 브로커에서 큐별 대기 메시지 수 조회 (METRICS_QUEUE_DEPTH_CACHE_SECONDS 동안 재사용)"""
+
+    def __init__(self, app, queues: Iterable[str]):
+        self.app = app
+        self.queues = list(queues)
+        self._depths: Dict[str, int] = {}
+        self._loaded_at = float("-inf")
+
+    def _family(self) -> GaugeMetricFamily:
+        return GaugeMetricFamily("celery_queue_depth", "브로커 큐의 대기 메시지 수", labels=["queue"])
+
+    def describe(self):
+        return [self._family()]
+
+    def _load(self) -> Dict[str, int]:
+        now = time.monotonic()
+        if now - self._loaded_at < float(settings.metrics_queue_depth_cache_seconds):
+            return self._depths
+        depths = {}
+        try:
+            with self.app.connection_for_read() as connection:
+                for queue in self.queues:
+                    try:
+                        depths[queue] = connection.default_channel.queue_declare(queue=queue, passive=True)[1]
+                    except Exception as e:
+                        logger.debug("Queue depth unavailable for %s: %s", queue, e)
+        except Exception as e:
+            logger.warning("Failed to read queue depth from broker: %s", e)
+        self._depths, self._loaded_at = depths, now
+        return depths
+
+    def collect(self):
+        family = self._family()
+        for queue, depth in self._load().items():
+            family.add_metric([queue], depth)
+        yield family
+
+
+def _start_worker_exporter(sender=None, **_):
+    """worker_init: 워커 메인 프로세스에서 메트릭 HTTP 서버 시작"""
+    from prometheus_client import start_http_server
+
+    port = int(settings.metrics_worker_port)
+    if port <= 0:
+        return
+    if MULTIPROC_DIR:
+        # 이전 실행의 프로세스별 파일 정리
+        for name in os.listdir(MULTIPROC_DIR):
+            if name.endswith(".db"):
+                os.remove(os.path.join(MULTIPROC_DIR, name))
+    registry = exposition_registry()
+    app = getattr(sender, "app", None)
+    if app is not None:
+        registry.register(QueueDepthCollector(app, app.conf.task_queues or ()))
+    try:
+        start_http_server(port, registry=registry)
+        logger.info("Worker metrics exporter listening on :%d", port)
+    except OSError as e:
+        logger.warning("Failed to start worker metrics exporter on :%d: %s", port, e)
+
+
+def install_worker_metrics() -> None:
+    """워커 앱용 Celery 시그널 연결 (작업 대기/실행 시간, 메트릭 노출)"""
+    from celery import signals
+
+    install_mongo_metrics()
+    signals.worker_init.connect(_start_worker_exporter, weak=False)
+    signals.task_prerun.connect(_on_task_prerun, weak=False)
+    signals.task_postrun.connect(_on_task_postrun, weak=False)
+    signals.worker_process_shutdown.connect(_on_worker_process_shutdown, weak=False)
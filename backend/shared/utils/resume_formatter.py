@@ -1,109 +1,232 @@
 """
 이력서 데이터 포맷팅 공통 유틸리티
+
+프로젝트/성과/기술 스택을 관련도 순으로 정렬한 뒤, 목표 입력 토큰 예산을 채울 때까지
+넓게(프로젝트별 핵심 정보) → 깊게(추가 성과, 기술) 순서로 추가한다.
 """
 
-from typing import Dict, Any
+import hashlib
+import json
+import re
+from typing import Dict, Any, List, Optional
+from shared.config.base import get_settings
+from shared.utils.token_estimator import estimate_tokens, DEFAULT_FAMILY
+
+# 정량 성과 (수치 + 단위)
+_METRIC_PATTERN = re.compile(r"\d+(\.\d+)?\s*(%|배|ms|초|분|건|명|개|TPS|RPS|QPS|만|천|억|x|X)")
+# 기술적 행위 키워드
+_ACTION_KEYWORDS = ("구현", "개선", "설계", "최적화", "구축", "도입", "해결", "단축", "감소", "자동화", "분리", "보장")
+
+# 성과 한 건의 최대 길이 (예산이 남아도 과도하게 긴 문장은 축약)
+MAX_ACHIEVEMENT_CHARS = 160
+# 1차(넓게) 단계에서 프로젝트별로 포함할 기술 수
+CORE_TECH_COUNT = 3
+
+
+def score_achievement(text: str, tech_stack: List[str]) -> float:
+    """성과 문장의 관련도 점수 (정량 지표, 기술 언급, 기술적 행위 기준)"""
+    score = 0.0
+    if _METRIC_PATTERN.search(text):
+        score += 3
+    lowered = text.lower()
+    score += min(sum(1 for tech in tech_stack if tech.lower() in lowered), 2)
+    score += min(sum(1 for keyword in _ACTION_KEYWORDS if keyword in text), 2) * 0.5
+    return score
+
+
+def _rank_tech_stack(tech_stack: List[str], evidence: str, frequency: Dict[str, int]) -> List[str]:
+    """성과/설명에서 언급된 기술 → 이력서 전체 등장 빈도 → 원래 순서"""
+    lowered = evidence.lower()
+    return sorted(
+        tech_stack,
+        key=lambda tech: (tech.lower() not in lowered, -frequency.get(tech.lower(), 0), tech_stack.index(tech))
+    )
+
+
+def _shorten(text: str) -> str:
+    if len(text) > MAX_ACHIEVEMENT_CHARS:
+        return text[:MAX_ACHIEVEMENT_CHARS] + "..."
+    return text
+
+
+def _collect_projects(resume_data: Dict[str, Any], max_work_projects: Optional[int],
+                      max_personal_projects: Optional[int]) -> List[Dict[str, Any]]:
+    """회사/개인 프로젝트를 공통 구조로 변환하고 관련도 순으로 정렬"""
+    work = [exp for exp in resume_data.get("work_experiences", []) if exp.get("project_name")]
+    personal = [proj for proj in resume_data.get("personal_projects", []) if proj.get("name")]
+
+    frequency: Dict[str, int] = {}
+    for item in work + personal:
+        for tech in item.get("tech_stack", []) or []:
+            frequency[tech.lower()] = frequency.get(tech.lower(), 0) + 1
+
+    projects = []
+    for kind, items, achievements_key, name_key in (
+        ("work", work, "achievements", "project_name"),
+        ("personal", personal, "key_achievements", "name"),
+    ):
+        for index, item in enumerate(items):
+            tech_stack = list(item.get("tech_stack", []) or [])
+            achievements = sorted(
+                (a for a in (item.get(achievements_key) or []) if a),
+                key=lambda a: -score_achievement(a, tech_stack)
+            )
+            evidence = " ".join(achievements) + " " + (item.get("project_description") or item.get("description") or "")
+            top_scores = [score_achievement(a, tech_stack) for a in achievements[:2]]
+            projects.append({
+                "kind": kind,
+                "name": item[name_key],
+                "tech": _rank_tech_stack(tech_stack, evidence, frequency),
+                "achievements": achievements,
+                # 회사 경력 우선, 목록 앞쪽(최근) 우선, 성과 점수 합산
+                "score": sum(top_scores) + (2 if kind == "work" else 0) + 1 / (1 + index),
+                "index": index,
+            })
+
+    projects.sort(key=lambda p: -p["score"])
+
+    # 종류별 최대 개수 제한 (지정된 경우만)
+    limits = {"work": max_work_projects, "personal": max_personal_projects}
+    counts = {"work": 0, "personal": 0}
+    selected = []
+    for project in projects:
+        limit = limits[project["kind"]]
+        if limit is not None and counts[project["kind"]] >= limit:
+            continue
+        counts[project["kind"]] += 1
+        selected.append(project)
+    return selected
+
+
+def _render_project(project: Dict[str, Any], tech_count: int, achievement_count: int) -> str:
+    label = "프로젝트" if project["kind"] == "work" else "개인 프로젝트"
+    line = f"{label}: {project['name']}"
+    if tech_count:
+        line += f" (기술: {', '.join(project['tech'][:tech_count])})"
+    if achievement_count:
+        achievements = [_shorten(a) for a in project["achievements"][:achievement_count]]
+        line += f" - 주요 성과: {'; '.join(achievements)}"
+    return line
+
+
+def _render_projects(projects: List[Dict[str, Any]], plan: Dict[int, List[int]]) -> str:
+    lines = [
+        f"- {_render_project(project, *plan[i])}"
+        for i, project in enumerate(projects) if i in plan
+    ]
+    return "\n".join(lines)
 
 
 def format_resume_for_ai(
-    resume_data: Dict[str, Any], 
-    max_work_projects: int = 2,
-    max_personal_projects: int = 1
+    resume_data: Dict[str, Any],
+    max_work_projects: Optional[int] = None,
+    max_personal_projects: Optional[int] = None,
+    token_budget: Optional[int] = None,
+    tokenizer_family: str = DEFAULT_FAMILY
 ) -> Dict[str, Any]:
     """
     이력서 데이터를 AI 프롬프트용으로 포맷팅
-    
+
     Args:
         resume_data: 원본 이력서 데이터
-        max_work_projects: 회사 프로젝트 최대 개수
-        max_personal_projects: 개인 프로젝트 최대 개수
-    
+        max_work_projects: 회사 프로젝트 최대 개수 (None이면 제한 없음)
+        max_personal_projects: 개인 프로젝트 최대 개수 (None이면 제한 없음)
+        token_budget: 이력서 영역 목표 입력 토큰 수 (None이면 관련도 순으로 전부 포함)
+        tokenizer_family: 토큰 추정에 사용할 토크나이저 계열
+
     Returns:
-        AI 프롬프트용으로 포맷팅된 데이터
+        AI 프롬프트용으로 포맷팅된 데이터 (estimated_tokens: 이력서 영역 추정 토큰 수)
     """
-    # 경력 정보
     total_months = resume_data.get("total_experience_months", 0)
-    
-    # 프로젝트 경험 추출 (핵심!)
-    projects = []
-    
-    # 회사 프로젝트
-    work_experiences = resume_data.get("work_experiences", [])
-    for exp in work_experiences[:max_work_projects]:
-        if exp.get("project_name"):
-            project_info = _format_work_project(exp)
-            if project_info:
-                projects.append(project_info)
-    
-    # 개인 프로젝트  
-    personal_projects = resume_data.get("personal_projects", [])
-    for proj in personal_projects[:max_personal_projects]:
-        project_info = _format_personal_project(proj)
-        if project_info:
-            projects.append(project_info)
-    
+    name = resume_data.get("name", "")
+    projects = _collect_projects(resume_data, max_work_projects, max_personal_projects)
+
+    def tokens_of(plan: Dict[int, List[int]]) -> int:
+        return estimate_tokens(f"{name} {total_months} " + _render_projects(projects, plan), tokenizer_family)
+
+    def fits(plan: Dict[int, List[int]]) -> bool:
+        return token_budget is None or tokens_of(plan) <= token_budget
+
+    # plan: 프로젝트 인덱스 -> [포함할 기술 수, 포함할 성과 수]
+    plan: Dict[int, List[int]] = {}
+
+    # 1단계 (넓게): 관련도 순으로 프로젝트별 핵심 기술 + 최상위 성과 1건
+    for i, project in enumerate(projects):
+        candidate = {**plan, i: [min(CORE_TECH_COUNT, len(project["tech"])), min(1, len(project["achievements"]))]}
+        if fits(candidate):
+            plan = candidate
+        elif fits({**plan, i: [0, 0]}):
+            plan = {**plan, i: [0, 0]}
+
+    # 2단계 (깊게): 남은 성과를 점수 순으로 추가
+    remaining = sorted(
+        ((score_achievement(a, project["tech"]), i, rank)
+         for i, project in enumerate(projects) if i in plan
+         for rank, a in enumerate(project["achievements"]) if rank >= plan[i][1]),
+        key=lambda item: (-item[0], item[2])
+    )
+    for _, i, rank in remaining:
+        if plan[i][1] != rank:
+            continue  # 같은 프로젝트의 앞 순위 성과가 빠진 경우 건너뜀
+        candidate = {**plan, i: [plan[i][0], rank + 1]}
+        if fits(candidate):
+            plan = candidate
+
+    # 3단계: 남은 예산으로 기술 스택 보강
+    for i in sorted(plan):
+        for tech_count in range(plan[i][0] + 1, len(projects[i]["tech"]) + 1):
+            candidate = {**plan, i: [tech_count, plan[i][1]]}
+            if not fits(candidate):
+                break
+            plan = candidate
+
     return {
-        "name": resume_data.get("name", ""),
+        "name": name,
         "experience_months": total_months,
-        "projects": "\n".join([f"- {project}" for project in projects])
+        "projects": _render_projects(projects, plan),
+        "estimated_tokens": tokens_of(plan),
     }
 
 
-def _format_work_project(exp: Dict[str, Any]) -> str:
-    """회사 프로젝트 포맷팅"""
-    project_info = f"프로젝트: {exp['project_name']}"
-    
-    # 기술 스택 추가 (주요 4개만)
-    if exp.get("tech_stack"):
-        tech_list = exp["tech_stack"][:4]  # 주요 기술 4개만
-        project_info += f" (기술: {', '.join(tech_list)})"
-    
-    # 주요 성과 추가 (첫 번째 성과만)
-    if exp.get("achievements"):
-        key_achievement = exp["achievements"][0] if exp["achievements"] else ""
-        if key_achievement:
-            # 너무 길면 축약
-            if len(key_achievement) > 100:
-                key_achievement = key_achievement[:100] + "..."
-            project_info += f" - 주요 성과: {key_achievement}"
-    
-    return project_info
-
-
-def _format_personal_project(proj: Dict[str, Any]) -> str:
-    """개인 프로젝트 포맷팅"""
-    project_info = f"개인 프로젝트: {proj.get('name', '')}"
-    
-    # 기술 스택 추가 (주요 4개만)
-    if proj.get("tech_stack"):
-        tech_list = proj["tech_stack"][:4]  # 주요 기술 4개만
-        project_info += f" (기술: {', '.join(tech_list)})"
-    
-    # 주요 성과 추가 (첫 번째 성과만)
-    if proj.get("key_achievements"):
-        key_achievement = proj["key_achievements"][0] if proj["key_achievements"] else ""
-        if key_achievement:
-            # 너무 길면 축약
-            if len(key_achievement) > 100:
-                key_achievement = key_achievement[:100] + "..."
-            project_info += f" - 주요 성과: {key_achievement}"
-    
-    return project_info
-
-
-def format_resume_for_interview(resume_data: Dict[str, Any]) -> Dict[str, Any]:
-    """면접 질문 생성용 이력서 포맷팅 (회사 2개 + 개인 1개)"""
+def fingerprint_formatted_resume(formatted_data: Dict[str, Any]) -> str:
+    """
+    포맷팅 결과(프롬프트 입력)의 안정적인 지문
+
+    프롬프트에 들어가는 필드만 사용하므로 연락처 등 프롬프트와 무관한 수정은 지문을 바꾸지 않는다.
+    """
+    payload = {key: formatted_data.get(key) for key in ("name", "experience_months", "projects")}
+    encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:32]
+
+
+def format_resume_for_interview(resume_data: Dict[str, Any], token_budget: Optional[int] = None) -> Dict[str, Any]:
+    """면접 질문 생성용 이력서 포맷팅 (토큰 예산 기본값: PROMPT_RESUME_TOKEN_BUDGET_INTERVIEW)"""
     return format_resume_for_ai(
-        resume_data, 
-        max_work_projects=2, 
-        max_personal_projects=1
+        resume_data,
+        token_budget=token_budget or get_settings().prompt_resume_token_budget_interview
     )
 
 
-def format_resume_for_learning(resume_data: Dict[str, Any]) -> Dict[str, Any]:
-    """학습 경로 생성용 이력서 포맷팅 (회사 2개 + 개인 2개)"""
+def format_resume_for_learning(resume_data: Dict[str, Any], token_budget: Optional[int] = None) -> Dict[str, Any]:
+    """학습 경로 생성용 이력서 포맷팅 (토큰 예산 기본값: PROMPT_RESUME_TOKEN_BUDGET_LEARNING)"""
     return format_resume_for_ai(
-        resume_data, 
-        max_work_projects=2, 
-        max_personal_projects=2
+        resume_data,
+        token_budget=token_budget or get_settings().prompt_resume_token_budget_learning
     )
+
+
+# 생성 종류별 프롬프트 입력 포맷터
+PROMPT_FORMATTERS = {
+    "interview": format_resume_for_interview,
+    "learning": format_resume_for_learning,
+}
+
+
+def prompt_input_fingerprint(kind: str, resume_data: Dict[str, Any]) -> str:
+    """생성 종류('interview' | 'learning')별 프롬프트 입력 지문 (원본 이력서 기준)"""
+    return fingerprint_formatted_resume(PROMPT_FORMATTERS[kind](resume_data))
+
+
+def compute_prompt_fingerprints(resume_data: Dict[str, Any]) -> Dict[str, str]:
+    """이력서 문서에 저장할 생성 종류별 프롬프트 입력 지문"""
+    return {kind: prompt_input_fingerprint(kind, resume_data) for kind in PROMPT_FORMATTERS}
@@ -0,0 +1,121 @@
+"""
+서비스 시작 시간 관리
+- 명시적 워밍업 / 종료 정리 (FastAPI lifespan에서 호출)
+- import 시간 프로파일 (-X importtime 기반)
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+from shared.config.base import get_settings
+from shared.utils.logger import setup_logger
+
+settings = get_settings()
+logger = setup_logger("shared-startup", settings.log_level)
+
+
+async def warm_up_service(service_name: str, prompt_files: List[str]) -> Dict[str, float]:
+    """
+    서비스 워밍업 (Redis 연결, 프롬프트 설정, 설정된 LLM 클라이언트)
+
+    첫 요청이 SDK import와 파일 파싱 비용을 떠안지 않도록 시작 시 미리 수행한다.
+    각 단계는 실패해도 서비스 기동을 막지 않는다.
+
+    Args:
+        service_name: 서비스명 ('interview', 'learning')
+        prompt_files: 미리 로드할 프롬프트 파일 목록
+
+    Returns:
+        Dict[str, float]: 단계별 소요 시간 (ms)
+    """
+    from shared.database.redis_client import get_redis_client
+    from shared.llm.registry import registry
+    from shared.prompts.loader import get_prompt_loader
+
+    def _load_prompts():
+        loader = get_prompt_loader(service_name)
+        for prompt_file in prompt_files:
+            loader.load_prompt_config(prompt_file)
+
+    stages = {
+        "redis": lambda: get_redis_client().ping(),
+        "prompts": _load_prompts,
+        "llm_clients": registry.warm_up,
+    }
+
+    timings = {}
+    for stage, func in stages.items():
+        started = time.perf_counter()
+        try:
+            await asyncio.to_thread(func)
+        except Exception as e:
+            logger.warning(f"Warm-up stage '{stage}' failed for {service_name}: {e}")
+        timings[stage] = round((time.perf_counter() - started) * 1000, 1)
+
+    logger.info(f"{service_name} service warm-up completed: {timings}")
+    return timings
+
+
+async def shut_down_service() -> None:
+    """서비스 종료 시 공유 자원 정리 (LLM 제공자 HTTP 커넥션 풀)"""
+    from shared.llm.transport import close_http_clients
+
+    await close_http_clients()
+
+
+def profile_imports(module: str, cwd: Optional[str] = None, top: int = 10) -> Dict[str, Any]:
+    """
+    새 인터프리터에서 모듈 import 시간 측정
+
+    Args:
+        module: import할 모듈명 (예: 'main')
+        cwd: 실행 디렉토리 (서비스 디렉토리)
+        top: 보고할 최상위 import 개수
+
+    Returns:
+        Dict: 전체 소요 시간(ms), 느린 import 목록, 로드된 모듈 이름 목록
+    """
+    backend_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env = {**os.environ, "PYTHONPATH": backend_dir}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd, env=env, capture_output=True, text=True, check=True
+    )
+
+    # "import time: self [us] | cumulative | imported package" 형식 (하위 import가 부모보다 먼저 출력)
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), depth, int(cumulative)))
+
+    root_index = max(i for i, (name, depth, _) in enumerate(entries) if name == module and depth == 0)
+    children = []
+    for name, depth, us in reversed(entries[:root_index]):
+        if depth == 0:
+            break
+        if depth == 1:
+            children.append((name, us))
+    children.sort(key=lambda item: item[1], reverse=True)
+
+    root = entries[root_index][2]
+    return {
+        "module": module,
+        "total_ms": round(root / 1000, 1),
+        "slowest": [{"module": name, "ms": round(us / 1000, 1)} for name, us in children[:top]],
+        "modules": [name for name, _, _ in entries],
+    }
+
+
+if __name__ == "__main__":
+    # 사용법: python -m shared.utils.startup <service-dir> [module]
+    service_dir = sys.argv[1]
+    report = profile_imports(sys.argv[2] if len(sys.argv) > 2 else "main", cwd=service_dir)
+    print(f"{report['module']}: {report['total_ms']} ms")
+    for entry in report["slowest"]:
+        print(f"  {entry['ms']:>8} ms  {entry['module']}")
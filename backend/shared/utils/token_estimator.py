@@ -0,0 +1,90 @@
+"""
+로컬 토큰 수 추정기
+제공자 토크나이저를 내려받지 않고 문자 종류별 평균 토큰 비율로 빠르게 추정
+"""
+
+import math
+import re
+from typing import Any, Dict, Iterable
+
+# 제공자 토크나이저 계열별 평균 비율
+# latin: 토큰당 영문 글자 수, digits: 토큰당 숫자 수, hangul/cjk: 글자당 토큰 수
+TOKENIZER_PROFILES: Dict[str, Dict[str, float]] = {
+    "openai": {"latin": 4.0, "digits": 3.0, "hangul": 0.7, "cjk": 0.9},   # o200k 계열 BPE
+    "claude": {"latin": 3.5, "digits": 1.0, "hangul": 1.1, "cjk": 1.2},
+    "gemini": {"latin": 4.0, "digits": 1.0, "hangul": 0.55, "cjk": 0.7},  # SentencePiece
+}
+
+# 제공자를 모를 때는 가장 보수적인(큰) 추정치 사용
+DEFAULT_FAMILY = "default"
+
+# 메시지 단위 고정 오버헤드 (역할 구분자 등)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+_HANGUL = "\uac00-\ud7a3\u3131-\u318e"
+_CJK = "\u3040-\u30ff\u4e00-\u9fff"
+_SEGMENT_PATTERN = re.compile(
+    r"(?P<latin>[A-Za-z]+)"
+    r"|(?P<digits>[0-9]+)"
+    rf"|(?P<hangul>[{_HANGUL}]+)"
+    rf"|(?P<cjk>[{_CJK}]+)"
+    r"|(?P<space>\s+)"
+    rf"|(?P<other>[^\sA-Za-z0-9{_HANGUL}{_CJK}]+)"
+)
+
+
+def _estimate_with_profile(text: str, profile: Dict[str, float]) -> int:
+    tokens = 0.0
+    for match in _SEGMENT_PATTERN.finditer(text):
+        kind = match.lastgroup
+        length = len(match.group())
+        if kind == "latin":
+            tokens += math.ceil(length / profile["latin"])
+        elif kind == "digits":
+            tokens += math.ceil(length / profile["digits"])
+        elif kind in ("hangul", "cjk"):
+            tokens += length * profile[kind]
+        elif kind == "space":
+            # 공백은 대부분 다음 단어에 붙고, 줄바꿈만 별도 토큰
+            tokens += match.group().count("\n") * 0.5
+        else:
+            # 기호/이모지는 대개 글자당 1토큰 이상
+            tokens += sum(1 if ord(ch) < 0x2000 else 2 for ch in match.group())
+    return int(math.ceil(tokens))
+
+
+def estimate_tokens(text: str, family: str = DEFAULT_FAMILY) -> int:
+    """
+    텍스트의 토큰 수 추정
+
+    Args:
+        text: 대상 텍스트
+        family: 토크나이저 계열 ('openai', 'claude', 'gemini'). 그 외에는 계열 중 최댓값
+
+    Returns:
+        int: 추정 토큰 수
+    """
+    if not text:
+        return 0
+    profile = TOKENIZER_PROFILES.get(family)
+    if profile:
+        return _estimate_with_profile(text, profile)
+    return max(_estimate_with_profile(text, p) for p in TOKENIZER_PROFILES.values())
+
+
+def estimate_message_tokens(messages: Iterable[Any], family: str = DEFAULT_FAMILY) -> int:
+    """
+    채팅 메시지 목록의 입력 토큰 수 추정
+
+    Args:
+        messages: LangChain 메시지, {"role", "content"} dict 또는 문자열 목록
+        family: 토크나이저 계열
+    """
+    total = 0
+    for message in messages:
+        if isinstance(message, dict):
+            content = message.get("content", "")
+        else:
+            content = getattr(message, "content", message)
+        total += estimate_tokens(str(content), family) + MESSAGE_OVERHEAD_TOKENS
+    return total
@@ -0,0 +1,626 @@
+"""
+분산 트레이싱
+
+- W3C Trace Context(traceparent)로 HTTP 요청 → Celery 작업 메시지 헤더 → 워커 작업까지 같은 trace로 연결
+- 스팬: HTTP 요청, Celery 작업과 작업 단계(진행률 stage), 프롬프트 렌더링, LLM 호출(토큰 수 속성),
+  MongoDB 명령(Motor/pymongo 명령 모니터링), Redis 명령
+- HTTP 요청/작업 스팬만 trace를 시작하고, 나머지 스팬은 진행 중인 스팬이 있을 때만 기록
+  (워밍업 등 요청 밖의 호출은 기록하지 않음)
+- 종료된 스팬은 큐에 넣고 별도 스레드가 배치로 내보냄: TRACING_EXPORTER=otlp(OTLP/HTTP JSON, 수집기로 전송) |
+  file(JSON Lines, 오프라인 분석) | none(기본, 스팬을 만들지 않음)
+- 오프라인 분석: python -m shared.utils.tracing traces.jsonl [--trace <trace_id>] [--slowest N]
+"""
+
+import argparse
+import asyncio
+import atexit
+import contextvars
+import functools
+import json
+import os
+import queue
+import random
+import re
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from pymongo import monitoring
+
+from shared.config.base import get_settings
+from shared.utils.logger import setup_logger
+
+settings = get_settings()
+logger = setup_logger("shared-tracing", settings.log_level)
+
+EXPORTER_NONE = "none"
+EXPORTER_FILE = "file"
+EXPORTER_OTLP = "otlp"
+
+TRACEPARENT_HEADER = "traceparent"
+TRACE_ID_RESPONSE_HEADER = b"x-trace-id"
+
+# OTLP span kind 코드
+SPAN_KINDS = {"internal": 1, "server": 2, "client": 3, "producer": 4, "consumer": 5}
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+_EXPORT_BATCH = 256
+
+# (trace_id, span_id, sampled)
+SpanContext = Tuple[str, str, bool]
+
+
+class Span:
+    """진행 중인 작업 하나 (종료 시 샘플링된 스팬만 내보냄)"""
+
+    __slots__ = ("trace_id", "span_id", "parent_id", "name", "kind", "service", "start_ns", "end_ns",
+                 "attributes", "status", "sampled", "owner", "stage")
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], sampled: bool,
+                 kind: str = "internal", attributes: Optional[Dict[str, Any]] = None):
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.service = _service_name
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes = dict(attributes or {})
+        self.status: Optional[str] = None
+        self.sampled = sampled
+        self.owner: Optional["Span"] = None  # 작업 단계 스팬이면 단계를 연 작업 스팬
+        self.stage: Optional[Tuple["Span", contextvars.Token]] = None  # 열려 있는 작업 단계 스팬
+
+    @property
+    def context(self) -> SpanContext:
+        return self.trace_id, self.span_id, self.sampled
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if self.sampled and value is not None:
+            self.attributes[key] = value
+
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        for key, value in attributes.items():
+            self.set_attribute(key, value)
+
+    def record_exception(self, error: BaseException) -> None:
+        self.status = "error"
+        self.set_attributes({"exception.type": type(error).__name__, "exception.message": str(error)[:500]})
+
+    def end(self) -> None:
+        if self.end_ns is not None:
+            return
+        _end_stage(self)
+        self.end_ns = time.time_ns()
+        if self.sampled:
+            _submit(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """파일 내보내기/분석용 레코드"""
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "service": self.service,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": round((self.end_ns - self.start_ns) / 1e6, 3),
+            "status": self.status or "ok",
+            "attributes": self.attributes,
+        }
+
+
+class _NoopSpan:
+    """트레이싱이 꺼져 있거나 부모 스팬이 없을 때 반환 (기록/전파하지 않음)"""
+
+    sampled = False
+    traceparent = None
+    context = None
+
+    def set_attribute(self, key, value):
+        pass
+
+    def set_attributes(self, attributes):
+        pass
+
+    def record_exception(self, error):
+        pass
+
+    def end(self):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+_current: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("current_span", default=None)
+_suppressed: contextvars.ContextVar[bool] = contextvars.ContextVar("tracing_suppressed", default=False)
+_service_name = "interview-coach"
+
+
+def enabled() -> bool:
+    return str(settings.tracing_exporter or EXPORTER_NONE).lower() != EXPORTER_NONE
+
+
+def configure_tracing(service_name: str) -> None:
+    """이 프로세스에서 만드는 스팬의 서비스 이름"""
+    global _service_name
+    _service_name = service_name
+
+
+def current_span() -> Optional[Span]:
+    return _current.get()
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[SpanContext]:
+    """traceparent 헤더 → (trace_id, span_id, sampled) (형식이 잘못되면 None)"""
+    match = _TRACEPARENT.match((value or "").strip().lower())
+    if not match or match.group(1) == "0" * 32 or match.group(2) == "0" * 16:
+        return None
+    return match.group(1), match.group(2), bool(int(match.group(3), 16) & 1)
+
+
+def begin_span(name: str, kind: str = "internal", attributes: Optional[Dict[str, Any]] = None,
+               parent: Optional[SpanContext] = None, root: bool = False):
+    """
+    스팬 시작 (현재 스팬으로 설정하지 않음 - 수동으로 종료하는 콜백/시그널용)
+
+    Args:
+        parent: 원격 부모 (traceparent에서 추출). 없으면 현재 스팬을 부모로 사용
+        root: 부모가 없을 때 새 trace를 시작할지 (HTTP 요청/작업 스팬만 True)
+    """
+    if not enabled() or _suppressed.get():
+        return NOOP_SPAN
+    if parent is None:
+        current = _current.get()
+        parent = current.context if current is not None else None
+    if parent is not None:
+        trace_id, parent_id, sampled = parent
+    elif root:
+        trace_id, parent_id = os.urandom(16).hex(), None
+        sampled = random.random() < float(settings.tracing_sample_rate)
+    else:
+        return NOOP_SPAN
+    return Span(name, trace_id, parent_id, sampled, kind, attributes)
+
+
+def activate(span) -> Optional[contextvars.Token]:
+    """스팬을 현재 스팬으로 설정 (반환한 토큰으로 deactivate)"""
+    return _current.set(span) if isinstance(span, Span) else None
+
+
+def deactivate(token: Optional[contextvars.Token]) -> None:
+    if token is not None:
+        _current.reset(token)
+
+
+@contextmanager
+def start_span(name: str, kind: str = "internal", attributes: Optional[Dict[str, Any]] = None,
+               parent: Optional[SpanContext] = None, root: bool = False) -> Iterator[Any]:
+    """with 블록 동안 현재 스팬으로 설정 (예외는 스팬에 기록 후 다시 발생)"""
+    span = begin_span(name, kind, attributes, parent, root)
+    if span is NOOP_SPAN:
+        yield span
+        return
+    token = _current.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        span.record_exception(e)
+        raise
+    finally:
+        _end_stage(span)
+        _current.reset(token)
+        span.end()
+
+
+@contextmanager
+def untraced() -> Iterator[None]:
+    """블록 안의 호출은 스팬을 만들지 않음 (취소 확인 폴링 등 반복 호출)"""
+    token = _suppressed.set(True)
+    try:
+        yield
+    finally:
+        _suppressed.reset(token)
+
+
+def traced(name: str):
+    """함수 호출 전체를 스팬으로 감싸는 데코레이터 (동기/비동기 함수)"""
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with start_span(name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with start_span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# ---------- 작업 단계 ----------
+
+def _end_stage(owner: Span) -> None:
+    if owner.stage is not None:
+        stage, token = owner.stage
+        owner.stage = None
+        try:
+            _current.reset(token)
+        except ValueError:
+            # 단계를 연 컨텍스트 밖에서 종료하는 경우 (현재 스팬은 그 컨텍스트의 것이므로 그대로 둠)
+            pass
+        stage.end()
+
+
+def mark_stage(stage: Optional[str], terminal: bool = False) -> None:
+    """
+    현재 작업의 단계 전환 (이전 단계 스팬을 닫고 새 단계 스팬을 현재 스팬으로 설정)
+
+    진행률 기록(set_task_progress)에서 호출해 loading_resume → calling_llm → saving 같은 단계를 스팬으로 남긴다.
+    """
+    current = _current.get()
+    if current is None or not stage:
+        return
+    owner = current.owner or current
+    _end_stage(owner)
+    if terminal:
+        return
+    span = Span(f"stage {stage}", owner.trace_id, owner.span_id, owner.sampled)
+    span.owner = owner
+    owner.stage = (span, _current.set(span))
+
+
+# ---------- 전파 ----------
+
+def inject_task_headers(headers: Optional[Dict[str, Any]] = None, **_) -> None:
+    """before_task_publish: 현재 스팬의 traceparent를 작업 메시지 헤더에 기록"""
+    span = _current.get()
+    if headers is not None and span is not None:
+        headers.setdefault(TRACEPARENT_HEADER, span.traceparent)
+
+
+class TracingMiddleware:
+    """HTTP 요청 스팬 ASGI 미들웨어 (traceparent 헤더를 이어받고, 응답에 x-trace-id 헤더 추가)"""
+
+    def __init__(self, app, service: str):
+        self.app = app
+        self.service = service
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not enabled():
+            await self.app(scope, receive, send)
+            return
+        from shared.utils.metrics import route_template
+
+        headers = dict(scope.get("headers") or [])
+        parent = parse_traceparent(headers.get(TRACEPARENT_HEADER.encode(), b"").decode("latin-1"))
+        status = [500]
+
+        with start_span(f"{scope['method']} {scope['path']}", kind="server", parent=parent, root=True,
+                        attributes={"http.method": scope["method"], "url.path": scope["path"]}) as span:
+            async def send_with_trace_id(message):
+                if message["type"] == "http.response.start":
+                    status[0] = message["status"]
+                    if span.sampled:
+                        message["headers"] = list(message.get("headers") or []) + [
+                            (TRACE_ID_RESPONSE_HEADER, span.trace_id.encode())
+                        ]
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_trace_id)
+            finally:
+                route = route_template(scope)
+                span.name = f"{scope['method']} {route}"
+                span.set_attributes({"http.route": route, "http.status_code": status[0]})
+                if status[0] >= 500:
+                    span.status = "error"
+
+
+def install_tracing(app, service: str) -> None:
+    """FastAPI 앱에 요청 스팬 미들웨어 등록 (Mongo/Redis 스팬 포함)"""
+    configure_tracing(service)
+    install_mongo_tracing()
+    app.add_middleware(TracingMiddleware, service=service)
+
+
+# ---------- MongoDB ----------
+
+class MongoCommandTracer(monitoring.CommandListener):
+    """pymongo 명령 모니터링으로 Motor/pymongo 명령 스팬 기록 (진행 중인 스팬이 있을 때만)"""
+
+    def __init__(self):
+        self._pending: Dict[Any, Span] = {}
+
+    def started(self, event):
+        collection = event.command.get(event.command_name)
+        span = begin_span(f"mongo {event.command_name}", kind="client", attributes={
+            "db.system": "mongodb",
+            "db.operation": event.command_name,
+            "db.mongodb.collection": collection if isinstance(collection, str) else None,
+        })
+        if span is not NOOP_SPAN:
+            self._pending[(event.connection_id, event.request_id)] = span
+
+    def succeeded(self, event):
+        span = self._pending.pop((event.connection_id, event.request_id), None)
+        if span is not None:
+            span.end()
+
+    def failed(self, event):
+        span = self._pending.pop((event.connection_id, event.request_id), None)
+        if span is not None:
+            span.status = "error"
+            span.set_attribute("exception.message", str(event.failure)[:500])
+            span.end()
+
+
+_mongo_tracer: Optional[MongoCommandTracer] = None
+
+
+def install_mongo_tracing() -> None:
+    global _mongo_tracer
+    if _mongo_tracer is None:
+        _mongo_tracer = MongoCommandTracer()
+        monitoring.register(_mongo_tracer)
+
+
+# ---------- Celery ----------
+
+_task_spans: Dict[str, Tuple[Any, Optional[contextvars.Token]]] = {}
+
+
+def _on_task_prerun(task_id=None, task=None, **_):
+    from shared.utils.metrics import queue_wait_seconds
+
+    wait = queue_wait_seconds(task.request)
+    span = begin_span(f"celery.task {task.name}", kind="consumer", root=True,
+                      parent=parse_traceparent(getattr(task.request, TRACEPARENT_HEADER, None)),
+                      attributes={
+                          "celery.task_name": task.name,
+                          "celery.task_id": task_id,
+                          "celery.queue_wait_ms": round(wait * 1000, 1) if wait is not None else None,
+                          "celery.retries": getattr(task.request, "retries", None),
+                      })
+    _task_spans[task_id] = (span, activate(span))
+
+
+def _on_task_postrun(task_id=None, state=None, **_):
+    span, token = _task_spans.pop(task_id, (None, None))
+    if span is None or span is NOOP_SPAN:
+        return
+    _end_stage(span)
+    deactivate(token)
+    span.set_attribute("celery.state", state)
+    if state == "FAILURE":
+        span.status = "error"
+    span.end()
+
+
+def install_worker_tracing(service: str) -> None:
+    """워커 앱용 Celery 시그널 연결 (메시지 헤더의 traceparent로 작업 스팬 시작)"""
+    from celery import signals
+
+    configure_tracing(f"{service}-worker")
+    install_mongo_tracing()
+    signals.task_prerun.connect(_on_task_prerun, weak=False)
+    signals.task_postrun.connect(_on_task_postrun, weak=False)
+
+
+# ---------- 내보내기 ----------
+
+_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+_exporter_thread: Optional[threading.Thread] = None
+_exporter_lock = threading.Lock()
+
+
+def _submit(span: Span) -> None:
+    if _exporter_thread is None:
+        _start_exporter()
+    _queue.put(span)
+
+
+def _attribute_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp(spans: List[Span]) -> Dict[str, Any]:
+    """OTLP/HTTP JSON 요청 본문 (서비스별 resourceSpans)"""
+    by_service: Dict[str, List[Span]] = {}
+    for span in spans:
+        by_service.setdefault(span.service, []).append(span)
+    return {"resourceSpans": [
+        {
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service}}]},
+            "scopeSpans": [{
+                "scope": {"name": "shared.utils.tracing"},
+                "spans": [{
+                    "traceId": span.trace_id,
+                    "spanId": span.span_id,
+                    "parentSpanId": span.parent_id or "",
+                    "name": span.name,
+                    "kind": SPAN_KINDS.get(span.kind, 1),
+                    "startTimeUnixNano": str(span.start_ns),
+                    "endTimeUnixNano": str(span.end_ns),
+                    "attributes": [{"key": k, "value": _attribute_value(v)} for k, v in span.attributes.items()],
+                    "status": {"code": 2 if span.status == "error" else 1},
+                } for span in service_spans],
+            }],
+        }
+        for service, service_spans in by_service.items()
+    ]}
+
+
+def _export(spans: List[Span]) -> None:
+    if not spans:
+        return
+    exporter = str(settings.tracing_exporter or EXPORTER_NONE).lower()
+    try:
+        if exporter == EXPORTER_FILE:
+            lines = "".join(json.dumps(span.to_dict(), ensure_ascii=False, default=str) + "\n" for span in spans)
+            fd = os.open(settings.tracing_file_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                # 여러 프로세스가 같은 파일에 기록하므로 배치를 한 번에 append
+                os.write(fd, lines.encode("utf-8"))
+            finally:
+                os.close(fd)
+        elif exporter == EXPORTER_OTLP:
+            request = urllib.request.Request(
+                settings.tracing_otlp_endpoint, data=json.dumps(to_otlp(spans)).encode("utf-8"),
+                headers={"Content-Type": "application/json"}, method="POST",
+            )
+            urllib.request.urlopen(request, timeout=5).close()
+    except Exception as e:
+        logger.warning("Failed to export %d spans (%s): %s", len(spans), exporter, e)
+
+
+def _export_loop(spans: "queue.SimpleQueue") -> None:
+    """배치가 차거나 TRACING_EXPORT_INTERVAL_SECONDS가 지나면 내보냄 (Event는 flush 요청)"""
+    batch: List[Span] = []
+    first_at = 0.0
+    while True:
+        timeout = None
+        if batch:
+            timeout = max(first_at + float(settings.tracing_export_interval_seconds) - time.monotonic(), 0)
+        try:
+            item = spans.get(timeout=timeout)
+        except queue.Empty:
+            item = None
+        if isinstance(item, threading.Event):
+            _export(batch)
+            batch = []
+            item.set()
+            continue
+        if item is not None:
+            if not batch:
+                first_at = time.monotonic()
+            batch.append(item)
+            if len(batch) < _EXPORT_BATCH and time.monotonic() - first_at < float(settings.tracing_export_interval_seconds):
+                continue
+        _export(batch)
+        batch = []
+
+
+def _start_exporter() -> None:
+    global _exporter_thread
+    with _exporter_lock:
+        if _exporter_thread is None:
+            thread = threading.Thread(target=_export_loop, args=(_queue,), name="trace-exporter", daemon=True)
+            thread.start()
+            _exporter_thread = thread
+
+
+def flush_traces(timeout: float = 5.0) -> None:
+    """대기 중인 스팬을 모두 내보냄 (종료 시, 테스트/오프라인 분석 전)"""
+    if _exporter_thread is None:
+        return
+    done = threading.Event()
+    _queue.put(done)
+    done.wait(timeout)
+
+
+def _reset_after_fork() -> None:
+    """fork된 자식(Celery prefork 워커)에는 내보내기 스레드가 없으므로 새 큐로 교체"""
+    global _queue, _exporter_thread, _exporter_lock
+    _queue = queue.SimpleQueue()
+    _exporter_thread = None
+    _exporter_lock = threading.Lock()
+
+
+atexit.register(flush_traces)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+# ---------- 오프라인 분석 ----------
+
+def load_traces(path: str) -> Dict[str, List[Dict[str, Any]]]:
+    """JSON Lines 스팬 파일 → trace_id별 스팬 목록"""
+    traces: Dict[str, List[Dict[str, Any]]] = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                span = json.loads(line)
+                traces.setdefault(span["trace_id"], []).append(span)
+    return traces
+
+
+def trace_duration_ms(spans: List[Dict[str, Any]]) -> float:
+    return (max(s["end_ns"] for s in spans) - min(s["start_ns"] for s in spans)) / 1e6
+
+
+_SUMMARY_ATTRIBUTES = ("http.status_code", "celery.queue_wait_ms", "llm.provider", "llm.tokens.input",
+                       "llm.tokens.cached", "llm.tokens.output", "db.mongodb.collection", "exception.type")
+
+
+def format_trace(spans: List[Dict[str, Any]]) -> str:
+    """
+    trace 하나의 워터폴 (시작 오프셋, 소요 시간, 스팬 트리)
+
+    스팬 사이의 빈 구간(부모 안에서 자식 스팬이 없는 시간)도 함께 표시해 큐 대기 등 스팬 밖 시간을 드러낸다.
+    """
+    origin = min(s["start_ns"] for s in spans)
+    ids = {s["span_id"] for s in spans}
+    children: Dict[Optional[str], List[Dict[str, Any]]] = {}
+    for span in spans:
+        parent = span["parent_id"] if span["parent_id"] in ids else None
+        children.setdefault(parent, []).append(span)
+    for siblings in children.values():
+        siblings.sort(key=lambda s: s["start_ns"])
+
+    lines = [f"trace {spans[0]['trace_id']} ({trace_duration_ms(spans):.1f}ms, {len(spans)} spans)"]
+
+    def walk(parent_id: Optional[str], depth: int, cursor: Optional[int]):
+        for span in children.get(parent_id, []):
+            if cursor is not None and span["start_ns"] - cursor >= 1_000_000:
+                lines.append(f"{'':>10} {'':>10}  {'  ' * depth}(gap {(span['start_ns'] - cursor) / 1e6:.1f}ms)")
+            details = ", ".join(f"{k}={span['attributes'][k]}" for k in _SUMMARY_ATTRIBUTES
+                                if span["attributes"].get(k) is not None)
+            marker = " !" if span["status"] == "error" else ""
+            lines.append(f"{(span['start_ns'] - origin) / 1e6:>9.1f}ms {span['duration_ms']:>8.1f}ms  "
+                         f"{'  ' * depth}{span['name']} [{span['service']}]{marker}"
+                         f"{f' ({details})' if details else ''}")
+            walk(span["span_id"], depth + 1, span["start_ns"])
+            cursor = max(cursor or 0, span["end_ns"])
+
+    walk(None, 0, None)
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="트레이스 파일(JSON Lines) 워터폴 보기")
+    parser.add_argument("path", help="TRACING_EXPORTER=file로 기록한 스팬 파일")
+    parser.add_argument("--trace", help="trace_id (응답 x-trace-id 헤더 값)")
+    parser.add_argument("--slowest", type=int, default=3, help="trace_id를 지정하지 않으면 가장 느린 N개")
+    args = parser.parse_args(argv)
+
+    traces = load_traces(args.path)
+    if args.trace:
+        selected = [traces[args.trace]] if args.trace in traces else []
+    else:
+        selected = sorted(traces.values(), key=trace_duration_ms, reverse=True)[:args.slowest]
+    if not selected:
+        print("no matching traces")
+    print("\n\n".join(format_trace(spans) for spans in selected))
+
+
+if __name__ == "__main__":
+    main()
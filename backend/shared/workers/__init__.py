@@ -0,0 +1,6 @@
+"""
+서비스별 Celery 워커 진입점
+
+    celery -A shared.workers.interview worker -Q interview_queue.v2
+    celery -A shared.workers.learning worker -Q learning_queue.v2
+"""
@@ -0,0 +1,7 @@
+"""
+Interview Service Celery 워커 앱
+"""
+
+from shared.celery_app import create_celery_app
+
+app = create_celery_app("interview")
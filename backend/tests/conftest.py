@@ -11,6 +11,91 @@ from unittest.mock import MagicMock, patch
 from dotenv import load_dotenv
 from tests.test_config import TestAppSettings
 
+class FakeRedis:
+    """단위 테스트용 메모리 Redis (문자열/집합 명령과 파이프라인만 지원)"""
+
+    def __init__(self):
+        self.store = {}
+        self.sets = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def mget(self, keys):
+        return [self.store.get(key) for key in keys]
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+        return True
+
+    def incr(self, key):
+        self.store[key] = int(self.store.get(key, 0)) + 1
+        return self.store[key]
+
+    def expire(self, key, ttl):
+        return True
+
+    def delete(self, key):
+        self.store.pop(key, None)
+        self.sets.pop(key, None)
+
+    def sadd(self, key, member):
+        self.sets.setdefault(key, set()).add(member.encode())
+
+    def srem(self, key, member):
+        self.sets.get(key, set()).discard(member.encode())
+
+    def smembers(self, key):
+        return set(self.sets.get(key, set()))
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+class FakePipeline:
+    """명령을 모아 두었다가 execute()에서 순서대로 실행"""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    def execute(self):
+        return [getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+class FakeRouter:
+    """
+    정해진 응답을 돌려주고 호출/파싱 결과를 기록하는 가짜 LLM 라우터
+
+    Args:
+        response: 응답 텍스트 또는 메시지 목록을 받아 응답 텍스트를 돌려주는 함수
+        delay: 응답 전 대기 시간 (초)
+    """
+
+    def __init__(self, response="", delay=0.0):
+        self.response = response
+        self.delay = delay
+        self.calls = []
+        self.parses = []
+
+    async def ainvoke(self, messages, preferred=None, client_options=None, **kwargs):
+        self.calls.append((messages, client_options, kwargs))
+        await asyncio.sleep(self.delay)
+        client = MagicMock()
+        client.name = "gemini"
+        client._model = "gemini-model"
+        return (self.response(messages) if callable(self.response) else self.response), client
+
+    def record_parse(self, client, parsed, structured=False):
+        self.parses.append(parsed)
+
 @pytest.fixture(scope="session", autouse=True)
 def app_settings() -> TestAppSettings:
     """Override application settings for testing"""
@@ -115,4 +200,14 @@ def mock_redis():
 def mock_rabbitmq():
     """Mock RabbitMQ connection"""
     with patch('kombu.Connection') as mock:
-        yield mock
\ No newline at end of file
+        yield mock
+
+@pytest.fixture
+def memory_redis():
+    """메모리 Redis (테스트 대상 모듈의 get_redis_client를 patch해서 사용)"""
+    return FakeRedis()
+
+@pytest.fixture
+def make_fake_router():
+    """가짜 LLM 라우터 생성 함수 (FakeRouter(response, delay))"""
+    return FakeRouter
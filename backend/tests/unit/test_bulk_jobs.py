@@ -0,0 +1,193 @@
+"""
+대량(Bulk) 생성 작업 유틸리티 단위 테스트 (Redis/Celery 호출 없음)
+"""
+import importlib.util
+import os
+import sys
+
+import pytest
+from celery import Celery
+from celery.exceptions import SoftTimeLimitExceeded
+from unittest.mock import MagicMock, patch
+
+from shared.celery_app import WORKER_SERVICE_DIRS
+from shared.jobs import bulk
+from shared.jobs.bulk import split_into_lanes, build_progress_snapshot, build_resume_filter
+
+class TestBulkJobLanes:
+    """레인 분할 테스트"""
+
+    def test_lanes_bounded_by_concurrency(self):
+        """
+        시나리오: 동시 실행 수 제한
+        Given: 10개의 이력서 키와 동시 실행 수 3이 주어지고
+        When: 레인을 분할하면
+        Then: 3개의 레인에 모든 키가 고르게 분배된다
+        """
+        # Given
+        unique_keys = [f"개발자_{i}" for i in range(10)]
+
+        # When
+        lanes = split_into_lanes(unique_keys, 3)
+
+        # Then
+        assert len(lanes) == 3
+        assert sorted(key for lane in lanes for key in lane) == sorted(unique_keys)
+        assert max(len(lane) for lane in lanes) - min(len(lane) for lane in lanes) <= 1
+
+    @pytest.mark.parametrize("unique_keys,concurrency,expected_lanes", [
+        ([], 4, 0),
+        (["a_1"], 4, 1),
+        (["a_1", "b_1"], 0, 1),
+    ])
+    def test_lane_count_edge_cases(self, unique_keys, concurrency, expected_lanes):
+        """
+        시나리오: 대상이 동시 실행 수보다 적거나 없는 경우
+        Then: 빈 레인을 만들지 않는다
+        """
+        assert len(split_into_lanes(unique_keys, concurrency)) == expected_lanes
+
+class TestBulkJobProgress:
+    """진행률 스냅샷 테스트"""
+
+    def test_progress_snapshot_with_eta(self):
+        """
+        시나리오: 진행 중인 작업의 진행률과 ETA 계산
+        Given: 10건 중 4건 완료, 1건 실패, 평균 10초, 레인 2개인 작업이 주어지고
+        When: 스냅샷을 구성하면
+        Then: 진행률 50%와 남은 5건에 대한 ETA 25초가 계산된다
+        """
+        # Given
+        raw = {
+            b"job_type": b"interview", b"state": b"PROGRESS", b"total": b"10",
+            b"done": b"4", b"failed": b"1", b"skipped": b"0", b"running": b"2",
+            b"concurrency": b"2", b"duration_sum": b"50.0",
+        }
+
+        # When
+        snapshot = build_progress_snapshot("job-1", raw)
+
+        # Then
+        assert snapshot["progress"] == 50
+        assert snapshot["eta_seconds"] == 25.0
+        assert snapshot["running"] == 2
+
+    def test_progress_snapshot_not_found(self):
+        """
+        시나리오: 존재하지 않는 작업 조회
+        Then: NOT_FOUND 상태가 반환된다
+        """
+        assert build_progress_snapshot("missing", {})["state"] == "NOT_FOUND"
+
+    def test_terminal_state_has_no_eta(self):
+        """
+        시나리오: 취소된 작업
+        Then: ETA를 계산하지 않는다
+        """
+        raw = {"state": "CANCELLED", "total": "4", "done": "1", "skipped": "3", "duration_sum": "5"}
+        snapshot = build_progress_snapshot("job-2", raw)
+        assert snapshot["eta_seconds"] is None
+        assert snapshot["progress"] == 100
+
+class TestBulkResumeFilter:
+    """대상 이력서 조회 조건 변환 테스트"""
+
+    def test_experience_range_filter(self):
+        """
+        시나리오: 이름과 경력 범위 조건 변환
+        Then: MongoDB 범위 필터가 생성된다
+        """
+        resume_filter = build_resume_filter({
+            "name": "윤정은", "min_experience_months": 12, "max_experience_months": 36
+        })
+        assert resume_filter == {
+            "name": "윤정은",
+            "total_experience_months": {"$gte": 12, "$lte": 36}
+        }
+
+    def test_empty_query(self):
+        """조건이 없으면 빈 필터가 생성된다"""
+        assert build_resume_filter({"name": None}) == {}
+
+_SERVICE_LOCAL_MODULES = ("config", "src", "src.schemas")
+
+
+@pytest.fixture
+def learning_tasks(monkeypatch):
+    """learning-service tasks 모듈 (서비스 로컬 config/src 모듈은 테스트 후 원래대로)"""
+    service_dir = WORKER_SERVICE_DIRS["learning"]
+    monkeypatch.setattr(sys, "path", [service_dir] + sys.path)
+    saved = {name: sys.modules.pop(name) for name in _SERVICE_LOCAL_MODULES if name in sys.modules}
+    spec = importlib.util.spec_from_file_location("learning_tasks_under_test", os.path.join(service_dir, "tasks.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    yield module
+    for name in _SERVICE_LOCAL_MODULES:
+        sys.modules.pop(name, None)
+    sys.modules.update(saved)
+
+
+class TestBulkLaneTimeLimits:
+    """레인 태스크 시간 제한 테스트"""
+
+    def test_lane_limits_scale_with_lane_size(self):
+        """
+        시나리오: 항목 10개를 레인 4개로 나눠 대량 작업 시작
+        Then: 각 레인 태스크의 soft/hard 제한이 전역 제한(항목 하나 기준) × 레인 항목 수로 설정된다
+        """
+        with patch.object(bulk, "get_redis_client", return_value=MagicMock()), \
+             patch.object(bulk, "chord") as chord, \
+             patch.object(bulk.settings, "celery_task_soft_time_limit", 90), \
+             patch.object(bulk.settings, "celery_task_time_limit", 120), \
+             patch.object(bulk.settings, "bulk_job_max_concurrency", 4):
+            bulk.create_bulk_job(Celery("test"), "interview", [f"resume-{i}" for i in range(10)], concurrency=4)
+
+        header = chord.call_args.args[0]
+        for lane in header:
+            lane_size = len(lane.args[1])
+            assert lane.options["soft_time_limit"] == 90 * lane_size
+            assert lane.options["time_limit"] == 120 * lane_size
+
+    def test_lane_returns_after_soft_limit(self, learning_tasks):
+        """
+        시나리오: 실제 생성 태스크로 레인 실행, 두 번째 항목 실행 중 soft 제한 초과
+        Then: 일반 오류 항목은 실패로 계속 진행하고, 시간 초과 항목 이후 남은 항목은 건너뜀으로 집계한 뒤
+              레인이 정상 반환한다 (chord 콜백 실행 보장)
+        """
+        errors = {"resume-0": ValueError("broken resume"), "resume-1": SoftTimeLimitExceeded()}
+
+        def find_one(query):
+            raise errors[query["unique_key"]]
+
+        database = MagicMock()
+        database.resumes.find_one.side_effect = find_one
+
+        with patch.object(bulk, "get_redis_client", return_value=MagicMock()), \
+             patch.object(learning_tasks, "get_database", return_value=database), \
+             patch.object(learning_tasks, "set_task_progress"), \
+             patch.object(learning_tasks, "finish_generation"):
+            lane_result = bulk.run_bulk_lane("job-1", ["resume-0", "resume-1", "resume-2", "resume-3"],
+                                             learning_tasks.generate_learning_path_async)
+
+        assert [item["unique_key"] for item in lane_result["failed"]] == ["resume-0", "resume-1"]
+        assert lane_result["skipped"] == ["resume-2", "resume-3"]
+        assert database.resumes.find_one.call_count == 2
+
+    def test_soft_limit_between_items(self):
+        """
+        시나리오: 항목 결과를 Redis에 기록하는 도중 soft 제한 초과
+        Then: 기록되지 않은 현재 항목부터 건너뜀으로 집계하고 실행 중 카운터를 되돌린 뒤 반환한다
+        """
+        redis = MagicMock()
+        redis.pipeline.return_value.execute.side_effect = [None, SoftTimeLimitExceeded()]
+        generate_task = MagicMock()
+        generate_task.apply.return_value.successful.return_value = True
+        generate_task.apply.return_value.result = {"ok": True}
+
+        with patch.object(bulk, "get_redis_client", return_value=redis):
+            lane_result = bulk.run_bulk_lane("job-1", ["resume-0", "resume-1", "resume-2"], generate_task)
+
+        assert [item["unique_key"] for item in lane_result["succeeded"]] == ["resume-0"]
+        assert lane_result["skipped"] == ["resume-1", "resume-2"]
+        redis.hincrby.assert_any_call(bulk._job_key("job-1"), "running", -1)
+        redis.hincrby.assert_any_call(bulk._job_key("job-1"), "skipped", 2)
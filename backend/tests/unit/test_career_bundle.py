@@ -0,0 +1,98 @@
+"""
+커리어 번들(면접 질문 + 학습 경로) 생성 단위 테스트
+"""
+import json
+import time
+import pytest
+from unittest.mock import patch
+
+from shared.generation import career_bundle
+from shared.generation.career_bundle import generate_career_bundle, BUNDLE_MODE_MERGED
+
+INTERVIEW_RESPONSE = json.dumps({"questions": [{"difficulty": "medium", "topic": "Kafka", "question": "Q"}] * 6})
+LEARNING_RESPONSE = json.dumps({
+    "analysis": {"strengths": ["Kafka"], "weaknesses": ["모니터링"]},
+    "summary": "요약",
+    "learning_paths": [{"title": "Prometheus"}],
+})
+MERGED_RESPONSE = json.dumps({
+    "interview": json.loads(INTERVIEW_RESPONSE),
+    "learning": json.loads(LEARNING_RESPONSE),
+})
+
+def _respond(messages):
+    """프롬프트 내용으로 작업(합침/면접/학습)을 구분해 응답"""
+    system_prompt = messages[0].content
+    if "[작업 1" in system_prompt:
+        return MERGED_RESPONSE
+    if "면접" in system_prompt:
+        return INTERVIEW_RESPONSE
+    return LEARNING_RESPONSE
+
+@pytest.fixture
+def resume_data(test_resume_data):
+    return {**test_resume_data, "id": "resume-1"}
+
+@pytest.fixture
+def no_condense():
+    async def identity(resume):
+        return resume
+    with patch.object(career_bundle, "condense_resume", side_effect=identity):
+        yield
+
+class TestCareerBundle:
+    """번들 생성 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_mode_runs_generations_in_parallel(self, resume_data, no_condense, make_fake_router):
+        """
+        시나리오: 면접/학습 생성을 한 번에 요청
+        Then: 두 LLM 호출이 동시에 실행되어 전체 시간이 호출 하나의 시간에 가깝다
+        """
+        router = make_fake_router(_respond, delay=0.3)
+        with patch.object(career_bundle, "llm_router", make_fake_router(_respond)):
+            await generate_career_bundle(resume_data)  # 프롬프트 로드/임포트 워밍업
+        with patch.object(career_bundle, "llm_router", router):
+            started = time.perf_counter()
+            bundle = await generate_career_bundle(resume_data)
+            elapsed = time.perf_counter() - started
+
+        assert len(router.calls) == 2
+        assert all(call[2]["record_latency"] is True for call in router.calls)
+        assert elapsed < 0.5
+        assert len(bundle["interview"]["questions"]) == 5
+        assert bundle["learning"]["learning_paths"] == [{"title": "Prometheus"}]
+        assert bundle["interview"]["prompt_tokens"] > 0
+        assert router.parses == [True, True]
+
+    @pytest.mark.asyncio
+    async def test_resume_is_formatted_once(self, resume_data, no_condense, make_fake_router):
+        """두 프롬프트가 같은 포맷팅 결과를 사용한다"""
+        router = make_fake_router(_respond)
+        with patch.object(career_bundle, "llm_router", router), \
+             patch.object(career_bundle, "format_resume_for_ai", wraps=career_bundle.format_resume_for_ai) as formatter:
+            await generate_career_bundle(resume_data)
+        assert formatter.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_merged_mode_uses_single_call(self, resume_data, no_condense, make_fake_router):
+        """
+        시나리오: merged 모드
+        Then: 합쳐진 스키마로 LLM을 한 번만 호출하고 두 결과로 분리한다
+        """
+        router = make_fake_router(_respond)
+        with patch.object(career_bundle, "llm_router", router):
+            bundle = await generate_career_bundle(resume_data, mode=BUNDLE_MODE_MERGED)
+
+        assert len(router.calls) == 1
+        # 두 배 분량 출력의 지연은 단일 생성과 같은 p95 통계에 반영하지 않는다
+        assert router.calls[0][2]["record_latency"] is False
+        assert bundle["mode"] == BUNDLE_MODE_MERGED
+        assert len(bundle["interview"]["questions"]) == 5
+        assert bundle["learning"]["summary"] == "요약"
+        assert bundle["interview"]["provider"] == bundle["learning"]["provider"] == "gemini"
+
+    @pytest.mark.asyncio
+    async def test_unknown_mode(self, resume_data):
+        with pytest.raises(ValueError):
+            await generate_career_bundle(resume_data, mode="sequential")
@@ -0,0 +1,53 @@
+"""
+서비스별 Celery 앱 팩토리 단위 테스트 (브로커 연결 없음)
+"""
+import sys
+import pytest
+
+from shared.celery_app import create_celery_app, WORKER_SERVICE_DIRS
+
+class TestCeleryAppFactory:
+    """producer/워커 앱 구성 테스트"""
+
+    def test_producer_app_does_not_load_tasks(self):
+        """
+        시나리오: API 프로세스용 producer 앱 생성
+        Given: 서비스 이름 없이
+        When: 앱을 생성하면
+        Then: 워커 tasks 모듈을 로드하지 않고 라우팅 설정만 가진다
+        """
+        app = create_celery_app()
+
+        assert tuple(app.conf.imports) == ()
+        assert app.conf.task_routes['tasks.*'] == {'queue': 'interview_queue.v2'}
+
+    @pytest.mark.parametrize("service", ["interview", "learning"])
+    def test_worker_app_resolves_service_dir(self, service, monkeypatch):
+        """
+        시나리오: 작업 디렉토리와 무관한 워커 앱 생성
+        Then: 해당 서비스 디렉토리의 tasks 모듈이 워커 기동 시 로드되도록 설정된다
+        """
+        monkeypatch.setattr(sys, "path", list(sys.path))
+        monkeypatch.chdir("/")
+
+        app = create_celery_app(service)
+
+        assert tuple(app.conf.imports) == ("tasks",)
+        assert sys.path[0] == WORKER_SERVICE_DIRS[service]
+
+    def test_priority_queues_do_not_redeclare_legacy_queues(self):
+        """
+        시나리오: 우선순위 인자 없이 선언됐던 interview_queue/learning_queue가 브로커에 남아 있음
+        Then: x-max-priority 큐는 다른 이름/라우팅 키로 선언되어 재선언 충돌(PRECONDITION_FAILED)이 없다
+        """
+        queues = create_celery_app().conf.task_queues
+        priority_queues = {name: queue for name, queue in queues.items() if "queue_arguments" in queue}
+
+        assert set(priority_queues) == {"interview_queue.v2", "learning_queue.v2"}
+        assert not {"interview_queue", "learning_queue"} & set(queues)
+        assert {queue["routing_key"] for queue in priority_queues.values()}.isdisjoint({"interview", "learning"})
+
+    def test_unknown_service(self):
+        """알 수 없는 서비스 이름이면 ValueError가 발생한다"""
+        with pytest.raises(ValueError):
+            create_celery_app("resume")
@@ -0,0 +1,69 @@
+"""
+프롬프트 입력 지문 기반 생성 결과 재사용 단위 테스트
+"""
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from bson import ObjectId
+
+from shared.utils.resume_formatter import prompt_input_fingerprint, compute_prompt_fingerprints
+from shared.database.generations import find_reusable_generation, serialize_generation
+
+class TestPromptInputFingerprint:
+    """지문 계산 테스트"""
+
+    def test_contact_change_keeps_fingerprint(self, test_resume_data):
+        """
+        시나리오: 프롬프트에 쓰이지 않는 연락처만 수정
+        Then: 두 생성 종류 모두 지문이 같다
+        """
+        edited = {**test_resume_data, "contact": {**test_resume_data["contact"], "phone": "010-9999-9999"}}
+        assert compute_prompt_fingerprints(edited) == compute_prompt_fingerprints(test_resume_data)
+
+    def test_achievement_change_alters_fingerprint(self, test_resume_data):
+        """
+        시나리오: 경력 성과 문장 수정
+        Then: 면접 질문 지문이 바뀌어 재생성 대상이 된다
+        """
+        experiences = [dict(exp) for exp in test_resume_data["work_experiences"]]
+        experiences[0]["achievements"] = list(experiences[0].get("achievements", [])) + ["결제 장애율 80% 감소"]
+        edited = {**test_resume_data, "work_experiences": experiences}
+        assert prompt_input_fingerprint("interview", edited) != prompt_input_fingerprint("interview", test_resume_data)
+
+class TestReusableGeneration:
+    """기존 생성 결과 조회 테스트"""
+
+    def test_queries_latest_by_fingerprint_and_prompt_version(self):
+        """
+        시나리오: 프롬프트 핫 리로드(내용 해시)나 실험 변형 배정이 바뀐 뒤 같은 이력서로 재요청
+        Then: 입력 지문뿐 아니라 지금 프롬프트의 내용 해시/변형이 같은 결과만 재사용 대상이다
+        """
+        collection = MagicMock()
+        version = {"name": "interview_questions_generation", "version": "1.0.0", "hash": "abc123"}
+        find_reusable_generation(collection, "테스트개발자_1", "abc", version)
+        collection.find_one.assert_called_once_with(
+            {"unique_key": "테스트개발자_1", "input_fingerprint": "abc",
+             "prompt_version.hash": "abc123", "prompt_version.variant": None},
+            sort=[("created_at", -1)]
+        )
+
+        collection.reset_mock()
+        find_reusable_generation(collection, "테스트개발자_1", "abc",
+                                 {**version, "experiment": "interview_questions", "variant": "concise"})
+        assert collection.find_one.call_args.args[0]["prompt_version.variant"] == "concise"
+
+    def test_fallback_prompt_reuses_only_unversioned_results(self):
+        """
+        시나리오: 프롬프트 파일을 로드할 수 없어 폴백 프롬프트로 생성하는 상황
+        Then: 버전 표시 없는(폴백 프롬프트) 결과만 재사용 대상이다
+        """
+        collection = MagicMock()
+        find_reusable_generation(collection, "테스트개발자_1", "abc", None)
+        assert collection.find_one.call_args.args[0] == {
+            "unique_key": "테스트개발자_1", "input_fingerprint": "abc", "prompt_version": None
+        }
+
+    def test_serialize_generation(self):
+        object_id = ObjectId()
+        serialized = serialize_generation({"_id": object_id, "created_at": datetime(2024, 1, 1), "questions": []})
+        assert serialized == {"_id": str(object_id), "created_at": "2024-01-01T00:00:00", "questions": []}
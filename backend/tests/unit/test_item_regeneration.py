@@ -0,0 +1,95 @@
+"""
+면접 질문/학습 경로 항목 부분 재생성 단위 테스트
+"""
+import json
+import pytest
+from unittest.mock import patch
+
+from shared.generation import item_regeneration
+from shared.generation.item_regeneration import (
+    resolve_item_index,
+    build_item_messages,
+    parse_item_payload,
+    regenerate_item,
+    build_revision,
+)
+from shared.llm.prompt_cache import split_cache_prefix
+from shared.prompts.loader import get_prompt_loader
+from shared.utils.resume_formatter import format_resume_for_interview
+
+QUESTIONS = [
+    {"difficulty": "medium", "topic": f"주제{i}", "question": f"질문{i}"} for i in range(5)
+]
+NEW_QUESTION = {"difficulty": "hard", "topic": "Kafka, 재처리", "question": "컨슈머 재처리 전략은?"}
+
+@pytest.fixture
+def no_condense():
+    async def identity(resume):
+        return resume
+    with patch.object(item_regeneration, "condense_resume", side_effect=identity):
+        yield
+
+class TestItemRegeneration:
+    """부분 재생성 테스트"""
+
+    def test_resolve_by_index_or_topic(self):
+        assert resolve_item_index("interview", QUESTIONS, index=3) == 3
+        assert resolve_item_index("interview", QUESTIONS, topic="주제2") == 2
+
+    @pytest.mark.parametrize("kwargs", [{}, {"index": 1, "topic": "주제1"}, {"index": 5}, {"topic": "없는주제"}])
+    def test_resolve_rejects_invalid_target(self, kwargs):
+        with pytest.raises(ValueError):
+            resolve_item_index("interview", QUESTIONS, **kwargs)
+
+    def test_prompt_lists_kept_items_as_context(self, test_resume_data):
+        """
+        시나리오: 3번째 질문만 재생성
+        Then: 나머지 질문은 중복 방지 컨텍스트로, 교체 대상은 별도로 전달된다
+        """
+        messages = build_item_messages("interview", format_resume_for_interview(test_resume_data), QUESTIONS, 2)
+        human = messages[1].content
+        kept_section = human.split("유지할 기존")[1].split("교체할")[0]
+        assert all(f"질문{i}" in kept_section for i in (0, 1, 3, 4))
+        assert "질문2" not in kept_section
+        assert '{"item"' in human
+
+    def test_system_prompt_stays_identical_to_full_generation(self, test_resume_data):
+        """부분 재생성 지시문은 휴먼 프롬프트에 붙어 시스템 프롬프트(캐시 접두부)를 전체 생성과 공유한다"""
+        formatted = format_resume_for_interview(test_resume_data)
+        messages = build_item_messages("interview", formatted, QUESTIONS, 2)
+        loader = get_prompt_loader("interview")
+        full = loader.build_messages(loader.load_prompt_config("interview_questions.yaml"), formatted)
+        assert messages[0].content == full[0].content
+        assert split_cache_prefix(messages)[0] == messages[:1]
+
+    def test_parse_accepts_full_format_fallback(self):
+        assert parse_item_payload("interview", json.dumps({"item": NEW_QUESTION})) == NEW_QUESTION
+        assert parse_item_payload("interview", json.dumps({"questions": [NEW_QUESTION]})) == NEW_QUESTION
+
+    @pytest.mark.asyncio
+    async def test_regenerate_uses_small_output_budget(self, test_resume_data, no_condense, make_fake_router):
+        router = make_fake_router(json.dumps({"item": NEW_QUESTION}))
+        with patch.object(item_regeneration, "llm_router", router):
+            result = await regenerate_item("interview", test_resume_data, QUESTIONS, 1)
+
+        assert result["item"] == NEW_QUESTION
+        assert router.calls[0][1] == {"max_tokens": item_regeneration.settings.item_regeneration_max_tokens}
+        assert router.calls[0][2]["record_latency"] is False
+        assert router.parses == [True]
+
+    def test_revision_shares_untouched_items(self):
+        """
+        시나리오: 최신 리비전에서 질문 하나 교체
+        Then: 새 리비전은 나머지 질문과 입력 지문을 그대로 공유하고 부모를 가리킨다
+        """
+        parent = {"id": "parent-1", "unique_key": "테스트개발자_1", "input_fingerprint": "fp", "questions": QUESTIONS}
+        regenerated = {"item": NEW_QUESTION, "provider": "gemini", "model": "m", "prompt_tokens": 100}
+        revision = build_revision("interview", parent, 1, regenerated)
+
+        assert revision["questions"][1] == NEW_QUESTION
+        assert [q for i, q in enumerate(revision["questions"]) if i != 1] == [q for i, q in enumerate(QUESTIONS) if i != 1]
+        assert revision["parent_id"] == "parent-1"
+        assert revision["revision"] == 2
+        assert revision["input_fingerprint"] == "fp"
+        assert "id" not in revision
+        assert parent["questions"][1] == QUESTIONS[1]
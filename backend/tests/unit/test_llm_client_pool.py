@@ -0,0 +1,71 @@
+"""
+LLM 클라이언트 풀 단위 테스트 (네트워크 호출 없음)
+"""
+import pytest
+from unittest.mock import MagicMock
+
+from shared.llm.pool import LLMClientPool
+
+class TestLLMClientPool:
+    """옵션 조합별 LRU 풀 테스트"""
+
+    def test_reuses_instance_for_same_key(self):
+        """
+        시나리오: 같은 옵션 조합으로 반복 요청
+        Given: 풀에 클라이언트가 한 번 생성되고
+        When: 같은 키로 다시 요청하면
+        Then: 새로 생성하지 않고 기존 인스턴스를 반환한다
+        """
+        pool = LLMClientPool(maxsize=4)
+        factory = MagicMock(side_effect=lambda: MagicMock())
+        key = ("openai", "gpt-4.1", 0.7, 1000, 60)
+
+        first = pool.get_or_create(key, factory)
+        second = pool.get_or_create(key, factory)
+
+        assert first is second
+        assert factory.call_count == 1
+
+    def test_evicts_least_recently_used(self):
+        """
+        시나리오: 풀 크기 초과
+        Given: 크기 2인 풀에 a, b가 있고 a를 최근에 사용했을 때
+        When: c를 추가하면
+        Then: 가장 오래 사용하지 않은 b가 제거된다
+        """
+        pool = LLMClientPool(maxsize=2)
+        for key in ("a", "b"):
+            pool.get_or_create(key, MagicMock)
+        pool.get_or_create("a", MagicMock)
+
+        pool.get_or_create("c", MagicMock)
+
+        assert len(pool) == 2
+        assert "a" in pool and "c" in pool
+        assert "b" not in pool
+
+    def test_failed_creation_not_cached(self):
+        """생성에 실패(None)한 클라이언트는 풀에 저장하지 않는다"""
+        pool = LLMClientPool(maxsize=2)
+        assert pool.get_or_create("broken", lambda: None) is None
+        assert len(pool) == 0
+
+class TestPooledOptions:
+    """옵션 변경 시 인스턴스/커넥션 재사용 테스트"""
+
+    def test_with_options_shares_pool_and_transport(self):
+        """
+        시나리오: 요청 단위 옵션 변경
+        Given: 기본 OpenAI 클라이언트가 있고
+        When: 같은 옵션으로 with_options를 두 번 호출하면
+        Then: 같은 인스턴스가 반환되고 기본 클라이언트와 HTTP 커넥션 풀을 공유한다
+        """
+        pytest.importorskip("langchain_openai")
+        from shared.llm.registry import registry
+
+        base = registry.get_client("openai")
+        tuned = base.with_options(temperature=0.1)
+
+        assert tuned is base.with_options(temperature=0.1)
+        assert tuned is not base
+        assert tuned._llm.async_client._client._client is base._llm.async_client._client._client
@@ -0,0 +1,175 @@
+"""
+적응형 LLM 라우터 단위 테스트 (Redis 미사용 - 프로세스 로컬 통계로 동작)
+"""
+import asyncio
+import threading
+
+import pytest
+from unittest.mock import patch, MagicMock, AsyncMock
+
+from shared.llm import router as router_module
+from shared.llm.router import (
+    LLMRouter,
+    update_ewma_stats,
+    estimate_p95,
+    parse_provider_costs,
+    OBJECTIVE_CHEAPEST_UNDER_SLO,
+)
+
+@pytest.fixture
+def llm_router():
+    """Redis 연결 실패 상태의 라우터 (로컬 통계 사용)"""
+    with patch.object(router_module, "get_redis_client", side_effect=ConnectionError("no redis")), \
+         patch.object(router_module.registry, "get_available_clients", return_value=["gemini", "openai", "claude"]):
+        instance = LLMRouter()
+        instance.refresh_seconds = 0
+        instance.probe_rate = 0
+        yield instance
+
+def _observe(llm_router, provider, latencies, errors=0):
+    for latency in latencies:
+        llm_router.record(provider, latency_ms=latency, error=False)
+    for _ in range(errors):
+        llm_router.record(provider, error=True)
+
+class TestEwmaStats:
+    """EWMA 통계 계산 테스트"""
+
+    def test_first_sample_initializes(self):
+        """첫 관측값으로 평균이 초기화되고 분산은 0이다"""
+        stats = update_ewma_stats({}, 0.2, latency_ms=1000, error=False)
+        assert stats["latency_mean"] == 1000
+        assert estimate_p95(stats) == 1000
+        assert stats["error_rate"] == 0.0
+
+    def test_p95_grows_with_variance(self):
+        """
+        시나리오: 지연 시간 편차가 큰 제공자
+        Then: 추정 p95가 평균보다 커진다
+        """
+        stats = {}
+        for latency in (1000, 3000, 1000, 3000):
+            stats = update_ewma_stats(stats, 0.5, latency_ms=latency)
+        assert estimate_p95(stats) > stats["latency_mean"]
+
+    def test_no_samples(self):
+        """관측이 없으면 p95를 추정하지 않는다"""
+        assert estimate_p95({}) is None
+
+    def test_parse_provider_costs(self):
+        assert parse_provider_costs("gemini:1, openai:3") == {"gemini": 1.0, "openai": 3.0}
+
+class TestRouting:
+    """제공자 선택 테스트"""
+
+    def test_lowest_p95_prefers_fastest(self, llm_router):
+        """
+        시나리오: 지연 시간이 다른 세 제공자
+        Given: openai가 가장 빠르게 관측되고
+        When: lowest_p95 기준으로 순서를 정하면
+        Then: openai가 첫 번째로 선택된다
+        """
+        _observe(llm_router, "gemini", [3000, 3200])
+        _observe(llm_router, "openai", [800, 900])
+        _observe(llm_router, "claude", [5000])
+
+        assert llm_router.rank()[0] == "openai"
+
+    def test_unhealthy_provider_moved_last(self, llm_router):
+        """
+        시나리오: 빠르지만 오류가 잦은 제공자
+        Then: 오류율이 기준을 넘으면 마지막으로 밀려난다
+        """
+        _observe(llm_router, "openai", [500], errors=5)
+        _observe(llm_router, "gemini", [2000])
+        _observe(llm_router, "claude", [2500])
+
+        assert llm_router.rank()[-1] == "openai"
+
+    def test_cheapest_under_slo(self, llm_router):
+        """
+        시나리오: 비용 우선 선택
+        Given: 모든 제공자가 SLO 이내일 때
+        Then: 가장 저렴한 제공자가 선택된다
+        """
+        llm_router.costs = {"gemini": 1, "openai": 3, "claude": 4}
+        _observe(llm_router, "gemini", [4000])
+        _observe(llm_router, "openai", [1000])
+        _observe(llm_router, "claude", [1000])
+
+        assert llm_router.rank(objective=OBJECTIVE_CHEAPEST_UNDER_SLO)[0] == "gemini"
+
+    def test_preferred_provider_first(self, llm_router):
+        """명시적으로 요청된 제공자가 있으면 먼저 시도한다"""
+        _observe(llm_router, "openai", [500])
+        assert llm_router.rank(preferred="claude")[0] == "claude"
+
+    @pytest.mark.asyncio
+    async def test_ainvoke_falls_back_and_records(self, llm_router):
+        """
+        시나리오: 첫 번째 제공자 호출 실패
+        Then: 다음 제공자로 폴백하고 실패가 오류율에 반영된다
+        """
+        failing = MagicMock(name="gemini", _model="g")
+        failing.name = "gemini"
+        failing.ainvoke = AsyncMock(side_effect=RuntimeError("timeout"))
+        working = MagicMock(_model="o")
+        working.name = "openai"
+        working.ainvoke = AsyncMock(return_value="응답")
+        clients = {"gemini": failing, "openai": working, "claude": None}
+
+        with patch.object(router_module.registry, "get_client", side_effect=clients.get):
+            response, client = await llm_router.ainvoke("prompt", preferred="gemini")
+
+        assert response == "응답"
+        assert client is working
+        assert llm_router._local_stats["gemini"]["error_rate"] == 1.0
+        assert llm_router.describe()["recent_decisions"][-1]["order"][0] == "gemini"
+
+    @pytest.mark.asyncio
+    async def test_auxiliary_call_skips_latency_stats(self, llm_router):
+        """
+        시나리오: record_latency=False로 호출한 보조(요약) 호출
+        Then: 성공 여부는 오류율에 반영되지만 지연 시간 표본은 늘지 않는다
+        """
+        working = MagicMock(_model="o")
+        working.name = "openai"
+        working.ainvoke = AsyncMock(return_value="요약")
+        with patch.object(router_module.registry, "get_client", return_value=working):
+            await llm_router.ainvoke("prompt", preferred="openai", record_latency=False)
+
+        stats = llm_router._local_stats["openai"]
+        assert stats["error_rate"] == 0.0
+        assert "latency_samples" not in stats
+
+    @pytest.mark.asyncio
+    async def test_redis_io_runs_off_event_loop(self):
+        """
+        시나리오: 이벤트 루프 안에서 호출 (통계 캐시 만료 상태)
+        Then: 로컬 통계는 즉시 갱신되고, 공유 통계 조회/저장은 루프 스레드가 아닌 스레드에서 실행된다
+        """
+        loop_thread = threading.get_ident()
+        redis_threads = []
+
+        def redis_client():
+            redis_threads.append(threading.get_ident())
+            raise ConnectionError("no redis")
+
+        working = MagicMock(_model="o")
+        working.name = "openai"
+        working.ainvoke = AsyncMock(return_value="응답")
+        with patch.object(router_module, "get_redis_client", side_effect=redis_client), \
+             patch.object(router_module.registry, "get_available_clients", return_value=["openai"]), \
+             patch.object(router_module.registry, "get_client", return_value=working):
+            instance = LLMRouter()
+            instance.refresh_seconds = 0
+            await instance.ainvoke("prompt")
+            assert instance._local_stats["openai"]["latency_samples"] == 1
+            # 조회 1회 + 저장 1회 (저장은 기다리지 않으므로 완료될 때까지 대기)
+            for _ in range(100):
+                if len(redis_threads) >= 2:
+                    break
+                await asyncio.sleep(0.01)
+
+        assert len(redis_threads) == 2
+        assert loop_thread not in redis_threads
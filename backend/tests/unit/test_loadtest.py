@@ -0,0 +1,176 @@
+"""
+부하 테스트 도구 단위 테스트 - 시나리오 설정, 지표 요약, 가상 사용자 실행(SSE 구독 포함), 결과 비교, 자원 샘플링
+"""
+import os
+import random
+import uuid
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
+
+from loadtest.resources import ResourceSampler
+from loadtest.results import build_result, compare_results, load_result, resolve_result, save_result
+from loadtest.runner import Recorder, percentile, run_load
+from loadtest.scenarios import get_scenario
+
+
+def _stub_stack(calls):
+    """세 서비스의 부하 테스트 대상 엔드포인트만 흉내 내는 앱 (학습 경로 비동기 작업은 항상 실패)"""
+    app = FastAPI()
+    generated = set()
+
+    def sse(*events):
+        body = "".join(f"event: {event}\r\ndata: {{}}\r\n\r\n" for event in events)
+        return StreamingResponse(iter([body]), media_type="text/event-stream")
+
+    @app.post("/api/v1/resumes/")
+    async def create_resume(resume: dict):
+        calls["create_resume"] += 1
+        return {"unique_key": f"{resume['name']}_1"}
+
+    @app.get("/api/v1/resumes/{key}")
+    async def get_resume(key: str):
+        return {"unique_key": key}
+
+    @app.post("/api/v1/interview/{key}/questions")
+    async def sync_questions(key: str):
+        generated.add(key)
+        return {"questions": []}
+
+    @app.get("/api/v1/interview/{key}/questions")
+    async def get_questions(key: str):
+        if key not in generated:
+            raise HTTPException(status_code=404)
+        return {"questions": []}
+
+    @app.post("/api/v1/learning/{key}/learning-path")
+    async def sync_learning(key: str):
+        return {"learning_paths": []}
+
+    @app.post("/api/v1/{service}/async/{key}/{kind}")
+    async def submit(service: str, key: str, kind: str):
+        return {"task_id": f"{service}-{uuid.uuid4().hex}"}
+
+    @app.get("/api/v1/{service}/tasks/{task_id}/stream")
+    async def stream(service: str, task_id: str):
+        if service == "learning":
+            return sse("progress", "error", "close")
+        return sse("progress", "progress", "completed", "close")
+
+    return app
+
+
+class TestScenarios:
+    """시나리오 설정 테스트"""
+
+    def test_overrides_and_validation(self):
+        scenario = get_scenario("sse_storm", users=7, duration=None)
+        assert scenario["users"] == 7 and scenario["duration"] == 120 and scenario["watchers"] == 5
+        with pytest.raises(KeyError):
+            get_scenario("unknown")
+        with pytest.raises(KeyError):
+            get_scenario("smoke", mix={"delete_everything": 1})
+
+
+class TestSummary:
+    """지표 요약 테스트"""
+
+    def test_percentiles_error_rates_and_totals(self):
+        assert percentile([], 50) is None
+        assert percentile([10, 20, 30, 40], 50) == 25
+        assert percentile(list(range(1, 101)), 99) == pytest.approx(99.01)
+
+        recorder = Recorder()
+        for latency in (100, 200, 300, 400):
+            recorder.record("get_resume", latency)
+        recorder.record("get_resume", 5000, "ReadTimeout")
+        recorder.record("async_questions.stream", 900)
+
+        summary = recorder.summary(elapsed=2.0)
+        get_resume = summary["operations"]["get_resume"]
+
+        assert get_resume["count"] == 5 and get_resume["error_rate"] == 0.2
+        assert get_resume["throughput_rps"] == 2.5
+        assert get_resume["latency_ms"]["p50"] == 250.0 and get_resume["latency_ms"]["max"] == 400.0
+        assert get_resume["error_kinds"] == {"ReadTimeout": 1}
+        # 하위 측정(.stream)은 합계에서 제외
+        assert summary["totals"]["count"] == 5
+
+
+class TestRunner:
+    """가상 사용자 실행 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_mixed_load_with_sse_watchers(self):
+        """
+        시나리오: 모든 작업을 섞은 짧은 부하, 비동기 작업당 SSE 구독자 2명
+        Then: 작업/하위 측정별로 기록되고, 구독자 수만큼 스트림이 측정되며, 실패 이벤트는 오류로 분류된다
+        """
+        calls = {"create_resume": 0}
+        transport = httpx.ASGITransport(app=_stub_stack(calls))
+        clients = {name: httpx.AsyncClient(transport=transport, base_url="http://test")
+                   for name in ("resume", "interview", "learning")}
+        scenario = get_scenario("smoke", users=3, duration=0.5, watchers=2, think_ms=0, ramp_up=0)
+
+        summary = await run_load(scenario, clients, seed=1)
+        operations = summary["operations"]
+
+        assert {"get_resume", "sync_questions", "async_questions", "async_questions.stream"} <= set(operations)
+        assert operations["async_questions"]["errors"] == 0
+        assert operations["async_questions.stream"]["count"] == 2 * operations["async_questions"]["count"]
+        assert operations["async_learning"]["error_kinds"] == {"sse_error": operations["async_learning"]["count"]}
+        # 사전 준비한 이력서 생성은 측정에서 제외
+        assert calls["create_resume"] == scenario["seed_resumes"] + operations["create_resume"]["count"]
+        assert summary["totals"]["count"] > 0
+
+
+class TestResults:
+    """결과 저장/비교 테스트"""
+
+    @staticmethod
+    def _result(p95, rps, error_rate, commit):
+        summary = {
+            "elapsed_s": 60,
+            "operations": {"get_resume": {
+                "count": 600, "errors": int(600 * error_rate), "error_rate": error_rate, "throughput_rps": rps,
+                "latency_ms": {"p50": 20.0, "p95": p95, "p99": 120.0, "mean": 25.0, "max": 300.0},
+                "error_kinds": {},
+            }},
+            "totals": {"count": 600, "errors": 0, "error_rate": error_rate, "throughput_rps": rps},
+        }
+        result = build_result(get_scenario("mixed"), summary, datetime.now(timezone.utc), "attach")
+        result["meta"]["commit"] = commit
+        return result
+
+    def test_regressions_are_flagged(self):
+        rows = compare_results(self._result(80.0, 10.0, 0.0, "a"), self._result(100.0, 8.5, 0.02, "b"))
+        flagged = {row["metric"] for row in rows if row["regression"]}
+        assert flagged == {"latency_p95_ms", "throughput_rps", "error_rate"}
+
+        unchanged = compare_results(self._result(80.0, 10.0, 0.0, "a"), self._result(84.0, 9.8, 0.005, "b"))
+        assert not any(row["regression"] for row in unchanged)
+
+    def test_results_are_found_by_commit(self, tmp_path):
+        path = save_result(self._result(80.0, 10.0, 0.0, "abc1234def"), tmp_path)
+        assert path.parent.name == "mixed"
+        assert resolve_result("abc1234", "mixed", tmp_path) == path
+        assert load_result(resolve_result(str(path)))["meta"]["commit"] == "abc1234def"
+        with pytest.raises(FileNotFoundError):
+            resolve_result("fff", None, tmp_path)
+
+
+@pytest.mark.skipif(not ResourceSampler.available(), reason="/proc 없음")
+class TestResources:
+    """프로세스 자원 사용량 샘플링 테스트"""
+
+    def test_cpu_and_rss_of_process_tree(self):
+        sampler = ResourceSampler({"self": os.getpid()})
+        sampler.sample(0.0)
+        sum(random.random() for _ in range(200_000))
+        sampler.sample(1.0)
+
+        usage = sampler.summary()["self"]
+        assert usage["rss_mb_max"] > 0 and usage["cpu_percent_max"] >= 0 and usage["processes"] >= 1
@@ -0,0 +1,150 @@
+"""
+구조화 로깅 단위 테스트 - JSON 포맷, PII 마스킹, 샘플링, 지연 포맷, 큐 핸들러
+"""
+import json
+import logging
+import sys
+
+import pytest
+from unittest.mock import patch
+
+from shared.utils import logger as logger_module
+from shared.utils.logger import (
+    REDACTED,
+    JsonFormatter,
+    SamplingFilter,
+    flush_logs,
+    parse_sample_rates,
+    redact,
+    setup_logger,
+)
+
+
+class _CountingArg:
+    """문자열로 변환된 횟수를 세는 로그 인자"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __str__(self):
+        self.calls += 1
+        return "값"
+
+
+def _record(msg, *args, level=logging.INFO, **extra):
+    record = logging.LogRecord("test-service", level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+@pytest.fixture
+def captured(capsys):
+    """출력 스레드를 테스트의 stdout으로 다시 시작하고, 출력된 JSON 레코드 목록을 반환하는 함수 제공"""
+    flush_logs()
+    capsys.readouterr()
+
+    def read():
+        flush_logs()
+        return [json.loads(line) for line in capsys.readouterr().out.splitlines() if line]
+
+    with patch.object(logger_module._settings(), "log_format", "json"):
+        yield read
+
+
+class TestJsonFormatter:
+    """JSON 레코드 형식 테스트"""
+
+    def test_record_has_standard_fields_and_extras(self):
+        line = JsonFormatter(redact_pii=False).format(
+            _record("Selected %d/%d candidates", 5, 8, unique_key="resume-1", selection_ms=12)
+        )
+        payload = json.loads(line)
+
+        assert payload["level"] == "INFO" and payload["logger"] == "test-service"
+        assert payload["message"] == "Selected 5/8 candidates"
+        assert payload["unique_key"] == "resume-1" and payload["selection_ms"] == 12
+        assert "args" not in payload and "ts" in payload
+
+    def test_exception_is_included(self):
+        try:
+            raise ValueError("깨진 응답")
+        except ValueError:
+            record = logging.LogRecord("test-service", logging.ERROR, __file__, 1, "parse failed", None, sys.exc_info())
+        assert "ValueError: 깨진 응답" in json.loads(JsonFormatter().format(record))["exc"]
+
+
+class TestRedaction:
+    """이력서 PII 마스킹 테스트"""
+
+    def test_emails_and_phone_numbers_are_masked_in_text(self):
+        text = redact("연락처 kim.dev@example.com, 010-1234-5678 / +82 10 9876 5432, 경력 36개월")
+        assert "example.com" not in text and "1234" not in text and "9876" not in text
+        assert text.count(REDACTED) == 3 and "경력 36개월" in text
+
+    def test_pii_fields_are_masked_in_structured_extras(self):
+        """
+        시나리오: 이력서 일부를 extra 필드로 넘겨 로깅
+        Then: 이름/이메일 필드 값은 가려지고 나머지 필드와 원본 dict는 그대로 유지된다
+        """
+        resume = {"name": "김개발", "email": "kim@example.com", "skills": ["Python"], "summary": "문의 kim@example.com"}
+        payload = json.loads(JsonFormatter().format(_record("resume", resume=resume)))
+
+        assert payload["resume"] == {"name": REDACTED, "email": REDACTED, "skills": ["Python"],
+                                     "summary": f"문의 {REDACTED}"}
+        assert resume["name"] == "김개발"
+
+    def test_redaction_can_be_disabled(self):
+        payload = json.loads(JsonFormatter(redact_pii=False).format(_record("메일 %s", "kim@example.com")))
+        assert payload["message"] == "메일 kim@example.com"
+
+
+class TestSampling:
+    """로거별 샘플링 테스트"""
+
+    def test_parse_sample_rates(self):
+        assert parse_sample_rates("interview-service=0.1, shared=2,broken") == {"interview-service": 0.1, "shared": 1.0}
+        assert parse_sample_rates("") == {}
+
+    def test_warnings_are_never_sampled_out(self):
+        sampler = SamplingFilter(0.0)
+        assert not sampler.filter(_record("ok", level=logging.INFO))
+        assert sampler.filter(_record("slow", level=logging.WARNING))
+        assert sampler.filter(_record("failed", level=logging.ERROR))
+
+
+class TestLoggerPipeline:
+    """setup_logger 로거의 지연 포맷/큐 출력 테스트"""
+
+    def test_disabled_level_does_not_format_arguments(self):
+        logger = setup_logger("test-logging-lazy", "WARNING")
+        arg = _CountingArg()
+        logger.info("Selected %s", arg)
+        logger.debug("Prompt %s", arg)
+        assert arg.calls == 0
+
+    def test_sampled_out_records_are_not_formatted(self):
+        with patch.object(logger_module._settings(), "log_sample_rates", "test-logging-sampled=0"):
+            logger = setup_logger("test-logging-sampled")
+        arg = _CountingArg()
+        for _ in range(50):
+            logger.info("Selected %s", arg)
+        assert arg.calls == 0
+
+    def test_handler_enqueues_unformatted_records(self):
+        handler = logger_module._DeferredQueueHandler(logger_module._queue)
+        record = _record("Selected %s", _CountingArg())
+        assert handler.prepare(record) is record and record.args[0].calls == 0
+
+    def test_records_are_written_by_listener_as_json(self, captured):
+        """
+        시나리오: 서비스 로거로 성공/경고 레코드를 기록 후 flush
+        Then: 출력 스레드가 한 줄 JSON으로 기록하고, 메시지의 이메일은 마스킹된다
+        """
+        logger = setup_logger("test-logging-output")
+        logger.info("Generated for %s", "resume-1", extra={"prompt_tokens": 812})
+        logger.warning("Contact %s", "kim@example.com")
+
+        records = captured()
+
+        assert [r["message"] for r in records] == ["Generated for resume-1", f"Contact {REDACTED}"]
+        assert records[0]["prompt_tokens"] == 812 and records[1]["level"] == "WARNING"
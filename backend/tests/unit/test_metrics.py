@@ -0,0 +1,163 @@
+"""
+Prometheus 메트릭 단위 테스트 - HTTP 미들웨어, LLM 호출, MongoDB 명령, Celery 작업 대기, 큐 길이
+"""
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from prometheus_client import REGISTRY, CollectorRegistry
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from shared.llm import router as router_module
+from shared.llm.base import LLMResponse
+from shared.llm.router import LLMRouter
+from shared.utils import metrics
+from shared.utils.metrics import (
+    MongoCommandMetrics,
+    QueueDepthCollector,
+    install_metrics,
+    queue_wait_seconds,
+    stamp_published_at,
+)
+
+
+def _value(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestHttpMetrics:
+    """라우트별 요청 지연/동시 요청 수 테스트"""
+
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+
+        @app.get("/items/{item_id}")
+        async def get_item(item_id: str):
+            return {"item_id": item_id}
+
+        install_metrics(app, "test-http")
+        return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+    @pytest.mark.asyncio
+    async def test_requests_are_labeled_by_route_template(self, client):
+        """
+        시나리오: 경로 파라미터가 다른 요청 여러 건과 없는 경로 요청
+        Then: 원본 경로가 아닌 라우트 템플릿 하나로 집계되고, 없는 경로는 unmatched로 묶인다
+        """
+        labels = {"service": "test-http", "method": "GET", "route": "/items/{item_id}", "status": "2xx"}
+        before = _value("http_request_duration_seconds_count", **labels)
+
+        for key in ("resume-1", "resume-2", "resume-3"):
+            assert (await client.get(f"/items/{key}")).status_code == 200
+        await client.get("/missing/resume-4")
+
+        assert _value("http_request_duration_seconds_count", **labels) == before + 3
+        assert _value("http_request_duration_seconds_count", service="test-http", method="GET",
+                      route="unmatched", status="4xx") >= 1
+        assert _value("http_requests_in_flight", service="test-http") == 0
+
+        body = (await client.get("/metrics")).text
+        assert 'route="/items/{item_id}"' in body and "resume-1" not in body
+
+
+class TestLlmMetrics:
+    """라우터 LLM 호출 메트릭 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_latency_tokens_errors_and_parse_failures(self):
+        failing = MagicMock(_model="m-fail")
+        failing.name = "gemini"
+        failing.ainvoke = AsyncMock(side_effect=TimeoutError("timeout"))
+        working = MagicMock(_model="m-ok")
+        working.name = "openai"
+        working.ainvoke = AsyncMock(return_value=LLMResponse('{"questions": []}', "stop",
+                                                             {"input_tokens": 1200, "cached_tokens": 1000}))
+        clients = {"gemini": failing, "openai": working}
+        before = {
+            "errors": _value("llm_errors_total", provider="gemini", model="m-fail", error="TimeoutError"),
+            "calls": _value("llm_request_duration_seconds_count", provider="openai", model="m-ok", outcome="success"),
+            "input": _value("llm_tokens_total", provider="openai", model="m-ok", kind="input"),
+            "cached": _value("llm_tokens_total", provider="openai", model="m-ok", kind="cached"),
+            "parse": _value("llm_parse_total", provider="openai", model="m-ok", result="failure", structured="false"),
+        }
+
+        with patch.object(router_module, "get_redis_client", side_effect=ConnectionError("no redis")), \
+             patch.object(router_module.registry, "get_available_clients", return_value=["gemini", "openai"]), \
+             patch.object(router_module.registry, "get_client", side_effect=clients.get):
+            llm_router = LLMRouter()
+            _, client = await llm_router.ainvoke("prompt", preferred="gemini")
+            llm_router.record_parse(client, False)
+
+        assert _value("llm_errors_total", provider="gemini", model="m-fail", error="TimeoutError") == before["errors"] + 1
+        assert _value("llm_request_duration_seconds_count", provider="openai", model="m-ok",
+                      outcome="success") == before["calls"] + 1
+        assert _value("llm_tokens_total", provider="openai", model="m-ok", kind="input") == before["input"] + 1200
+        assert _value("llm_tokens_total", provider="openai", model="m-ok", kind="cached") == before["cached"] + 1000
+        assert _value("llm_tokens_total", provider="openai", model="m-ok", kind="output") > 0
+        assert _value("llm_parse_total", provider="openai", model="m-ok", result="failure",
+                      structured="false") == before["parse"] + 1
+
+
+class TestMongoMetrics:
+    """MongoDB 명령 모니터링 테스트"""
+
+    def test_command_duration_is_recorded_with_bounded_labels(self):
+        listener = MongoCommandMetrics()
+        before = _value("mongo_operation_duration_seconds_count", command="find", collection="resumes",
+                        outcome="success")
+
+        listener.started(SimpleNamespace(command_name="find", command={"find": "resumes", "filter": {}},
+                                         connection_id=("db", 27017), request_id=1))
+        listener.succeeded(SimpleNamespace(connection_id=("db", 27017), request_id=1, duration_micros=2500))
+        listener.started(SimpleNamespace(command_name="hello", command={"hello": 1},
+                                         connection_id=("db", 27017), request_id=2))
+        listener.failed(SimpleNamespace(connection_id=("db", 27017), request_id=2, duration_micros=100))
+
+        assert _value("mongo_operation_duration_seconds_count", command="find", collection="resumes",
+                      outcome="success") == before + 1
+        assert _value("mongo_operation_duration_seconds_count", command="other", collection="",
+                      outcome="error") >= 1
+        assert listener._pending == {}
+
+
+class TestCeleryMetrics:
+    """작업 대기 시간/큐 길이 테스트"""
+
+    def test_queue_wait_is_measured_from_publish_header(self):
+        headers = {}
+        stamp_published_at(headers=headers)
+        published_at = headers["published_at"]
+
+        request = SimpleNamespace(published_at=published_at, eta=None)
+        assert queue_wait_seconds(request, now=published_at + 2.5) == pytest.approx(2.5)
+        assert queue_wait_seconds(SimpleNamespace()) is None
+
+    def test_delayed_task_wait_starts_at_eta(self):
+        now = time.time()
+        eta = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(now + 60))
+        request = SimpleNamespace(published_at=now, eta=eta)
+        assert queue_wait_seconds(request, now=now + 61) < 2
+
+    def test_queue_depth_is_read_from_broker_and_cached(self):
+        def queue_declare(queue, passive):
+            if queue != "interview_queue":
+                raise RuntimeError("NOT_FOUND - no queue")
+            return queue, 7, 0
+
+        channel = MagicMock()
+        channel.queue_declare.side_effect = queue_declare
+        connection = MagicMock(default_channel=channel)
+        app = MagicMock()
+        app.connection_for_read.return_value.__enter__.return_value = connection
+
+        registry = CollectorRegistry()
+        registry.register(QueueDepthCollector(app, ["interview_queue", "missing_queue"]))
+        with patch.object(metrics.settings, "metrics_queue_depth_cache_seconds", 60):
+            assert registry.get_sample_value("celery_queue_depth", {"queue": "interview_queue"}) == 7
+            assert registry.get_sample_value("celery_queue_depth", {"queue": "missing_queue"}) is None
+            registry.get_sample_value("celery_queue_depth", {"queue": "interview_queue"})
+
+        assert app.connection_for_read.call_count == 1
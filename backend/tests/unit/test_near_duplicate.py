@@ -0,0 +1,83 @@
+"""
+유사 이력서 탐지 (MinHash + LSH) 단위 테스트 (Redis는 메모리 가짜 객체)
+"""
+import copy
+import pytest
+from unittest.mock import patch
+
+from shared.generation import near_duplicate
+from shared.generation.near_duplicate import (
+    index_resume,
+    find_similar_resumes,
+    resume_signature,
+    merge_draft_response,
+    resolve_near_duplicate_mode,
+)
+
+@pytest.fixture
+def fake_redis(memory_redis):
+    with patch.object(near_duplicate, "get_redis_client", return_value=memory_redis):
+        yield memory_redis
+
+def _resume(base, unique_key, name=None):
+    return {**copy.deepcopy(base), "unique_key": unique_key, "name": name or base["name"]}
+
+def _different_resume(unique_key):
+    return {
+        "unique_key": unique_key,
+        "name": "다른개발자",
+        "total_experience_months": 96,
+        "work_experiences": [{
+            "company": "다른회사", "position": "데이터 엔지니어", "duration": "2016.01 ~ 현재",
+            "project_name": "광고 로그 파이프라인", "tech_stack": ["Spark", "Airflow", "Hadoop"],
+            "achievements": ["일 20억 건 로그 배치 처리 시간을 6시간에서 40분으로 단축", "Airflow DAG 300개 운영 자동화"],
+        }],
+        "personal_projects": [],
+    }
+
+class TestNearDuplicate:
+    """유사 이력서 탐지 테스트"""
+
+    def test_name_is_not_part_of_signature(self, test_resume_data):
+        renamed = {**test_resume_data, "name": "다른이름", "contact": {}}
+        assert (resume_signature(renamed) == resume_signature(test_resume_data)).all()
+
+    def test_finds_resubmission_with_one_line_changed(self, fake_redis, test_resume_data):
+        """
+        시나리오: 같은 템플릿 이력서에 성과 한 줄만 추가해 재제출, 무관한 이력서도 색인됨
+        Then: 재제출 이력서만 임계값 이상으로 조회된다
+        """
+        original = _resume(test_resume_data, "동기1_1", "동기1")
+        index_resume(original)
+        index_resume(_different_resume("다른개발자_1"))
+
+        edited = _resume(test_resume_data, "동기2_1", "동기2")
+        edited["work_experiences"][0]["achievements"] = edited["work_experiences"][0]["achievements"] + ["배포 자동화"]
+        similar = find_similar_resumes(edited, threshold=0.8)
+
+        assert [key for key, _ in similar] == ["동기1_1"]
+        assert 0.8 <= similar[0][1] < 1.0
+
+    def test_excludes_itself_and_updates_buckets(self, fake_redis, test_resume_data):
+        """수정 시 이전 버킷에서 제거되어 수정 전 내용으로는 더 이상 조회되지 않는다"""
+        original = _resume(test_resume_data, "동기1_1")
+        index_resume(original)
+        assert find_similar_resumes(original) == []
+
+        index_resume({**_different_resume("x"), "unique_key": "동기1_1"})
+        assert find_similar_resumes(_resume(test_resume_data, "동기2_1")) == []
+
+    def test_redis_failure_does_not_raise(self, test_resume_data):
+        with patch.object(near_duplicate, "get_redis_client", side_effect=ConnectionError("no redis")):
+            assert index_resume(_resume(test_resume_data, "동기1_1")) is False
+
+    def test_merge_draft_response(self):
+        draft = [{"question": f"Q{i}"} for i in range(5)]
+        merged = merge_draft_response(draft, {"keep": [0, 2, 9], "questions": [{"question": "N1"}, {"question": "N2"}]})
+        assert [q["question"] for q in merged] == ["Q0", "Q2", "N1", "N2"]
+        assert merge_draft_response(draft, {"questions": [{"question": "N"}]}) == [{"question": "N"}]
+
+    def test_unknown_mode(self):
+        assert resolve_near_duplicate_mode(None) == "off"
+        with pytest.raises(ValueError):
+            resolve_near_duplicate_mode("copy")
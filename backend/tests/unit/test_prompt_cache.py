@@ -0,0 +1,236 @@
+"""
+제공자 프롬프트 캐시(고정 접두부) 단위 테스트 - SDK/HTTP 호출은 가짜 객체, 캐시 동작은 가짜 제공자로 검증
+"""
+import json
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from langchain_core.messages import SystemMessage, HumanMessage
+
+from shared.llm import prompt_cache
+from shared.llm import router as router_module
+from shared.llm.base import cached_prompt_tokens, prompt_cache_hit_ratio
+from shared.llm.fake_client import FakeClient
+from shared.llm.prompt_cache import GeminiContextCache, mark_cache_prefix, split_cache_prefix, prefix_cache_key
+from shared.llm.router import LLMRouter
+from shared.prompts.loader import get_prompt_loader
+from shared.utils.resume_formatter import format_resume_for_interview
+
+SYSTEM_PROMPT = "면접 질문 생성 지침 " * 400
+
+
+def _messages(resume="이력서 A"):
+    return [mark_cache_prefix(SystemMessage(content=SYSTEM_PROMPT)), HumanMessage(content=resume)]
+
+
+@pytest.fixture
+def fake_client():
+    FakeClient.reset_cache()
+    with patch.object(prompt_cache.settings, "fake_llm_latency_ms", 0), \
+         patch.object(prompt_cache.settings, "fake_llm_ms_per_1k_input_tokens", 1):
+        yield FakeClient()
+    FakeClient.reset_cache()
+
+
+class TestCachePrefixLayout:
+    """프롬프트 로더의 고정 접두부 표시 테스트"""
+
+    def test_loader_marks_system_prompt_as_prefix(self, test_resume_data):
+        loader = get_prompt_loader("interview")
+        config = loader.load_prompt_config("interview_questions.yaml")
+        first = loader.build_messages(config, format_resume_for_interview(test_resume_data))
+        other_resume = {**test_resume_data, "name": "다른 지원자"}
+        second = loader.build_messages(config, format_resume_for_interview(other_resume))
+
+        prefix, rest = split_cache_prefix(first)
+        assert prefix == first[:1] and rest == first[1:]
+        assert prefix_cache_key(prefix) == prefix_cache_key(split_cache_prefix(second)[0])
+
+    def test_string_prompt_has_no_prefix(self):
+        assert split_cache_prefix("프롬프트") == ([], ["프롬프트"])
+
+
+class TestProviderRequests:
+    """제공자별 캐시 표시와 캐시 적중 토큰 추출 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_claude_marks_system_block_and_reports_cache_read(self):
+        from shared.llm.claude_client import ClaudeClient
+
+        client = ClaudeClient(api_key="test", model="claude-test", temperature=0.2, max_tokens=100, timeout=5)
+        create = AsyncMock(return_value=SimpleNamespace(
+            content=[SimpleNamespace(type="text", text="{}")], stop_reason="end_turn",
+            usage=SimpleNamespace(input_tokens=50, cache_read_input_tokens=2000, cache_creation_input_tokens=0),
+        ))
+        object.__setattr__(client._llm, "_async_client", SimpleNamespace(messages=SimpleNamespace(create=create)))
+
+        response = await client.ainvoke(_messages())
+
+        system = create.await_args.kwargs["system"]
+        assert system == [{"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}]
+        assert response.usage == {"input_tokens": 2050, "cached_tokens": 2000, "cache_write_tokens": 0}
+        assert cached_prompt_tokens(response) == 2000
+
+    @pytest.mark.asyncio
+    async def test_claude_unmarked_prompt_is_sent_as_plain_system(self):
+        from shared.llm.claude_client import ClaudeClient
+
+        client = ClaudeClient(api_key="test", model="claude-test", temperature=0.2, max_tokens=100, timeout=5)
+        create = AsyncMock(return_value=SimpleNamespace(
+            content=[SimpleNamespace(type="text", text="요약")], stop_reason="end_turn", usage=None
+        ))
+        object.__setattr__(client._llm, "_async_client", SimpleNamespace(messages=SimpleNamespace(create=create)))
+
+        await client.ainvoke([SystemMessage(content="요약 지침"), HumanMessage(content="본문")])
+        assert create.await_args.kwargs["system"] == "요약 지침"
+
+    @pytest.mark.asyncio
+    async def test_openai_sends_prompt_cache_key_and_reads_cached_tokens(self):
+        from langchain_openai import ChatOpenAI
+        from shared.llm.openai_client import OpenAIClient
+
+        client = OpenAIClient(api_key="test", model="gpt-test", temperature=0.2, max_tokens=100, timeout=5)
+        result = SimpleNamespace(
+            generations=[[SimpleNamespace(message=SimpleNamespace(content="{}"), generation_info={"finish_reason": "stop"})]],
+            llm_output={"token_usage": {"prompt_tokens": 2100, "prompt_tokens_details": {"cached_tokens": 1920}}},
+        )
+        with patch.object(ChatOpenAI, "agenerate", AsyncMock(return_value=result)) as agenerate:
+            first = await client.ainvoke(_messages("이력서 A"))
+            await client.ainvoke(_messages("이력서 B"))
+
+        keys = [call.kwargs["prompt_cache_key"] for call in agenerate.await_args_list]
+        assert keys[0] == keys[1] == prefix_cache_key(_messages()[:1])
+        assert first.usage == {"input_tokens": 2100, "cached_tokens": 1920}
+
+
+class FakeHttp:
+    """cachedContents/generateContent REST 호출을 기록하는 가짜 httpx.AsyncClient"""
+
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+
+    def _response(self, payload, status=200):
+        response = MagicMock(status_code=status)
+        response.json.return_value = payload
+        response.raise_for_status.side_effect = Exception("400 too small") if self.fail else None
+        return response
+
+    async def post(self, url, **kwargs):
+        self.calls.append(("POST", url, kwargs))
+        if url.endswith(":generateContent"):
+            return self._response({
+                "candidates": [{"content": {"parts": [{"text": "{}"}]}, "finishReason": "STOP"}],
+                "usageMetadata": {"promptTokenCount": 2100, "cachedContentTokenCount": 2000},
+            })
+        return self._response({"name": "cachedContents/abc"})
+
+    async def patch(self, url, **kwargs):
+        self.calls.append(("PATCH", url, kwargs))
+        return self._response({"name": "cachedContents/abc"})
+
+
+class TestGeminiContextCache:
+    """Gemini cachedContents 핸들 생성/재사용/갱신 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def cache_settings(self):
+        with patch.object(prompt_cache.settings, "llm_prompt_cache_ttl_seconds", 3600), \
+             patch.object(prompt_cache.settings, "llm_prompt_cache_refresh_seconds", 300), \
+             patch.object(prompt_cache.settings, "gemini_cache_min_tokens", 1024):
+            yield
+
+    @pytest.mark.asyncio
+    async def test_handle_is_created_once_then_refreshed_before_expiry(self):
+        """
+        시나리오: 같은 접두부로 반복 호출하다 만료 5분 전 구간에 진입
+        Then: 처음 한 번만 생성하고, 갱신 구간에서는 TTL만 갱신한다
+        """
+        cache, http = GeminiContextCache(), FakeHttp()
+        clock = [1000.0]
+        with patch.object(prompt_cache.time, "monotonic", side_effect=lambda: clock[0]):
+            assert await cache.handle_for(http, "key", "gemini-test", SYSTEM_PROMPT, 5) == "cachedContents/abc"
+            assert await cache.handle_for(http, "key", "gemini-test", SYSTEM_PROMPT, 5) == "cachedContents/abc"
+            clock[0] += 3600 - 120
+            assert await cache.handle_for(http, "key", "gemini-test", SYSTEM_PROMPT, 5) == "cachedContents/abc"
+
+        assert [method for method, _, _ in http.calls] == ["POST", "PATCH"]
+        created = http.calls[0][2]["json"]
+        assert created["systemInstruction"]["parts"][0]["text"] == SYSTEM_PROMPT and created["ttl"] == "3600s"
+
+    @pytest.mark.asyncio
+    async def test_failed_creation_backs_off(self):
+        cache, http = GeminiContextCache(), FakeHttp(fail=True)
+        assert await cache.handle_for(http, "key", "gemini-test", SYSTEM_PROMPT, 5) is None
+        assert await cache.handle_for(http, "key", "gemini-test", SYSTEM_PROMPT, 5) is None
+        assert len(http.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_short_prefix_is_not_cached(self):
+        http = FakeHttp()
+        assert await GeminiContextCache().handle_for(http, "key", "gemini-test", "짧은 지침", 5) is None
+        assert http.calls == []
+
+    @pytest.mark.asyncio
+    async def test_gemini_client_sends_only_suffix_with_handle(self):
+        from shared.llm import gemini_client
+        from shared.llm.gemini_client import GeminiClient
+
+        client = GeminiClient(api_key="key", model="gemini-test", temperature=0.2, max_tokens=100, timeout=5)
+        http = FakeHttp()
+        with patch.object(gemini_client, "get_async_http_client", return_value=http), \
+             patch.object(gemini_client, "gemini_context_cache", GeminiContextCache()):
+            response = await client.ainvoke(_messages("이력서 A"))
+
+        method, url, request = http.calls[-1]
+        assert url.endswith("/models/gemini-test:generateContent")
+        assert request["json"]["cachedContent"] == "cachedContents/abc"
+        assert request["json"]["contents"] == [{"role": "user", "parts": [{"text": "이력서 A"}]}]
+        assert response.usage["cached_tokens"] == 2000 and response.finish_reason == "STOP"
+
+
+class TestFakeProviderCaching:
+    """가짜 제공자로 접두부 캐시 적중/지연 감소 재현"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_prefix_hits_cache(self, fake_client):
+        """
+        시나리오: 같은 시스템 프롬프트, 다른 이력서로 두 번 호출
+        Then: 두 번째 호출은 접두부 토큰이 캐시 적중으로 보고되고 입력 처리 지연이 줄어든다
+        """
+        first = await fake_client.ainvoke(_messages("이력서 A"))
+        second = await fake_client.ainvoke(_messages("이력서 B"))
+
+        assert cached_prompt_tokens(first) == 0 and first.usage["cache_write_tokens"] > 0
+        assert cached_prompt_tokens(second) == first.usage["cache_write_tokens"]
+        assert prompt_cache_hit_ratio(second) > 0.9
+        assert FakeClient._latency_seconds(second.usage) < FakeClient._latency_seconds(first.usage) / 5
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_never_hits(self, fake_client):
+        with patch.object(prompt_cache.settings, "llm_prompt_cache", False):
+            await fake_client.ainvoke(_messages())
+            assert cached_prompt_tokens(await fake_client.ainvoke(_messages())) == 0
+
+    @pytest.mark.asyncio
+    async def test_fake_provider_returns_valid_interview_json(self, fake_client, test_resume_data):
+        loader = get_prompt_loader("interview")
+        messages = loader.build_messages(loader.load_prompt_config("interview_questions.yaml"),
+                                         format_resume_for_interview(test_resume_data))
+        questions = json.loads(await fake_client.ainvoke(messages))["questions"]
+        assert len(questions) == 5 and all(q["question"] and q["what_good_answers_cover"] for q in questions)
+
+    @pytest.mark.asyncio
+    async def test_router_tracks_cache_hit_ratio(self, fake_client):
+        with patch.object(router_module.settings, "llm_fake_provider", True), \
+             patch.object(router_module, "get_redis_client", side_effect=ConnectionError("no redis")):
+            llm_router = LLMRouter()
+            llm_router.refresh_seconds = 0
+            llm_router.alpha = 0.5
+            for resume in ("이력서 A", "이력서 B", "이력서 C"):
+                _, client = await llm_router.ainvoke(_messages(resume))
+            ratio = llm_router.describe()["providers"]["fake"]["prompt_cache_hit_ratio"]
+
+        assert client.name == "fake"
+        assert 0.5 < ratio < 1.0
@@ -0,0 +1,174 @@
+"""
+프롬프트 변형 실험 단위 테스트 - 트래픽 배정, 오프라인 실행(가짜 제공자/카세트), 비교 보고서
+"""
+import json
+from collections import Counter
+
+import pytest
+import yaml
+from unittest.mock import patch
+
+from shared.llm import prompt_cache
+from shared.llm.fake_client import FakeClient
+from shared.prompts import experiments
+from shared.prompts.experiments import (
+    PromptCassette,
+    assign_variant,
+    build_report,
+    format_report,
+    run_experiment,
+    select_prompt,
+    selected_prompt_version,
+)
+from shared.prompts.loader import get_prompt_loader, prompt_version_of
+from shared.utils.resume_formatter import format_resume_for_interview
+
+BASE_PROMPT = "interview_questions.yaml"
+
+
+@pytest.fixture
+def variant_file(tmp_path):
+    """기준 프롬프트에서 시스템 지침만 바꾼 변형 (절대 경로)"""
+    config = dict(get_prompt_loader("interview").load_prompt_config(BASE_PROMPT))
+    config.update(name="interview_questions_concise", version="1.1.0",
+                  system_prompt_template="간결한 면접 질문 생성 지침 (questions 5개 JSON)")
+    path = tmp_path / "interview_questions.concise.yaml"
+    path.write_text(yaml.safe_dump(config, allow_unicode=True), encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def fake_client():
+    FakeClient.reset_cache()
+    with patch.object(prompt_cache.settings, "fake_llm_latency_ms", 0), \
+         patch.object(prompt_cache.settings, "fake_llm_ms_per_1k_input_tokens", 0):
+        yield FakeClient()
+
+
+def _resumes(test_resume_data, count):
+    return [{**test_resume_data, "unique_key": f"resume-{n}", "name": f"지원자{n}"} for n in range(count)]
+
+
+class TestTrafficAssignment:
+    """결정적 변형 배정 테스트"""
+
+    def test_assignment_is_deterministic_and_follows_weights(self):
+        variants = {"control": 80, "treatment": 20}
+        first = [assign_variant("exp", f"user-{n}", variants) for n in range(2000)]
+        second = [assign_variant("exp", f"user-{n}", variants) for n in range(2000)]
+
+        assert first == second
+        assert 0.75 < Counter(first)["control"] / 2000 < 0.85
+
+    def test_experiments_are_assigned_independently(self):
+        variants = {"a": 50, "b": 50}
+        keys = [f"user-{n}" for n in range(200)]
+        assert [assign_variant("exp1", k, variants) for k in keys] != [assign_variant("exp2", k, variants) for k in keys]
+
+    def test_select_prompt_records_experiment_in_version(self, variant_file, test_resume_data):
+        """
+        시나리오: 면접 프롬프트에 변형 100% 실험 설정
+        Then: 배정된 변형으로 메시지를 만들고 버전 표시에 실험/변형 이름이 기록된다
+        """
+        loader = get_prompt_loader("interview")
+        setting = json.dumps({BASE_PROMPT: {BASE_PROMPT: 0, variant_file: 100}})
+        with patch.object(experiments.settings, "prompt_experiments", setting):
+            prompt, assignment = select_prompt(loader, BASE_PROMPT, "resume-1")
+            control, no_assignment = select_prompt(loader, BASE_PROMPT, None)
+
+        version = prompt_version_of(prompt.build_messages(format_resume_for_interview(test_resume_data), assignment))
+        assert version["name"] == "interview_questions_concise" and version["version"] == "1.1.0"
+        assert assignment == {"experiment": "interview_questions", "variant": "interview_questions.concise"}
+        assert version["variant"] == "interview_questions.concise"
+        assert control.name == "interview_questions_generation" and no_assignment is None
+
+    def test_selected_prompt_version_follows_assignment(self, variant_file):
+        """
+        시나리오: 생성 결과 재사용 조회 전에 지금 프롬프트 버전을 계산
+        Then: 실험 배정이 바뀌면 내용 해시와 변형이 달라져 이전 결과와 구분된다
+        """
+        loader = get_prompt_loader("interview")
+        control = selected_prompt_version(loader, BASE_PROMPT, "resume-1")
+        setting = json.dumps({BASE_PROMPT: {BASE_PROMPT: 0, variant_file: 100}})
+        with patch.object(experiments.settings, "prompt_experiments", setting):
+            treatment = selected_prompt_version(loader, BASE_PROMPT, "resume-1")
+
+        assert control == loader.get_prompt(BASE_PROMPT).version_info
+        assert treatment["variant"] == "interview_questions.concise" and treatment["hash"] != control["hash"]
+        assert selected_prompt_version(loader, "missing.yaml") is None
+
+    def test_invalid_setting_disables_experiments(self):
+        with patch.object(experiments.settings, "prompt_experiments", "{not json"):
+            prompt, assignment = select_prompt(get_prompt_loader("interview"), BASE_PROMPT, "resume-1")
+        assert assignment is None and prompt.name == "interview_questions_generation"
+
+
+class TestOfflineRun:
+    """가짜 제공자/카세트 오프라인 실행 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_fake_provider_run_measures_every_variant(self, fake_client, variant_file, test_resume_data):
+        samples = await run_experiment("interview", _resumes(test_resume_data, 3), [BASE_PROMPT, variant_file],
+                                       fake_client)
+
+        assert len(samples) == 6
+        assert Counter(sample["variant"] for sample in samples) == {
+            "interview_questions": 3, "interview_questions.concise": 3
+        }
+        for sample in samples:
+            assert sample["parsed"] and sample["items"] == 5 and sample["answer_chars"] > 0
+            assert sample["input_tokens"] > 0 and sample["output_tokens"] > 0
+            assert 0 <= sample["ttft_ms"] <= sample["latency_ms"]
+
+        concise = [s for s in samples if s["variant"] == "interview_questions.concise"]
+        control = [s for s in samples if s["variant"] == "interview_questions"]
+        assert max(s["input_tokens"] for s in concise) < min(s["input_tokens"] for s in control)
+
+    @pytest.mark.asyncio
+    async def test_cassette_replays_recorded_timings_without_provider(self, fake_client, tmp_path, test_resume_data):
+        path = str(tmp_path / "cassette.json")
+        resumes = _resumes(test_resume_data, 2)
+        recorder = PromptCassette(path, client=fake_client, record=True)
+        recorded = await run_experiment("interview", resumes, [BASE_PROMPT], recorder)
+        recorder.save()
+
+        replayed = await run_experiment("interview", resumes, [BASE_PROMPT], PromptCassette(path))
+
+        assert [s["latency_ms"] for s in replayed] == [s["latency_ms"] for s in recorded]
+        assert all(s["parsed"] for s in replayed)
+
+    @pytest.mark.asyncio
+    async def test_unrecorded_request_is_counted_as_error(self, tmp_path, test_resume_data):
+        samples = await run_experiment("interview", _resumes(test_resume_data, 1), [BASE_PROMPT],
+                                       PromptCassette(str(tmp_path / "empty.json")))
+        assert samples[0]["error"] and samples[0]["parsed"] is False
+
+
+class TestReport:
+    """비교 보고서/신뢰구간 테스트"""
+
+    @staticmethod
+    def _sample(variant, latency, parsed=True):
+        return {"variant": variant, "prompt_version": {"version": "1", "hash": variant}, "parsed": parsed,
+                "input_tokens": 100, "output_tokens": 50, "ttft_ms": latency / 2, "latency_ms": latency,
+                "items": 5, "answer_chars": 40.0}
+
+    def test_report_compares_against_control_with_confidence_intervals(self):
+        samples = [self._sample("a", 1000 + n) for n in range(20)] + \
+                  [self._sample("b", 700 + n, parsed=n % 4 != 0) for n in range(20)]
+
+        report = build_report(samples)
+
+        assert report["control"] == "a"
+        latency = report["variants"]["a"]["latency_ms"]
+        assert latency["n"] == 20 and latency["ci"][0] < latency["mean"] < latency["ci"][1]
+        parse = report["variants"]["b"]["parse_success"]
+        assert parse["rate"] == 0.75 and 0 <= parse["ci"][0] < 0.75 < parse["ci"][1] <= 1
+        comparison = report["comparisons"]["b"]
+        assert comparison["latency_ms"]["diff"] == -300 and comparison["latency_ms"]["significant"]
+        assert comparison["input_tokens"]["diff"] == 0 and not comparison["input_tokens"]["significant"]
+        assert "b vs a" in format_report(report)
+
+    def test_single_sample_has_no_interval(self):
+        report = build_report([self._sample("a", 100)])
+        assert report["variants"]["a"]["latency_ms"]["ci"] is None and report["comparisons"] == {}
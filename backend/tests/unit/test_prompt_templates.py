@@ -0,0 +1,120 @@
+"""
+컴파일된 프롬프트 템플릿 / 핫 리로드 / 버전 기록 단위 테스트
+"""
+import os
+
+import pytest
+from unittest.mock import patch
+
+from shared.generation.career_bundle import build_interview_messages, build_merged_messages
+from shared.prompts import loader as loader_module
+from shared.prompts.loader import CompiledTemplate, PromptLoader, get_prompt_loader, prompt_version_of
+from shared.utils.resume_formatter import format_resume_for_ai, format_resume_for_interview
+
+PROMPT_YAML = """
+name: "test_prompt"
+version: "{version}"
+system_prompt_template: |
+  시스템 지침 {{JSON 예시}}
+human_prompt_template: |
+  이름: {{name}}
+  경력: {{experience_months:>3}}개월
+  {{{{고정 중괄호}}}}
+"""
+
+
+def _write(path, version="1.0.0", body=None):
+    path.write_text(body if body is not None else PROMPT_YAML.format(version=version), encoding="utf-8")
+
+
+@pytest.fixture
+def prompt_dir(tmp_path):
+    _write(tmp_path / "test.yaml")
+    with patch.object(loader_module.settings, "prompt_reload_check_seconds", 0):
+        yield tmp_path
+
+
+class TestCompiledTemplate:
+    """템플릿 컴파일/렌더링 테스트"""
+
+    def test_render_matches_str_format(self):
+        source = "이름: {name}\n경력: {experience_months:>3}개월 {flag!r}\n{{리터럴}}"
+        values = {"name": "김개발", "experience_months": 36, "flag": "y", "unused": "무시"}
+        template = CompiledTemplate(source)
+        assert template.fields == {"name", "experience_months", "flag"}
+        assert template.render(values) == source.format(**values)
+
+    @pytest.mark.parametrize("source", ["{}", "{0}", "{resume.name}", "{items[0]}", "{name:{width}}"])
+    def test_unsupported_placeholders_fail_at_compile_time(self, source):
+        with pytest.raises(ValueError):
+            CompiledTemplate(source)
+
+    def test_missing_values_raise_key_error_with_names(self):
+        with pytest.raises(KeyError, match="experience_months"):
+            CompiledTemplate("{name} {experience_months}").render({"name": "김개발"})
+
+    def test_real_prompt_files_compile(self, test_resume_data):
+        prompt = get_prompt_loader("interview").get_prompt("interview_questions.yaml")
+        formatted = format_resume_for_interview(test_resume_data)
+        assert prompt.human_template.fields <= set(formatted)
+        assert prompt.render_human(formatted) == prompt.config["human_prompt_template"].format(**formatted)
+
+
+class TestHotReload:
+    """파일 변경 감지와 원자적 교체 테스트"""
+
+    def test_changed_file_is_recompiled_and_swapped(self, prompt_dir):
+        """
+        시나리오: 서비스 실행 중 프롬프트 YAML의 버전과 내용을 수정
+        Then: 다음 조회에서 새 버전으로 교체되고, 이전에 받은 인스턴스는 그대로 유지된다
+        """
+        loader = PromptLoader(str(prompt_dir))
+        first = loader.get_prompt("test.yaml")
+        assert loader.get_prompt("test.yaml") is first
+
+        _write(prompt_dir / "test.yaml", version="1.1.0")
+        os.utime(prompt_dir / "test.yaml", ns=(first.file_stamp[0] + 10**9,) * 2)
+        second = loader.get_prompt("test.yaml")
+
+        assert second is not first and second.version == "1.1.0" and first.version == "1.0.0"
+        assert second.content_hash != first.content_hash
+
+    def test_invalid_edit_keeps_previous_version(self, prompt_dir):
+        loader = PromptLoader(str(prompt_dir))
+        first = loader.get_prompt("test.yaml")
+        _write(prompt_dir / "test.yaml", body="name: broken\nhuman_prompt_template: '{resume.name}'\n")
+        os.utime(prompt_dir / "test.yaml", ns=(first.file_stamp[0] + 10**9,) * 2)
+        assert loader.get_prompt("test.yaml") is first
+
+    def test_file_is_not_checked_within_interval(self, prompt_dir):
+        loader = PromptLoader(str(prompt_dir))
+        with patch.object(loader_module.settings, "prompt_reload_check_seconds", 60):
+            first = loader.get_prompt("test.yaml")
+            _write(prompt_dir / "test.yaml", version="2.0.0")
+            with patch.object(loader_module.Path, "stat", side_effect=AssertionError("stat called")):
+                assert loader.get_prompt("test.yaml") is first
+
+    def test_missing_file_raises(self, prompt_dir):
+        with pytest.raises(FileNotFoundError):
+            PromptLoader(str(prompt_dir)).get_prompt("missing.yaml")
+
+
+class TestPromptVersion:
+    """생성 결과에 기록할 프롬프트 버전 표시 테스트"""
+
+    def test_messages_carry_name_version_and_hash(self, prompt_dir):
+        loader = PromptLoader(str(prompt_dir))
+        prompt = loader.get_prompt("test.yaml")
+        messages = loader.build_messages(loader.load_prompt_config("test.yaml"), {"name": "김", "experience_months": 7})
+
+        assert prompt_version_of(messages) == {"name": "test_prompt", "version": "1.0.0", "hash": prompt.content_hash}
+        assert messages[1].content == "이름: 김\n경력:   7개월\n{고정 중괄호}\n"
+        assert prompt_version_of("문자열 프롬프트") is None
+
+    def test_career_bundle_messages_record_versions(self, test_resume_data):
+        formatted = format_resume_for_ai(test_resume_data)
+        interview = get_prompt_loader("interview").get_prompt("interview_questions.yaml").version_info
+        learning = get_prompt_loader("learning").get_prompt("learning_path.yaml").version_info
+
+        assert prompt_version_of(build_interview_messages(formatted)) == interview
+        assert prompt_version_of(build_merged_messages(formatted)) == [interview, learning]
@@ -0,0 +1,132 @@
+"""
+면접 질문 은행 (SimHash 중복 제거, mmap 색인, LLM 없는 세트 구성) 단위 테스트
+"""
+import time
+from unittest.mock import MagicMock
+from bson import ObjectId
+
+from shared.generation.question_bank import (
+    QuestionBankBuilder,
+    QuestionBankIndex,
+    write_index,
+    update_question_bank,
+    get_question_bank,
+    assemble_question_set,
+    split_tags,
+)
+
+def _q(topic, question, difficulty="medium"):
+    return {"difficulty": difficulty, "topic": topic, "question": question, "what_good_answers_cover": ["요소"]}
+
+QUESTIONS = [
+    _q("Kafka, MSA", "주식 시세 서비스에서 Kafka를 사용하여 실시간 데이터를 처리하셨는데, Consumer group은 어떤 기준으로 구성하셨나요?"),
+    _q("Redis, WebSocket", "채팅 서비스에서 Redis Pub/Sub을 사용하셨는데, 메시지 유실은 어떻게 방지하셨나요?", "hard"),
+    _q("Spring Boot", "Spring Boot 애플리케이션의 트랜잭션 경계를 어떻게 설계하셨나요?", "easy"),
+    _q("MySQL", "MySQL 인덱스 설계에서 가장 어려웠던 점은 무엇이었나요?"),
+    _q("AWS", "AWS 배포 파이프라인에서 장애가 발생하면 어떻게 롤백하시나요?"),
+    _q("Redis", "Redis 캐시 만료 전략을 어떻게 설계하셨고 캐시 스탬피드는 어떻게 막으셨나요?"),
+    _q("Go", "Go 고루틴 누수를 어떻게 탐지하시나요?", "hard"),
+]
+
+def _index(tmp_path, questions=QUESTIONS):
+    builder = QuestionBankBuilder()
+    for question in questions:
+        builder.add(question)
+    path = str(tmp_path / "bank.idx")
+    write_index(path, builder.entries, checkpoint=None)
+    return path
+
+class TestQuestionBank:
+    """질문 은행 테스트"""
+
+    def test_split_tags(self):
+        assert split_tags(" Kafka,  MSA / redis ") == ["kafka", "msa", "redis"]
+
+    def test_near_duplicates_are_merged(self):
+        """
+        시나리오: 조사만 바뀐 같은 질문과 앞부분만 같은 다른 질문
+        Then: 앞의 것은 빈도만 증가하고, 뒤의 것은 새 항목으로 추가된다
+        """
+        builder = QuestionBankBuilder()
+        builder.add(QUESTIONS[0])
+        assert not builder.add({**QUESTIONS[0], "question": QUESTIONS[0]["question"].replace("Kafka를 사용하여", "Kafka로")})
+        assert builder.add({**QUESTIONS[0], "question": "주식 시세 서비스에서 Kafka를 사용하여 실시간 데이터를 처리하셨는데, 메시지 처리 실패 시 어떤 복구 전략을 적용하셨나요?"})
+        assert [entry["count"] for entry in builder.entries] == [2, 1]
+        assert builder.duplicates == 1
+
+    def test_index_round_trip(self, tmp_path):
+        index = QuestionBankIndex.open(_index(tmp_path))
+        try:
+            assert len(index) == len(QUESTIONS)
+            assert index.entry(0)["question"] == QUESTIONS[0]["question"]
+            assert sorted(int(p) for p in index.postings("Redis")) == [1, 5]
+            assert len(index.postings("Haskell")) == 0
+        finally:
+            index.close()
+
+    def test_incremental_update_uses_checkpoint(self, tmp_path):
+        """두 번째 수집은 체크포인트 이후 생성분만 조회하고 기존 항목을 유지한다"""
+        path = str(tmp_path / "bank.idx")
+        first_id, second_id = ObjectId(), ObjectId()
+        db = MagicMock()
+        db.interview_questions.find.return_value.sort.return_value = [{"_id": first_id, "questions": QUESTIONS[:3]}]
+        assert update_question_bank(db, path)["entries"] == 3
+
+        db.interview_questions.find.return_value.sort.return_value = [{"_id": second_id, "questions": QUESTIONS[3:]}]
+        stats = update_question_bank(db, path)
+
+        query = db.interview_questions.find.call_args[0][0]
+        assert query["_id"] == {"$gt": first_id}
+        assert query["source"] == {"$ne": "question_bank"}
+        assert stats["entries"] == len(QUESTIONS)
+        assert stats["checkpoint"] == str(second_id)
+
+    def test_assemble_matches_resume_stack(self, tmp_path, test_resume_data):
+        """
+        시나리오: Spring Boot/Redis/MySQL/AWS 이력서
+        Then: 이력서 기술 질문만으로, 주 태그를 최대한 겹치지 않게 난이도를 섞어 구성된다
+        """
+        index = QuestionBankIndex.open(_index(tmp_path))
+        try:
+            questions = assemble_question_set(index, test_resume_data, 5)
+        finally:
+            index.close()
+
+        topics = [q["topic"] for q in questions]
+        assert "Go" not in topics and "Kafka, MSA" not in topics
+        assert len(questions) == 5
+        assert {split_tags(t)[0] for t in topics} == {"redis", "spring boot", "mysql", "aws"}
+        assert {"easy", "hard"} <= {q["difficulty"] for q in questions}
+
+    def test_require_match_and_degraded_fill(self, tmp_path):
+        index = QuestionBankIndex.open(_index(tmp_path))
+        unrelated = {"work_experiences": [{"tech_stack": ["Haskell"]}]}
+        try:
+            assert assemble_question_set(index, unrelated, 5) == []
+            assert len(assemble_question_set(index, unrelated, 5, require_match=False)) == 5
+        finally:
+            index.close()
+
+    def test_assemble_is_fast(self, tmp_path, test_resume_data):
+        questions = [_q(f"Redis, 주제{i}", f"{i}번 시나리오에서 Redis 장애가 나면 서비스 {i}에 어떤 영향이 있나요? " * 2)
+                     for i in range(2000)]
+        index = QuestionBankIndex.open(_index(tmp_path, questions + QUESTIONS))
+        try:
+            timings = []
+            for _ in range(10):
+                started = time.perf_counter()
+                assemble_question_set(index, test_resume_data, 5)
+                timings.append(time.perf_counter() - started)
+        finally:
+            index.close()
+        assert min(timings) < 0.01
+
+    def test_get_question_bank_reloads_replaced_file(self, tmp_path):
+        path = _index(tmp_path, QUESTIONS[:2])
+        assert len(get_question_bank(path)) == 2
+        builder = QuestionBankBuilder()
+        for question in QUESTIONS:
+            builder.add(question)
+        write_index(path, builder.entries)
+        assert len(get_question_bank(path)) == len(QUESTIONS)
+        assert get_question_bank(str(tmp_path / "missing.idx")) is None
@@ -0,0 +1,75 @@
+"""
+면접 질문 후보 과생성 + MMR 다양성 선택 단위 테스트
+"""
+import time
+from unittest.mock import patch
+
+from shared.generation import diversity
+from shared.generation.diversity import (
+    resolve_candidate_count,
+    select_diverse_questions,
+    tfidf_vectors,
+    mmr_select,
+)
+
+def _q(topic, question):
+    return {"difficulty": "medium", "topic": topic, "question": question}
+
+CANDIDATES = [
+    _q("Redis", "Redis 캐시 만료 전략을 어떻게 설계하셨나요?"),
+    _q("Redis", "Redis 캐시 만료 정책은 어떻게 설계하셨나요?"),
+    _q("Redis", "Redis 캐시 만료 전략은 어떻게 정하셨나요?"),
+    _q("Spring Boot, MSA", "MSA로 분리하면서 서비스 간 통신을 어떻게 구성하셨나요?"),
+    _q("MySQL", "MySQL 인덱스 설계에서 가장 어려웠던 점은 무엇인가요?"),
+    _q("AWS", "AWS 배포 파이프라인에서 장애가 나면 어떻게 롤백하시나요?"),
+    _q("WebSocket", "WebSocket 연결 끊김을 어떻게 감지하셨나요?"),
+    _q("협업", "팀과 API 스펙을 어떻게 협의하셨나요?"),
+    _q("Kotlin", "Kotlin 코루틴을 도입한다면 어떤 점이 달라질까요?"),
+    _q("PostgreSQL", "PostgreSQL 트랜잭션 격리 수준을 어떻게 선택하셨나요?"),
+    _q("Redis", "Redis 캐시 만료 설계를 어떻게 하셨나요?"),
+    _q("테스트", "비동기 메시지 처리 로직을 어떻게 테스트하셨나요?"),
+]
+
+class TestQuestionDiversity:
+    """다양성 선택 테스트"""
+
+    def test_candidate_count_resolution(self):
+        assert resolve_candidate_count(None, 5) == 0  # 기본값 0: 과생성 안 함
+        assert resolve_candidate_count(5, 5) == 0
+        assert resolve_candidate_count(10, 5) == 10
+        with patch.object(diversity.settings, "interview_candidate_max", 8):
+            assert resolve_candidate_count(30, 5) == 8
+
+    def test_near_duplicates_are_not_selected_together(self, test_resume_data):
+        """
+        시나리오: 같은 주제를 표현만 바꾼 후보 4개 포함
+        Then: 선택된 5개 중 Redis 캐시 질문은 하나뿐이다
+        """
+        selection = select_diverse_questions(CANDIDATES, test_resume_data, 5)
+
+        assert len(selection["questions"]) == 5
+        assert sum(1 for q in selection["questions"] if "캐시 만료" in q["question"]) == 1
+        assert selection["indices"] == sorted(selection["indices"])
+
+    def test_relevance_prefers_resume_tech_stack(self, test_resume_data):
+        """관련도만 보면(λ=1) 이력서에 없는 기술(Kotlin) 질문은 뽑히지 않는다"""
+        selection = select_diverse_questions(CANDIDATES, test_resume_data, 5, mmr_lambda=1.0)
+        assert all(q["topic"] != "Kotlin" for q in selection["questions"])
+
+    def test_mmr_without_query_is_pure_diversity(self):
+        matrix, query = tfidf_vectors(["a b c", "a b c", "x y z"])
+        assert not query.any()
+        assert sorted(mmr_select(matrix, matrix @ query, 2, mmr_lambda=0.0)) == [0, 2]
+
+    def test_fewer_candidates_than_k(self, test_resume_data):
+        assert select_diverse_questions(CANDIDATES[:3], test_resume_data, 5)["questions"] == CANDIDATES[:3]
+
+    def test_selection_is_fast(self, test_resume_data):
+        """15개 후보 선택이 5ms보다 충분히 빠르다 (여러 번 측정한 최솟값)"""
+        candidates = CANDIDATES + CANDIDATES[:3]
+        timings = []
+        for _ in range(20):
+            started = time.perf_counter()
+            select_diverse_questions(candidates, test_resume_data, 5)
+            timings.append(time.perf_counter() - started)
+        assert min(timings) < 0.005
@@ -0,0 +1,104 @@
+"""
+대형 이력서 map-reduce 요약 단위 테스트 (Redis는 dict 기반 가짜 클라이언트)
+"""
+import pytest
+from unittest.mock import patch, MagicMock, AsyncMock
+
+from shared.llm import summarizer
+from shared.llm.summarizer import condense_resume, parse_summary, section_hash
+
+def _senior_resume(count=12):
+    return {
+        "id": "resume-1",
+        "name": "시니어개발자",
+        "total_experience_months": 150,
+        "work_experiences": [
+            {
+                "project_name": f"프로젝트 {i}",
+                "tech_stack": ["Java", "Kafka", "Redis"],
+                "achievements": [
+                    f"Kafka 기반 이벤트 파이프라인 {i}단계 구현으로 초당 {i}000건 처리",
+                    f"Redis 캐시 도입으로 조회 API 응답 시간 {i}0% 단축 및 DB 부하 감소",
+                    "레거시 배치 시스템을 스트리밍 구조로 전환하고 장애 대응 프로세스 자동화",
+                    "서비스 간 계약 테스트를 도입해 배포 전 호환성 검증 체계 구축",
+                ],
+            }
+            for i in range(count)
+        ],
+        "personal_projects": [],
+    }
+
+@pytest.fixture
+def fake_redis(memory_redis):
+    with patch.object(summarizer, "get_redis_client", return_value=memory_redis):
+        yield memory_redis
+
+@pytest.fixture
+def fake_llm():
+    client = MagicMock()
+    client.name = "gemini"
+    with patch.object(summarizer.llm_router, "ainvoke",
+                      new=AsyncMock(return_value=("- 핵심 성과 A\n- 핵심 성과 B", client))) as ainvoke:
+        yield ainvoke
+
+class TestParseSummary:
+    """요약 응답 파싱 테스트"""
+
+    def test_strips_bullets_and_limits_items(self):
+        text = "- 첫째\n* 둘째\n\n1. 셋째\n2) 넷째"
+        assert parse_summary(text) == ["첫째", "둘째", "셋째"]
+
+    def test_section_hash_ignores_key_order(self):
+        assert section_hash({"a": 1, "b": [1, 2]}) == section_hash({"b": [1, 2], "a": 1})
+
+class TestCondenseResume:
+    """섹션 요약 및 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_small_resume_is_untouched(self, fake_redis, fake_llm):
+        """
+        시나리오: 임계값 이하의 작은 이력서
+        Then: LLM 호출 없이 원본을 그대로 사용한다
+        """
+        resume = _senior_resume(count=1)
+        assert await condense_resume(resume) is resume
+        fake_llm.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_large_resume_sections_summarized_in_parallel(self, fake_redis, fake_llm):
+        """
+        시나리오: 10개 이상의 경력을 가진 대형 이력서
+        Then: 섹션마다 요약 호출이 한 번씩 실행되고 성과 목록이 요약으로 대체된다
+        """
+        resume = _senior_resume()
+        condensed = await condense_resume(resume)
+
+        assert fake_llm.await_count == len(resume["work_experiences"])
+        # 요약 호출 지연은 라우팅 통계(p95)에 반영하지 않는다
+        assert all(call.kwargs["record_latency"] is False for call in fake_llm.await_args_list)
+        assert all(exp["achievements"] == ["핵심 성과 A", "핵심 성과 B"] for exp in condensed["work_experiences"])
+        # 원본은 변경하지 않는다
+        assert len(resume["work_experiences"][0]["achievements"]) == 4
+        assert condensed["id"] == "resume-1"
+
+    @pytest.mark.asyncio
+    async def test_unchanged_sections_are_not_summarized_twice(self, fake_redis, fake_llm):
+        """
+        시나리오: 섹션 하나만 수정된 이력서를 다시 요약
+        Then: 수정된 섹션만 LLM을 호출하고 나머지는 캐시를 사용한다
+        """
+        resume = _senior_resume()
+        await condense_resume(resume)
+        fake_llm.reset_mock()
+
+        resume["work_experiences"][3]["achievements"].append("신규 성과 추가로 섹션 내용 변경")
+        await condense_resume(resume)
+        assert fake_llm.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_section_keeps_original(self, fake_redis):
+        """요약 호출이 실패한 섹션은 원본 성과를 유지한다"""
+        with patch.object(summarizer.llm_router, "ainvoke", new=AsyncMock(side_effect=Exception("all failed"))):
+            resume = _senior_resume()
+            condensed = await condense_resume(resume)
+        assert condensed["work_experiences"] == resume["work_experiences"]
@@ -0,0 +1,116 @@
+"""
+쓰기 시점 생성 워밍업 단위 테스트 (Redis/Celery는 메모리 가짜 객체)
+"""
+import itertools
+import pytest
+from unittest.mock import patch, MagicMock
+
+from shared.jobs import warmup
+from shared.utils.resume_formatter import prompt_input_fingerprint
+from shared.jobs.warmup import (
+    schedule_resume_warmup,
+    finish_generation,
+    SKIP_DISABLED,
+    SKIP_IN_FLIGHT,
+    SKIP_RATE_LIMITED,
+    SKIP_UNCHANGED,
+    SKIP_UNAVAILABLE,
+)
+
+class FakeCeleryApp:
+    def __init__(self):
+        self.sent = []
+        self._ids = itertools.count(1)
+
+    def send_task(self, name, args=None, **options):
+        self.sent.append((name, args, options))
+        return MagicMock(id=f"task-{next(self._ids)}")
+
+@pytest.fixture
+def fake_redis(memory_redis):
+    with patch.object(warmup, "get_redis_client", return_value=memory_redis):
+        yield memory_redis
+
+@pytest.fixture
+def resume(test_resume_data):
+    return {**test_resume_data, "unique_key": "테스트개발자_1"}
+
+class TestResumeWarmup:
+    """워밍업 정책 테스트"""
+
+    def test_disabled_by_default(self, fake_redis, resume):
+        """opt-in 설정이 꺼져 있으면 작업을 등록하지 않는다"""
+        app = FakeCeleryApp()
+        result = schedule_resume_warmup(app, resume)
+        assert app.sent == []
+        assert set(result["skipped"].values()) == {SKIP_DISABLED}
+
+    def test_enqueues_both_generations_with_low_priority(self, fake_redis, resume):
+        """
+        시나리오: 이력서 생성 시 워밍업 opt-in
+        Then: 면접/학습 생성 작업이 각 큐에 낮은 우선순위로 등록된다
+        """
+        app = FakeCeleryApp()
+        result = schedule_resume_warmup(app, resume, enabled=True)
+
+        assert set(result["enqueued"]) == {"interview", "learning"}
+        queues = {options["queue"] for _, _, options in app.sent}
+        assert queues == {"interview_queue.v2", "learning_queue.v2"}
+        assert all(options["priority"] == warmup.settings.resume_warmup_priority for _, _, options in app.sent)
+
+    def test_deduplicates_in_flight_tasks(self, fake_redis, resume):
+        """진행 중인 워밍업 작업이 있으면 다시 등록하지 않는다"""
+        app = FakeCeleryApp()
+        schedule_resume_warmup(app, resume, enabled=True)
+        result = schedule_resume_warmup(app, resume, enabled=True)
+
+        assert len(app.sent) == 2
+        assert set(result["skipped"].values()) == {SKIP_IN_FLIGHT}
+
+    def test_skips_when_prompt_input_unchanged(self, fake_redis, resume):
+        """
+        시나리오: 생성 완료 후 연락처만 수정
+        Then: 프롬프트 입력 지문이 같아 재생성하지 않는다
+        """
+        app = FakeCeleryApp()
+        first = schedule_resume_warmup(app, resume, enabled=True)
+        for kind, task_id in first["enqueued"].items():
+            finish_generation(kind, resume["unique_key"], task_id, prompt_input_fingerprint(kind, resume))
+
+        edited = {**resume, "contact": {**resume["contact"], "phone": "010-9999-9999"}}
+        result = schedule_resume_warmup(app, edited, enabled=True)
+
+        assert result["enqueued"] == {}
+        assert set(result["skipped"].values()) == {SKIP_UNCHANGED}
+
+    def test_failed_generation_is_retried(self, fake_redis, resume):
+        """실패한 생성은 지문을 기록하지 않아 다음 워밍업에서 다시 등록된다"""
+        app = FakeCeleryApp()
+        first = schedule_resume_warmup(app, resume, enabled=True)
+        for kind, task_id in first["enqueued"].items():
+            finish_generation(kind, resume["unique_key"], task_id)
+
+        result = schedule_resume_warmup(app, resume, enabled=True)
+        assert set(result["enqueued"]) == {"interview", "learning"}
+
+    def test_rate_limited_per_resume(self, fake_redis, resume):
+        """
+        시나리오: 같은 이력서를 한도 이상 연속 수정하고, 동명이인이 이력서를 저장
+        Then: 같은 이력서만 한도에 걸리고 이름이 같은 다른 이력서는 영향받지 않는다
+        """
+        app = FakeCeleryApp()
+        with patch.object(warmup.settings, "resume_warmup_rate_limit", 1):
+            schedule_resume_warmup(app, resume, enabled=True)
+            limited = schedule_resume_warmup(app, {**resume, "skills": ["Rust"]}, enabled=True)
+            namesake = schedule_resume_warmup(app, {**resume, "unique_key": "테스트개발자_2"}, enabled=True)
+        assert set(limited["skipped"].values()) == {SKIP_RATE_LIMITED}
+        assert set(namesake["enqueued"]) == {"interview", "learning"}
+        assert {key for key in fake_redis.store if key.startswith("warmup:rate:")} == {
+            "warmup:rate:테스트개발자_1", "warmup:rate:테스트개발자_2"
+        }
+
+    def test_redis_failure_does_not_raise(self, resume):
+        """Redis 장애 시 워밍업만 건너뛰고 이력서 저장은 계속된다"""
+        with patch.object(warmup, "get_redis_client", side_effect=ConnectionError("no redis")):
+            result = schedule_resume_warmup(FakeCeleryApp(), resume, enabled=True)
+        assert set(result["skipped"].values()) == {SKIP_UNAVAILABLE}
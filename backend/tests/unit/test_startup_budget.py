@@ -0,0 +1,37 @@
+"""
+서비스 시작 시간 예산 테스트 (새 인터프리터에서 main import 측정)
+"""
+import os
+import pytest
+
+from shared.config.base import get_settings
+from shared.utils.startup import profile_imports
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PROVIDER_SDK_MODULES = ("langchain_openai", "langchain_anthropic", "langchain_google_genai")
+
+@pytest.mark.slow
+@pytest.mark.parametrize("service_dir", ["interview-service", "learning-service"])
+class TestStartupBudget:
+    """API 프로세스 import 비용 테스트"""
+
+    @pytest.fixture
+    def report(self, service_dir):
+        return profile_imports("main", cwd=os.path.join(BACKEND_DIR, service_dir))
+
+    def test_provider_sdks_not_imported(self, report):
+        """
+        시나리오: API 서비스 모듈 import
+        Then: 제공자 SDK는 클라이언트 최초 사용 전까지 import되지 않는다
+        """
+        loaded = {name.split(".")[0] for name in report["modules"]}
+        assert loaded.isdisjoint(PROVIDER_SDK_MODULES)
+
+    def test_worker_tasks_not_imported(self, report):
+        """API 프로세스는 워커 tasks 모듈을 import하지 않는다"""
+        assert "tasks" not in report["modules"]
+
+    def test_import_time_within_budget(self, report):
+        """main 모듈 import 시간이 예산 이내이다"""
+        assert report["total_ms"] <= get_settings().startup_import_budget_ms, report["slowest"]
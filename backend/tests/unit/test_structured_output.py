@@ -0,0 +1,201 @@
+"""
+제공자 네이티브 구조화 출력 단위 테스트 (SDK 호출은 가짜 객체로 대체)
+"""
+import importlib.util
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from shared.llm import router as router_module
+from shared.llm.router import LLMRouter
+from shared.llm.structured import structured_json_schema, parse_structured_response, uses_structured_output
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _load_schemas(service_dir):
+    """서비스 schemas.py를 패키지 import 없이 로드 (pydantic만 의존)"""
+    spec = importlib.util.spec_from_file_location(
+        f"{service_dir.replace('-', '_')}_schemas", os.path.join(BACKEND_DIR, service_dir, "src", "schemas.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+interview_schemas = _load_schemas("interview-service")
+learning_schemas = _load_schemas("learning-service")
+
+QUESTIONS = {"questions": [{
+    "difficulty": "medium", "topic": "Redis", "question": "캐시 만료 전략은?",
+    "what_good_answers_cover": ["TTL", "캐시 스탬피드"],
+}]}
+
+
+def _structured_client(name="openai"):
+    client = MagicMock(_model="m")
+    client.name = name
+    client.supports_structured_output = True
+    return client
+
+
+def _text_client(name="gemini"):
+    client = MagicMock(_model="m")
+    client.name = name
+    client.supports_structured_output = False
+    return client
+
+
+def _objects(schema):
+    if isinstance(schema, dict):
+        if "properties" in schema:
+            yield schema
+        for value in schema.values():
+            yield from _objects(value)
+    elif isinstance(schema, list):
+        for value in schema:
+            yield from _objects(value)
+
+
+class TestStructuredSchema:
+    """서비스 스키마에서 strict JSON 스키마 생성 테스트"""
+
+    @pytest.mark.parametrize("model", [interview_schemas.InterviewQuestionsOutput, learning_schemas.LearningPathOutput])
+    def test_strict_schema(self, model):
+        """
+        시나리오: 서비스 schemas.py의 출력 모델로 스키마 생성
+        Then: $ref 없이 인라인되고 모든 객체가 전체 필수 + 추가 속성 금지이다
+        """
+        schema = structured_json_schema(model)
+        assert "$ref" not in json.dumps(schema) and "$defs" not in schema
+        objects = list(_objects(schema))
+        assert len(objects) >= 2
+        for node in objects:
+            assert node["additionalProperties"] is False
+            assert set(node["required"]) == set(node["properties"])
+
+    def test_defaulted_field_is_required(self):
+        schema = structured_json_schema(learning_schemas.LearningPathOutput)
+        item = schema["properties"]["learning_paths"]["items"]
+        assert "resources" in item["required"]
+        assert "default" not in json.dumps(schema)
+
+
+class TestStructuredParsing:
+    """구조화/텍스트 응답 파싱 테스트"""
+
+    def test_structured_response_is_validated_once(self):
+        parsed = parse_structured_response(
+            json.dumps(QUESTIONS), _structured_client(), interview_schemas.InterviewQuestionsOutput
+        )
+        assert parsed == QUESTIONS
+
+    def test_structured_response_is_not_repaired(self):
+        """구조화 출력이 스키마에 맞지 않으면 복구하지 않고 실패한다"""
+        broken = {"questions": [{"question": "필드 누락"}]}
+        with pytest.raises(ValueError):
+            parse_structured_response(json.dumps(broken), _structured_client(), interview_schemas.InterviewQuestionsOutput)
+
+    def test_unsupported_client_uses_tolerant_parser(self):
+        text = f"결과입니다\n```json\n{json.dumps(QUESTIONS, ensure_ascii=False)}\n```"
+        parsed = parse_structured_response(text, _text_client(), interview_schemas.InterviewQuestionsOutput,
+                                           expected_keys=["questions"])
+        assert parsed["questions"] == QUESTIONS["questions"]
+
+    def test_disabled_by_setting(self):
+        with patch("shared.llm.structured.settings") as settings:
+            settings.llm_structured_output = False
+            assert uses_structured_output(_structured_client(), interview_schemas.InterviewQuestionsOutput) is False
+
+
+@pytest.fixture
+def llm_router():
+    with patch.object(router_module, "get_redis_client", side_effect=ConnectionError("no redis")), \
+         patch.object(router_module.registry, "get_available_clients", return_value=["openai", "gemini"]):
+        instance = LLMRouter()
+        instance.refresh_seconds = 0
+        instance.probe_rate = 0
+        yield instance
+
+
+class TestRouterStructuredOutput:
+    """라우터의 구조화 출력 호출과 모드별 파싱 통계 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_dispatch_by_client_support(self, llm_router):
+        """
+        시나리오: 구조화 출력 지원 제공자 실패 후 미지원 제공자로 폴백
+        Then: 지원 제공자는 ainvoke_structured, 미지원 제공자는 일반 ainvoke로 호출된다
+        """
+        openai = _structured_client("openai")
+        openai.ainvoke_structured = AsyncMock(side_effect=RuntimeError("timeout"))
+        gemini = _text_client("gemini")
+        gemini.ainvoke = AsyncMock(return_value="```json {} ```")
+        clients = {"openai": openai, "gemini": gemini}
+
+        with patch.object(router_module.registry, "get_client", side_effect=lambda name, **_: clients[name]):
+            response, client = await llm_router.ainvoke(
+                "prompt", preferred="openai", response_model=interview_schemas.InterviewQuestionsOutput
+            )
+
+        assert client is gemini
+        openai.ainvoke_structured.assert_awaited_once()
+        assert openai.ainvoke_structured.await_args.args[1] is interview_schemas.InterviewQuestionsOutput
+        openai.ainvoke.assert_not_called()
+
+    def test_parse_failure_rate_per_mode(self, llm_router):
+        client = _structured_client("openai")
+        llm_router.record_parse(client, True, structured=True)
+        llm_router.record_parse(client, False, structured=True)
+        llm_router.record_parse(_text_client("gemini"), False)
+
+        stats = llm_router._local_stats
+        assert 0 < stats["openai"]["structured_parse_success"] < 1
+        assert "structured_parse_success" not in stats["gemini"]
+        assert llm_router.describe()["providers"]["gemini"]["parse_failure_rate"] == 1.0
+
+
+class TestProviderRequests:
+    """제공자별 구조화 출력 요청 형태 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_claude_forces_single_tool(self):
+        from langchain_core.messages import SystemMessage, HumanMessage
+        from shared.llm.claude_client import ClaudeClient
+
+        client = ClaudeClient(api_key="test", model="claude-test", temperature=0.2, max_tokens=100, timeout=5)
+        create = AsyncMock(return_value=SimpleNamespace(content=[
+            SimpleNamespace(type="text", text="생성합니다"),
+            SimpleNamespace(type="tool_use", input=QUESTIONS),
+        ], stop_reason="tool_use"))
+        object.__setattr__(client._llm, "_async_client", SimpleNamespace(messages=SimpleNamespace(create=create)))
+
+        response = await client.ainvoke_structured(
+            [SystemMessage(content="지침"), HumanMessage(content="이력서")], interview_schemas.InterviewQuestionsOutput
+        )
+
+        assert json.loads(response) == QUESTIONS
+        params = create.await_args.kwargs
+        assert params["system"] == "지침"
+        assert params["tool_choice"] == {"type": "tool", "name": "InterviewQuestionsOutput"}
+        assert params["tools"][0]["input_schema"] == structured_json_schema(interview_schemas.InterviewQuestionsOutput)
+
+    @pytest.mark.asyncio
+    async def test_openai_sends_strict_json_schema(self):
+        from langchain_openai import ChatOpenAI
+        from shared.llm.openai_client import OpenAIClient
+
+        client = OpenAIClient(api_key="test", model="gpt-test", temperature=0.2, max_tokens=100, timeout=5)
+        result = SimpleNamespace(generations=[[SimpleNamespace(
+            message=SimpleNamespace(content="{}"), generation_info={"finish_reason": "stop"}
+        )]], llm_output=None)
+        with patch.object(ChatOpenAI, "agenerate", AsyncMock(return_value=result)) as agenerate:
+            await client.ainvoke_structured("prompt", learning_schemas.LearningPathOutput)
+
+        response_format = agenerate.await_args.kwargs["response_format"]
+        assert response_format["type"] == "json_schema"
+        assert response_format["json_schema"]["strict"] is True
+        assert response_format["json_schema"]["name"] == "LearningPathOutput"
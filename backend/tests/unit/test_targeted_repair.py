@@ -0,0 +1,168 @@
+"""
+잘린 응답 이어받기 / 검증 실패 항목 재요청 단위 테스트 (LLM 호출은 가짜 라우터로 대체)
+"""
+import importlib.util
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from langchain_core.messages import SystemMessage, HumanMessage
+
+from shared.generation import repair as repair_module
+from shared.generation.repair import repair_response
+from shared.llm.base import LLMResponse, is_truncated
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _load_schemas(service_dir):
+    """서비스 schemas.py를 패키지 import 없이 로드 (pydantic만 의존)"""
+    spec = importlib.util.spec_from_file_location(
+        f"{service_dir.replace('-', '_')}_repair_schemas", os.path.join(BACKEND_DIR, service_dir, "src", "schemas.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+interview_schemas = _load_schemas("interview-service")
+MESSAGES = [SystemMessage(content="면접 질문 지침"), HumanMessage(content="이력서 내용")]
+
+
+def _question(n):
+    return {"difficulty": "medium", "topic": f"주제{n}", "question": f"질문 {n}?", "what_good_answers_cover": ["요소"]}
+
+
+def _client(name="openai", structured=False):
+    client = MagicMock(_model="m")
+    client.name = name
+    client.supports_structured_output = structured
+    return client
+
+
+@pytest.fixture
+def fake_router():
+    """복구 호출에 대한 응답을 차례로 돌려주는 라우터"""
+    router = MagicMock()
+    router.responses = []
+
+    async def ainvoke(messages, **kwargs):
+        return router.responses.pop(0), _client()
+
+    router.ainvoke = AsyncMock(side_effect=ainvoke)
+    with patch.object(repair_module, "llm_router", router), \
+         patch.object(repair_module.settings, "llm_repair_max_attempts", 2), \
+         patch.object(repair_module.settings, "llm_repair_max_tokens", 300):
+        yield router
+
+
+async def _repair(response_text, client=None, **kwargs):
+    return await repair_response(
+        "interview", response_text, client or _client(), MESSAGES, interview_schemas.InterviewQuestion, 5,
+        response_model=interview_schemas.InterviewQuestionsOutput, expected_keys=["questions"], **kwargs
+    )
+
+
+class TestFinishReason:
+    """제공자 종료 사유 전달 테스트"""
+
+    def test_response_is_plain_string_with_finish_reason(self):
+        response = LLMResponse('{"questions": []}', "length")
+        assert response == '{"questions": []}' and json.loads(response) == {"questions": []}
+        assert is_truncated(response) is True
+        assert is_truncated(LLMResponse("{}", "stop")) is False
+        assert is_truncated("{}") is False
+
+    @pytest.mark.asyncio
+    async def test_claude_surfaces_stop_reason(self):
+        from shared.llm.claude_client import ClaudeClient
+
+        client = ClaudeClient(api_key="test", model="claude-test", temperature=0.2, max_tokens=100, timeout=5)
+        create = AsyncMock(return_value=SimpleNamespace(
+            content=[SimpleNamespace(type="text", text='{"questions": [')], stop_reason="max_tokens"
+        ))
+        object.__setattr__(client._llm, "_async_client", SimpleNamespace(messages=SimpleNamespace(create=create)))
+
+        response = await client.ainvoke(MESSAGES)
+
+        assert response == '{"questions": [' and is_truncated(response)
+        assert create.await_args.kwargs["system"] == "면접 질문 지침"
+
+
+class TestTargetedRepair:
+    """이어받기/부분 재요청 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_complete_valid_response_is_not_repaired(self, fake_router):
+        text = LLMResponse(json.dumps({"questions": [_question(n) for n in range(5)]}), "stop")
+        parsed, repair = await _repair(text)
+        assert len(parsed["questions"]) == 5 and repair is None
+        fake_router.ainvoke.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_truncated_response_continues_from_last_complete_item(self, fake_router):
+        """
+        시나리오: 출력 토큰 한도로 세 번째 질문 중간에서 잘린 응답
+        Then: 완성된 2개는 유지하고, 나머지 3개만 작은 출력 한도로 이어서 생성한다
+        """
+        full = json.dumps({"questions": [_question(0), _question(1), _question(2)]}, ensure_ascii=False)
+        truncated = LLMResponse(full[:full.index("주제2") + 4], "length")
+        fake_router.responses = [LLMResponse(json.dumps({"items": [_question(n) for n in (2, 3, 4)]}), "stop")]
+
+        parsed, repair = await _repair(truncated)
+
+        assert parsed["questions"] == [_question(n) for n in range(5)]
+        assert repair["truncated"] is True and repair["continued_items"] == 3 and repair["attempts"] == 1
+        call = fake_router.ainvoke.await_args
+        assert call.kwargs["client_options"] == {"max_tokens": 300}
+        assert call.kwargs["preferred"] == "openai"
+        assert call.kwargs["record_latency"] is False
+        prompt = call.args[0][-1].content
+        assert "나머지 3개" in prompt and json.dumps(_question(1), ensure_ascii=False) in prompt
+
+    @pytest.mark.asyncio
+    async def test_only_invalid_items_are_reasked(self, fake_router):
+        """
+        시나리오: 구조화 응답의 질문 하나가 필수 필드 누락으로 스키마 검증 실패
+        Then: 그 질문만 재요청해 같은 위치에 채우고, 나머지 질문은 그대로 유지한다
+        """
+        questions = [_question(n) for n in range(5)]
+        questions[2] = {"question": "필드 누락"}
+        fake_router.responses = [LLMResponse(json.dumps({"items": [_question(9)]}), "stop")]
+
+        parsed, repair = await _repair(json.dumps({"questions": questions}), client=_client(structured=True))
+
+        assert parsed["questions"] == [_question(0), _question(1), _question(9), _question(3), _question(4)]
+        assert repair["invalid_items"] == 1 and repair["reasked_items"] == 1 and repair["dropped_items"] == 0
+        prompt = fake_router.ainvoke.await_args.args[0][-1].content
+        assert "필드 누락" in prompt and "difficulty" in prompt
+
+    @pytest.mark.asyncio
+    async def test_retry_cap_drops_unrepairable_items(self, fake_router):
+        questions = [_question(0), {"question": "필드 누락"}]
+        fake_router.responses = [LLMResponse(json.dumps({"items": [{"question": "또 누락"}]}), "stop")] * 3
+
+        parsed, repair = await _repair(json.dumps({"questions": questions}))
+
+        assert fake_router.ainvoke.await_count == 2
+        assert parsed["questions"] == [_question(0)]
+        assert repair["attempts"] == 2 and repair["dropped_items"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_repair_call_keeps_salvaged_items(self, fake_router):
+        fake_router.ainvoke.side_effect = Exception("All LLM clients failed")
+        text = LLMResponse(json.dumps({"questions": [_question(0), _question(1)]})[:-2], "MAX_TOKENS")
+
+        parsed, repair = await _repair(text, client=_client("gemini"))
+
+        assert parsed["questions"] == [_question(0), _question(1)]
+        assert repair["missing_items"] == 3
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_setting(self, fake_router):
+        with patch.object(repair_module.settings, "llm_repair_max_attempts", 0):
+            parsed, repair = await _repair(LLMResponse('{"questions": [{"question": "Q"}', "length"))
+        assert parsed["questions"] == [{"question": "Q"}] and repair is None
+        fake_router.ainvoke.assert_not_called()
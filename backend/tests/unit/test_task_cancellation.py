@@ -0,0 +1,139 @@
+"""
+협력적 작업 취소 단위 테스트 (Redis 호출은 Mock)
+"""
+import asyncio
+import pytest
+from unittest.mock import patch, MagicMock
+
+from shared.jobs import cancellation, progress
+from shared.jobs.cancellation import TaskCancelledError, run_cancellable, raise_if_cancelled, cancel_task
+
+class TestRunCancellable:
+    """실행 중 취소 테스트"""
+
+    def test_returns_result_when_not_cancelled(self):
+        """
+        시나리오: 취소 신호 없이 LLM 호출 완료
+        Given: 취소 신호가 없는 작업이 주어지고
+        When: 코루틴을 실행하면
+        Then: 코루틴 결과가 그대로 반환된다
+        """
+        async def fake_llm_call():
+            await asyncio.sleep(0.01)
+            return "응답"
+
+        with patch.object(cancellation, "is_task_cancelled", return_value=False):
+            assert run_cancellable(fake_llm_call(), "task-1", poll_interval=0.005) == "응답"
+
+    def test_aborts_in_flight_call_on_cancel(self):
+        """
+        시나리오: LLM 호출 도중 취소 신호 수신
+        Given: 오래 걸리는 LLM 호출이 진행 중이고
+        When: 취소 신호가 들어오면
+        Then: 호출이 중단되고 TaskCancelledError가 발생한다
+        """
+        call_state = {"cancelled": False}
+
+        async def slow_llm_call():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                call_state["cancelled"] = True
+                raise
+
+        with patch.object(cancellation, "is_task_cancelled", side_effect=[False, True]):
+            with pytest.raises(TaskCancelledError):
+                run_cancellable(slow_llm_call(), "task-2", poll_interval=0.005)
+
+        assert call_state["cancelled"] is True
+
+    def test_interrupted_run_leaves_no_pending_tasks(self):
+        """
+        시나리오: LLM 호출 도중 시간 제한/인터럽트로 실행이 중단됨
+        Then: 호출과 감시 코루틴이 취소되어 재사용하는 워커 루프에 남지 않는다 (다음 작업에서 이어 실행되지 않음)
+        """
+        call_state = {"cancelled": False}
+
+        def interrupt():
+            raise KeyboardInterrupt
+
+        async def slow_llm_call():
+            asyncio.get_running_loop().call_later(0.01, interrupt)
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                call_state["cancelled"] = True
+                raise
+
+        with patch.object(cancellation, "is_task_cancelled", return_value=False):
+            with pytest.raises(KeyboardInterrupt):
+                run_cancellable(slow_llm_call(), "task-6", poll_interval=0.005)
+
+        assert call_state["cancelled"] is True
+        assert not asyncio.all_tasks(cancellation._get_worker_loop())
+
+    def test_stage_checkpoint(self):
+        """단계 사이 확인 지점에서 취소 신호가 있으면 예외가 발생한다"""
+        with patch.object(cancellation, "is_task_cancelled", return_value=True):
+            with pytest.raises(TaskCancelledError):
+                raise_if_cancelled("task-3")
+
+class TestCancelTask:
+    """취소 요청 테스트"""
+
+    @pytest.mark.parametrize("current_state,expected_state,expected_cancelled", [
+        ("PENDING", "CANCELLED", True),
+        ("PROGRESS", "CANCELLING", True),
+        ("SUCCESS", "SUCCESS", False),
+    ])
+    def test_cancel_by_state(self, current_state, expected_state, expected_cancelled):
+        """
+        시나리오: 작업 상태별 취소 요청 처리
+        Then: 대기 중이면 즉시 취소, 실행 중이면 취소 중, 종료된 작업은 변경 없음
+        """
+        celery_app = MagicMock()
+        with patch.object(cancellation, "has_task_progress", return_value=True), \
+             patch.object(cancellation, "get_task_progress_from_redis", return_value={"state": current_state}), \
+             patch.object(cancellation, "request_task_cancel") as mock_signal, \
+             patch.object(cancellation, "set_task_progress"):
+            result = cancel_task(celery_app, "task-4")
+
+        assert result["state"] == expected_state
+        assert result["cancelled"] is expected_cancelled
+        assert celery_app.control.revoke.called is expected_cancelled
+        assert mock_signal.called is expected_cancelled
+
+    @pytest.mark.parametrize("result_state,expected_state,expected_cancelled", [
+        ("PENDING", "NOT_FOUND", False),
+        ("SUCCESS", "SUCCESS", False),
+        ("STARTED", "CANCELLING", True),
+    ])
+    def test_without_progress_record(self, result_state, expected_state, expected_cancelled):
+        """
+        시나리오: 진행률 기록이 없는 작업 ID (잘못된 ID 또는 만료)
+        Then: Celery 결과 상태로 판단하며, PENDING이면 알 수 없는 작업으로 보고 revoke/상태 기록을 하지 않는다
+        """
+        celery_app = MagicMock()
+        celery_app.AsyncResult.return_value.state = result_state
+        with patch.object(cancellation, "has_task_progress", return_value=False), \
+             patch.object(cancellation, "request_task_cancel") as mock_signal, \
+             patch.object(cancellation, "set_task_progress") as mock_progress:
+            result = cancel_task(celery_app, "unknown-task")
+
+        assert result["state"] == expected_state
+        assert result["cancelled"] is expected_cancelled
+        assert celery_app.control.revoke.called is expected_cancelled
+        assert mock_signal.called is expected_cancelled
+        mock_progress.assert_not_called()
+
+    def test_queued_marker_keeps_worker_progress(self):
+        """
+        시나리오: 작업 등록 직후 대기 상태 기록
+        Then: 워커가 이미 기록한 진행률은 덮어쓰지 않도록 키가 없을 때만 저장한다
+        """
+        redis = MagicMock()
+        with patch.object(progress, "get_redis_client", return_value=redis):
+            progress.mark_task_queued("task-5")
+
+        assert redis.set.call_args.kwargs["nx"] is True
+        assert '"PENDING"' in redis.set.call_args.args[1]
@@ -0,0 +1,92 @@
+"""
+로컬 토큰 추정기 및 토큰 예산 기반 이력서 포맷팅 단위 테스트
+"""
+import pytest
+
+from shared.utils.token_estimator import estimate_tokens, estimate_message_tokens
+from shared.utils.resume_formatter import format_resume_for_ai
+
+@pytest.fixture
+def resume_data():
+    """프로젝트/성과가 많은 이력서"""
+    return {
+        "name": "테스트개발자",
+        "total_experience_months": 36,
+        "work_experiences": [
+            {
+                "project_name": "사내 관리 도구",
+                "tech_stack": ["Java", "Spring Boot", "MySQL", "Redis", "Docker"],
+                "achievements": ["관리 화면 유지보수", "Redis 캐시 도입으로 조회 응답 시간 70% 단축"],
+            },
+            {
+                "project_name": "결제 플랫폼",
+                "tech_stack": ["Kotlin", "Kafka", "PostgreSQL"],
+                "achievements": ["Kafka 기반 이벤트 처리로 초당 3000건 결제 처리", "정산 배치 자동화"],
+            },
+        ],
+        "personal_projects": [
+            {
+                "name": "채팅 서비스",
+                "tech_stack": ["WebSocket", "Node.js"],
+                "key_achievements": ["WebSocket 기반 실시간 채팅 구현"],
+            }
+        ],
+    }
+
+class TestTokenEstimator:
+    """토큰 추정 테스트"""
+
+    def test_empty_text(self):
+        assert estimate_tokens("") == 0
+
+    def test_grows_with_length(self):
+        """텍스트가 길어지면 추정 토큰 수도 늘어난다"""
+        text = "Spring Boot 기반 마이크로서비스 개발 경험"
+        assert estimate_tokens(text * 2) > estimate_tokens(text)
+
+    def test_default_is_most_conservative(self):
+        """제공자를 모를 때는 계열별 추정치 중 최댓값을 사용한다"""
+        text = "Kafka 메시지 키로 파티션 순서 보장 구현"
+        families = [estimate_tokens(text, family) for family in ("openai", "claude", "gemini")]
+        assert estimate_tokens(text) == max(families)
+
+    def test_message_overhead(self):
+        """메시지마다 역할 구분자 오버헤드가 더해진다"""
+        messages = [{"role": "system", "content": "hello"}, {"role": "user", "content": "hello"}]
+        assert estimate_message_tokens(messages, "openai") == 2 * estimate_tokens("hello", "openai") + 8
+
+class TestBudgetedResumeFormatter:
+    """토큰 예산 기반 포맷팅 테스트"""
+
+    @pytest.mark.parametrize("budget", [40, 80, 150])
+    def test_respects_budget(self, resume_data, budget):
+        """
+        시나리오: 목표 토큰 예산 지정
+        Then: 이력서 영역 추정 토큰 수가 예산을 넘지 않는다
+        """
+        formatted = format_resume_for_ai(resume_data, token_budget=budget)
+        assert formatted["estimated_tokens"] <= budget
+
+    def test_ranks_quantified_achievement_first(self, resume_data):
+        """
+        시나리오: 목록 순서보다 관련도 우선
+        Given: 첫 번째 성과는 일반 업무, 두 번째 성과는 정량 지표가 있는 프로젝트가 있고
+        When: 예산이 빠듯하게 포맷팅하면
+        Then: 정량 성과가 먼저 포함된다
+        """
+        formatted = format_resume_for_ai(resume_data, token_budget=120)
+        assert "70% 단축" in formatted["projects"]
+        assert "관리 화면 유지보수" not in formatted["projects"]
+
+    def test_breadth_before_depth(self, resume_data):
+        """예산이 허용하면 두 번째 성과보다 모든 프로젝트를 먼저 포함한다"""
+        formatted = format_resume_for_ai(resume_data, token_budget=170)
+        for name in ("사내 관리 도구", "결제 플랫폼", "채팅 서비스"):
+            assert name in formatted["projects"]
+        assert "관리 화면 유지보수" not in formatted["projects"]
+
+    def test_unlimited_budget_includes_everything(self, resume_data):
+        """예산이 없으면 모든 성과와 기술을 포함한다"""
+        formatted = format_resume_for_ai(resume_data)
+        assert "정산 배치 자동화" in formatted["projects"]
+        assert "Node.js" in formatted["projects"]
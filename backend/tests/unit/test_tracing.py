@@ -0,0 +1,201 @@
+"""
+분산 트레이싱 단위 테스트 - traceparent 전파(HTTP → Celery 헤더 → 워커), 작업 단계/LLM/Mongo 스팬, 파일 내보내기
+"""
+import json
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from shared.llm import router as router_module
+from shared.llm.base import LLMResponse
+from shared.llm.router import LLMRouter
+from shared.utils import tracing
+from shared.utils.tracing import (
+    NOOP_SPAN,
+    MongoCommandTracer,
+    begin_span,
+    current_span,
+    flush_traces,
+    format_trace,
+    inject_task_headers,
+    install_tracing,
+    load_traces,
+    mark_stage,
+    parse_traceparent,
+    start_span,
+    untraced,
+)
+
+
+@pytest.fixture
+def exported(tmp_path):
+    """파일 내보내기로 트레이싱을 켜고, 기록된 스팬 목록을 반환하는 함수 제공"""
+    path = tmp_path / "traces.jsonl"
+
+    def read():
+        flush_traces()
+        if not path.exists():
+            return []
+        return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line]
+
+    with patch.object(tracing.settings, "tracing_exporter", "file"), \
+         patch.object(tracing.settings, "tracing_file_path", str(path)), \
+         patch.object(tracing.settings, "tracing_sample_rate", 1.0):
+        yield read
+
+
+def _by_name(spans):
+    return {span["name"]: span for span in spans}
+
+
+class TestTraceparent:
+    """W3C traceparent 파싱 테스트"""
+
+    def test_valid_and_invalid_headers(self):
+        trace_id, span_id = "4bf92f3577b34da6a3ce929d0e0e4736", "00f067aa0ba902b7"
+        assert parse_traceparent(f"00-{trace_id}-{span_id}-01") == (trace_id, span_id, True)
+        assert parse_traceparent(f"00-{trace_id}-{span_id}-00") == (trace_id, span_id, False)
+        assert parse_traceparent(f"00-{'0' * 32}-{span_id}-01") is None
+        assert parse_traceparent("garbage") is None
+        assert parse_traceparent(None) is None
+
+
+class TestSpanLifecycle:
+    """스팬 생성 조건 테스트"""
+
+    def test_disabled_tracing_creates_no_spans(self):
+        with patch.object(tracing.settings, "tracing_exporter", "none"):
+            with start_span("request", root=True) as span:
+                assert span is NOOP_SPAN and current_span() is None
+
+    def test_client_spans_require_a_parent(self, exported):
+        """
+        시나리오: 요청/작업 밖(워밍업 등)에서 Redis/LLM 같은 하위 호출 스팬 시작
+        Then: 새 trace를 만들지 않고, 취소 확인 폴링처럼 untraced 블록 안의 호출도 기록하지 않는다
+        """
+        assert begin_span("redis GET", kind="client") is NOOP_SPAN
+        with start_span("request", root=True):
+            with untraced():
+                assert begin_span("redis EXISTS", kind="client") is NOOP_SPAN
+        assert [span["name"] for span in exported()] == ["request"]
+
+    def test_unsampled_root_propagates_but_is_not_exported(self, exported):
+        with patch.object(tracing.settings, "tracing_sample_rate", 0.0):
+            with start_span("request", root=True) as span:
+                headers = {}
+                inject_task_headers(headers=headers)
+        assert headers["traceparent"].endswith("-00")
+        assert exported() == []
+
+
+class TestPropagation:
+    """HTTP 요청 → Celery 메시지 헤더 → 워커 작업 연결 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_http_request_trace_continues_in_worker_task(self, exported):
+        """
+        시나리오: 라우트에서 작업을 등록하고, 워커가 같은 메시지 헤더로 작업 실행
+        Then: 워커 작업 스팬과 단계 스팬이 HTTP 요청 스팬과 같은 trace로 이어지고, 응답에 trace_id가 담긴다
+        """
+        published = {}
+        app = FastAPI()
+
+        @app.post("/interview/{unique_key}/generate")
+        async def generate(unique_key: str):
+            inject_task_headers(headers=published)
+            return {"unique_key": unique_key}
+
+        install_tracing(app, "test-tracing")
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.post("/interview/resume-1/generate")
+
+        # 워커: before_task_publish에서 넣은 헤더는 task.request 속성으로 전달됨
+        task = SimpleNamespace(name="tasks.generate_interview_questions_async",
+                               request=SimpleNamespace(retries=0, eta=None, **published))
+        tracing._on_task_prerun(task_id="task-1", task=task)
+        mark_stage("loading_resume")
+        with start_span("redis SETEX", kind="client"):
+            pass
+        mark_stage("calling_llm")
+        mark_stage("completed", terminal=True)
+        tracing._on_task_postrun(task_id="task-1", state="SUCCESS")
+        assert current_span() is None
+
+        spans = _by_name(exported())
+        http_span = spans["POST /interview/{unique_key}/generate"]
+        task_span = spans["celery.task tasks.generate_interview_questions_async"]
+
+        assert response.headers["x-trace-id"] == http_span["trace_id"]
+        assert http_span["attributes"]["http.status_code"] == 200 and http_span["parent_id"] is None
+        assert task_span["trace_id"] == http_span["trace_id"] and task_span["parent_id"] == http_span["span_id"]
+        assert spans["stage loading_resume"]["parent_id"] == task_span["span_id"]
+        assert spans["stage calling_llm"]["parent_id"] == task_span["span_id"]
+        assert spans["redis SETEX"]["parent_id"] == spans["stage loading_resume"]["span_id"]
+        assert task_span["attributes"]["celery.state"] == "SUCCESS"
+
+
+class TestClientSpans:
+    """LLM/MongoDB 호출 스팬 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_llm_attempts_are_recorded_with_tokens(self, exported):
+        failing = MagicMock(_model="m-fail")
+        failing.name = "gemini"
+        failing.ainvoke = AsyncMock(side_effect=TimeoutError("timeout"))
+        working = MagicMock(_model="m-ok")
+        working.name = "openai"
+        working.ainvoke = AsyncMock(return_value=LLMResponse('{"questions": []}', "stop",
+                                                             {"input_tokens": 1200, "cached_tokens": 1000}))
+        clients = {"gemini": failing, "openai": working}
+
+        with patch.object(router_module, "get_redis_client", side_effect=ConnectionError("no redis")), \
+             patch.object(router_module.registry, "get_available_clients", return_value=["gemini", "openai"]), \
+             patch.object(router_module.registry, "get_client", side_effect=clients.get):
+            with start_span("celery.task test", kind="consumer", root=True):
+                await LLMRouter().ainvoke("prompt", preferred="gemini")
+
+        calls = [span for span in exported() if span["name"] == "llm.call"]
+        assert [(span["attributes"]["llm.provider"], span["status"]) for span in calls] == \
+            [("gemini", "error"), ("openai", "ok")]
+        assert calls[0]["attributes"]["exception.type"] == "TimeoutError"
+        assert calls[1]["attributes"]["llm.tokens.input"] == 1200
+        assert calls[1]["attributes"]["llm.tokens.cached"] == 1000
+        assert calls[1]["attributes"]["llm.finish_reason"] == "stop"
+
+    def test_mongo_commands_become_child_spans(self, exported):
+        listener = MongoCommandTracer()
+        with start_span("celery.task test", kind="consumer", root=True) as parent:
+            listener.started(SimpleNamespace(command_name="find", command={"find": "resumes"},
+                                             connection_id=("db", 27017), request_id=1))
+            listener.succeeded(SimpleNamespace(connection_id=("db", 27017), request_id=1))
+        listener.started(SimpleNamespace(command_name="find", command={"find": "resumes"},
+                                         connection_id=("db", 27017), request_id=2))
+
+        mongo = _by_name(exported())["mongo find"]
+        assert mongo["parent_id"] == parent.span_id
+        assert mongo["attributes"]["db.mongodb.collection"] == "resumes"
+        assert listener._pending == {}
+
+
+class TestOfflineAnalysis:
+    """스팬 파일 워터폴 분석 테스트"""
+
+    def test_waterfall_shows_tree_and_gaps(self, tmp_path):
+        spans = [
+            {"trace_id": "t1", "span_id": "a", "parent_id": None, "name": "POST /generate", "service": "api",
+             "start_ns": 0, "end_ns": 900_000_000, "duration_ms": 900.0, "status": "ok", "attributes": {}},
+            {"trace_id": "t1", "span_id": "b", "parent_id": "a", "name": "celery.task gen", "service": "worker",
+             "start_ns": 400_000_000, "end_ns": 900_000_000, "duration_ms": 500.0, "status": "error",
+             "attributes": {"celery.queue_wait_ms": 390.0}},
+        ]
+        path = tmp_path / "offline.jsonl"
+        path.write_text("".join(json.dumps(span) + "\n" for span in spans), encoding="utf-8")
+
+        text = format_trace(load_traces(str(path))["t1"])
+
+        assert "trace t1 (900.0ms, 2 spans)" in text
+        assert "(gap 400.0ms)" in text
+        assert "celery.task gen [worker] ! (celery.queue_wait_ms=390.0)" in text